@@ -128,6 +128,7 @@ Algorithms that can find the minimum eigenvalue of an operator.
    NumPyMinimumEigensolver
    QAOA
    VQE
+   VQECheckpoint
 
 Optimizers
 ++++++++++
@@ -183,6 +184,7 @@ from .linear_solvers import HHL, LinearSolver, NumPyLinearSolver, LinearSolverRe
 from .minimum_eigen_solvers import (
     VQE,
     VQEResult,
+    VQECheckpoint,
     QAOA,
     NumPyMinimumEigensolver,
     MinimumEigensolver,
@@ -223,6 +225,7 @@ __all__ = [
     "ShorResult",
     "VQE",
     "VQEResult",
+    "VQECheckpoint",
     "QAOA",
     "LinearSolver",
     "HHL",
@@ -12,17 +12,16 @@
 
 """The Quantum Phase Estimation-based Amplitude Estimation algorithm."""
 
-from typing import Optional, Union, List, Tuple, Dict
+from typing import Callable, Optional, Union, List, Tuple, Dict
 from collections import OrderedDict
 import numpy as np
 from scipy.stats import chi2, norm
-from scipy.optimize import bisect
 
 from qiskit import QuantumCircuit, ClassicalRegister
 from qiskit.providers import BaseBackend, Backend
 from qiskit.utils import QuantumInstance
-from .amplitude_estimator import AmplitudeEstimator, AmplitudeEstimatorResult
-from .ae_utils import pdf_a, derivative_log_pdf_a, bisect_max
+from .amplitude_estimator import AmplitudeEstimator, AmplitudeEstimatorResult, _execute_batch
+from .ae_utils import pdf_a, derivative_log_pdf_a, grid_max, bisect_roots
 from .estimation_problem import EstimationProblem
 
 
@@ -203,7 +202,7 @@ class AmplitudeEstimation(AmplitudeEstimator):
         # construct probabilities
         measurements = OrderedDict()
         samples = OrderedDict()
-        shots = self._quantum_instance._run_config.shots
+        shots = sum(counts.values())
 
         for state, count in counts.items():
             y = int(state.replace(" ", "")[: self._m][::-1], 2)
@@ -228,50 +227,47 @@ class AmplitudeEstimation(AmplitudeEstimator):
         Returns:
             The MLE for the provided result object.
         """
-        m = result.num_evaluation_qubits
-        M = 2 ** m  # pylint: disable=invalid-name
-        qae = result.estimation
+        return AmplitudeEstimation.compute_mles([result], apply_post_processing)[0]
 
-        # likelihood function
-        a_i = np.asarray(list(result.samples.keys()))
-        p_i = np.asarray(list(result.samples.values()))
+    @staticmethod
+    def compute_mles(
+        results: List["AmplitudeEstimationResult"], apply_post_processing: bool = False
+    ) -> List[float]:
+        """Compute the Maximum Likelihood Estimators (MLEs) of several results at once.
 
-        def loglikelihood(a):
-            return np.sum(result.shots * p_i * np.log(pdf_a(a_i, a, m)))
+        The log-likelihood functions of all results are evaluated together on grids of
+        candidate amplitudes, so post-processing many results at once is much faster than
+        calling :meth:`compute_mle` for each of them. The results only need to contain the
+        samples, shots, estimation and number of evaluation qubits, i.e. they do not need to
+        stem from this instance.
 
-        # y is pretty much an integer, but to map 1.9999 to 2 we must first
-        # use round and then int conversion
-        y = int(np.round(M * np.arcsin(np.sqrt(qae)) / np.pi))
-
-        # Compute the two intervals in which are candidates for containing
-        # the maximum of the log-likelihood function: the two bubbles next to
-        # the QAE estimate
-        if y == 0:
-            right_of_qae = np.sin(np.pi * (y + 1) / M) ** 2
-            bubbles = [qae, right_of_qae]
+        Args:
+            results: The amplitude estimation result objects.
+            apply_post_processing: If True, apply the post processing to the MLEs before returning
+                them.
 
-        elif y == int(M / 2):  # remember, M = 2^m is a power of 2
-            left_of_qae = np.sin(np.pi * (y - 1) / M) ** 2
-            bubbles = [left_of_qae, qae]
+        Returns:
+            The MLE for each of the provided result objects.
+        """
+        if len(results) == 0:
+            return []
 
-        else:
-            left_of_qae = np.sin(np.pi * (y - 1) / M) ** 2
-            right_of_qae = np.sin(np.pi * (y + 1) / M) ** 2
-            bubbles = [left_of_qae, qae, right_of_qae]
+        loglikelihood = _loglikelihood(results)
+        lower, upper = _bubbles(results)
 
-        # Find global maximum amongst the two local maxima
-        a_opt = qae
-        loglik_opt = loglikelihood(a_opt)
-        for a, b in zip(bubbles[:-1], bubbles[1:]):
-            locmax, val = bisect_max(loglikelihood, a, b, retval=True)
-            if val > loglik_opt:
-                a_opt = locmax
-                loglik_opt = val
+        # Find global maximum amongst the estimate and the local maxima in the bubbles,
+        # the first of them on ties
+        qae = np.array([result.estimation for result in results], dtype=float)
+        locmax, values = grid_max(loglikelihood, lower, upper)
+        candidates = np.column_stack([qae, locmax])
+        values = np.column_stack([loglikelihood(qae), values])
+        best = np.argmax(values, axis=1)
+        mles = [candidates[i, index] for i, index in enumerate(best)]
 
         if apply_post_processing:
-            return result.post_processing(a_opt)
+            return [result.post_processing(mle) for result, mle in zip(results, mles)]
 
-        return a_opt
+        return mles
 
     def estimate(self, estimation_problem: EstimationProblem) -> "AmplitudeEstimationResult":
         """Run the amplitude estimation algorithm on provided estimation problem.
@@ -286,69 +282,103 @@ class AmplitudeEstimation(AmplitudeEstimator):
             ValueError: If `state_preparation` or `objective_qubits` are not set in the
                 `estimation_problem`.
         """
-        # check if A factory or state_preparation has been set
-        if estimation_problem.state_preparation is None:
-            raise ValueError(
-                "The state_preparation property of the estimation problem must be " "set."
-            )
+        return self.estimate_batch([estimation_problem])[0]
 
-        if estimation_problem.objective_qubits is None:
-            raise ValueError(
-                "The objective_qubits property of the estimation problem must be " "set."
-            )
+    def estimate_batch(
+        self, estimation_problems: List[EstimationProblem]
+    ) -> List["AmplitudeEstimationResult"]:
+        """Run the amplitude estimation algorithm on several estimation problems at once.
 
-        result = AmplitudeEstimationResult()
-        result.num_evaluation_qubits = self._m
-        result.post_processing = estimation_problem.post_processing
+        The circuits of all problems are executed together, in as few jobs as the maximum number
+        of experiments per job of the backend allows, and the results are post-processed
+        together.
 
-        if self._quantum_instance.is_statevector:
-            circuit = self.construct_circuit(estimation_problem, measurement=False)
-            # run circuit on statevector simulator
-            statevector = self._quantum_instance.execute(circuit).get_statevector()
-            result.circuit_results = statevector
+        Args:
+            estimation_problems: The estimation problems.
 
-            # store number of shots: convention is 1 shot for statevector,
-            # needed so that MLE works!
-            result.shots = 1
-        else:
-            # run circuit on QASM simulator
-            circuit = self.construct_circuit(estimation_problem, measurement=True)
-            counts = self._quantum_instance.execute(circuit).get_counts()
-            result.circuit_results = counts
-
-            # store shots
-            result.shots = sum(counts.values())
-
-        samples, measurements = self.evaluate_measurements(result.circuit_results)
-
-        result.samples = samples
-        result.samples_processed = {
-            estimation_problem.post_processing(a): p for a, p in samples.items()
-        }
-        result.measurements = measurements
-
-        # determine the most likely estimate
-        result.max_probability = 0
-        for amplitude, (mapped, prob) in zip(samples.keys(), result.samples_processed.items()):
-            if prob > result.max_probability:
-                result.max_probability = prob
-                result.estimation = amplitude
-                result.estimation_processed = mapped
-
-        # store the number of oracle queries
-        result.num_oracle_queries = result.shots * (self._M - 1)
-
-        # run the MLE post processing
-        mle = self.compute_mle(result)
-        result.mle = mle
-        result.mle_processed = estimation_problem.post_processing(mle)
-
-        result.confidence_interval = self.compute_confidence_interval(result)
-        result.confidence_interval_processed = tuple(
-            estimation_problem.post_processing(value) for value in result.confidence_interval
-        )
+        Returns:
+            An amplitude estimation results object for each of the problems.
+
+        Raises:
+            ValueError: If `state_preparation` or `objective_qubits` are not set in one of the
+                `estimation_problems`.
+        """
+        for estimation_problem in estimation_problems:
+            # check if A factory or state_preparation has been set
+            if estimation_problem.state_preparation is None:
+                raise ValueError(
+                    "The state_preparation property of the estimation problem must be " "set."
+                )
+
+            if estimation_problem.objective_qubits is None:
+                raise ValueError(
+                    "The objective_qubits property of the estimation problem must be " "set."
+                )
+
+        if len(estimation_problems) == 0:
+            return []
+
+        # run the circuits of all problems in the same jobs, on a statevector simulator without
+        # and else with measurements
+        is_statevector = self._quantum_instance.is_statevector
+        circuits = [
+            self.construct_circuit(estimation_problem, measurement=not is_statevector)
+            for estimation_problem in estimation_problems
+        ]
+        ret = _execute_batch(self._quantum_instance, circuits)
+
+        results = []
+        for i, estimation_problem in enumerate(estimation_problems):
+            result = AmplitudeEstimationResult()
+            result.num_evaluation_qubits = self._m
+            result.post_processing = estimation_problem.post_processing
+
+            if is_statevector:
+                result.circuit_results = ret.get_statevector(i)
+
+                # store number of shots: convention is 1 shot for statevector,
+                # needed so that MLE works!
+                result.shots = 1
+            else:
+                counts = ret.get_counts(i)
+                result.circuit_results = counts
+
+                # store shots
+                result.shots = sum(counts.values())
+
+            samples, measurements = self.evaluate_measurements(result.circuit_results)
+
+            result.samples = samples
+            result.samples_processed = {
+                estimation_problem.post_processing(a): p for a, p in samples.items()
+            }
+            result.measurements = measurements
+
+            # determine the most likely estimate
+            result.max_probability = 0
+            for amplitude, (mapped, prob) in zip(samples.keys(), result.samples_processed.items()):
+                if prob > result.max_probability:
+                    result.max_probability = prob
+                    result.estimation = amplitude
+                    result.estimation_processed = mapped
+
+            # store the number of oracle queries
+            result.num_oracle_queries = result.shots * (self._M - 1)
+            results.append(result)
+
+        # run the MLE post processing of all results at once
+        for result, mle in zip(results, self.compute_mles(results)):
+            result.mle = mle
+            result.mle_processed = result.post_processing(mle)
+
+        confidence_intervals = self.compute_confidence_intervals(results)
+        for result, confidence_interval in zip(results, confidence_intervals):
+            result.confidence_interval = confidence_interval
+            result.confidence_interval_processed = tuple(
+                result.post_processing(value) for value in confidence_interval
+            )
 
-        return result
+        return results
 
     @staticmethod
     def compute_confidence_interval(
@@ -369,20 +399,52 @@ class AmplitudeEstimation(AmplitudeEstimator):
             AquaError: If 'mle' is not in self._ret.keys() (i.e. `run` was not called yet).
             NotImplementedError: If the confidence interval method `kind` is not implemented.
         """
-        # if statevector simulator the estimate is exact
-        if isinstance(result.circuit_results, (list, np.ndarray)):
-            return (result.mle, result.mle)
+        return AmplitudeEstimation.compute_confidence_intervals([result], alpha, kind)[0]
 
-        if kind in ["likelihood_ratio", "lr"]:
-            return _likelihood_ratio_confint(result, alpha)
+    @staticmethod
+    def compute_confidence_intervals(
+        results: List["AmplitudeEstimationResult"],
+        alpha: float = 0.05,
+        kind: str = "likelihood_ratio",
+    ) -> List[Tuple[float, float]]:
+        """Compute the (1 - alpha) confidence intervals of several results at once.
 
-        if kind in ["fisher", "fi"]:
-            return _fisher_confint(result, alpha, observed=False)
+        Like :meth:`compute_mles`, the likelihood ratio confidence intervals of all results are
+        computed together.
 
-        if kind in ["observed_fisher", "observed_information", "oi"]:
-            return _fisher_confint(result, alpha, observed=True)
+        Args:
+            results: The amplitude estimation results for which to compute the confidence
+                intervals.
+            alpha: Confidence level: compute the (1 - alpha) confidence intervals.
+            kind: The method to compute the confidence intervals, can be 'fisher',
+                'observed_fisher' or 'likelihood_ratio' (default)
 
-        raise NotImplementedError("CI `{}` is not implemented.".format(kind))
+        Returns:
+            The (1 - alpha) confidence interval of the specified kind for each result.
+
+        Raises:
+            NotImplementedError: If the confidence interval method `kind` is not implemented.
+        """
+        # if statevector simulator the estimate is exact
+        exact = [isinstance(result.circuit_results, (list, np.ndarray)) for result in results]
+        sampled = [result for result, is_exact in zip(results, exact) if not is_exact]
+
+        if len(sampled) == 0:
+            confints = []
+        elif kind in ["likelihood_ratio", "lr"]:
+            confints = _likelihood_ratio_confints(sampled, alpha)
+        elif kind in ["fisher", "fi"]:
+            confints = [_fisher_confint(result, alpha, observed=False) for result in sampled]
+        elif kind in ["observed_fisher", "observed_information", "oi"]:
+            confints = [_fisher_confint(result, alpha, observed=True) for result in sampled]
+        else:
+            raise NotImplementedError("CI `{}` is not implemented.".format(kind))
+
+        confints = iter(confints)
+        return [
+            (result.mle, result.mle) if is_exact else next(confints)
+            for result, is_exact in zip(results, exact)
+        ]
 
 
 class AmplitudeEstimationResult(AmplitudeEstimatorResult):
@@ -490,14 +552,10 @@ def _compute_fisher_information(result: AmplitudeEstimationResult, observed: boo
         p_i = np.asarray(list(result.samples.values()))
 
         # Calculate the observed Fisher information
-        fisher_information = sum(p * derivative_log_pdf_a(a, mlv, m) ** 2 for p, a in zip(p_i, a_i))
+        fisher_information = np.sum(p_i * derivative_log_pdf_a(a_i, mlv, m) ** 2)
     else:
-
-        def integrand(x):
-            return (derivative_log_pdf_a(x, mlv, m)) ** 2 * pdf_a(x, mlv, m)
-
         grid = np.sin(np.pi * np.arange(M / 2 + 1) / M) ** 2
-        fisher_information = sum(integrand(x) for x in grid)
+        fisher_information = np.sum(derivative_log_pdf_a(grid, mlv, m) ** 2 * pdf_a(grid, mlv, m))
 
     return fisher_information
 
@@ -524,73 +582,122 @@ def _fisher_confint(
     return tuple(result.post_processing(bound) for bound in confint)
 
 
-def _likelihood_ratio_confint(result: AmplitudeEstimationResult, alpha: float) -> List[float]:
-    """Compute the likelihood ratio confidence interval for the MLE of the previous run.
+def _likelihood_ratio_confints(
+    results: List[AmplitudeEstimationResult], alpha: float
+) -> List[Tuple[float, float]]:
+    """Compute the likelihood ratio confidence intervals for the MLEs of several results at once.
 
     Args:
-        result: An amplitude estimation result for which to compute the confidence interval.
+        results: The amplitude estimation results for which to compute the confidence intervals.
         alpha: Specifies the (1 - alpha) confidence level (0 < alpha < 1).
 
     Returns:
-        The likelihood ratio confidence interval.
+        The likelihood ratio confidence interval of each result.
     """
-    # Compute the two intervals in which we the look for values above
-    # the likelihood ratio: the two bubbles next to the QAE estimate
-    m = result.num_evaluation_qubits
-    M = 2 ** m  # pylint: disable=invalid-name
-    qae = result.estimation
-
-    y = int(np.round(M * np.arcsin(np.sqrt(qae)) / np.pi))
-    if y == 0:
-        right_of_qae = np.sin(np.pi * (y + 1) / M) ** 2
-        bubbles = [qae, right_of_qae]
-
-    elif y == int(M / 2):  # remember, M = 2^m is a power of 2
-        left_of_qae = np.sin(np.pi * (y - 1) / M) ** 2
-        bubbles = [left_of_qae, qae]
+    if len(results) == 0:
+        return []
 
-    else:
-        left_of_qae = np.sin(np.pi * (y - 1) / M) ** 2
-        right_of_qae = np.sin(np.pi * (y + 1) / M) ** 2
-        bubbles = [left_of_qae, qae, right_of_qae]
-
-    # likelihood function
-    a_i = np.asarray(list(result.samples.keys()))
-    p_i = np.asarray(list(result.samples.values()))
-
-    def loglikelihood(a):
-        return np.sum(result.shots * p_i * np.log(pdf_a(a_i, a, m)))
+    loglikelihood = _loglikelihood(results)
 
     # The threshold above which the likelihoods are in the
     # confidence interval
-    loglik_mle = loglikelihood(result.mle)
-    thres = loglik_mle - chi2.ppf(1 - alpha, df=1) / 2
+    mle = np.array([result.mle for result in results], dtype=float)
+    thres = loglikelihood(mle) - chi2.ppf(1 - alpha, df=1) / 2
 
     def cut(x):
-        return loglikelihood(x) - thres
+        return loglikelihood(x) - thres[:, np.newaxis]
+
+    # Check the two intervals/bubbles next to the QAE estimate: check if they surpass the
+    # threshold and if yes add the part that does to the CI. Compute the local maxima and
+    # search the intersections with the threshold between the local maxima and the bubble
+    # boundaries, in all bubbles at once
+    lower_bubble, upper_bubble = _bubbles(results)
+    locmax, values = grid_max(loglikelihood, lower_bubble, upper_bubble)
+    above = values >= thres[:, np.newaxis]
+    cut_locmax = cut(locmax)
+
+    # Bisect pre-condition is that the function has different
+    # signs at the boundaries of the interval we search in
+    has_left = above & (cut(lower_bubble) * cut_locmax < 0)
+    has_right = above & (cut_locmax * cut(upper_bubble) < 0)
+    left = bisect_roots(cut, lower_bubble, locmax)
+    right = bisect_roots(cut, locmax, upper_bubble)
 
-    # Store the boundaries of the confidence interval
     # It's valid to start off with the zero-width confidence interval, since the maximum
     # of the likelihood function is guaranteed to be over the threshold, and if alpha = 0
     # that's the valid interval
-    lower = upper = result.mle
-
-    # Check the two intervals/bubbles: check if they surpass the
-    # threshold and if yes add the part that does to the CI
-    for a, b in zip(bubbles[:-1], bubbles[1:]):
-        # Compute local maximum and perform a bisect search between
-        # the local maximum and the bubble boundaries
-        locmax, val = bisect_max(loglikelihood, a, b, retval=True)
-        if val >= thres:
-            # Bisect pre-condition is that the function has different
-            # signs at the boundaries of the interval we search in
-            if cut(a) * cut(locmax) < 0:
-                left = bisect(cut, a, locmax)
-                lower = np.minimum(lower, left)
-            if cut(locmax) * cut(b) < 0:
-                right = bisect(cut, locmax, b)
-                upper = np.maximum(upper, right)
-
-    # Put together CI
-    confint = [lower, upper]
-    return tuple(result.post_processing(bound) for bound in confint)
+    lower = np.minimum(mle, np.min(np.where(has_left, left, np.inf), axis=1))
+    upper = np.maximum(mle, np.max(np.where(has_right, right, -np.inf), axis=1))
+
+    return [
+        tuple(result.post_processing(bound) for bound in confint)
+        for result, confint in zip(results, zip(lower, upper))
+    ]
+
+
+def _loglikelihood(results: List[AmplitudeEstimationResult]) -> Callable[[np.ndarray], np.ndarray]:
+    """Construct the log-likelihood functions of several results, evaluated all at once.
+
+    Args:
+        results: The amplitude estimation results.
+
+    Returns:
+        A function mapping an array of candidate amplitudes, whose first axis indexes the results,
+        to the array of log-likelihoods of the respective results at these amplitudes.
+    """
+    # stack the samples of the results, padded with zero-weight samples
+    num_samples = max(len(result.samples) for result in results)
+    a_i = np.zeros((len(results), num_samples))
+    weights = np.zeros((len(results), num_samples))
+    for i, result in enumerate(results):
+        a_i[i, : len(result.samples)] = list(result.samples.keys())
+        weights[i, : len(result.samples)] = result.shots * np.asarray(list(result.samples.values()))
+    m = np.array([result.num_evaluation_qubits for result in results])
+
+    def loglikelihood(a):
+        a = np.asarray(a, dtype=float)
+        shape = (len(results),) + (1,) * (a.ndim - 1) + (num_samples,)
+        with np.errstate(divide="ignore"):
+            log_pdf = np.log(
+                pdf_a(a_i.reshape(shape), a[..., np.newaxis], m.reshape(shape[:-1] + (1,)))
+            )
+        return np.sum(np.where(weights.reshape(shape) > 0, weights.reshape(shape) * log_pdf, 0), -1)
+
+    return loglikelihood
+
+
+def _bubbles(results: List[AmplitudeEstimationResult]) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the bubbles, the two intervals next to the QAE estimate, of several results.
+
+    These intervals are the candidates for containing the maximum of the log-likelihood function.
+
+    Args:
+        results: The amplitude estimation results.
+
+    Returns:
+        The lower and upper boundaries of the bubbles, arrays of shape (len(results), 2). If the
+        estimate is at the boundary of the grid, its only bubble is returned twice.
+    """
+    bubbles = []
+    for result in results:
+        M = 2 ** result.num_evaluation_qubits  # pylint: disable=invalid-name
+        qae = result.estimation
+
+        # y is pretty much an integer, but to map 1.9999 to 2 we must first
+        # use round and then int conversion
+        y = int(np.round(M * np.arcsin(np.sqrt(qae)) / np.pi))
+        if y == 0:
+            right_of_qae = np.sin(np.pi * (y + 1) / M) ** 2
+            bubbles.append([(qae, right_of_qae)] * 2)
+
+        elif y == int(M / 2):  # remember, M = 2^m is a power of 2
+            left_of_qae = np.sin(np.pi * (y - 1) / M) ** 2
+            bubbles.append([(left_of_qae, qae)] * 2)
+
+        else:
+            left_of_qae = np.sin(np.pi * (y - 1) / M) ** 2
+            right_of_qae = np.sin(np.pi * (y + 1) / M) ** 2
+            bubbles.append([(left_of_qae, qae), (qae, right_of_qae)])
+
+    bubbles = np.asarray(bubbles, dtype=float)
+    return bubbles[..., 0], bubbles[..., 1]
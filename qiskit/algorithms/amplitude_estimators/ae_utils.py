@@ -76,43 +76,32 @@ def _circ_dist(x, p):
             d(x, p) = \min_{z \in [-1, 0, 1]} |z + p - x|
 
     Args:
-        x (float): first angle
-        p (float): second angle
+        x (float or np.ndarray): first angle
+        p (float or np.ndarray): second angle
 
     Returns:
-        float: d(x, p)
+        float or np.ndarray: d(x, p), broadcast over the shapes of x and p
     """
     t = p - x
     # Since x and p \in [0,1] it suffices to check not all integers
     # but only -1, 0 and 1
-    z = np.array([-1, 0, 1])
-
-    if hasattr(t, "__len__"):
-        d = np.empty_like(t)
-        for idx, ti in enumerate(t):
-            d[idx] = np.min(np.abs(z + ti))
-        return d
-
-    return np.min(np.abs(z + t))
+    return np.minimum(np.abs(t), np.minimum(np.abs(t - 1), np.abs(t + 1)))
 
 
 def _derivative_circ_dist(x, p):
     """Derivative of circumferential distance function.
 
     Args:
-        x (float): first angle
-        p (float): second angle
+        x (float or np.ndarray): first angle
+        p (float or np.ndarray): second angle
 
     Returns:
-        float: The derivative.
+        float or np.ndarray: The derivative.
     """
-    # pylint: disable=chained-comparison,misplaced-comparison-constant
     t = p - x
-    if t < -0.5 or (0 < t and t < 0.5):
-        return -1
-    if t > 0.5 or (-0.5 < t and t < 0):
-        return 1
-    return 0
+    decreasing = (t < -0.5) | ((t > 0) & (t < 0.5))
+    increasing = (t > 0.5) | ((t > -0.5) & (t < 0))
+    return np.where(decreasing, -1, np.where(increasing, 1, 0))
 
 
 def _amplitude_to_angle(a):
@@ -174,9 +163,10 @@ def _pdf_a_single_angle(x, p, m, pi_delta):
     M = 2 ** m
 
     d = pi_delta(x, p)
-    res = np.sin(M * d) ** 2 / (M * np.sin(d)) ** 2 if d != 0 else 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        res = np.sin(M * d) ** 2 / (M * np.sin(d)) ** 2
 
-    return res
+    return np.where(d != 0, res, 1)
 
 
 def pdf_a(x, p, m):
@@ -184,75 +174,145 @@ def pdf_a(x, p, m):
     Return the PDF of a, i.e. the probability of getting the estimate x
     (in [0, 1]) if p (in [0, 1]) is the true value, given that we use m qubits.
 
+    The arguments are broadcast against each other, so the PDF of many grid points and many
+    true values, e.g. a whole grid of candidates for the maximum likelihood estimate, is
+    evaluated at once.
+
     Args:
-        x (float): the grid point
-        p (float): the true value
-        m (float): the number of evaluation qubits
+        x (float or np.ndarray): the grid point(s)
+        p (float or np.ndarray): the true value(s)
+        m (int or np.ndarray): the number of evaluation qubits
 
     Returns:
-        float: PDF(x|p)
+        float or np.ndarray: PDF(x|p)
     """
-    # We'll use list comprehension, so the input should be a list
-    scalar = False
-    if not hasattr(x, "__len__"):
-        scalar = True
-        x = np.asarray([x])
+    x = np.asarray(x, dtype=float)
 
     # Compute the probabilities: Add up both angles that produce the given
     # value, except for the angles 0 and 0.5, which map to the unique a-values,
     # 0 and 1, respectively
-    pr = np.array(
-        [
-            _pdf_a_single_angle(xi, p, m, _alpha) + _pdf_a_single_angle(xi, p, m, _beta)
-            if (xi not in [0, 1])
-            else _pdf_a_single_angle(xi, p, m, _alpha)
-            for xi in x
-        ]
-    ).flatten()
+    pr = _pdf_a_single_angle(x, p, m, _alpha) + np.where(
+        (x != 0) & (x != 1), _pdf_a_single_angle(x, p, m, _beta), 0
+    )
 
     # If is was a scalar return scalar otherwise the array
-    return pr[0] if scalar else pr
+    return pr[()] if pr.ndim == 0 else pr
 
 
 def derivative_log_pdf_a(x, p, m):
     """
     Return the derivative of the logarithm of the PDF of a.
 
+    Like :func:`pdf_a`, the arguments are broadcast against each other.
+
     Args:
-        x (float): the grid point
-        p (float): the true value
-        m (float): the number of evaluation qubits
+        x (float or np.ndarray): the grid point(s)
+        p (float or np.ndarray): the true value(s)
+        m (int or np.ndarray): the number of evaluation qubits
 
     Returns:
-        float: d/dp log(PDF(x|p))
+        float or np.ndarray: d/dp log(PDF(x|p))
     """
     M = 2 ** m
+    x = np.asarray(x, dtype=float)
+
+    alpha, beta = _alpha(x, p), _beta(x, p)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d_alpha, d_beta = _derivative_alpha(x, p), _derivative_beta(x, p)
 
-    if x not in [0, 1]:
         num_p1 = 0
-        for A, dA, B, dB in zip(
-            [_alpha, _beta],
-            [_derivative_alpha, _derivative_beta],
-            [_beta, _alpha],
-            [_derivative_beta, _derivative_alpha],
-        ):
-            num_p1 += 2 * M * np.sin(M * A(x, p)) * np.cos(M * A(x, p)) * dA(x, p) * np.sin(
-                B(x, p)
-            ) ** 2 + 2 * np.sin(M * A(x, p)) ** 2 * np.sin(B(x, p)) * np.cos(B(x, p)) * dB(x, p)
+        for A, dA, B, dB in [(alpha, d_alpha, beta, d_beta), (beta, d_beta, alpha, d_alpha)]:
+            num_p1 += (
+                2 * M * np.sin(M * A) * np.cos(M * A) * dA * np.sin(B) ** 2
+                + 2 * np.sin(M * A) ** 2 * np.sin(B) * np.cos(B) * dB
+            )
 
         den_p1 = (
-            np.sin(M * _alpha(x, p)) ** 2 * np.sin(_beta(x, p)) ** 2
-            + np.sin(M * _beta(x, p)) ** 2 * np.sin(_alpha(x, p)) ** 2
+            np.sin(M * alpha) ** 2 * np.sin(beta) ** 2 + np.sin(M * beta) ** 2 * np.sin(alpha) ** 2
         )
 
         num_p2 = 0
-        for A, dA, B in zip(
-            [_alpha, _beta], [_derivative_alpha, _derivative_beta], [_beta, _alpha]
-        ):
-            num_p2 += 2 * np.cos(A(x, p)) * dA(x, p) * np.sin(B(x, p))
+        for A, dA, B in [(alpha, d_alpha, beta), (beta, d_beta, alpha)]:
+            num_p2 += 2 * np.cos(A) * dA * np.sin(B)
+
+        den_p2 = np.sin(alpha) * np.sin(beta)
 
-        den_p2 = np.sin(_alpha(x, p)) * np.sin(_beta(x, p))
+        inner = num_p1 / den_p1 - num_p2 / den_p2
+        boundary = 2 * d_alpha * (M / np.tan(M * alpha) - 1 / np.tan(alpha))
 
-        return num_p1 / den_p1 - num_p2 / den_p2
+    res = np.where((x != 0) & (x != 1), inner, boundary)
+    return res[()] if res.ndim == 0 else res
 
-    return 2 * _derivative_alpha(x, p) * (M / np.tan(M * _alpha(x, p)) - 1 / np.tan(_alpha(x, p)))
+
+def grid_max(f, a, b, num_points=33, steps=50, minwidth=1e-12):
+    """Find the maxima of the real-valued function f in the intervals [a, b] by grid refinement.
+
+    Instead of evaluating ``f`` point by point, as :func:`bisect_max` does, each step evaluates
+    ``f`` on a grid of ``num_points`` points in all intervals at once and shrinks the intervals
+    to the neighbourhood of the grid maximum. Like :func:`bisect_max`, this assumes ``f`` to be
+    unimodal in the intervals.
+
+    Args:
+        f (callable): the vectorized function to find the maxima of, which maps an array of points
+            of shape ``a.shape + (num_points,)`` to the array of values at these points
+        a (float or np.ndarray): the lower limits of the intervals
+        b (float or np.ndarray): the upper limits of the intervals
+        num_points (int): the number of grid points per interval and step, at least 3
+        steps (int): the maximum number of refinement steps
+        minwidth (float): if all intervals are smaller than minwidth stop the search
+
+    Returns:
+        tuple(np.ndarray, np.ndarray): The locations of the maxima and the maxima, of the shape of
+        the broadcast ``a`` and ``b``.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    offsets = np.linspace(0, 1, num_points)
+    for _ in range(steps):
+        width = b - a
+        grid = a[..., np.newaxis] + width[..., np.newaxis] * offsets
+        values = f(grid)
+        index = np.argmax(values, axis=-1)[..., np.newaxis]
+        location = np.take_along_axis(grid, index, axis=-1)[..., 0]
+        value = np.take_along_axis(values, index, axis=-1)[..., 0]
+        if np.all(width <= minwidth):
+            break
+
+        # for a unimodal function the maximum is within one grid step of the grid maximum
+        step = width / (num_points - 1)
+        a, b = np.maximum(a, location - step), np.minimum(b, location + step)
+    else:
+        logger.warning("-- Warning, grid_max didn't converge after %s steps", steps)
+
+    return location, value
+
+
+def bisect_roots(f, a, b, steps=100, xtol=2e-12):
+    """Find roots of the real-valued function f in the intervals [a, b] using bisection.
+
+    All intervals are bisected at once, so ``f`` is evaluated once per step.
+
+    Args:
+        f (callable): the vectorized function to find the roots of, which maps an array of
+            points of the shape of ``a`` to the array of values at these points
+        a (np.ndarray): the lower limits of the intervals
+        b (np.ndarray): the upper limits of the intervals, ``f`` must have different signs at the
+            limits of an interval to find a root in it
+        steps (int): the maximum number of bisection steps
+        xtol (float): if all intervals are smaller than xtol stop the search
+
+    Returns:
+        np.ndarray: The roots, of the shape of the broadcast ``a`` and ``b``.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    f_a = f(a)
+    for _ in range(steps):
+        if np.all(np.abs(b - a) <= xtol):
+            break
+        middle = (a + b) / 2
+        f_middle = f(middle)
+        # the sign changes in the right half of the interval
+        right = np.sign(f_middle) == np.sign(f_a)
+        a, f_a = np.where(right, middle, a), np.where(right, f_middle, f_a)
+        b = np.where(right, b, middle)
+
+    return (a + b) / 2
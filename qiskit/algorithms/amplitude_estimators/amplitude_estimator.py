@@ -13,9 +13,13 @@
 """The Amplitude Estimation interface."""
 
 from abc import abstractmethod
-from typing import Union, Optional, Dict, Callable, Tuple
+from typing import Union, Optional, Dict, Callable, List, Tuple
+import copy
 import numpy as np
 
+from qiskit.circuit import QuantumCircuit
+from qiskit.result import Result
+from qiskit.utils import QuantumInstance
 from .estimation_problem import EstimationProblem
 from ..algorithm_result import AlgorithmResult
 
@@ -33,6 +37,59 @@ class AmplitudeEstimator:
         """
         raise NotImplementedError
 
+    def estimate_batch(
+        self, estimation_problems: List[EstimationProblem]
+    ) -> List["AmplitudeEstimatorResult"]:
+        """Run the amplitude estimation algorithm on several estimation problems.
+
+        Estimators which can execute the circuits of several problems in the same jobs override
+        this method, by default the problems are estimated one after another.
+
+        Args:
+            estimation_problems: The ``EstimationProblem`` objects to estimate.
+
+        Returns:
+            An amplitude estimation result for each of the problems, in the same order.
+        """
+        return [self.estimate(estimation_problem) for estimation_problem in estimation_problems]
+
+
+def _execute_batch(quantum_instance: QuantumInstance, circuits: List[QuantumCircuit]) -> Result:
+    """Execute the circuits of several estimation problems in as few executions as possible.
+
+    With measurement error mitigation, all circuits of an execution must measure the same set of
+    qubits, hence the transpiled circuits are then grouped by their measured qubits and each group
+    is executed separately.
+
+    Args:
+        quantum_instance: The quantum instance to execute the circuits on.
+        circuits: The circuits to execute.
+
+    Returns:
+        The result of the circuits, in the order of ``circuits``.
+    """
+    if quantum_instance.measurement_error_mitigation_cls is None:
+        return quantum_instance.execute(circuits)
+
+    transpiled = quantum_instance.transpile(circuits)
+    groups = {}  # type: Dict[frozenset, List[int]]
+    for index, circuit in enumerate(transpiled):
+        measured_qubits = frozenset(
+            qargs[0].index for inst, qargs, _ in circuit.data if inst.name == "measure"
+        )
+        groups.setdefault(measured_qubits, []).append(index)
+    if len(groups) == 1:
+        return quantum_instance.execute(transpiled, had_transpiled=True)
+
+    experiments = [None] * len(transpiled)
+    for indices in groups.values():
+        ret = quantum_instance.execute([transpiled[i] for i in indices], had_transpiled=True)
+        for index, experiment in zip(indices, ret.results):
+            experiments[index] = experiment
+    ret = copy.copy(ret)
+    ret.results = experiments
+    return ret
+
 
 class AmplitudeEstimatorResult(AlgorithmResult):
     """The results object for amplitude estimation algorithms."""
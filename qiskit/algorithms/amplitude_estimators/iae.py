@@ -20,7 +20,7 @@ from qiskit import ClassicalRegister, QuantumCircuit
 from qiskit.providers import BaseBackend, Backend
 from qiskit.utils import QuantumInstance
 
-from .amplitude_estimator import AmplitudeEstimator, AmplitudeEstimatorResult
+from .amplitude_estimator import AmplitudeEstimator, AmplitudeEstimatorResult, _execute_batch
 from .estimation_problem import EstimationProblem
 from ..exceptions import AlgorithmError
 
@@ -282,127 +282,186 @@ class IterativeAmplitudeEstimation(AmplitudeEstimator):
     def estimate(
         self, estimation_problem: EstimationProblem
     ) -> "IterativeAmplitudeEstimationResult":
-        # initialize memory variables
-        powers = [0]  # list of powers k: Q^k, (called 'k' in paper)
-        ratios = []  # list of multiplication factors (called 'q' in paper)
-        theta_intervals = [[0, 1 / 4]]  # a priori knowledge of theta / 2 / pi
-        a_intervals = [[0.0, 1.0]]  # a priori knowledge of the confidence interval of the estimate
-        num_oracle_queries = 0
-        num_one_shots = []
+        return self.estimate_batch([estimation_problem])[0]
+
+    def estimate_batch(
+        self, estimation_problems: List[EstimationProblem]
+    ) -> List["IterativeAmplitudeEstimationResult"]:
+        """Run the algorithm on several estimation problems at once.
+
+        The rounds of all problems advance together: in each round the circuits of all problems
+        whose confidence interval is not narrow enough yet are executed together, in as few jobs
+        as the maximum number of experiments per job of the backend allows.
+
+        Args:
+            estimation_problems: The estimation problems.
+
+        Returns:
+            An iterative amplitude estimation result for each of the problems.
+        """
+        if len(estimation_problems) == 0:
+            return []
+
+        states = [_IterationState() for _ in estimation_problems]
 
         # maximum number of rounds
         max_rounds = (
             int(np.log(self._min_ratio * np.pi / 8 / self._epsilon) / np.log(self._min_ratio)) + 1
         )
-        upper_half_circle = True  # initially theta is in the upper half-circle
 
         # for statevector we can directly return the probability to measure 1
         # note, that no iterations here are necessary
         if self._quantum_instance.is_statevector:
-            # simulate circuit
-            circuit = self.construct_circuit(estimation_problem, k=0, measurement=False)
-            ret = self._quantum_instance.execute(circuit)
+            # simulate circuits
+            circuits = [
+                self.construct_circuit(estimation_problem, k=0, measurement=False)
+                for estimation_problem in estimation_problems
+            ]
+            ret = _execute_batch(self._quantum_instance, circuits)
 
-            # get statevector
-            statevector = ret.get_statevector(circuit)
+            for i, (estimation_problem, circuit, state) in enumerate(
+                zip(estimation_problems, circuits, states)
+            ):
+                # get statevector
+                statevector = ret.get_statevector(i)
 
-            # calculate the probability of measuring '1'
-            num_qubits = circuit.num_qubits - circuit.num_ancillas
-            prob = self._good_state_probability(estimation_problem, statevector, num_qubits)
-            prob = cast(float, prob)  # tell MyPy it's a float and not Tuple[int, float ]
+                # calculate the probability of measuring '1'
+                num_qubits = circuit.num_qubits - circuit.num_ancillas
+                prob = self._good_state_probability(estimation_problem, statevector, num_qubits)
+                prob = cast(float, prob)  # tell MyPy it's a float and not Tuple[int, float ]
 
-            a_confidence_interval = [prob, prob]  # type: List[float]
-            a_intervals.append(a_confidence_interval)
+                a_confidence_interval = [prob, prob]  # type: List[float]
+                state.a_intervals.append(a_confidence_interval)
 
-            theta_i_interval = [
-                np.arccos(1 - 2 * a_i) / 2 / np.pi for a_i in a_confidence_interval  # type: ignore
-            ]
-            theta_intervals.append(theta_i_interval)
-            num_oracle_queries = 0  # no Q-oracle call, only a single one to A
+                theta_i_interval = [
+                    np.arccos(1 - 2 * a_i) / 2 / np.pi  # type: ignore
+                    for a_i in a_confidence_interval
+                ]
+                state.theta_intervals.append(theta_i_interval)
+                state.num_oracle_queries = 0  # no Q-oracle call, only a single one to A
 
         else:
-            num_iterations = 0  # keep track of the number of iterations
             shots = self._quantum_instance._run_config.shots  # number of shots per iteration
 
             # do while loop, keep in mind that we scaled theta mod 2pi such that it lies in [0,1]
-            while theta_intervals[-1][1] - theta_intervals[-1][0] > self._epsilon / np.pi:
-                num_iterations += 1
+            active = [i for i, state in enumerate(states) if not self._has_converged(state)]
+            while len(active) > 0:
+                circuits = []
+                for i in active:
+                    state = states[i]
+
+                    # get the next k
+                    k, state.upper_half_circle = self._find_next_k(
+                        state.powers[-1],
+                        state.upper_half_circle,
+                        state.theta_intervals[-1],  # type: ignore
+                        min_ratio=self._min_ratio,
+                    )
 
-                # get the next k
-                k, upper_half_circle = self._find_next_k(
-                    powers[-1],
-                    upper_half_circle,
-                    theta_intervals[-1],  # type: ignore
-                    min_ratio=self._min_ratio,
-                )
+                    # store the variables
+                    state.powers.append(k)
+                    state.ratios.append((2 * state.powers[-1] + 1) / (2 * state.powers[-2] + 1))
 
-                # store the variables
-                powers.append(k)
-                ratios.append((2 * powers[-1] + 1) / (2 * powers[-2] + 1))
+                    circuits.append(
+                        self.construct_circuit(estimation_problems[i], k, measurement=True)
+                    )
 
-                # run measurements for Q^k A|0> circuit
-                circuit = self.construct_circuit(estimation_problem, k, measurement=True)
-                ret = self._quantum_instance.execute(circuit)
+                # run measurements for the Q^k A|0> circuits of all active problems
+                ret = _execute_batch(self._quantum_instance, circuits)
+
+                for j, (i, circuit) in enumerate(zip(active, circuits)):
+                    self._update_state(
+                        states[i],
+                        estimation_problems[i],
+                        circuit,
+                        ret.get_counts(j),
+                        shots,
+                        max_rounds,
+                    )
 
-                # get the counts and store them
-                counts = ret.get_counts(circuit)
+                active = [i for i in active if not self._has_converged(states[i])]
 
-                # calculate the probability of measuring '1', 'prob' is a_i in the paper
-                num_qubits = circuit.num_qubits - circuit.num_ancillas
-                # type: ignore
-                one_counts, prob = self._good_state_probability(
-                    estimation_problem, counts, num_qubits
-                )
-
-                num_one_shots.append(one_counts)
-
-                # track number of Q-oracle calls
-                num_oracle_queries += shots * k
-
-                # if on the previous iterations we have K_{i-1} == K_i, we sum these samples up
-                j = 1  # number of times we stayed fixed at the same K
-                round_shots = shots
-                round_one_counts = one_counts
-                if num_iterations > 1:
-                    while (
-                        powers[num_iterations - j] == powers[num_iterations]
-                        and num_iterations >= j + 1
-                    ):
-                        j = j + 1
-                        round_shots += shots
-                        round_one_counts += num_one_shots[-j]
-
-                # compute a_min_i, a_max_i
-                if self._confint_method == "chernoff":
-                    a_i_min, a_i_max = _chernoff_confint(prob, round_shots, max_rounds, self._alpha)
-                else:  # 'beta'
-                    a_i_min, a_i_max = _clopper_pearson_confint(
-                        round_one_counts, round_shots, self._alpha / max_rounds
-                    )
+        return [
+            self._build_result(estimation_problem, state)
+            for estimation_problem, state in zip(estimation_problems, states)
+        ]
 
-                # compute theta_min_i, theta_max_i
-                if upper_half_circle:
-                    theta_min_i = np.arccos(1 - 2 * a_i_min) / 2 / np.pi
-                    theta_max_i = np.arccos(1 - 2 * a_i_max) / 2 / np.pi
-                else:
-                    theta_min_i = 1 - np.arccos(1 - 2 * a_i_max) / 2 / np.pi
-                    theta_max_i = 1 - np.arccos(1 - 2 * a_i_min) / 2 / np.pi
-
-                # compute theta_u, theta_l of this iteration
-                scaling = 4 * k + 2  # current K_i factor
-                theta_u = (int(scaling * theta_intervals[-1][1]) + theta_max_i) / scaling
-                theta_l = (int(scaling * theta_intervals[-1][0]) + theta_min_i) / scaling
-                theta_intervals.append([theta_l, theta_u])
-
-                # compute a_u_i, a_l_i
-                a_u = np.sin(2 * np.pi * theta_u) ** 2
-                a_l = np.sin(2 * np.pi * theta_l) ** 2
-                a_u = cast(float, a_u)
-                a_l = cast(float, a_l)
-                a_intervals.append([a_l, a_u])
+    def _has_converged(self, state: "_IterationState") -> bool:
+        """Check if the confidence interval of the angle of a problem is narrow enough."""
+        theta_interval = state.theta_intervals[-1]
+        return theta_interval[1] - theta_interval[0] <= self._epsilon / np.pi
 
+    def _update_state(
+        self,
+        state: "_IterationState",
+        estimation_problem: EstimationProblem,
+        circuit: QuantumCircuit,
+        counts: Dict[str, int],
+        shots: int,
+        max_rounds: int,
+    ) -> None:
+        """Update the intervals of a problem with the counts of its circuit of this round."""
+        k = state.powers[-1]
+        num_iterations = len(state.powers) - 1  # the number of rounds, including this one
+
+        # calculate the probability of measuring '1', 'prob' is a_i in the paper
+        num_qubits = circuit.num_qubits - circuit.num_ancillas
+        # type: ignore
+        one_counts, prob = self._good_state_probability(estimation_problem, counts, num_qubits)
+
+        state.num_one_shots.append(one_counts)
+
+        # track number of Q-oracle calls
+        state.num_oracle_queries += shots * k
+
+        # if on the previous iterations we have K_{i-1} == K_i, we sum these samples up
+        j = 1  # number of times we stayed fixed at the same K
+        round_shots = shots
+        round_one_counts = one_counts
+        if num_iterations > 1:
+            while (
+                state.powers[num_iterations - j] == state.powers[num_iterations]
+                and num_iterations >= j + 1
+            ):
+                j = j + 1
+                round_shots += shots
+                round_one_counts += state.num_one_shots[-j]
+
+        # compute a_min_i, a_max_i
+        if self._confint_method == "chernoff":
+            a_i_min, a_i_max = _chernoff_confint(prob, round_shots, max_rounds, self._alpha)
+        else:  # 'beta'
+            a_i_min, a_i_max = _clopper_pearson_confint(
+                round_one_counts, round_shots, self._alpha / max_rounds
+            )
+
+        # compute theta_min_i, theta_max_i
+        if state.upper_half_circle:
+            theta_min_i = np.arccos(1 - 2 * a_i_min) / 2 / np.pi
+            theta_max_i = np.arccos(1 - 2 * a_i_max) / 2 / np.pi
+        else:
+            theta_min_i = 1 - np.arccos(1 - 2 * a_i_max) / 2 / np.pi
+            theta_max_i = 1 - np.arccos(1 - 2 * a_i_min) / 2 / np.pi
+
+        # compute theta_u, theta_l of this iteration
+        scaling = 4 * k + 2  # current K_i factor
+        theta_u = (int(scaling * state.theta_intervals[-1][1]) + theta_max_i) / scaling
+        theta_l = (int(scaling * state.theta_intervals[-1][0]) + theta_min_i) / scaling
+        state.theta_intervals.append([theta_l, theta_u])
+
+        # compute a_u_i, a_l_i
+        a_u = np.sin(2 * np.pi * theta_u) ** 2
+        a_l = np.sin(2 * np.pi * theta_l) ** 2
+        a_u = cast(float, a_u)
+        a_l = cast(float, a_l)
+        state.a_intervals.append([a_l, a_u])
+
+    def _build_result(
+        self, estimation_problem: EstimationProblem, state: "_IterationState"
+    ) -> "IterativeAmplitudeEstimationResult":
+        """Construct the result of a problem from its final intervals."""
         # get the latest confidence interval for the estimate of a
-        confidence_interval = tuple(a_intervals[-1])
+        confidence_interval = tuple(state.a_intervals[-1])
 
         # the final estimate is the mean of the confidence interval
         estimation = np.mean(confidence_interval)
@@ -410,7 +469,7 @@ class IterativeAmplitudeEstimation(AmplitudeEstimator):
         result = IterativeAmplitudeEstimationResult()
         result.alpha = self._alpha
         result.post_processing = estimation_problem.post_processing
-        result.num_oracle_queries = num_oracle_queries
+        result.num_oracle_queries = state.num_oracle_queries
 
         result.estimation = estimation
         result.epsilon_estimated = (confidence_interval[1] - confidence_interval[0]) / 2
@@ -422,14 +481,28 @@ class IterativeAmplitudeEstimation(AmplitudeEstimator):
         )
         result.confidence_interval_processed = confidence_interval
         result.epsilon_estimated_processed = (confidence_interval[1] - confidence_interval[0]) / 2
-        result.estimate_intervals = a_intervals
-        result.theta_intervals = theta_intervals
-        result.powers = powers
-        result.ratios = ratios
+        result.estimate_intervals = state.a_intervals
+        result.theta_intervals = state.theta_intervals
+        result.powers = state.powers
+        result.ratios = state.ratios
 
         return result
 
 
+class _IterationState:
+    """The intervals and powers of one problem in the course of the iterations."""
+
+    def __init__(self) -> None:
+        self.powers = [0]  # list of powers k: Q^k, (called 'k' in paper)
+        self.ratios = []  # list of multiplication factors (called 'q' in paper)
+        self.theta_intervals = [[0, 1 / 4]]  # a priori knowledge of theta / 2 / pi
+        # a priori knowledge of the confidence interval of the estimate
+        self.a_intervals = [[0.0, 1.0]]
+        self.num_oracle_queries = 0
+        self.num_one_shots = []
+        self.upper_half_circle = True  # initially theta is in the upper half-circle
+
+
 class IterativeAmplitudeEstimationResult(AmplitudeEstimatorResult):
     """The ``IterativeAmplitudeEstimation`` result object."""
 
@@ -537,8 +610,8 @@ class IterativeAmplitudeEstimationResult(AmplitudeEstimatorResult):
 
 
 def _chernoff_confint(
-    value: float, shots: int, max_rounds: int, alpha: float
-) -> Tuple[float, float]:
+    value: Union[float, np.ndarray], shots: int, max_rounds: int, alpha: float
+) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
     """Compute the Chernoff confidence interval for `shots` i.i.d. Bernoulli trials.
 
     The confidence interval is
@@ -548,13 +621,13 @@ def _chernoff_confint(
     but at most [0, 1].
 
     Args:
-        value: The current estimate.
+        value: The current estimate, or an array of estimates.
         shots: The number of shots.
         max_rounds: The maximum number of rounds, used to compute epsilon_a.
         alpha: The confidence level, used to compute epsilon_a.
 
     Returns:
-        The Chernoff confidence interval.
+        The Chernoff confidence interval, or the arrays of lower and upper bounds.
     """
     eps = np.sqrt(3 * np.log(2 * max_rounds / alpha) / shots)
     lower = np.maximum(0, value - eps)
@@ -562,25 +635,27 @@ def _chernoff_confint(
     return lower, upper
 
 
-def _clopper_pearson_confint(counts: int, shots: int, alpha: float) -> Tuple[float, float]:
+def _clopper_pearson_confint(
+    counts: Union[int, np.ndarray], shots: Union[int, np.ndarray], alpha: float
+) -> Tuple[Union[float, np.ndarray], Union[float, np.ndarray]]:
     """Compute the Clopper-Pearson confidence interval for `shots` i.i.d. Bernoulli trials.
 
     Args:
-        counts: The number of positive counts.
-        shots: The number of shots.
+        counts: The number of positive counts, or an array of them.
+        shots: The number of shots, or an array of them.
         alpha: The confidence level for the confidence interval.
 
     Returns:
-        The Clopper-Pearson confidence interval.
+        The Clopper-Pearson confidence interval, or the arrays of lower and upper bounds.
     """
-    lower, upper = 0, 1
+    counts, shots = np.asarray(counts), np.asarray(shots)
 
-    # if counts == 0, the beta quantile returns nan
-    if counts != 0:
-        lower = beta.ppf(alpha / 2, counts, shots - counts + 1)
+    # if counts == 0 or counts == shots, the beta quantiles return nan
+    with np.errstate(invalid="ignore"):
+        lower = np.where(counts != 0, beta.ppf(alpha / 2, counts, shots - counts + 1), 0)
+        upper = np.where(counts != shots, beta.ppf(1 - alpha / 2, counts + 1, shots - counts), 1)
 
-    # if counts == shots, the beta quantile returns nan
-    if counts != shots:
-        upper = beta.ppf(1 - alpha / 2, counts + 1, shots - counts)
+    if lower.ndim == 0:
+        return lower[()], upper[()]
 
     return lower, upper
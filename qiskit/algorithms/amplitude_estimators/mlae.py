@@ -14,7 +14,7 @@
 
 from typing import Optional, List, Union, Tuple, Dict, Callable
 import numpy as np
-from scipy.optimize import brute
+from scipy.optimize import fmin
 from scipy.stats import norm, chi2
 
 from qiskit.providers import BaseBackend
@@ -22,7 +22,7 @@ from qiskit.providers import Backend
 from qiskit import ClassicalRegister, QuantumRegister, QuantumCircuit
 from qiskit.utils import QuantumInstance
 
-from .amplitude_estimator import AmplitudeEstimator, AmplitudeEstimatorResult
+from .amplitude_estimator import AmplitudeEstimator, AmplitudeEstimatorResult, _execute_batch
 from .estimation_problem import EstimationProblem
 from ..exceptions import AlgorithmError
 
@@ -62,9 +62,11 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimator):
                 `[id, Q^2^0, ..., Q^2^(evaluation_schedule-1)]`.
             minimizer: A minimizer used to find the minimum of the likelihood function.
                 Defaults to a brute search where the number of evaluation points is determined
-                according to ``evaluation_schedule``. The minimizer takes a function as first
-                argument and a list of (float, float) tuples (as bounds) as second argument and
-                returns a single float which is the found minimum.
+                according to ``evaluation_schedule``, and all points are evaluated at once.
+                The minimizer takes a function as first argument and a list of (float, float)
+                tuples (as bounds) as second argument and returns a single float which is the
+                found minimum. The function accepts a single float or an array of floats, at
+                which it is evaluated at once.
             quantum_instance: Quantum Instance or Backend
 
         Raises:
@@ -93,7 +95,10 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimator):
             nevals = max(10000, int(np.pi / 2 * 1000 * 2 * self._evaluation_schedule[-1]))
 
             def default_minimizer(objective_fn, bounds):
-                return brute(objective_fn, bounds, Ns=nevals)[0]
+                # evaluate the whole grid at once and polish the best point, like ``brute``
+                grid = np.linspace(bounds[0][0], bounds[0][1], nevals)
+                best = grid[np.argmin(objective_fn(grid))]
+                return fmin(lambda x: objective_fn(x[0]), [best], disp=False)[0]
 
             self._minimizer = default_minimizer
         else:
@@ -245,13 +250,7 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimator):
         search_range = [0 + eps, np.pi / 2 - eps]
 
         def loglikelihood(theta):
-            # loglik contains the first `it` terms of the full loglikelihood
-            loglik = 0
-            for i, k in enumerate(self._evaluation_schedule):
-                angle = (2 * k + 1) * theta
-                loglik += np.log(np.sin(angle) ** 2) * good_counts[i]
-                loglik += np.log(np.cos(angle) ** 2) * (all_counts[i] - good_counts[i])
-            return -loglik
+            return -_loglikelihood(theta, self._evaluation_schedule, good_counts, all_counts)
 
         est_theta = self._minimizer(loglikelihood, [search_range])
 
@@ -262,66 +261,100 @@ class MaximumLikelihoodAmplitudeEstimation(AmplitudeEstimator):
     def estimate(
         self, estimation_problem: EstimationProblem
     ) -> "MaximumLikelihoodAmplitudeEstimationResult":
-        if estimation_problem.state_preparation is None:
-            raise AlgorithmError(
-                "Either the state_preparation variable or the a_factory "
-                "(deprecated) must be set to run the algorithm."
-            )
-
-        result = MaximumLikelihoodAmplitudeEstimationResult()
-        result.evaluation_schedule = self._evaluation_schedule
-        result.minimizer = self._minimizer
-        result.post_processing = estimation_problem.post_processing
-
-        if self._quantum_instance.is_statevector:
-            # run circuit on statevector simulator
-            circuits = self.construct_circuits(estimation_problem, measurement=False)
-            ret = self._quantum_instance.execute(circuits)
+        return self.estimate_batch([estimation_problem])[0]
 
-            # get statevectors and construct MLE input
-            statevectors = [np.asarray(ret.get_statevector(circuit)) for circuit in circuits]
-            result.circuit_results = statevectors
+    def estimate_batch(
+        self, estimation_problems: List[EstimationProblem]
+    ) -> List["MaximumLikelihoodAmplitudeEstimationResult"]:
+        """Run the algorithm on several estimation problems at once.
 
-            # to count the number of Q-oracle calls (don't count shots)
-            result.shots = 1
+        The circuits of all problems are executed together, in as few jobs as the maximum number
+        of experiments per job of the backend allows.
 
-        else:
-            # run circuit on QASM simulator
-            circuits = self.construct_circuits(estimation_problem, measurement=True)
-            ret = self._quantum_instance.execute(circuits)
+        Args:
+            estimation_problems: The estimation problems.
 
-            # get counts and construct MLE input
-            result.circuit_results = [ret.get_counts(circuit) for circuit in circuits]
+        Returns:
+            A maximum likelihood amplitude estimation result for each of the problems.
 
-            # to count the number of Q-oracle calls
-            result.shots = self._quantum_instance._run_config.shots
+        Raises:
+            AlgorithmError: If the state preparation of one of the problems is not set.
+        """
+        for estimation_problem in estimation_problems:
+            if estimation_problem.state_preparation is None:
+                raise AlgorithmError(
+                    "Either the state_preparation variable or the a_factory "
+                    "(deprecated) must be set to run the algorithm."
+                )
 
-        # run maximum likelihood estimation
-        num_state_qubits = circuits[0].num_qubits - circuits[0].num_ancillas
-        theta, good_counts = self.compute_mle(
-            result.circuit_results, estimation_problem, num_state_qubits, True
+        if len(estimation_problems) == 0:
+            return []
+
+        # run the circuits of all problems in the same jobs, on a statevector simulator without
+        # and else with measurements
+        is_statevector = self._quantum_instance.is_statevector
+        circuits_per_problem = [
+            self.construct_circuits(estimation_problem, measurement=not is_statevector)
+            for estimation_problem in estimation_problems
+        ]
+        ret = _execute_batch(
+            self._quantum_instance,
+            [circuit for circuits in circuits_per_problem for circuit in circuits],
         )
 
-        # store results
-        result.theta = theta
-        result.good_counts = good_counts
-        result.estimation = np.sin(result.theta) ** 2
+        results = []
+        offset = 0
+        for estimation_problem, circuits in zip(estimation_problems, circuits_per_problem):
+            result = MaximumLikelihoodAmplitudeEstimationResult()
+            result.evaluation_schedule = self._evaluation_schedule
+            result.minimizer = self._minimizer
+            result.post_processing = estimation_problem.post_processing
+
+            indices = range(offset, offset + len(circuits))
+            offset += len(circuits)
+            if is_statevector:
+                # get statevectors and construct MLE input
+                result.circuit_results = [np.asarray(ret.get_statevector(i)) for i in indices]
+
+                # to count the number of Q-oracle calls (don't count shots)
+                result.shots = 1
+
+            else:
+                # get counts and construct MLE input
+                result.circuit_results = [ret.get_counts(i) for i in indices]
+
+                # to count the number of Q-oracle calls
+                result.shots = self._quantum_instance._run_config.shots
+
+            # run maximum likelihood estimation
+            num_state_qubits = circuits[0].num_qubits - circuits[0].num_ancillas
+            theta, good_counts = self.compute_mle(
+                result.circuit_results, estimation_problem, num_state_qubits, True
+            )
 
-        # not sure why pylint complains, this is a callable and the tests pass
-        # pylint: disable=not-callable
-        result.estimation_processed = result.post_processing(result.estimation)
+            # store results
+            result.theta = theta
+            result.good_counts = good_counts
+            result.estimation = np.sin(result.theta) ** 2
 
-        result.fisher_information = _compute_fisher_information(result)
-        result.num_oracle_queries = result.shots * sum(k for k in result.evaluation_schedule)
+            # not sure why pylint complains, this is a callable and the tests pass
+            # pylint: disable=not-callable
+            result.estimation_processed = result.post_processing(result.estimation)
 
-        # compute and store confidence interval
-        confidence_interval = self.compute_confidence_interval(result, alpha=0.05, kind="fisher")
-        result.confidence_interval = confidence_interval
-        result.confidence_interval_processed = tuple(
-            estimation_problem.post_processing(value) for value in confidence_interval
-        )
+            result.fisher_information = _compute_fisher_information(result)
+            result.num_oracle_queries = result.shots * sum(k for k in result.evaluation_schedule)
+
+            # compute and store confidence interval
+            confidence_interval = self.compute_confidence_interval(
+                result, alpha=0.05, kind="fisher"
+            )
+            result.confidence_interval = confidence_interval
+            result.confidence_interval_processed = tuple(
+                estimation_problem.post_processing(value) for value in confidence_interval
+            )
+            results.append(result)
 
-        return result
+        return results
 
 
 class MaximumLikelihoodAmplitudeEstimationResult(AmplitudeEstimatorResult):
@@ -424,33 +457,29 @@ def _compute_fisher_information(
     theta_a = np.arcsin(np.sqrt(np.real(a)))
 
     # Get the number of hits (shots_k) and one-hits (h_k)
-    one_hits = result.good_counts
-    all_hits = [result.shots] * len(one_hits)
+    one_hits = np.asarray(result.good_counts)
+    all_hits = np.full(len(one_hits), result.shots)
 
     # Include all sum terms or just up to a certain term?
-    evaluation_schedule = result.evaluation_schedule
+    evaluation_schedule = np.asarray(result.evaluation_schedule)
     if num_sum_terms is not None:
         evaluation_schedule = evaluation_schedule[:num_sum_terms]
-        # not necessary since zip goes as far as shortest list:
-        # all_hits = all_hits[:num_sum_terms]
-        # one_hits = one_hits[:num_sum_terms]
+    num_terms = len(evaluation_schedule)
+    scaling = 2 * evaluation_schedule + 1
 
     # Compute the Fisher information
     fisher_information = None
     if observed:
         # Note, that the observed Fisher information is very unreliable in this algorithm!
-        d_loglik = 0
-        for shots_k, h_k, m_k in zip(all_hits, one_hits, evaluation_schedule):
-            tan = np.tan((2 * m_k + 1) * theta_a)
-            d_loglik += (2 * m_k + 1) * (h_k / tan + (shots_k - h_k) * tan)
+        tan = np.tan(scaling * theta_a)
+        shots_k, h_k = all_hits[:num_terms], one_hits[:num_terms]
+        d_loglik = np.sum(scaling * (h_k / tan + (shots_k - h_k) * tan))
 
         d_loglik /= np.sqrt(a * (1 - a))
         fisher_information = d_loglik ** 2 / len(all_hits)
 
     else:
-        fisher_information = sum(
-            shots_k * (2 * m_k + 1) ** 2 for shots_k, m_k in zip(all_hits, evaluation_schedule)
-        )
+        fisher_information = np.sum(all_hits[:num_terms] * scaling ** 2)
         fisher_information /= a * (1 - a)
 
     return fisher_information
@@ -508,23 +537,14 @@ def _likelihood_ratio_confint(
     if nevals is None:
         nevals = max(10000, int(np.pi / 2 * 1000 * 2 * result.evaluation_schedule[-1]))
 
-    def loglikelihood(theta, one_counts, all_counts):
-        loglik = 0
-        for i, k in enumerate(result.evaluation_schedule):
-            loglik += np.log(np.sin((2 * k + 1) * theta) ** 2) * one_counts[i]
-            loglik += np.log(np.cos((2 * k + 1) * theta) ** 2) * (all_counts[i] - one_counts[i])
-        return loglik
-
     one_counts = result.good_counts
     all_counts = [result.shots] * len(one_counts)
 
     eps = 1e-15  # to avoid invalid value in log
     thetas = np.linspace(0 + eps, np.pi / 2 - eps, nevals)
-    values = np.zeros(len(thetas))
-    for i, theta in enumerate(thetas):
-        values[i] = loglikelihood(theta, one_counts, all_counts)
+    values = _loglikelihood(thetas, result.evaluation_schedule, one_counts, all_counts)
 
-    loglik_mle = loglikelihood(result.theta, one_counts, all_counts)
+    loglik_mle = _loglikelihood(result.theta, result.evaluation_schedule, one_counts, all_counts)
     chi2_quantile = chi2.ppf(1 - alpha, df=1)
     thres = loglik_mle - chi2_quantile / 2
 
@@ -540,6 +560,30 @@ def _likelihood_ratio_confint(
     return mapped_confint
 
 
+def _loglikelihood(
+    theta: Union[float, np.ndarray],
+    evaluation_schedule: List[int],
+    good_counts: List[float],
+    all_counts: List[float],
+) -> Union[float, np.ndarray]:
+    """Compute the log-likelihood of the angle theta, or of an array of angles at once.
+
+    Args:
+        theta: The angle(s) at which to evaluate the log-likelihood.
+        evaluation_schedule: The powers of the Grover operator.
+        good_counts: The good counts per power.
+        all_counts: The total counts per power.
+
+    Returns:
+        The log-likelihood, of the shape of ``theta``.
+    """
+    angles = np.multiply.outer(theta, 2 * np.asarray(evaluation_schedule) + 1)
+    good_counts = np.asarray(good_counts)
+    bad_counts = np.asarray(all_counts) - good_counts
+    loglik = np.log(np.sin(angles) ** 2) * good_counts + np.log(np.cos(angles) ** 2) * bad_counts
+    return np.sum(loglik, axis=-1)
+
+
 def _get_counts(
     circuit_results: List[Union[np.ndarray, List[float], Dict[str, int]]],
     estimation_problem: EstimationProblem,
@@ -556,20 +600,23 @@ def _get_counts(
     one_hits = []  # h_k: how often 1 has been measured, for a power Q^(m_k)
     all_hits = []  # shots_k: how often has been measured at a power Q^(m_k)
     if all(isinstance(data, (list, np.ndarray)) for data in circuit_results):
-        probabilities = []
         num_qubits = int(np.log2(len(circuit_results[0])))  # the total number of qubits
-        for statevector in circuit_results:
-            p_k = 0.0
-            for i, amplitude in enumerate(statevector):
-                probability = np.abs(amplitude) ** 2
-                # consider only state qubits and revert bit order
-                bitstr = bin(i)[2:].zfill(num_qubits)[-num_state_qubits:][::-1]
-                objectives = [bitstr[index] for index in estimation_problem.objective_qubits]
-                if estimation_problem.is_good_state(objectives):
-                    p_k += probability
-            probabilities += [p_k]
-
-        one_hits = probabilities
+
+        # the bits of the objective qubits in each basis state, whose good states are evaluated
+        # once per distinct bit pattern, instead of once per basis state
+        objective_qubits = np.asarray(estimation_problem.objective_qubits)
+        bits = (np.arange(2 ** num_qubits)[:, np.newaxis] >> objective_qubits) & 1
+        patterns, inverse = np.unique(bits, axis=0, return_inverse=True)
+        is_good = np.array(
+            [
+                estimation_problem.is_good_state([str(bit) for bit in pattern])
+                for pattern in patterns
+            ],
+            dtype=bool,
+        )[inverse.reshape(-1)]
+
+        probabilities = np.abs(np.asarray(circuit_results)) ** 2
+        one_hits = list(np.sum(probabilities[:, is_good], axis=1))
         all_hits = np.ones_like(one_hits)
     else:
         for counts in circuit_results:
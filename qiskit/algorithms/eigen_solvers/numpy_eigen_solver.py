@@ -13,12 +13,14 @@
 """The Eigensolver algorithm."""
 
 import logging
-from typing import List, Optional, Union, Tuple, Callable
+from numbers import Number
+from typing import List, Optional, Union, Callable
 
 import numpy as np
 from scipy import sparse as scisparse
+from scipy.sparse.linalg import LinearOperator
 
-from qiskit.opflow import OperatorBase, I, StateFn, ListOp
+from qiskit.opflow import OperatorBase, I, StateFn, ListOp, PauliSumOp
 from qiskit.utils.validation import validate_min
 from .eigen_solver import Eigensolver, EigensolverResult
 from ..exceptions import AlgorithmError
@@ -39,9 +41,20 @@ class NumPyEigensolver(Eigensolver):
     Note:
         Operators are automatically converted to SciPy's ``spmatrix``
         as needed and this conversion can be costly in terms of memory and performance as the
-        operator size, mostly in terms of number of qubits it represents, gets larger.
+        operator size, mostly in terms of number of qubits it represents, gets larger. Operators
+        on 18 or more qubits are therefore passed to the iterative solver as a
+        ``LinearOperator`` (see :meth:`~qiskit.opflow.OperatorBase.to_linear_operator`), which
+        is matrix-free for sums of Paulis.
+
+        Hermitian operators are diagonalized with SciPy's ``eigsh`` (or NumPy's ``eigh`` if all
+        eigenvalues are requested), other operators with ``eigs`` respectively ``eig``. The aux
+        operators are converted only once and evaluated on all eigenstates at once.
     """
 
+    # Number of qubits from which operators are applied matrix-free through a SciPy
+    # ``LinearOperator`` instead of being converted to a sparse matrix.
+    _MATRIX_FREE_NUM_QUBITS = 18
+
     def __init__(
         self,
         k: int = 1,
@@ -112,10 +125,59 @@ class NumPyEigensolver(Eigensolver):
             else:
                 self._k = self._in_k
 
+    @staticmethod
+    def _is_hermitian(operator: OperatorBase, sp_mat: Optional[scisparse.spmatrix]) -> bool:
+        """Check if the operator is Hermitian, from its sparse matrix if it was constructed.
+
+        Without the matrix only sums of Paulis with real coefficients are known to be Hermitian.
+        """
+        if sp_mat is not None:
+            sp_mat = scisparse.csr_matrix(sp_mat)
+            if sp_mat.nnz == 0:
+                return True
+            scale = max(1.0, abs(sp_mat).max())
+            return abs(sp_mat - sp_mat.getH()).max() <= 1e-12 * scale
+        if isinstance(operator, PauliSumOp):
+            coeffs = operator.primitive.coeffs
+            if coeffs.dtype == object or not isinstance(operator.coeff, Number):
+                return False
+            return np.allclose((coeffs * operator.coeff).imag, 0.0)
+        return False
+
+    @staticmethod
+    def _real_if_possible(
+        operator: OperatorBase, sp_mat: Union[scisparse.spmatrix, LinearOperator]
+    ) -> Union[scisparse.spmatrix, LinearOperator]:
+        """Return a Hermitian matrix as a real one if its entries are real.
+
+        SciPy's ``eigsh`` only runs the symmetric Lanczos iteration for real matrices, for
+        complex ones it falls back to the solver of ``eigs``. Sums of Paulis with real
+        coefficients are real if each term has an even number of Y.
+        """
+        if isinstance(sp_mat, scisparse.spmatrix):
+            if np.any(sp_mat.data.imag):
+                return sp_mat
+            # copy, since the real part is a strided view of the complex data, which would be
+            # copied on every product
+            return sp_mat.real.copy()
+        if isinstance(operator, PauliSumOp):
+            table = operator.primitive.table
+            if not np.any(np.sum(table.X & table.Z, axis=1) % 2):
+
+                def matvec(vec):
+                    return (sp_mat @ vec).real
+
+                return LinearOperator(sp_mat.shape, matvec=matvec, matmat=matvec, dtype=float)
+        return sp_mat
+
     def _solve(self, operator: OperatorBase) -> None:
-        sp_mat = operator.to_spmatrix()
+        matrix_free = (
+            operator.num_qubits >= self._MATRIX_FREE_NUM_QUBITS
+            and self._k < 2 ** operator.num_qubits - 1
+        )
+        sp_mat = None if matrix_free else operator.to_spmatrix()
         # If matrix is diagonal, the elements on the diagonal are the eigenvalues. Solve by sorting.
-        if scisparse.csr_matrix(sp_mat.diagonal()).nnz == sp_mat.nnz:
+        if sp_mat is not None and scisparse.csr_matrix(sp_mat.diagonal()).nnz == sp_mat.nnz:
             diag = sp_mat.diagonal()
             indices = np.argsort(diag)[: self._k]
             eigval = diag[indices]
@@ -123,13 +185,23 @@ class NumPyEigensolver(Eigensolver):
             for i, idx in enumerate(indices):
                 eigvec[idx, i] = 1.0
         else:
+            hermitian = self._is_hermitian(operator, sp_mat)
+            if matrix_free:
+                # Large operators are never materialized, the iterative solver only needs
+                # products of the operator with vectors.
+                sp_mat = operator.to_linear_operator()
             if self._k >= 2 ** operator.num_qubits - 1:
                 logger.debug("SciPy doesn't support to get all eigenvalues, using NumPy instead.")
-                eigval, eigvec = np.linalg.eig(operator.to_matrix())
-            else:
-                eigval, eigvec = scisparse.linalg.eigs(
-                    operator.to_spmatrix(), k=self._k, which="SR"
+                if hermitian:
+                    eigval, eigvec = np.linalg.eigh(operator.to_matrix())
+                else:
+                    eigval, eigvec = np.linalg.eig(operator.to_matrix())
+            elif hermitian:
+                eigval, eigvec = scisparse.linalg.eigsh(
+                    self._real_if_possible(operator, sp_mat), k=self._k, which="SA"
                 )
+            else:
+                eigval, eigvec = scisparse.linalg.eigs(sp_mat, k=self._k, which="SR")
             indices = np.argsort(eigval)[: self._k]
             eigval = eigval[indices]
             eigvec = eigvec[:, indices]
@@ -147,35 +219,51 @@ class NumPyEigensolver(Eigensolver):
             self._solve(operator)
 
         if aux_operators is not None:
-            aux_op_vals = []
-            for i in range(self._k):
-                aux_op_vals.append(
-                    self._eval_aux_operators(aux_operators, self._ret.eigenstates[i])
-                )
-            self._ret.aux_operator_eigenvalues = aux_op_vals
+            self._ret.aux_operator_eigenvalues = self._eval_aux_operators(
+                aux_operators, self._ret.eigenstates
+            )
 
     @staticmethod
     def _eval_aux_operators(
-        aux_operators: List[OperatorBase], wavefn, threshold: float = 1e-12
-    ) -> np.ndarray:
-        values = []  # type: List[Tuple[float, int]]
+        aux_operators: List[OperatorBase], wavefns: np.ndarray, threshold: float = 1e-12
+    ) -> List[np.ndarray]:
+        """Evaluate the aux operators on all eigenstates, the rows of ``wavefns``.
+
+        Each operator is converted once, sums of Paulis to a matrix-free ``LinearOperator`` and
+        other operators to a sparse matrix, and applied to the matrix of all eigenstates in a
+        single product.
+
+        Returns:
+            The values of the aux operators for each eigenstate.
+        """
+        # the eigenstates as columns
+        states = np.asarray(wavefns).T
+        num_states = states.shape[1]
+        expectations = []  # type: List[Optional[np.ndarray]]
         for operator in aux_operators:
             if operator is None:
-                values.append(None)
+                expectations.append(None)
+                continue
+            if operator.coeff == 0:
+                expectations.append(np.zeros(num_states))
                 continue
-            value = 0.0
-            if operator.coeff != 0:
-                mat = operator.to_spmatrix()
-                # Terra doesn't support sparse yet, so do the matmul directly if so
+            if isinstance(operator, PauliSumOp):
+                applied = operator.to_linear_operator().matmat(states)
+            else:
                 # This is necessary for the particle_hole and other chemistry tests because the
                 # pauli conversions are 2^12th large and will OOM error if not sparse.
-                if isinstance(mat, scisparse.spmatrix):
-                    value = mat.dot(wavefn).dot(np.conj(wavefn))
-                else:
-                    value = StateFn(operator, is_measurement=True).eval(wavefn)
-                value = value.real if abs(value.real) > threshold else 0.0
-            values.append((value, 0))
-        return np.array(values, dtype=object)
+                applied = operator.to_spmatrix() @ states
+            values = np.einsum("ij,ij->j", states.conj(), applied).real
+            values[np.abs(values) <= threshold] = 0.0
+            expectations.append(values)
+
+        return [
+            np.array(
+                [None if values is None else (values[i], 0) for values in expectations],
+                dtype=object,
+            )
+            for i in range(num_states)
+        ]
 
     def compute_eigenvalues(
         self, operator: OperatorBase, aux_operators: Optional[List[Optional[OperatorBase]]] = None
@@ -25,6 +25,7 @@ from qiskit.utils.quantum_instance import QuantumInstance
 from qiskit.utils.validation import validate_min
 from qiskit.circuit.library.n_local.qaoa_ansatz import QAOAAnsatz
 from qiskit.algorithms.minimum_eigen_solvers.vqe import VQE
+from qiskit.algorithms.minimum_eigen_solvers.vqe_checkpoint import VQECheckpoint
 
 
 class QAOA(VQE):
@@ -66,6 +67,8 @@ class QAOA(VQE):
         max_evals_grouped: int = 1,
         callback: Optional[Callable[[int, np.ndarray, float, float], None]] = None,
         quantum_instance: Optional[Union[QuantumInstance, BaseBackend, Backend]] = None,
+        checkpoint: Optional[VQECheckpoint] = None,
+        warm_start: bool = False,
     ) -> None:
         """
         Args:
@@ -106,6 +109,11 @@ class QAOA(VQE):
                 These are: the evaluation count, the optimizer parameters for the
                 ansatz, the evaluated mean and the evaluated standard deviation.
             quantum_instance: Quantum Instance or Backend
+            checkpoint: A checkpoint to periodically save the progress of the optimization in
+                and to resume it from, see :class:`~qiskit.algorithms.VQECheckpoint`.
+            warm_start: If ``True``, each call of :meth:`compute_minimum_eigenvalue` starts from
+                the optimal point of the previous call and reuses its transpiled measurement
+                circuits, if they are the same.
         """
         validate_min("reps", reps, 1)
 
@@ -123,6 +131,8 @@ class QAOA(VQE):
             max_evals_grouped=max_evals_grouped,
             callback=callback,
             quantum_instance=quantum_instance,
+            checkpoint=checkpoint,
+            warm_start=warm_start,
         )
 
     def _check_operator(self, operator: OperatorBase) -> OperatorBase:
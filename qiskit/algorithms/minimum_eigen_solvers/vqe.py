@@ -15,13 +15,14 @@
 See https://arxiv.org/abs/1304.3061
 """
 
-from typing import Optional, List, Callable, Union, Dict
+from typing import Any, Optional, List, Callable, Union, Dict, Tuple
+import hashlib
 import logging
 from time import time
 import numpy as np
 
 from qiskit import ClassicalRegister, QuantumCircuit
-from qiskit.circuit import Parameter
+from qiskit.circuit import ControlledGate, Gate, Instruction, Parameter
 from qiskit.circuit.library import RealAmplitudes
 from qiskit.providers import BaseBackend
 from qiskit.providers import Backend
@@ -34,6 +35,9 @@ from qiskit.opflow import (
     ListOp,
     I,
     CircuitSampler,
+    PauliSumOp,
+    CompiledExpectation,
+    OpflowError,
 )
 from qiskit.opflow.gradients import GradientBase
 from qiskit.utils.validation import validate_min
@@ -42,6 +46,7 @@ from qiskit.utils.quantum_instance import QuantumInstance
 from ..optimizers import Optimizer, SLSQP
 from ..variational_algorithm import VariationalAlgorithm, VariationalResult
 from .minimum_eigen_solver import MinimumEigensolver, MinimumEigensolverResult
+from .vqe_checkpoint import VQECheckpoint
 from ..exceptions import AlgorithmError
 
 logger = logging.getLogger(__name__)
@@ -91,6 +96,19 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
         same result. Also, the ``optimal_point`` of the result object can be used as initial
         point of another VQE run by passing it as ``initial_point`` to the initializer.
 
+    Scans over the parameters of a Hamiltonian, such as a dissociation profile, can set
+    ``warm_start`` to start each optimization from the optimal point of the previous call of
+    :meth:`compute_minimum_eigenvalue`. The transpiled measurement circuits of the previous
+    call are then reused as well, if the measurement circuits are the same, e.g. if only the
+    coefficients of the Hamiltonian changed.
+
+    Long optimizations can be saved to a :class:`~qiskit.algorithms.VQECheckpoint`, to resume
+    them after an interruption::
+
+        vqe = VQE(ansatz, SPSA(maxiter=1000), quantum_instance=backend,
+                  checkpoint=VQECheckpoint("h2.ckpt", interval=50))
+        result = vqe.compute_minimum_eigenvalue(hamiltonian)  # resumes from h2.ckpt if present
+
     """
 
     def __init__(
@@ -104,6 +122,8 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
         max_evals_grouped: int = 1,
         callback: Optional[Callable[[int, np.ndarray, float, float], None]] = None,
         quantum_instance: Optional[Union[QuantumInstance, BaseBackend, Backend]] = None,
+        checkpoint: Optional[VQECheckpoint] = None,
+        warm_start: bool = False,
     ) -> None:
         """
 
@@ -139,6 +159,11 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
                 These are: the evaluation count, the optimizer parameters for the
                 ansatz, the evaluated mean and the evaluated standard deviation.`
             quantum_instance: Quantum Instance or Backend
+            checkpoint: A checkpoint to periodically save the progress of the optimization in
+                and to resume it from, see :class:`~qiskit.algorithms.VQECheckpoint`.
+            warm_start: If ``True``, each call of :meth:`compute_minimum_eigenvalue` starts from
+                the optimal point of the previous call and reuses its transpiled measurement
+                circuits, if they are the same.
         """
         validate_min("max_evals_grouped", max_evals_grouped, 1)
         if ansatz is None:
@@ -157,6 +182,7 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
         self._user_valid_expectation = self._expectation is not None
         self._include_custom = include_custom
         self._expect_op = None
+        self._compiled_expect_op = None  # type: Optional[CompiledExpectation]
 
         super().__init__(
             ansatz=ansatz,
@@ -172,6 +198,13 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
         self._callback = callback
 
         self._eval_count = 0
+        self._checkpoint = checkpoint
+        self._warm_start = warm_start
+        self._checkpoint_eval_count = 0
+        self._history = []  # type: List[Tuple[int, np.ndarray, float]]
+        self._best = None  # type: Optional[Tuple[float, np.ndarray]]
+        self._fingerprint = None  # type: Optional[str]
+        self._optimizer_state = None  # type: Optional[Dict[str, Any]]
         logger.info(self.print_settings())
 
     def _try_set_expectation_value_from_factory(self, operator: OperatorBase) -> None:
@@ -188,6 +221,7 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
         self._expectation = exp
         self._user_valid_expectation = False
         self._expect_op = None
+        self._compiled_expect_op = None
 
     @VariationalAlgorithm.quantum_instance.setter
     def quantum_instance(
@@ -199,6 +233,27 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
         self._circuit_sampler = CircuitSampler(
             self._quantum_instance, param_qobj=is_aer_provider(self._quantum_instance.backend)
         )
+        self._compiled_expect_op = None
+
+    @property
+    def checkpoint(self) -> Optional[VQECheckpoint]:
+        """Returns the checkpoint the progress of the optimization is saved in."""
+        return self._checkpoint
+
+    @checkpoint.setter
+    def checkpoint(self, checkpoint: Optional[VQECheckpoint]) -> None:
+        """Sets the checkpoint the progress of the optimization is saved in."""
+        self._checkpoint = checkpoint
+
+    @property
+    def warm_start(self) -> bool:
+        """Returns whether an optimization starts from the optimal point of the previous one."""
+        return self._warm_start
+
+    @warm_start.setter
+    def warm_start(self, warm_start: bool) -> None:
+        """Sets whether an optimization starts from the optimal point of the previous one."""
+        self._warm_start = warm_start
 
     @property
     def expectation(self) -> ExpectationBase:
@@ -379,6 +434,7 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
     def _check_operator(self, operator: OperatorBase) -> OperatorBase:
         """set operator"""
         self._expect_op = None
+        self._compiled_expect_op = None
         self._check_operator_varform(operator)
         # Expectation was not passed by user, try to create one
         if not self._user_valid_expectation:
@@ -398,7 +454,16 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
         if operator is None:
             raise AlgorithmError("The operator was never provided.")
 
+        # the previous optimization, before checking the operator resets its compilation
+        previous_point = self._ret.optimal_point if self._warm_start else None
+        circuit_cache = None
+        if self._warm_start and self._compiled_expect_op is not None:
+            circuit_cache = self._compiled_expect_op.circuit_cache
+
         operator = self._check_operator(operator)
+        initial_point = self.initial_point
+        if previous_point is not None and len(previous_point) == self.ansatz.num_parameters:
+            initial_point = previous_point
         # We need to handle the array entries being Optional i.e. having value None
         if aux_operators:
             zero_op = I.tensorpower(operator.num_qubits) * 0.0
@@ -417,6 +482,25 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
         self._quantum_instance.circuit_summary = True
 
         self._eval_count = 0
+        self._checkpoint_eval_count = 0
+        self._history = []
+        self._best = None
+        # only a state taken by the optimization about to start marks the start of an iteration
+        self._optimizer_state = self.optimizer.get_state()
+        if self._checkpoint is not None:
+            self._fingerprint = _problem_fingerprint(operator, self.ansatz)
+        state = self._load_checkpoint()
+        if state is not None:
+            if state["circuit_cache"] is not None:
+                circuit_cache = state["circuit_cache"]
+            if not state["finished"]:
+                self._eval_count = self._checkpoint_eval_count = state["eval_count"]
+                # the loaded history is appended to, so that only new evaluations are saved
+                self._history = state["history"]
+                if state["best_point"] is not None:
+                    self._best = (state["best_value"], state["best_point"])
+                    initial_point = state["best_point"]
+                self.optimizer.set_state(state["optimizer"])
 
         # Convert the gradient operator into a callable function that is compatible with the
         # optimization routine.
@@ -429,8 +513,9 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
                 )
         if not self._expect_op:
             self._expect_op = self.construct_expectation(self._ansatz_params, operator)
+        self._compiled_expect_op = self._compile_expectation(self._expect_op, circuit_cache)
         vqresult = self.find_minimum(
-            initial_point=self.initial_point,
+            initial_point=initial_point,
             ansatz=self.ansatz,
             cost_fn=self._energy_evaluation,
             gradient_fn=self._gradient,
@@ -459,8 +544,102 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
 
         self._ret.cost_function_evals = self._eval_count
 
+        if self._checkpoint is not None:
+            self._save_checkpoint(finished=True)
+
         return self._ret
 
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Load the checkpoint, checking it was saved for the operator and the ansatz."""
+        if self._checkpoint is None:
+            return None
+        state = self._checkpoint.load()
+        if state is None:
+            return None
+        names = [param.name for param in self._ansatz_params]
+        if state["parameter_names"] != names:
+            raise AlgorithmError(
+                "The checkpoint {} was saved for the parameters {}, not the parameters {} of "
+                "the ansatz.".format(self._checkpoint.filename, state["parameter_names"], names)
+            )
+        if state["fingerprint"] != self._fingerprint:
+            raise AlgorithmError(
+                "The checkpoint {} was saved for another operator or ansatz.".format(
+                    self._checkpoint.filename
+                )
+            )
+        return state
+
+    def _save_checkpoint(
+        self, optimizer_state: Optional[Dict[str, Any]] = None, finished: bool = False
+    ) -> None:
+        """Save the progress of the optimization in the checkpoint.
+
+        Args:
+            optimizer_state: The state of the optimizer, which must have been taken after the
+                evaluations counted so far and before any other.
+            finished: Whether the optimization finished.
+        """
+        self._checkpoint_eval_count = self._eval_count
+        best_value, best_point = self._best if self._best is not None else (None, None)
+        self._checkpoint.save(
+            {
+                "parameter_names": [param.name for param in self._ansatz_params],
+                "fingerprint": self._fingerprint,
+                "eval_count": self._eval_count,
+                "best_point": best_point,
+                "best_value": best_value,
+                "history": self._history,
+                "optimizer": optimizer_state,
+                "circuit_cache": (
+                    self._compiled_expect_op.circuit_cache
+                    if self._compiled_expect_op is not None
+                    else None
+                ),
+                "finished": finished,
+            }
+        )
+
+    def _maybe_save_checkpoint(self) -> None:
+        """Save the checkpoint before an evaluation, if it is due.
+
+        The state of an optimizer like SPSA is taken at the start of each iteration. The progress
+        is only saved when a new state was taken since the previous evaluation, so that the saved
+        counters and history match the state. Optimizers without a state restart from the best
+        point, hence their progress is saved before any evaluation.
+        """
+        optimizer_state = self.optimizer.get_state()
+        if optimizer_state is not None:
+            if optimizer_state is self._optimizer_state:
+                return
+            self._optimizer_state = optimizer_state
+        if self._eval_count - self._checkpoint_eval_count >= self._checkpoint.interval:
+            self._save_checkpoint(optimizer_state)
+
+    def _compile_expectation(
+        self, expect_op: OperatorBase, circuit_cache: Optional[Tuple[Any, ...]] = None
+    ) -> Optional[CompiledExpectation]:
+        """Compile the expectation value measurement, if its structure allows it.
+
+        The compiled measurement is evaluated with a single backend call and a vectorized
+        reduction over the counts, instead of converting and evaluating the Operator tree
+        on every energy evaluation. Aer's parameterized Qobj and snapshot expectations are
+        left to the ``CircuitSampler``. The transpiled circuits of ``circuit_cache`` are reused
+        if the measurement circuits did not change.
+        """
+        if self._circuit_sampler._param_qobj:
+            return None
+        try:
+            return CompiledExpectation(
+                expect_op,
+                self._quantum_instance,
+                statevector=self._circuit_sampler._statevector,
+                circuit_cache=circuit_cache,
+            )
+        except OpflowError as ex:
+            logger.debug("Evaluating the expectation with the CircuitSampler: %s", ex)
+            return None
+
     def _energy_evaluation(
         self, parameters: Union[List[float], np.ndarray]
     ) -> Union[float, List[float]]:
@@ -483,17 +662,33 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
             raise RuntimeError("The ansatz cannot have 0 parameters.")
 
         parameter_sets = np.reshape(parameters, (-1, num_parameters))
+        if self._checkpoint is not None:
+            self._maybe_save_checkpoint()
+
         # Create dict associating each parameter with the lists of parameterization values for it
         param_bindings = dict(
             zip(self._ansatz_params, parameter_sets.transpose().tolist())
         )  # type: Dict
 
         start_time = time()
-        sampled_expect_op = self._circuit_sampler.convert(self._expect_op, params=param_bindings)
-        means = np.real(sampled_expect_op.eval())
+        if self._compiled_expect_op is not None:
+            if self._callback is not None:
+                means, variance = self._compiled_expect_op.evaluate(
+                    param_bindings, compute_variance=True
+                )
+                variance = np.real(variance)
+            else:
+                means = self._compiled_expect_op.evaluate(param_bindings)
+            means = np.real(means)
+        else:
+            sampled_expect_op = self._circuit_sampler.convert(
+                self._expect_op, params=param_bindings
+            )
+            means = np.real(sampled_expect_op.eval())
+            if self._callback is not None:
+                variance = np.real(self._expectation.compute_variance(sampled_expect_op))
 
         if self._callback is not None:
-            variance = np.real(self._expectation.compute_variance(sampled_expect_op))
             estimator_error = np.sqrt(variance / self.quantum_instance.run_config.shots)
             for i, param_set in enumerate(parameter_sets):
                 self._eval_count += 1
@@ -501,6 +696,14 @@ class VQE(VariationalAlgorithm, MinimumEigensolver):
         else:
             self._eval_count += len(means)
 
+        if self._checkpoint is not None:
+            first_count = self._eval_count - len(means) + 1
+            for i, param_set in enumerate(parameter_sets):
+                point = np.array(param_set)
+                self._history.append((first_count + i, point, means[i]))
+                if self._best is None or means[i] < self._best[0]:
+                    self._best = (means[i], point)
+
         end_time = time()
         logger.info(
             "Energy evaluation returned %s - %.5f (ms), eval count: %s",
@@ -578,3 +781,41 @@ class VQEResult(VariationalResult, MinimumEigensolverResult):
     def cost_function_evals(self, value: int) -> None:
         """Sets number of cost function evaluations"""
         self._cost_function_evals = value
+
+
+def _problem_fingerprint(operator: OperatorBase, ansatz: QuantumCircuit) -> str:
+    """Return a digest identifying the operator and the ansatz of an optimization.
+
+    The digest is the same in every process, unlike the hashes of the objects.
+    """
+    digest = hashlib.sha256()
+
+    def update(value):
+        digest.update(repr(value).encode())
+
+    def param_key(param):
+        if isinstance(param, np.ndarray):
+            return (param.shape, param.tobytes())
+        return str(param)
+
+    def update_circuit(circuit):
+        update((circuit.num_qubits, str(circuit.global_phase)))
+        qubit_indices = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+        for inst, qargs, _ in circuit.data:
+            update(
+                (
+                    inst.name,
+                    [param_key(param) for param in inst.params],
+                    [qubit_indices[qubit] for qubit in qargs],
+                )
+            )
+            # the definition of custom instructions is not determined by their name
+            if type(inst) in (Instruction, Gate, ControlledGate) and inst.definition is not None:
+                update_circuit(inst.definition)
+
+    if isinstance(operator, PauliSumOp):
+        update((operator.primitive.to_list(), str(operator.coeff)))
+    else:
+        update(str(operator))
+    update_circuit(ansatz)
+    return digest.hexdigest()
@@ -0,0 +1,160 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Checkpoints of a VQE optimization """
+
+from typing import Any, Dict, List, Optional
+import logging
+import os
+import pickle
+import tempfile
+
+from qiskit.utils.validation import validate_min
+
+logger = logging.getLogger(__name__)
+
+
+class VQECheckpoint:
+    """A file the progress of a :class:`~qiskit.algorithms.VQE` optimization is saved in.
+
+    A VQE, or QAOA, given a checkpoint saves its progress every ``interval`` energy evaluations
+    and once the optimization finished. The checkpoint holds the best point and energy found so
+    far, the history of the evaluated points and energies, the state of the optimizer as
+    returned by :meth:`~qiskit.algorithms.optimizers.Optimizer.get_state`, e.g. the iterate and
+    the calibration of :class:`~qiskit.algorithms.optimizers.SPSA`, the transpiled measurement
+    circuits of the ansatz and a fingerprint of the operator and the ansatz. For an optimizer
+    with a state, the progress is saved at the start of an iteration, when the state was taken.
+
+    If the file exists when the optimization starts, for example after the previous run was
+    interrupted, the VQE resumes from it, provided it was saved for the same operator and ansatz.
+    An optimizer with a state, like SPSA, continues exactly where it stopped, other optimizers
+    restart from the best point of the checkpoint. The transpiled circuits are reused if the
+    measurement circuits did not change. Delete the files with :meth:`remove` to start anew.
+
+    The history is appended to a second file, named like the checkpoint with the suffix
+    ``.history``, so that every save only writes the evaluations since the previous one. The
+    checkpoint file is written atomically after the history, so an interruption while saving
+    leaves the previous checkpoint intact.
+    """
+
+    def __init__(self, filename: str, interval: int = 10) -> None:
+        """
+        Args:
+            filename: The file to save the checkpoint in.
+            interval: The number of energy evaluations between two saves.
+        """
+        validate_min("interval", interval, 1)
+        self._filename = filename
+        self._interval = interval
+        # the history last loaded or saved, and its number of entries and size in the file
+        self._history = None  # type: Optional[List[Any]]
+        self._history_length = 0
+        self._history_size = 0
+
+    @property
+    def filename(self) -> str:
+        """Returns the file the checkpoint is saved in."""
+        return self._filename
+
+    @property
+    def history_filename(self) -> str:
+        """Returns the file the history of the evaluations is saved in."""
+        return self._filename + ".history"
+
+    @property
+    def interval(self) -> int:
+        """Returns the number of energy evaluations between two saves."""
+        return self._interval
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Load the checkpoint.
+
+        Returns:
+            The saved state of the optimization, or None if there is no checkpoint yet.
+        """
+        self._history = None
+        try:
+            with open(self._filename, "rb") as file:
+                state = pickle.load(file)
+        except FileNotFoundError:
+            return None
+
+        history = []
+        self._history_size = 0
+        try:
+            with open(self.history_filename, "rb") as file:
+                # entries appended after the checkpoint was written are ignored
+                while len(history) < state["history_length"]:
+                    history.append(pickle.load(file))
+                    self._history_size = file.tell()
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            pass
+        if len(history) < state["history_length"]:
+            logger.warning(
+                "The history of %s holds only %s of %s evaluations.",
+                self._filename,
+                len(history),
+                state["history_length"],
+            )
+        state["history"] = self._history = history
+        self._history_length = len(history)
+        logger.info(
+            "Loaded the checkpoint of %s energy evaluations from %s.",
+            state["eval_count"],
+            self._filename,
+        )
+        return state
+
+    def save(self, state: Dict[str, Any]) -> None:
+        """Atomically replace the checkpoint.
+
+        Args:
+            state: The state of the optimization, which must be picklable. Its ``history`` entry
+                is the list of evaluations. If it is the list saved before, or returned by
+                :meth:`load`, it must only have been appended to and only the new entries are
+                written, otherwise the history file is written anew.
+        """
+        history = state["history"]
+        if history is not self._history or len(history) < self._history_length:
+            self._history = history
+            self._history_length = self._history_size = 0
+        handle = os.open(self.history_filename, os.O_RDWR | os.O_CREAT, 0o666)
+        with os.fdopen(handle, "r+b") as file:
+            file.seek(self._history_size)
+            file.truncate()
+            for entry in history[self._history_length :]:
+                pickle.dump(entry, file)
+            self._history_size = file.tell()
+        self._history_length = len(history)
+
+        state = {key: value for key, value in state.items() if key != "history"}
+        state["history_length"] = self._history_length
+        directory = os.path.dirname(os.path.abspath(self._filename))
+        handle, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                pickle.dump(state, file)
+            os.replace(tmp_path, self._filename)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        logger.debug("Saved a checkpoint after %s energy evaluations.", state["eval_count"])
+
+    def remove(self) -> None:
+        """Delete the checkpoint and history files, if they exist."""
+        self._history = None
+        for filename in [self._filename, self.history_filename]:
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                pass
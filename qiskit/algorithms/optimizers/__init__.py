@@ -37,6 +37,24 @@ Optimizer Base Class
    OptimizerSupportLevel
    Optimizer
 
+Parallel Evaluation
+===================
+Independent objective function evaluations, such as the points of finite difference gradients,
+the perturbations of :class:`SPSA` or the runs of a multi-start optimization, can be distributed
+over a shared pool of workers.
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   WorkerPool
+   MultiStartOptimizer
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   evaluate_points
+
 Local Optimizers
 ================
 
@@ -98,6 +116,8 @@ The global optimizers are as follows:
 """
 
 from .optimizer import OptimizerSupportLevel, Optimizer
+from .parallel import WorkerPool, evaluate_points
+from .multi_start import MultiStartOptimizer
 from .adam_amsgrad import ADAM
 from .cg import CG
 from .cobyla import COBYLA
@@ -123,6 +143,9 @@ from .imfil import IMFIL
 __all__ = [
     "Optimizer",
     "OptimizerSupportLevel",
+    "WorkerPool",
+    "evaluate_points",
+    "MultiStartOptimizer",
     "ADAM",
     "AQGD",
     "CG",
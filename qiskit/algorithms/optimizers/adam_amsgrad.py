@@ -254,7 +254,8 @@ class ADAM(Optimizer):
             initial_point = algorithm_globals.random.random(num_vars)
         if gradient_function is None:
             gradient_function = Optimizer.wrap_function(
-                Optimizer.gradient_num_diff, (objective_function, self._eps)
+                Optimizer.gradient_num_diff,
+                (objective_function, self._eps, self._max_evals_grouped, self._worker_pool),
             )
 
         point, value, nfev = self.minimize(objective_function, initial_point, gradient_function)
@@ -96,10 +96,13 @@ class L_BFGS_B(Optimizer):  # pylint: disable=invalid-name
             num_vars, objective_function, gradient_function, variable_bounds, initial_point
         )
 
-        if gradient_function is None and self._max_evals_grouped > 1:
+        if gradient_function is None and (
+            self._max_evals_grouped > 1 or self._worker_pool is not None
+        ):
             epsilon = self._options["epsilon"]
             gradient_function = Optimizer.wrap_function(
-                Optimizer.gradient_num_diff, (objective_function, epsilon, self._max_evals_grouped)
+                Optimizer.gradient_num_diff,
+                (objective_function, epsilon, self._max_evals_grouped, self._worker_pool),
             )
 
         approx_grad = bool(gradient_function is None)
@@ -0,0 +1,181 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Multi-start optimization."""
+
+from typing import Callable, List, Optional, Tuple
+import copy
+import logging
+
+import numpy as np
+
+from qiskit.utils import algorithm_globals
+from qiskit.utils.validation import validate_min
+from .optimizer import Optimizer, OptimizerSupportLevel
+from .parallel import WorkerPool
+
+logger = logging.getLogger(__name__)
+
+
+class MultiStartOptimizer(Optimizer):
+    r"""
+    Multi-start optimizer.
+
+    Runs an optimizer from several starting points and returns the best of the results. Starting from several points can help local optimizers, such as :class:`COBYLA` or
+    :class:`NELDER_MEAD`, to avoid getting stuck at local optima.
+
+    The first run starts at the given initial point, the others at points drawn uniformly
+    from the variable bounds, where a missing bound is replaced by :math:`\pm 2\pi`. All
+    starting points are drawn from ``algorithm_globals.random`` before any run starts and
+    ties are resolved in favor of the earlier run, so the result does not depend on the
+    order in which the runs finish.
+
+    The runs are made one after another, unless a worker pool is set with
+    :meth:`set_worker_pool`, in which case they run concurrently on its threads and the
+    objective and gradient functions must be safe to call concurrently. Each run uses a
+    shallow copy of the wrapped optimizer.
+
+    .. code-block:: python
+
+        from qiskit.algorithms.optimizers import COBYLA, MultiStartOptimizer
+
+        optimizer = MultiStartOptimizer(COBYLA(maxiter=200), num_starts=4)
+        point, value, nfev = optimizer.optimize(num_vars, objective, initial_point=x0)
+    """
+
+    def __init__(self, optimizer: Optimizer, num_starts: int = 2) -> None:
+        """
+        Args:
+            optimizer: The optimizer to run from each starting point.
+            num_starts: The number of runs, has a min. value of 1.
+        """
+        validate_min("num_starts", num_starts, 1)
+        self._optimizer = optimizer
+        super().__init__()
+        self._num_starts = num_starts
+
+    @property
+    def optimizer(self) -> Optimizer:
+        """Returns the optimizer run from each starting point."""
+        return self._optimizer
+
+    @property
+    def num_starts(self) -> int:
+        """Returns the number of runs."""
+        return self._num_starts
+
+    def get_support_level(self):
+        """Return support level dictionary"""
+        return {
+            "gradient": self._optimizer.gradient_support_level,
+            "bounds": self._optimizer.bounds_support_level,
+            "initial_point": OptimizerSupportLevel.supported,
+        }
+
+    def set_max_evals_grouped(self, limit):
+        super().set_max_evals_grouped(limit)
+        self._optimizer.set_max_evals_grouped(limit)
+
+    def optimize(
+        self,
+        num_vars,
+        objective_function,
+        gradient_function=None,
+        variable_bounds=None,
+        initial_point=None,
+    ):
+        super().optimize(
+            num_vars, objective_function, gradient_function, variable_bounds, initial_point
+        )
+
+        starting_points = random_starting_points(
+            num_vars, variable_bounds, self._num_starts - (initial_point is not None)
+        )
+        if initial_point is not None:
+            starting_points.insert(0, np.asarray(initial_point))
+
+        def optimize_from(point):
+            optimizer = copy.copy(self._optimizer)
+            return optimizer.optimize(
+                num_vars, objective_function, gradient_function, variable_bounds, point
+            )
+
+        return multi_start(optimize_from, starting_points, self._worker_pool)
+
+
+def random_starting_points(
+    num_vars: int, variable_bounds: Optional[List[Tuple[float, float]]], num_points: int
+) -> List[np.ndarray]:
+    """Draw starting points uniformly from the variable bounds.
+
+    Missing bounds are replaced by :math:`\\pm 2\\pi`. The points are drawn one after another from
+    ``algorithm_globals.random``.
+
+    Args:
+        num_vars: The number of parameters.
+        variable_bounds: The pairs of (lower, upper) bounds, or ``None`` if unbounded.
+        num_points: The number of points to draw.
+
+    Returns:
+        The starting points.
+    """
+    threshold = 2 * np.pi
+    if variable_bounds is None:
+        variable_bounds = [(-threshold, threshold)] * num_vars
+    low = [(l if l is not None else -threshold) for (l, u) in variable_bounds]
+    high = [(u if u is not None else threshold) for (l, u) in variable_bounds]
+    return [algorithm_globals.random.uniform(low, high) for _ in range(num_points)]
+
+
+def multi_start(
+    optimize: Callable[[np.ndarray], Tuple[np.ndarray, float, Optional[int]]],
+    starting_points: List[np.ndarray],
+    worker_pool: Optional[WorkerPool] = None,
+) -> Tuple[np.ndarray, float, Optional[int]]:
+    """Optimize from each starting point and return the best result.
+
+    Args:
+        optimize: Runs the optimization from the given starting point and returns the tuple
+            (point, value, nfev).
+        starting_points: The starting points.
+        worker_pool: The pool to run the optimizations concurrently on.
+
+    Returns:
+        The point and value of the run with the lowest value, the first of them on ties, and the
+        number of function evaluations of all runs, or ``None`` if no run reported it.
+    """
+    if worker_pool is None:
+        results = [optimize(point) for point in starting_points]
+    else:
+        results = worker_pool.map(optimize, starting_points)
+    return best_result(results)
+
+
+def best_result(
+    results: List[Tuple[np.ndarray, float, Optional[int]]]
+) -> Tuple[np.ndarray, float, Optional[int]]:
+    """Return the best of the results of several optimization runs.
+
+    Args:
+        results: The tuples (point, value, nfev) of the runs, in the order they were started.
+
+    Returns:
+        The point and value of the run with the lowest value, the first of them on ties, and the
+        number of function evaluations of all runs, or ``None`` if no run reported it.
+    """
+    best = min(range(len(results)), key=lambda i: results[i][1])
+    sol, opt, _ = results[best]
+    logger.debug("Run %s of %s has the lowest value %s", best, len(results), opt)
+
+    nfevs = [nfev for _, _, nfev in results if nfev is not None]
+    nfev = sum(nfevs) if nfevs else None
+    return sol, opt, nfev
@@ -15,8 +15,12 @@
 from enum import IntEnum
 import logging
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
 import numpy as np
 
+from .parallel import WorkerPool, evaluate_points
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,6 +49,7 @@ class Optimizer(ABC):
         self._initial_point_support_level = self.get_support_level()["initial_point"]
         self._options = {}
         self._max_evals_grouped = 1
+        self._worker_pool = None
 
     @abstractmethod
     def get_support_level(self):
@@ -69,7 +74,7 @@ class Optimizer(ABC):
 
     # pylint: disable=invalid-name
     @staticmethod
-    def gradient_num_diff(x_center, f, epsilon, max_evals_grouped=1):
+    def gradient_num_diff(x_center, f, epsilon, max_evals_grouped=1, worker_pool=None):
         """
         We compute the gradient with the numeric differentiation in the parallel way,
         around the point x_center.
@@ -79,45 +84,15 @@ class Optimizer(ABC):
             f (func): the function of which the gradient is to be computed.
             epsilon (float): the epsilon used in the numeric differentiation.
             max_evals_grouped (int): max evals grouped
+            worker_pool (WorkerPool): pool to evaluate the groups of points concurrently on
         Returns:
             grad: the gradient computed
 
         """
-        forig = f(*((x_center,)))
-        grad = []
-        ei = np.zeros((len(x_center),), float)
-        todos = []
-        for k in range(len(x_center)):
-            ei[k] = 1.0
-            d = epsilon * ei
-            todos.append(x_center + d)
-            ei[k] = 0.0
-
-        counter = 0
-        chunk = []
-        chunks = []
-        length = len(todos)
-        # split all points to chunks, where each chunk has batch_size points
-        for i in range(length):
-            x = todos[i]
-            chunk.append(x)
-            counter += 1
-            # the last one does not have to reach batch_size
-            if counter == max_evals_grouped or i == length - 1:
-                chunks.append(chunk)
-                chunk = []
-                counter = 0
-
-        for chunk in chunks:  # eval the chunks in order
-            parallel_parameters = np.concatenate(chunk)
-            todos_results = f(parallel_parameters)  # eval the points in a chunk (order preserved)
-            if isinstance(todos_results, float):
-                grad.append((todos_results - forig) / epsilon)
-            else:
-                for todor in todos_results:
-                    grad.append((todor - forig) / epsilon)
-
-        return np.array(grad)
+        x_center = np.asarray(x_center, dtype=float)
+        todos = [x_center] + [x_center + epsilon * ei for ei in np.eye(len(x_center))]
+        values = evaluate_points(f, todos, max_evals_grouped, worker_pool)
+        return (values[1:] - values[0]) / epsilon
 
     @staticmethod
     def wrap_function(function, args):
@@ -281,3 +256,30 @@ class Optimizer(ABC):
     def set_max_evals_grouped(self, limit):
         """Set max evals grouped"""
         self._max_evals_grouped = limit
+
+    @property
+    def worker_pool(self) -> Optional[WorkerPool]:
+        """Returns the pool the objective function evaluations are distributed over"""
+        return self._worker_pool
+
+    def set_worker_pool(self, worker_pool: Optional[WorkerPool]):
+        """Set the pool to evaluate independent objective function calls concurrently on,
+        e.g. the points of a finite difference gradient, or ``None`` to evaluate them serially"""
+        self._worker_pool = worker_pool
+
+    def get_state(self) -> Optional[Dict[str, Any]]:
+        """Returns the state of the running or last optimization, to resume it later.
+
+        Optimizers which can continue an interrupted optimization exactly where it stopped
+        override this method and :meth:`set_state`. The state is a dictionary of picklable
+        values. By default ``None`` is returned, and an optimization is resumed by restarting it
+        from the best point found so far.
+        """
+        return None
+
+    def set_state(self, state: Optional[Dict[str, Any]]) -> None:
+        """Resume the next optimization from a state returned by :meth:`get_state`.
+
+        Args:
+            state: The state to resume from, or ``None`` to start the next optimization anew.
+        """
@@ -20,9 +20,9 @@ import logging
 import numpy as np
 from scipy import optimize as sciopt
 
-from qiskit.utils import algorithm_globals
 from qiskit.utils.validation import validate_min
 from .optimizer import Optimizer, OptimizerSupportLevel
+from .multi_start import best_result, multi_start, random_starting_points
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +36,17 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
     machine. This allows the multiple processes to use simulation to potentially reach a minimum
     faster. The parallelization may also help the optimizer avoid getting stuck at local optima.
 
+    Besides the run from the given initial point, P-BFGS runs up to ``max_processes`` optimizations
+    from random points within the variable bounds, one fewer than the number of CPUs by default.
+    Each additional run is a forked process with its own copy of the objective function, so
+    objective functions which are not thread safe, like those of the variational algorithms, can
+    be used. Forking is not supported on Windows and on macOS with Python 3.8 or later, where
+    only the run from the initial point is made. If a :class:`WorkerPool` is set with
+    :meth:`set_worker_pool`, the runs are instead made on its worker threads, which requires the
+    objective function to be safe to call concurrently. The random starting points are drawn
+    from ``algorithm_globals.random`` before the runs start and the best run is selected
+    independently of the order in which they finish, so seeded optimizations are reproducible.
+
     Uses scipy.optimize.fmin_l_bfgs_b.
     For further detail, please refer to
     https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.fmin_l_bfgs_b.html
@@ -67,7 +78,8 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
                 details of every iteration except n-vectors; iprint = 100 print also the
                 changes of active set and final x; iprint > 100 print details of
                 every iteration including x and g.
-            max_processes: maximum number of processes allowed, has a min. value of 1 if not None.
+            max_processes: maximum number of additional runs from random starting points evaluated
+                concurrently, has a min. value of 1 if not None.
         """
         if max_processes:
             validate_min("max_processes", max_processes, 1)
@@ -99,63 +111,68 @@ class P_BFGS(Optimizer):  # pylint: disable=invalid-name
         )
         num_procs = num_procs if num_procs >= 0 else 0
 
-        if platform.system() == "Darwin":
-            # Changed in version 3.8: On macOS, the spawn start method is now the
-            # default. The fork start method should be considered unsafe as it can
-            # lead to crashes.
-            # However P_BFGS doesn't support spawn, so we revert to single process.
-            major, minor, _ = platform.python_version_tuple()
-            if major > "3" or (major == "3" and minor >= "8"):
+        if self._worker_pool is None:
+            if platform.system() == "Darwin":
+                # Changed in version 3.8: On macOS, the spawn start method is now the
+                # default. The fork start method should be considered unsafe as it can
+                # lead to crashes.
+                # However P_BFGS doesn't support spawn, so we revert to single process.
+                major, minor, _ = platform.python_version_tuple()
+                if major > "3" or (major == "3" and minor >= "8"):
+                    num_procs = 0
+                    logger.warning(
+                        "For MacOS, python >= 3.8, using only current process. "
+                        "Multiple core use not supported."
+                    )
+            elif platform.system() == "Windows":
                 num_procs = 0
                 logger.warning(
-                    "For MacOS, python >= 3.8, using only current process. "
-                    "Multiple core use not supported."
+                    "For Windows, using only current process. " "Multiple core use not supported."
                 )
-        elif platform.system() == "Windows":
-            num_procs = 0
-            logger.warning(
-                "For Windows, using only current process. " "Multiple core use not supported."
-            )
 
-        queue = multiprocessing.Queue()
         # bounds for additional initial points in case bounds has any None values
         threshold = 2 * np.pi
         if variable_bounds is None:
             variable_bounds = [(-threshold, threshold)] * num_vars
-        low = [(l if l is not None else -threshold) for (l, u) in variable_bounds]
-        high = [(u if u is not None else threshold) for (l, u) in variable_bounds]
 
-        def optimize_runner(_queue, _i_pt):  # Multi-process sampling
-            _sol, _opt, _nfev = self._optimize(
-                num_vars, objective_function, gradient_function, variable_bounds, _i_pt
+        # the runs from random points are seeded up front, so the result does not depend on the
+        # order in which the concurrent runs finish
+        starting_points = [initial_point] + random_starting_points(
+            num_vars, variable_bounds, num_procs
+        )
+
+        def optimize_runner(point):
+            return self._optimize(
+                num_vars, objective_function, gradient_function, variable_bounds, point
             )
-            _queue.put((_sol, _opt, _nfev))
+
+        if self._worker_pool is not None:
+            return multi_start(optimize_runner, starting_points, self._worker_pool)
+
+        queue = multiprocessing.Queue()
+
+        def process_runner(index, point):  # Multi-process sampling
+            queue.put((index, optimize_runner(point)))
 
         # Start off as many other processes running the optimize (can be 0)
         processes = []
-        for _ in range(num_procs):
-            i_pt = algorithm_globals.random.uniform(low, high)  # Another random point in bounds
-            proc = multiprocessing.Process(target=optimize_runner, args=(queue, i_pt))
+        for index, point in enumerate(starting_points[1:], start=1):
+            proc = multiprocessing.Process(target=process_runner, args=(index, point))
             processes.append(proc)
             proc.start()
 
         # While the one _optimize in this process below runs the other processes will
-        # be running to. This one runs
-        # with the supplied initial point. The process ones have their own random one
-        sol, opt, nfev = self._optimize(
-            num_vars, objective_function, gradient_function, variable_bounds, initial_point
-        )
-
+        # be running to. This one runs with the supplied initial point.
+        results = [optimize_runner(initial_point)] + [None] * num_procs
+        # the results are received before joining, since a process only ends once its result
+        # was taken from the queue
+        for _ in processes:
+            index, result = queue.get()
+            results[index] = result
         for proc in processes:
-            # For each other process we wait now for it to finish and see if it has
-            # a better result than above
             proc.join()
-            p_sol, p_opt, p_nfev = queue.get()
-            if p_opt < opt:
-                sol, opt = p_sol, p_opt
-            nfev += p_nfev
 
-        return sol, opt, nfev
+        return best_result(results)
 
     def _optimize(
         self,
@@ -0,0 +1,171 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Concurrent evaluation of objective functions."""
+
+from typing import Any, Callable, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import numpy as np
+
+from qiskit.utils.validation import validate_min
+
+
+class WorkerPool:
+    """A reusable pool of worker threads to evaluate objective functions concurrently.
+
+    The workers are started by the first call of :meth:`map` and are reused by all later calls
+    until :meth:`shutdown` is called, so optimizers sharing a pool do not start new workers in
+    every iteration or every optimization. Since the workers are threads, the evaluated functions
+    must be safe to call concurrently. Objective functions spending most of their time in
+    compiled code or waiting on a backend, such as circuit simulators or remote devices, profit
+    the most from being evaluated concurrently.
+
+    A :meth:`map` issued from within a worker of the same pool, for example a finite difference
+    gradient computed in one of the runs of a
+    :class:`~qiskit.algorithms.optimizers.MultiStartOptimizer`, is evaluated serially in that
+    worker so that the pool cannot deadlock.
+
+    .. code-block:: python
+
+        from qiskit.algorithms.optimizers import L_BFGS_B, WorkerPool
+
+        with WorkerPool(max_workers=4) as pool:
+            optimizer = L_BFGS_B()
+            optimizer.set_worker_pool(pool)
+            point, value, nfev = optimizer.optimize(num_vars, objective, initial_point=x0)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Args:
+            max_workers: The maximum number of worker threads, has a min. value of 1 if not None.
+                Defaults to the default of :class:`concurrent.futures.ThreadPoolExecutor`.
+        """
+        if max_workers is not None:
+            validate_min("max_workers", max_workers, 1)
+        self._max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._worker_threads = set()
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        """Returns the maximum number of worker threads."""
+        return self._max_workers
+
+    def map(self, function: Callable[[Any], Any], values: Iterable[Any]) -> List[Any]:
+        """Evaluate ``function`` at each of the ``values`` on the workers.
+
+        Args:
+            function: The function to evaluate.
+            values: The arguments to evaluate the function at.
+
+        Returns:
+            The list of ``function(value)`` for all ``values``, in the order of ``values``.
+        """
+        values = list(values)
+        if (
+            len(values) <= 1
+            or self._max_workers == 1
+            or threading.get_ident() in self._worker_threads
+        ):
+            return [function(value) for value in values]
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="qiskit_optimizer_worker",
+                    initializer=self._register_worker,
+                )
+            executor = self._executor
+        return list(executor.map(function, values))
+
+    def _register_worker(self):
+        with self._lock:
+            self._worker_threads.add(threading.get_ident())
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers. The pool starts new workers if it is used again.
+
+        Args:
+            wait: Whether to wait for the pending evaluations to finish.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._worker_threads = set()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    def __deepcopy__(self, memo):
+        # the workers are a shared resource, copies of an optimizer use the same pool
+        return self
+
+    def __getstate__(self):
+        return {"_max_workers": self._max_workers}
+
+    def __setstate__(self, state):
+        self.__init__(state["_max_workers"])
+
+
+def evaluate_points(
+    function: Callable,
+    points: Iterable[np.ndarray],
+    max_evals_grouped: int = 1,
+    worker_pool: Optional[WorkerPool] = None,
+) -> np.ndarray:
+    """Evaluate an objective function at several points.
+
+    If ``max_evals_grouped`` is larger than 1, the points are split into groups of at most
+    ``max_evals_grouped`` points and ``function`` is called once per group with the concatenation
+    of its points, returning the value at each of them, like the objective functions of the
+    variational algorithms do. Otherwise ``function`` is called once per point. The calls are
+    distributed over the ``worker_pool``, if given, and made one after another otherwise.
+
+    Args:
+        function: The objective function.
+        points: The points to evaluate the function at.
+        max_evals_grouped: The maximum number of points ``function`` can evaluate in a single call.
+        worker_pool: The pool to evaluate the calls concurrently on.
+
+    Returns:
+        The function values at the points, in the order of ``points``.
+    """
+    points = [np.asarray(point) for point in points]
+    if max_evals_grouped <= 1:
+        groups = [[point] for point in points]
+
+        def evaluate(group):
+            return [function(group[0])]
+
+    else:
+        groups = [
+            points[start : start + max_evals_grouped]
+            for start in range(0, len(points), max_evals_grouped)
+        ]
+
+        def evaluate(group):
+            return np.atleast_1d(function(np.concatenate(group)))
+
+    if worker_pool is None:
+        results = [evaluate(group) for group in groups]
+    else:
+        results = worker_pool.map(evaluate, groups)
+    return np.array([value for values in results for value in values])
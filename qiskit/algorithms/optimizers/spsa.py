@@ -12,7 +12,8 @@
 
 """Simultaneous Perturbation Stochastic Approximation (SPSA) optimizer."""
 
-from typing import Iterator, Optional, Union, Callable, Tuple, Dict
+from typing import Any, Iterator, Optional, Union, Callable, Tuple, Dict
+import functools
 import logging
 import warnings
 from time import time
@@ -23,6 +24,7 @@ import numpy as np
 from qiskit.utils import algorithm_globals
 
 from .optimizer import Optimizer, OptimizerSupportLevel
+from .parallel import WorkerPool, evaluate_points
 
 # number of function evaluations, parameters, loss, stepsize, accepted
 CALLBACK = Callable[[int, np.ndarray, float, float, bool], None]
@@ -135,6 +137,8 @@ class SPSA(Optimizer):
 
         # runtime arguments
         self._nfev = None
+        self._state = None  # type: Optional[Dict[str, Any]]
+        self._resume_state = None  # type: Optional[Dict[str, Any]]
 
     @staticmethod
     def calibrate(
@@ -146,6 +150,8 @@ class SPSA(Optimizer):
         alpha: float = 0.602,
         gamma: float = 0.101,
         modelspace: bool = False,
+        max_evals_grouped: int = 1,
+        worker_pool: Optional[WorkerPool] = None,
     ) -> Tuple[Iterator[float], Iterator[float]]:
         r"""Calibrate SPSA parameters with a powerseries as learning rate and perturbation coeffs.
 
@@ -166,6 +172,9 @@ class SPSA(Optimizer):
             gamma: The exponent of the perturbation powerseries.
             modelspace: Whether the target magnitude is the difference of parameter values
                 or function values (= model space).
+            max_evals_grouped: The maximum number of points the loss function can evaluate at
+                once, if it accepts the concatenation of several points.
+            worker_pool: The pool to evaluate the loss function calls concurrently on.
 
         Returns:
             tuple(generator, generator): A tuple of powerseries generators, the first one for the
@@ -176,17 +185,14 @@ class SPSA(Optimizer):
 
         dim = len(initial_point)
 
-        # compute the average magnitude of the first step
+        # compute the average magnitude of the first step, evaluating the loss at all perturbed
+        # points at once
         steps = 25
-        avg_magnitudes = 0
-        for _ in range(steps):
-            # compute the random directon
-            pert = bernoulli_perturbation(dim)
-            delta = loss(initial_point + c * pert) - loss(initial_point - c * pert)
-
-            avg_magnitudes += np.abs(delta / (2 * c))
-
-        avg_magnitudes /= steps
+        perts = np.array([bernoulli_perturbation(dim) for _ in range(steps)])
+        values = evaluate_points(
+            loss, _perturbed_points(initial_point, c, perts), max_evals_grouped, worker_pool
+        )
+        avg_magnitudes = np.sum(np.abs((values[0::2] - values[1::2]) / (2 * c))) / steps
 
         if modelspace:
             a = target_magnitude / (avg_magnitudes ** 2)
@@ -198,49 +204,40 @@ class SPSA(Optimizer):
             warnings.warn(f"Calibration failed, using {target_magnitude} for `a`")
             a = target_magnitude
 
-        # set up the powerseries
-        def learning_rate():
-            return powerseries(a, alpha, stability_constant)
-
-        def perturbation():
-            return powerseries(c, gamma)
+        # set up the powerseries, as partials so that they can be stored in a checkpoint
+        learning_rate = functools.partial(powerseries, a, alpha, stability_constant)
+        perturbation = functools.partial(powerseries, c, gamma)
 
         return learning_rate, perturbation
 
     @staticmethod
     def estimate_stddev(
-        loss: Callable[[np.ndarray], float], initial_point: np.ndarray, avg: int = 25
+        loss: Callable[[np.ndarray], float],
+        initial_point: np.ndarray,
+        avg: int = 25,
+        max_evals_grouped: int = 1,
+        worker_pool: Optional[WorkerPool] = None,
     ) -> float:
         """Estimate the standard deviation of the loss function."""
-        losses = [loss(initial_point) for _ in range(avg)]
+        losses = evaluate_points(
+            loss, np.tile(initial_point, (avg, 1)), max_evals_grouped, worker_pool
+        )
         return np.std(losses)
 
-    def _point_sample(self, loss, x, eps, delta):
-        """A single sample of the gradient at position ``x`` in direction ``delta``."""
-        if self._max_evals_grouped > 1:
-            plus, minus = loss(np.concatenate((x + eps * delta, x - eps * delta)))
-        else:
-            plus, minus = loss(x + eps * delta), loss(x - eps * delta)
-
-        gradient_sample = (plus - minus) / (2 * eps) * delta
-        self._nfev += 2
-
-        return gradient_sample
-
     def _point_estimate(self, loss, x, eps, deltas):
-        """The gradient estimate at point ``x`` consisting as average of all directions ``delta``."""
-        # number of samples
-        resamplings = len(deltas)
+        """The gradient estimate at point ``x`` consisting as average of all directions ``delta``.
 
-        # set up variables to store averages
-        gradient_estimate = np.zeros(x.size)
-
-        # iterate over the directions
-        for delta in deltas:
-            gradient_sample = self._point_sample(loss, x, eps, delta)
-            gradient_estimate += gradient_sample
+        The loss is evaluated at all perturbed points ``x + eps * delta`` and ``x - eps * delta``
+        in as few calls as ``max_evals_grouped`` allows, concurrently if a worker pool is set.
+        """
+        deltas = np.asarray(deltas)
+        values = evaluate_points(
+            loss, _perturbed_points(x, eps, deltas), self._max_evals_grouped, self._worker_pool
+        )
+        self._nfev += len(values)
 
-        return gradient_estimate / resamplings
+        gradient_samples = (values[0::2] - values[1::2]) / (2 * eps)
+        return gradient_samples.dot(deltas) / len(deltas)
 
     def _compute_update(self, loss, x, k, eps):
         # compute the perturbations
@@ -258,42 +255,117 @@ class SPSA(Optimizer):
 
         return gradient
 
+    def get_state(self) -> Optional[Dict[str, Any]]:
+        """Returns the state of the running or last optimization, to resume it later.
+
+        The state is taken at the start of every iteration. It holds the number of completed
+        iterations, the current iterate, the calibrated learning rate and perturbation, the
+        last iterates for ``last_avg``, the current loss and allowed increase for ``blocking``,
+        the number of function evaluations and the state of the random number generator of
+        :attr:`~qiskit.utils.algorithm_globals.random`. An optimization resumed from it with
+        :meth:`set_state` continues exactly as the original one would have.
+        """
+        return self._state
+
+    def set_state(self, state: Optional[Dict[str, Any]]) -> None:
+        """Resume the next optimization from a state returned by :meth:`get_state`.
+
+        The iterate of the state replaces the initial point passed to the optimization, and the
+        state of :attr:`~qiskit.utils.algorithm_globals.random` is restored.
+
+        Args:
+            state: The state to resume from, or ``None`` to start the next optimization anew.
+        """
+        self._resume_state = state
+
+    def _snapshot(self, iteration, x, fx, last_steps, calibration):
+        return {
+            "iteration": iteration,
+            "x": np.array(x),
+            "fx": fx,
+            "allowed_increase": self.allowed_increase,
+            "last_steps": [np.array(step) for step in last_steps],
+            "nfev": self._nfev,
+            "calibration": calibration,
+            "random_state": algorithm_globals.random.bit_generator.state,
+        }
+
     def _minimize(self, loss, initial_point):
+        resume, self._resume_state = self._resume_state, None
+        if resume is not None and np.size(resume["x"]) != np.size(initial_point):
+            raise ValueError(
+                "The state to resume from has {} parameters, the initial point {}.".format(
+                    np.size(resume["x"]), np.size(initial_point)
+                )
+            )
+
         # ensure learning rate and perturbation are correctly set: either none or both
         # this happens only here because for the calibration the loss function is required
-        if self.learning_rate is None and self.perturbation is None:
-            get_learning_rate, get_perturbation = self.calibrate(loss, initial_point)
-            # get iterator
-            eta = get_learning_rate()
-            eps = get_perturbation()
+        calibration = None
+        if resume is not None and resume["calibration"] is not None:
+            calibration = resume["calibration"]
+        elif self.learning_rate is None and self.perturbation is None:
+            calibration = self.calibrate(
+                loss,
+                initial_point,
+                max_evals_grouped=self._max_evals_grouped,
+                worker_pool=self._worker_pool,
+            )
         elif self.learning_rate is None or self.perturbation is None:
             raise ValueError("If one of learning rate or perturbation is set, both must be set.")
+
+        # get iterator
+        if calibration is not None:
+            get_learning_rate, get_perturbation = calibration
         else:
-            # get iterator
-            eta = self.learning_rate()
-            eps = self.perturbation()
+            get_learning_rate, get_perturbation = self.learning_rate, self.perturbation
+        eta = get_learning_rate()
+        eps = get_perturbation()
+
+        fx = None
+        if resume is None:
+            # prepare some initials
+            x = np.asarray(initial_point)
 
-        # prepare some initials
-        x = np.asarray(initial_point)
+            self._nfev = 0
 
-        self._nfev = 0
+            # if blocking is enabled we need to keep track of the function values
+            if self.blocking:
+                fx = loss(x)
 
-        # if blocking is enabled we need to keep track of the function values
-        if self.blocking:
-            fx = loss(x)
+                self._nfev += 1
+                if self.allowed_increase is None:
+                    self.allowed_increase = 2 * self.estimate_stddev(
+                        loss,
+                        x,
+                        max_evals_grouped=self._max_evals_grouped,
+                        worker_pool=self._worker_pool,
+                    )
 
-            self._nfev += 1
-            if self.allowed_increase is None:
-                self.allowed_increase = 2 * self.estimate_stddev(loss, x)
+            # keep track of the last few steps to return their average
+            last_steps = deque([x])
+            first_iteration = 1
+        else:
+            x = np.asarray(resume["x"])
+            fx = resume["fx"]
+            if self.blocking:
+                self.allowed_increase = resume["allowed_increase"]
+            last_steps = deque(resume["last_steps"])
+            self._nfev = resume["nfev"]
+            algorithm_globals.random.bit_generator.state = resume["random_state"]
+
+            # advance the learning rate and perturbation to the resumed iteration
+            for _ in range(resume["iteration"]):
+                next(eta)
+                next(eps)
+            first_iteration = resume["iteration"] + 1
 
         logger.info("=" * 30)
         logger.info("Starting SPSA optimization")
         start = time()
 
-        # keep track of the last few steps to return their average
-        last_steps = deque([x])
-
-        for k in range(1, self.maxiter + 1):
+        for k in range(first_iteration, self.maxiter + 1):
+            self._state = self._snapshot(k - 1, x, fx, last_steps, calibration)
             iteration_start = time()
             # compute update
             update = self._compute_update(loss, x, k, next(eps))
@@ -359,6 +431,7 @@ class SPSA(Optimizer):
                 if len(last_steps) > self.last_avg:
                     last_steps.popleft()
 
+        self._state = self._snapshot(self.maxiter, x, fx, last_steps, calibration)
         logger.info("SPSA finished in %s", time() - start)
         logger.info("=" * 30)
 
@@ -386,6 +459,11 @@ class SPSA(Optimizer):
         return self._minimize(objective_function, initial_point)
 
 
+def _perturbed_points(x, eps, deltas):
+    """The points ``x + eps * delta`` and ``x - eps * delta`` for all ``deltas``, in pairs."""
+    return np.stack((x + eps * deltas, x - eps * deltas), axis=1).reshape(-1, np.size(x))
+
+
 def bernoulli_perturbation(dim, perturbation_dims=None):
     """Get a Bernoulli random perturbation."""
     if perturbation_dims is None:
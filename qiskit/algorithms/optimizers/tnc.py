@@ -90,10 +90,13 @@ class TNC(Optimizer):
             num_vars, objective_function, gradient_function, variable_bounds, initial_point
         )
 
-        if gradient_function is None and self._max_evals_grouped > 1:
+        if gradient_function is None and (
+            self._max_evals_grouped > 1 or self._worker_pool is not None
+        ):
             epsilon = self._options["eps"]
             gradient_function = Optimizer.wrap_function(
-                Optimizer.gradient_num_diff, (objective_function, epsilon, self._max_evals_grouped)
+                Optimizer.gradient_num_diff,
+                (objective_function, epsilon, self._max_evals_grouped, self._worker_pool),
             )
 
         res = minimize(
@@ -178,6 +178,7 @@ from .expectations import (
     MatrixExpectation,
     AerPauliExpectation,
     CVaRExpectation,
+    CompiledExpectation,
 )
 from .evolutions import (
     EvolutionBase,
@@ -261,6 +262,7 @@ __all__ = [
     "MatrixExpectation",
     "AerPauliExpectation",
     "CVaRExpectation",
+    "CompiledExpectation",
     "EvolutionBase",
     "EvolvedOp",
     "EvolutionFactory",
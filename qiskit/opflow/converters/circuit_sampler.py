@@ -14,14 +14,23 @@
 
 
 import logging
+import pickle
+from collections import OrderedDict
 from functools import partial
 from time import time
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple, Union, cast
 
 import numpy as np
 
 from qiskit import QiskitError
-from qiskit.circuit import Parameter, ParameterExpression, QuantumCircuit
+from qiskit.circuit import (
+    ControlledGate,
+    Gate,
+    Instruction,
+    Parameter,
+    ParameterExpression,
+    QuantumCircuit,
+)
 from qiskit.opflow.converters.converter_base import ConverterBase
 from qiskit.opflow.exceptions import OpflowError
 from qiskit.opflow.list_ops.list_op import ListOp
@@ -35,6 +44,29 @@ from qiskit.utils.quantum_instance import QuantumInstance
 
 logger = logging.getLogger(__name__)
 
+CacheInfo = NamedTuple(
+    "CacheInfo",
+    [
+        ("hits", int),
+        ("misses", int),
+        ("evictions", int),
+        ("operators", int),
+        ("circuits", int),
+        ("memory", Optional[int]),
+    ],
+)
+CacheInfo.__doc__ = """Statistics of the operator cache of a :class:`CircuitSampler`.
+
+Attributes:
+    hits: The number of conversions of an operator found in the cache.
+    misses: The number of conversions of an operator not found in the cache.
+    evictions: The number of operators evicted from the cache.
+    operators: The number of operators currently cached.
+    circuits: The number of transpiled circuit templates currently cached.
+    memory: The estimated size of the cached circuit templates in bytes, or ``None`` if
+        the cache is not bounded by memory.
+"""
+
 
 class CircuitSampler(ConverterBase):
     """
@@ -47,8 +79,10 @@ class CircuitSampler(ConverterBase):
     state function, per the Born rule.
 
     The CircuitSampler aggressively caches transpiled circuits to handle re-parameterization of
-    the same circuit efficiently. If you are converting multiple different Operators,
-    you are better off using a different CircuitSampler for each Operator to avoid cache thrashing.
+    the same circuit efficiently. By default only the last converted Operator is cached. When
+    alternating between several Operators, e.g. in gradient workflows, use ``caching='lru'`` to
+    keep the most recently used Operators up to a number of Operators or an estimated memory
+    size. Transpiled circuits are cached once even when they are shared by several Operators.
     """
 
     def __init__(
@@ -58,6 +92,8 @@ class CircuitSampler(ConverterBase):
         param_qobj: bool = False,
         attach_results: bool = False,
         caching: str = "last",
+        max_cache_size: Optional[int] = None,
+        max_cache_memory: Optional[int] = None,
     ) -> None:
         """
         Args:
@@ -71,10 +107,17 @@ class CircuitSampler(ConverterBase):
             param_qobj: Whether to use Aer's parameterized Qobj capability to avoid re-assembling
                 the circuits.
             caching: The caching strategy. Can be `'last'` (default) to store the last operator
-                that was converted, set to `'all'` to cache all processed operators.
+                that was converted, set to `'all'` to cache all processed operators, or `'lru'`
+                to cache the most recently used operators within ``max_cache_size`` and
+                ``max_cache_memory``.
+            max_cache_size: The maximum number of operators cached with `'lru'` caching.
+                Defaults to 16 if neither this nor ``max_cache_memory`` is set.
+            max_cache_memory: The maximum estimated size, in bytes, of the transpiled circuits
+                cached with `'lru'` caching. The most recently used operator is always kept.
 
         Raises:
-            ValueError: Set statevector or param_qobj True when not supported by backend.
+            ValueError: Set statevector or param_qobj True when not supported by backend, or
+                an unknown caching strategy or invalid cache bound.
         """
         self._quantum_instance = (
             backend if isinstance(backend, QuantumInstance) else QuantumInstance(backend=backend)
@@ -87,9 +130,29 @@ class CircuitSampler(ConverterBase):
 
         self._check_quantum_instance_and_modes_consistent()
 
+        if caching not in ("last", "all", "lru"):
+            raise ValueError(
+                "Unknown caching strategy {}, expected 'last', 'all' or 'lru'.".format(caching)
+            )
+        if caching == "lru" and max_cache_size is None and max_cache_memory is None:
+            max_cache_size = 16
+        if (max_cache_size is not None and max_cache_size < 1) or (
+            max_cache_memory is not None and max_cache_memory < 0
+        ):
+            raise ValueError("The cache bounds must be positive.")
+
         # Object state variables
         self._caching = caching
-        self._cached_ops: Dict[int, OperatorCache] = {}
+        self._max_cache_size = max_cache_size
+        self._max_cache_memory = max_cache_memory
+        self._cached_ops: "OrderedDict[int, OperatorCache]" = OrderedDict()
+        # the transpiled circuits of the cached operators, keyed by the circuit contents,
+        # with the number of cached operators using them
+        self._circuit_templates: Dict[Hashable, CircuitTemplate] = {}
+        self._transpiled_circ_keys: Optional[List[Hashable]] = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_evictions = 0
 
         self._last_op: Optional[OperatorBase] = None
         self._reduced_op_cache = None
@@ -130,7 +193,7 @@ class CircuitSampler(ConverterBase):
     def quantum_instance(
         self, quantum_instance: Union[QuantumInstance, Backend, BaseBackend]
     ) -> None:
-        """Sets the QuantumInstance.
+        """Sets the QuantumInstance, and clears the cache.
 
         Raises:
             ValueError: statevector or param_qobj are True when not supported by backend.
@@ -139,6 +202,8 @@ class CircuitSampler(ConverterBase):
             quantum_instance = QuantumInstance(quantum_instance)
         self._quantum_instance = quantum_instance
         self._check_quantum_instance_and_modes_consistent()
+        # the cached circuits were transpiled for the previous backend
+        self.clear_cache()
 
     # pylint: disable=arguments-differ
     def convert(
@@ -166,9 +231,7 @@ class CircuitSampler(ConverterBase):
         op_id = operator.instance_id
         # op_id = id(operator)
         if op_id not in self._cached_ops.keys():
-            # delete cache if we only want to cache one operator
-            if self._caching == "last":
-                self.clear_cache()
+            self._cache_misses += 1
 
             # convert to circuit and reduce
             operator_dicts_replaced = operator.to_circuit_op()
@@ -183,12 +246,17 @@ class CircuitSampler(ConverterBase):
                     "Check that the operator is an instance of CircuitStateFn or its ListOp."
                 )
             self._transpiled_circ_cache = None
+            self._transpiled_circ_keys = None
             self._transpile_before_bind = True
         else:
+            self._cache_hits += 1
+            self._cached_ops.move_to_end(op_id)
+
             # load the cached circuits
             self._reduced_op_cache = self._cached_ops[op_id].reduced_op_cache
             self._circuit_ops_cache = self._cached_ops[op_id].circuit_ops_cache
             self._transpiled_circ_cache = self._cached_ops[op_id].transpiled_circ_cache
+            self._transpiled_circ_keys = self._cached_ops[op_id].circuit_keys
             self._transpile_before_bind = self._cached_ops[op_id].transpile_before_bind
             self._transpiled_circ_templates = self._cached_ops[op_id].transpiled_circ_templates
 
@@ -233,7 +301,11 @@ class CircuitSampler(ConverterBase):
             op_cache.transpiled_circ_cache = self._transpiled_circ_cache
             op_cache.transpile_before_bind = self._transpile_before_bind
             op_cache.transpiled_circ_templates = self._transpiled_circ_templates
+            op_cache.circuit_keys = self._transpiled_circ_keys
+            for key in op_cache.circuit_keys or []:
+                self._circuit_templates[key].references += 1
             self._cached_ops[op_id] = op_cache
+            self._evict_cache(keep=op_id)
 
         if return_as_list:
             return ListOp(
@@ -246,8 +318,73 @@ class CircuitSampler(ConverterBase):
             return replace_circuits_with_dicts(self._reduced_op_cache, param_index=0)
 
     def clear_cache(self) -> None:
-        """Clear the cache of sampled operator expressions."""
-        self._cached_ops = {}
+        """Clear the cache of sampled operator expressions.
+
+        The statistics reported by :attr:`cache_info` are kept.
+        """
+        self._cached_ops = OrderedDict()
+        self._circuit_templates = {}
+
+    @property
+    def cache_info(self) -> CacheInfo:
+        """Returns the statistics of the operator cache."""
+        return CacheInfo(
+            hits=self._cache_hits,
+            misses=self._cache_misses,
+            evictions=self._cache_evictions,
+            operators=len(self._cached_ops),
+            circuits=len(self._circuit_templates),
+            memory=self._cache_memory() if self._max_cache_memory is not None else None,
+        )
+
+    def _cache_memory(self) -> int:
+        return sum(template.memory for template in self._circuit_templates.values())
+
+    def _evict_cache(self, keep: int) -> None:
+        """Evict operators according to the caching strategy, except the one with id ``keep``."""
+
+        def over_bounds():
+            if self._caching == "last":
+                return len(self._cached_ops) > 1
+            if self._caching == "lru":
+                return (
+                    self._max_cache_size is not None
+                    and len(self._cached_ops) > self._max_cache_size
+                ) or (
+                    self._max_cache_memory is not None
+                    and self._cache_memory() > self._max_cache_memory
+                )
+            return False
+
+        # the operators are kept in order of use, so the first one is the least recently used
+        while over_bounds():
+            op_id = next(iter(self._cached_ops))
+            if op_id == keep:
+                break
+            op_cache = self._cached_ops.pop(op_id)
+            for key in op_cache.circuit_keys or []:
+                template = self._circuit_templates[key]
+                template.references -= 1
+                if template.references == 0:
+                    del self._circuit_templates[key]
+            self._cache_evictions += 1
+
+    def _transpile_circuits(self, circuits: List[QuantumCircuit]) -> List[QuantumCircuit]:
+        """Transpile the circuits, reusing the cached transpiled circuits with the same contents."""
+        keys = [_circuit_key(circuit) for circuit in circuits]
+        missing = {}  # type: Dict[Hashable, QuantumCircuit]
+        for key, circuit in zip(keys, circuits):
+            if key not in self._circuit_templates and key not in missing:
+                missing[key] = circuit
+
+        if missing:
+            transpiled = self.quantum_instance.transpile(list(missing.values()))
+            for key, circuit in zip(missing, transpiled):
+                memory = len(pickle.dumps(circuit)) if self._max_cache_memory is not None else 0
+                self._circuit_templates[key] = CircuitTemplate(circuit, memory)
+
+        self._transpiled_circ_keys = keys
+        return [self._circuit_templates[key].circuit for key in keys]
 
     def _extract_circuitstatefns(self, operator: OperatorBase) -> None:
         r"""
@@ -294,7 +431,7 @@ class CircuitSampler(ConverterBase):
                 circuits = [op_c.to_circuit(meas=True) for op_c in circuit_sfns]
 
             try:
-                self._transpiled_circ_cache = self.quantum_instance.transpile(circuits)
+                self._transpiled_circ_cache = self._transpile_circuits(circuits)
             except QiskitError:
                 logger.debug(
                     r"CircuitSampler failed to transpile circuits with unbound "
@@ -303,6 +440,7 @@ class CircuitSampler(ConverterBase):
                 )
                 self._transpile_before_bind = False
                 self._transpiled_circ_cache = circuits
+                self._transpiled_circ_keys = None
         else:
             circuit_sfns = list(self._circuit_ops_cache.values())
 
@@ -444,9 +582,64 @@ class CircuitSampler(ConverterBase):
         self.quantum_instance._run_config.parameterizations = []
 
 
+def _circuit_key(circuit: QuantumCircuit) -> Hashable:
+    """Return a hashable key identifying the contents of a circuit.
+
+    Parameters are compared by identity, so circuits over different parameters with the same
+    names get different keys. Instructions whose definition is attached to the instance, like
+    those of :meth:`~qiskit.circuit.QuantumCircuit.to_instruction`, are identified by the key of
+    their definition, since their name does not determine their contents.
+    """
+    definition_keys = {}  # type: Dict[int, Hashable]
+
+    def param_key(param):
+        if isinstance(param, ParameterExpression):
+            return (str(param), frozenset(param.parameters))
+        if isinstance(param, np.ndarray):
+            return (param.shape, param.tobytes())
+        return repr(param)
+
+    def definition_key(inst):
+        if type(inst) not in _CUSTOM_INSTRUCTION_TYPES or inst.definition is None:
+            return None
+        # the same block is often appended many times, so its key is only computed once
+        definition = inst.definition
+        if id(definition) not in definition_keys:
+            definition_keys[id(definition)] = (definition, circuit_key(definition))
+        return definition_keys[id(definition)][1]
+
+    def circuit_key(circ):
+        qubit_indices = {qubit: index for index, qubit in enumerate(circ.qubits)}
+        clbit_indices = {clbit: index for index, clbit in enumerate(circ.clbits)}
+        return (
+            circ.num_qubits,
+            circ.num_clbits,
+            param_key(circ.global_phase),
+            tuple(
+                (
+                    type(inst),
+                    inst.name,
+                    tuple(param_key(param) for param in inst.params),
+                    tuple(qubit_indices[qubit] for qubit in qargs),
+                    tuple(clbit_indices[clbit] for clbit in cargs),
+                    None if inst.condition is None else (str(inst.condition[0]), inst.condition[1]),
+                    definition_key(inst),
+                )
+                for inst, qargs, cargs in circ.data
+            ),
+        )
+
+    return circuit_key(circuit)
+
+
+# The instruction types whose definition is set per instance rather than by their class
+_CUSTOM_INSTRUCTION_TYPES = (Instruction, Gate, ControlledGate)
+
+
 def _filter_params(circuit, param_dict):
     """Remove all parameters from ``param_dict`` that are not in ``circuit``."""
-    return {param: value for param, value in param_dict.items() if param in circuit.parameters}
+    parameters = set(circuit.parameters)
+    return {param: value for param, value in param_dict.items() if param in parameters}
 
 
 class OperatorCache:
@@ -457,3 +650,13 @@ class OperatorCache:
     transpiled_circ_cache = None  # the transpiled circuits
     transpile_before_bind = True  # whether to transpile before binding parameters in the operator
     transpiled_circ_templates: Optional[List[Any]] = None  # transpiled circuit templates for Aer
+    circuit_keys: Optional[List[Hashable]] = None  # the keys of the shared transpiled circuits
+
+
+class CircuitTemplate:
+    """A transpiled circuit shared between the cached operators."""
+
+    def __init__(self, circuit: QuantumCircuit, memory: int) -> None:
+        self.circuit = circuit  # the transpiled circuit
+        self.memory = memory  # the estimated size in bytes, if the cache is bounded by memory
+        self.references = 0  # the number of cached operators using the circuit
@@ -54,6 +54,15 @@ Expectations
    PauliExpectation
    CVaRExpectation
 
+Compiled Expectations
+=====================
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   CompiledExpectation
+
 """
 
 from .expectation_base import ExpectationBase
@@ -62,6 +71,7 @@ from .pauli_expectation import PauliExpectation
 from .aer_pauli_expectation import AerPauliExpectation
 from .matrix_expectation import MatrixExpectation
 from .cvar_expectation import CVaRExpectation
+from .compiled_expectation import CompiledExpectation
 
 __all__ = [
     "ExpectationBase",
@@ -70,4 +80,5 @@ __all__ = [
     "AerPauliExpectation",
     "CVaRExpectation",
     "MatrixExpectation",
+    "CompiledExpectation",
 ]
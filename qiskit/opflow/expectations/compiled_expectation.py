@@ -0,0 +1,434 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" CompiledExpectation Class """
+
+import logging
+from numbers import Number
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from qiskit import QiskitError
+from qiskit.circuit import Parameter, QuantumCircuit
+from qiskit.opflow.converters.circuit_sampler import _filter_params
+from qiskit.opflow.exceptions import OpflowError
+from qiskit.opflow.list_ops.composed_op import ComposedOp
+from qiskit.opflow.list_ops.list_op import ListOp
+from qiskit.opflow.list_ops.summed_op import SummedOp
+from qiskit.opflow.operator_base import OperatorBase
+from qiskit.opflow.primitive_ops.pauli_op import PauliOp
+from qiskit.opflow.primitive_ops.pauli_sum_op import PauliSumOp
+from qiskit.opflow.state_fns.circuit_state_fn import CircuitStateFn
+from qiskit.opflow.state_fns.operator_state_fn import OperatorStateFn
+from qiskit.providers import Backend, BaseBackend
+from qiskit.quantum_info.operators.symplectic.pauli_table import PauliTable
+from qiskit.result import Result
+from qiskit.utils.backend_utils import is_statevector_backend
+from qiskit.utils.quantum_instance import QuantumInstance
+
+logger = logging.getLogger(__name__)
+
+
+class CompiledExpectation:
+    r"""
+    A precompiled form of an expectation value measurement, for evaluating the same
+    measurement many times with different parameter bindings.
+
+    A :class:`~qiskit.opflow.converters.CircuitSampler` rebuilds the Operator tree with
+    sampled state functions on each ``convert``, and the tree is then evaluated recursively.
+    A CompiledExpectation instead walks the Operator once, when it is constructed. It
+    transpiles the measurement circuits and stores each diagonal observable as packed Z masks
+    and coefficients. It also stores a flat plan saying how to combine the group averages
+    into the final expectation values. An evaluation is then a single backend call followed
+    by array arithmetic on the counts (or statevectors) of the circuits.
+
+    The Operator must be built from an expectation conversion whose measurements are
+    diagonal Paulis, e.g. ``PauliExpectation().convert(~StateFn(op) @ StateFn(circuit))``.
+    It may be a sum of such measurements, or a ``ListOp`` of sums for several observables.
+    Any other structure raises an :class:`~qiskit.opflow.OpflowError`. Callers can catch it
+    and fall back to a ``CircuitSampler``.
+
+    Transpiling the measurement circuits is usually the most expensive part of the compilation.
+    The :attr:`circuit_cache` of a compiled expectation can be passed to the compilation of
+    another operator with the same measurement circuits, e.g. the next point of a scan over the
+    coefficients of a Hamiltonian or the same measurement in another process, which then reuses
+    the transpiled circuits.
+    """
+
+    def __init__(
+        self,
+        operator: OperatorBase,
+        backend: Union[Backend, BaseBackend, QuantumInstance],
+        statevector: Optional[bool] = None,
+        circuit_cache: Optional[Tuple[Any, ...]] = None,
+    ) -> None:
+        """
+        Args:
+            operator: The expectation value measurement to compile.
+            backend: The quantum backend or QuantumInstance to evaluate the measurement with.
+            statevector: Whether to compute the averages from the statevectors rather than
+                the counts of the circuits. ``None`` will set this argument automatically
+                based on the backend.
+            circuit_cache: The :attr:`circuit_cache` of a previous compilation. If it was
+                compiled for the same backend and its measurement circuits equal the ones of
+                ``operator``, up to parameters of the same names, its transpiled circuits are
+                reused instead of transpiling the circuits again.
+
+        Raises:
+            ValueError: statevector is True when not supported by the backend.
+            OpflowError: The operator is not an expectation value measurement of diagonal
+                Paulis on circuit state functions.
+        """
+        self._quantum_instance = (
+            backend if isinstance(backend, QuantumInstance) else QuantumInstance(backend=backend)
+        )
+        self._statevector = (
+            statevector if statevector is not None else self._quantum_instance.is_statevector
+        )
+        if self._statevector and not is_statevector_backend(self._quantum_instance.backend):
+            raise ValueError(
+                "Statevector mode for compiled expectations requires statevector "
+                "backend, not {}.".format(self._quantum_instance.backend)
+            )
+
+        reduced_op = operator.to_circuit_op().reduce()
+
+        # pylint: disable=unidiomatic-typecheck
+        self._is_list = type(reduced_op) == ListOp and reduced_op.combo_fn == ListOp([]).combo_fn
+        if self._is_list:
+            outputs = reduced_op.oplist
+            factor = _to_complex(reduced_op.coeff)
+        else:
+            outputs = [reduced_op]
+            factor = 1.0
+        self._num_outputs = len(outputs)
+
+        # the circuit state functions, keyed by id() as in the CircuitSampler
+        self._circuit_indices: Dict[int, int] = {}
+        self._circuit_sfns: List[CircuitStateFn] = []
+
+        # one entry per measurement group, i.e. per ComposedOp in the operator
+        self._group_circuits: List[int] = []
+        self._group_masks: List[np.ndarray] = []
+        self._group_coeffs: List[np.ndarray] = []
+        self._group_state_coeffs: List[complex] = []
+        self._group_variance_factors: List[complex] = []
+        group_outputs: List[int] = []
+        group_factors: List[complex] = []
+
+        def compile_scalar(op, output, factor):
+            if type(op) == SummedOp:
+                for summand in op.oplist:
+                    compile_scalar(summand, output, factor * _to_complex(op.coeff))
+            elif isinstance(op, ComposedOp):
+                measurement, state = _split_measurement(op)
+                masks, coeffs = _diagonal_terms(measurement.primitive)
+                state_coeff = _to_complex(state.coeff)
+                if id(state) not in self._circuit_indices:
+                    self._circuit_indices[id(state)] = len(self._circuit_sfns)
+                    self._circuit_sfns.append(state)
+                self._group_circuits.append(self._circuit_indices[id(state)])
+                self._group_masks.append(masks)
+                self._group_coeffs.append(coeffs * _to_complex(measurement.coeff))
+                self._group_state_coeffs.append(state_coeff)
+                self._group_variance_factors.append(_to_complex(op.coeff) * state_coeff ** 2)
+                group_outputs.append(output)
+                group_factors.append(factor * _to_complex(op.coeff))
+            else:
+                raise OpflowError(
+                    "Cannot compile a {} into an expectation value measurement.".format(
+                        op.__class__.__name__
+                    )
+                )
+
+        for output, op in enumerate(outputs):
+            compile_scalar(op, output, factor)
+        if not self._circuit_sfns:
+            raise OpflowError("The operator does not contain any circuits to measure.")
+
+        # the reduction plan from the group averages to the expectation values
+        self._group_outputs = np.array(group_outputs, dtype=int)
+        self._group_factors = np.array(group_factors, dtype=complex)
+
+        circuits = [
+            sfn.to_circuit(meas=not self._statevector) for sfn in self._circuit_sfns
+        ]  # type: List[QuantumCircuit]
+        self._circuits = circuits
+        self._transpile_before_bind = True
+        reused = None
+        if circuit_cache is not None:
+            reused = _reuse_transpiled(circuits, self._backend_name(), circuit_cache)
+        if reused is not None:
+            logger.debug("CompiledExpectation reused the transpiled circuits of the cache.")
+            self._transpiled_circuits = reused
+        else:
+            try:
+                self._transpiled_circuits = self._quantum_instance.transpile(circuits)
+            except QiskitError:
+                logger.debug(
+                    r"CompiledExpectation failed to transpile circuits with unbound "
+                    r"parameters. Attempting to transpile only when circuits are bound "
+                    r"now, but this can hurt performance due to repeated transpilation."
+                )
+                self._transpile_before_bind = False
+                self._transpiled_circuits = circuits
+
+    @property
+    def quantum_instance(self) -> QuantumInstance:
+        """Returns the quantum instance the measurement is evaluated with."""
+        return self._quantum_instance
+
+    @property
+    def circuits(self) -> List[QuantumCircuit]:
+        """Returns the (transpiled) measurement circuits, before binding parameters."""
+        return list(self._transpiled_circuits)
+
+    @property
+    def circuit_cache(self) -> Optional[Tuple[Any, ...]]:
+        """Returns the untranspiled and transpiled measurement circuits with the name of the
+        backend, to reuse the transpilation when compiling another operator, see ``__init__``.
+        The cache is picklable. It is ``None`` if the circuits are transpiled only after binding
+        their parameters."""
+        if not self._transpile_before_bind:
+            return None
+        return (self._backend_name(), list(self._circuits), list(self._transpiled_circuits))
+
+    def _backend_name(self) -> str:
+        backend = self._quantum_instance.backend
+        return backend.name() if callable(backend.name) else backend.name
+
+    @property
+    def num_groups(self) -> int:
+        """Returns the number of measurement groups, each a diagonal observable on a circuit."""
+        return len(self._group_circuits)
+
+    def evaluate(
+        self,
+        params: Optional[Dict[Parameter, Union[float, List[float]]]] = None,
+        compute_variance: bool = False,
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        r"""
+        Evaluate the expectation values for the given parameter bindings.
+
+        Args:
+            params: A dictionary mapping parameters to either single binding values or lists
+                of binding values, as in :meth:`~qiskit.opflow.CircuitSampler.convert`.
+            compute_variance: Whether to also return the variances of the expectation values,
+                as computed by :meth:`~qiskit.opflow.PauliExpectation.compute_variance`.
+
+        Returns:
+            The expectation values, with a leading axis over the parameter bindings if lists of
+            binding values were given, and a trailing axis over the observables if the operator
+            is a ``ListOp``. If ``compute_variance`` is True, a tuple of the expectation values
+            and their variances.
+        """
+        return_as_list = False
+        if params is not None and len(params.keys()) > 0:
+            p_0 = list(params.values())[0]
+            if isinstance(p_0, (list, np.ndarray)):
+                num_parameterizations = len(p_0)
+                param_bindings = [
+                    {param: value_list[i] for param, value_list in params.items()}  # type: ignore
+                    for i in range(num_parameterizations)
+                ]
+                return_as_list = True
+            else:
+                num_parameterizations = 1
+                param_bindings = [params]
+
+            ready_circs = [
+                circ.assign_parameters(_filter_params(circ, binding))
+                for circ in self._transpiled_circuits
+                for binding in param_bindings
+            ]
+        else:
+            num_parameterizations = 1
+            ready_circs = self._transpiled_circuits
+
+        results = self._quantum_instance.execute(
+            ready_circs, had_transpiled=self._transpile_before_bind
+        )
+
+        averages = np.zeros((self.num_groups, num_parameterizations), dtype=complex)
+        variances = np.zeros((self.num_groups, num_parameterizations), dtype=complex)
+        for j in range(num_parameterizations):
+            distributions: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+            for group, circ_index in enumerate(self._group_circuits):
+                if circ_index not in distributions:
+                    distributions[circ_index] = self._distribution(
+                        results,
+                        circ_index * num_parameterizations + j,
+                        self._circuit_sfns[circ_index].num_qubits,
+                    )
+                outcomes, probabilities = distributions[circ_index]
+                masks = self._group_masks[group]
+                signs = 1 - 2 * (PauliTable._count_bits(outcomes[:, None, :] & masks) % 2)
+                values = signs @ self._group_coeffs[group]
+                state_coeff = self._group_state_coeffs[group]
+                average = abs(state_coeff) ** 2 * (probabilities @ values)
+                averages[group, j] = average
+                if compute_variance:
+                    variances[group, j] = self._group_variance_factors[group] * (
+                        probabilities @ (values - average) ** 2
+                    )
+
+        means = self._reduce(averages * self._group_factors[:, None])
+        if not compute_variance:
+            return means if return_as_list else means[0]
+        variances = self._reduce(variances)
+        if return_as_list:
+            return means, variances
+        return means[0], variances[0]
+
+    def _reduce(self, group_values: np.ndarray) -> np.ndarray:
+        """Sum the values of the groups into the outputs they contribute to."""
+        outputs = np.zeros((self._num_outputs, group_values.shape[1]), dtype=complex)
+        np.add.at(outputs, self._group_outputs, group_values)
+        outputs = outputs.T
+        return outputs if self._is_list else outputs[:, 0]
+
+    def _distribution(
+        self, results: Result, index: int, num_qubits: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the packed measurement outcomes of a circuit and their probabilities."""
+        if self._statevector:
+            probabilities = np.abs(np.asarray(results.get_statevector(index))) ** 2
+            outcomes = np.arange(len(probabilities), dtype=np.uint64).reshape(-1, 1)
+            return outcomes, probabilities
+
+        shots = self._quantum_instance._run_config.shots
+        counts = results.data(index)["counts"]
+        if num_qubits <= 64 and all(key.startswith("0x") for key in counts):
+            # the raw counts are keyed by hex integers, which for up to 64 qubits are
+            # already the packed outcomes, so skip formatting them as bitstrings
+            outcomes = np.array([int(key, 16) for key in counts], dtype=np.uint64)
+            probabilities = np.fromiter(counts.values(), dtype=float, count=len(counts)) / shots
+            return outcomes.reshape(-1, 1), probabilities
+
+        counts = results.get_counts(index)
+        keys = [key.replace(" ", "") for key in counts]
+        probabilities = np.fromiter(counts.values(), dtype=float, count=len(keys)) / shots
+        bits = np.frombuffer("".join(keys).encode("ascii"), dtype=np.uint8)
+        bits = bits.reshape(len(keys), -1)[:, ::-1] == ord("1")
+        return PauliTable._pack_bits(bits), probabilities
+
+
+def _reuse_transpiled(
+    circuits: List[QuantumCircuit], backend_name: str, circuit_cache: Tuple[Any, ...]
+) -> Optional[List[QuantumCircuit]]:
+    """Return the cached transpiled circuits, with the parameters of ``circuits``, if the cached
+    untranspiled circuits equal ``circuits`` up to the parameter objects, else None.
+
+    Parameters are matched by name, since a circuit rebuilt in another process, e.g. from a
+    checkpoint, has new parameter objects.
+    """
+    cached_backend_name, cached_circuits, transpiled_circuits = circuit_cache
+    if cached_backend_name != backend_name or len(cached_circuits) != len(circuits):
+        return None
+    reused = []
+    for circuit, cached, transpiled in zip(circuits, cached_circuits, transpiled_circuits):
+        parameters = {parameter.name: parameter for parameter in circuit.parameters}
+        if len(parameters) != circuit.num_parameters or sorted(parameters) != sorted(
+            parameter.name for parameter in cached.parameters
+        ):
+            return None
+        mapping = {
+            parameter: parameters[parameter.name]
+            for parameter in cached.parameters
+            if parameter is not parameters[parameter.name]
+        }
+        if mapping:
+            cached = cached.assign_parameters(mapping)
+            transpiled = transpiled.assign_parameters(
+                {
+                    parameter: value
+                    for parameter, value in mapping.items()
+                    if parameter in transpiled.parameters
+                }
+            )
+        if not _same_instructions(cached, circuit):
+            return None
+        reused.append(transpiled)
+    return reused
+
+
+def _same_instructions(first: QuantumCircuit, second: QuantumCircuit) -> bool:
+    """Compare the instructions of two circuits on the same bit indices, ignoring the names of
+    the registers, which the opflow conversions generate."""
+    if (
+        first.num_qubits != second.num_qubits
+        or first.num_clbits != second.num_clbits
+        or len(first.data) != len(second.data)
+        or first.global_phase != second.global_phase
+    ):
+        return False
+    first_bits = {bit: i for i, bit in enumerate(first.qubits + first.clbits)}
+    second_bits = {bit: i for i, bit in enumerate(second.qubits + second.clbits)}
+    for (inst, qargs, cargs), (other, other_qargs, other_cargs) in zip(first.data, second.data):
+        if inst != other or [first_bits[bit] for bit in qargs + cargs] != [
+            second_bits[bit] for bit in other_qargs + other_cargs
+        ]:
+            return False
+    return True
+
+
+def _split_measurement(op: ComposedOp) -> Tuple[OperatorStateFn, CircuitStateFn]:
+    """Return the measurement and the circuit state function of a measured ComposedOp."""
+    if len(op.oplist) == 2:
+        measurement, state = op.oplist
+        if (
+            isinstance(measurement, OperatorStateFn)
+            and measurement.is_measurement
+            and isinstance(state, CircuitStateFn)
+            and not state.is_measurement
+        ):
+            return measurement, state
+    raise OpflowError(
+        "Can only compile compositions of an operator measurement and a circuit state function."
+    )
+
+
+def _diagonal_terms(primitive: OperatorBase) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the packed Z masks and the coefficients of a diagonal Pauli observable."""
+    if isinstance(primitive, PauliSumOp):
+        table = primitive.primitive.table
+        x, z = table.X, table.Z
+        if primitive.primitive.coeffs.dtype == object:
+            raise OpflowError("Cannot compile operators with unbound coefficients.")
+        coeffs = primitive.primitive.coeffs * _to_complex(primitive.coeff)
+    elif isinstance(primitive, PauliOp):
+        x, z = primitive.primitive.x[None, :], primitive.primitive.z[None, :]
+        coeffs = np.array([_to_complex(primitive.coeff)])
+    elif type(primitive) == SummedOp and all(  # pylint: disable=unidiomatic-typecheck
+        isinstance(op, PauliOp) for op in primitive.oplist
+    ):
+        x = np.array([op.primitive.x for op in primitive.oplist])
+        z = np.array([op.primitive.z for op in primitive.oplist])
+        coeffs = np.array([_to_complex(op.coeff) for op in primitive.oplist])
+        coeffs = coeffs * _to_complex(primitive.coeff)
+    else:
+        raise OpflowError(
+            "Can only compile measurements of Pauli operators, not {}.".format(
+                primitive.__class__.__name__
+            )
+        )
+    if np.any(x):
+        raise OpflowError("Can only compile measurements of diagonal Pauli operators.")
+    return PauliTable._pack_bits(z), np.asarray(coeffs, dtype=complex)
+
+
+def _to_complex(coeff) -> complex:
+    """Return a numeric coefficient as a complex number."""
+    if not isinstance(coeff, Number):
+        raise OpflowError("Cannot compile operators with unbound coefficients.")
+    return complex(coeff)
@@ -15,12 +15,14 @@
 from collections.abc import Iterable
 from copy import deepcopy
 from functools import partial
-from typing import List, Union, Tuple, Dict
+from typing import Callable, List, Optional, Union, Tuple, Dict
 
 import scipy
 import numpy as np
 from qiskit import transpile, QuantumCircuit
 from qiskit.circuit import Parameter, ParameterExpression, ParameterVector
+from qiskit.providers import BaseBackend
+from qiskit.utils.quantum_instance import QuantumInstance
 from .circuit_gradient import CircuitGradient
 from ...operator_base import OperatorBase
 from ...state_fns.state_fn import StateFn
@@ -160,7 +162,7 @@ class ParamShift(CircuitGradient):
                     "The following parameters do not appear in the provided operator: ",
                     absent_params,
                 )
-            return ListOp(absent_params)
+            return ListOp(param_grads)
 
         # By this point, it's only one parameter
         param = params
@@ -259,6 +261,168 @@ class ParamShift(CircuitGradient):
             else:
                 return SummedOp(shifted_ops).reduce()
 
+    def gradient_wrapper(
+        self,
+        operator: OperatorBase,
+        bind_params: Union[ParameterExpression, ParameterVector, List[ParameterExpression]],
+        grad_params: Optional[
+            Union[ParameterExpression, ParameterVector, List[ParameterExpression]]
+        ] = None,
+        backend: Optional[Union[BaseBackend, QuantumInstance]] = None,
+    ) -> Callable[[Iterable], np.ndarray]:
+        r"""Get a callable function which provides the gradient of an expectation value,
+        evaluating all parameter shifts in a single batch of circuits.
+
+        Instead of converting the operator into one shifted copy of the operator per parameter
+        occurrence, every parameterized gate parameter depending on ``grad_params`` is offset
+        by its own shift parameter in a single template circuit. Each evaluation binds the
+        template to a table of shifts (one +shift and one -shift binding per gate parameter)
+        and samples it with one :class:`~qiskit.opflow.CircuitSampler` call. The gradient is
+        then the product of the chain rule weights of the gate parameters with the shifted
+        differences.
+
+        Args:
+            operator: The expectation value we want the gradient of. It must contain a single
+                circuit, and its coefficients may not depend on ``grad_params``.
+            bind_params: The operator parameters to which the parameter values are assigned.
+            grad_params: The parameters with respect to which we are taking the gradient. If
+                grad_params = None, then grad_params = bind_params
+            backend: The quantum backend or QuantumInstance to use to evaluate the gradient.
+
+        Returns:
+            callable(param_values): Function to compute the gradient. The function takes an
+            iterable as argument which holds the parameter values.
+
+        Raises:
+            OpflowError: If the operator or parameters are not supported by the batched
+                gradient, in which case the gradient can be computed by :meth:`convert`.
+        """
+        # pylint: disable=cyclic-import
+        from ...converters.circuit_sampler import CircuitSampler
+        from ...expectations.pauli_expectation import PauliExpectation
+
+        if backend is None:
+            raise OpflowError("The batched parameter shift gradient requires a backend.")
+        if grad_params is None:
+            grad_params = bind_params
+        return_list = isinstance(grad_params, (ParameterVector, list))
+        grad_params = list(grad_params) if return_list else [grad_params]
+        if not all(isinstance(param, Parameter) for param in grad_params):
+            raise OpflowError("The batched parameter shift gradient only supports Parameters.")
+        if not _is_expectation(operator):
+            raise OpflowError(
+                "The batched parameter shift gradient only supports expectation values."
+            )
+
+        circs = self.get_unique_circuits(operator)
+        if len(circs) != 1:
+            raise OpflowError("The batched parameter shift gradient requires a single circuit.")
+        circ = circs[0]
+        stripped_op = self._replace_operator_circuit(operator, QuantumCircuit(circ.num_qubits))
+        if not stripped_op.parameters.isdisjoint(grad_params):
+            raise OpflowError(
+                "The batched parameter shift gradient does not support coefficients depending "
+                "on the gradient parameters."
+            )
+        if self.analytic:
+            circ = ParamShift._unroll_to_supported_operations(circ)
+
+        template, shift_params, weights = ParamShift._shift_template(circ, grad_params)
+        expec_op = PauliExpectation().convert(self._replace_operator_circuit(operator, template))
+        sampler = CircuitSampler(backend=backend)
+
+        num_shifts = len(shift_params)
+        if self.analytic:
+            shift, shift_constant = np.pi / 2, 0.5
+        else:
+            shift, shift_constant = self._epsilon, 1.0 / (2 * self._epsilon)
+        # binding 2 * j shifts gate parameter j by +shift, binding 2 * j + 1 by -shift
+        shift_table = np.zeros((num_shifts, 2 * num_shifts))
+        shift_table[np.arange(num_shifts), 2 * np.arange(num_shifts)] = shift
+        shift_table[np.arange(num_shifts), 2 * np.arange(num_shifts) + 1] = -shift
+        shift_bindings = dict(zip(shift_params, shift_table.tolist()))
+
+        constant_weights = np.zeros((len(grad_params), num_shifts))
+        expression_weights = []
+        for i, j, weight in weights:
+            if isinstance(weight, ParameterExpression):
+                expression_weights.append((i, j, weight))
+            else:
+                constant_weights[i, j] += weight
+
+        def gradient_fn(p_values):
+            p_values_dict = dict(zip(bind_params, p_values))
+            if num_shifts == 0:
+                grad = np.zeros(len(grad_params))
+                return grad if return_list else grad[0]
+
+            bindings = {param: [value] * (2 * num_shifts) for param, value in p_values_dict.items()}
+            bindings.update(shift_bindings)
+            values = np.real(np.asarray(sampler.convert(expec_op, bindings).eval()))
+            shift_grads = shift_constant * (values[0::2] - values[1::2])
+
+            chain_weights = constant_weights.copy()
+            for i, j, weight in expression_weights:
+                bound = weight.bind({param: p_values_dict[param] for param in weight.parameters})
+                chain_weights[i, j] += float(bound)
+            grad = np.tensordot(chain_weights, shift_grads, axes=1)
+            return grad if return_list else grad[0]
+
+        return gradient_fn
+
+    @staticmethod
+    def _shift_template(
+        circuit: QuantumCircuit, params: List[Parameter]
+    ) -> Tuple[
+        QuantumCircuit, ParameterVector, List[Tuple[int, int, Union[float, ParameterExpression]]]
+    ]:
+        """Offset each gate parameter depending on ``params`` by a new shift parameter.
+
+        Args:
+            circuit: The circuit to build the template from.
+            params: The parameters to take the gradient with respect to.
+
+        Returns:
+            The template circuit, the shift parameters, and the chain rule weights as
+            ``(index of the parameter, index of the shift parameter, derivative)`` triples.
+        """
+        param_indices = {param: i for i, param in enumerate(params)}
+        shifted = [
+            (index, k)
+            for index, (inst, _, _) in enumerate(circuit.data)
+            for k, inst_param in enumerate(inst.params)
+            if isinstance(inst_param, ParameterExpression)
+            and any(param in param_indices for param in inst_param.parameters)
+        ]
+        shift_params = ParameterVector("_shift", len(shifted))
+        shift_indices = {occurrence: j for j, occurrence in enumerate(shifted)}
+
+        template = QuantumCircuit(*circuit.qregs, *circuit.cregs, name=circuit.name)
+        template.global_phase = circuit.global_phase
+        weights = []
+        for index, (inst, qargs, cargs) in enumerate(circuit.data):
+            if any((index, k) in shift_indices for k in range(len(inst.params))):
+                inst = inst.copy()
+                for k, inst_param in enumerate(inst.params):
+                    if (index, k) not in shift_indices:
+                        continue
+                    j = shift_indices[(index, k)]
+                    inst.params[k] = inst_param + shift_params[j]
+                    for param in inst_param.parameters:
+                        if param not in param_indices:
+                            continue
+                        if inst_param == param:
+                            weights.append((param_indices[param], j, 1.0))
+                        else:
+                            weight = _coeff_derivative(inst_param, param)
+                            if isinstance(weight, ParameterExpression) and not weight.parameters:
+                                weight = complex(weight)
+                            if not isinstance(weight, ParameterExpression):
+                                weight = float(np.real(weight))
+                            weights.append((param_indices[param], j, weight))
+            template._append(inst, qargs, cargs)
+        return template, shift_params, weights
+
     @staticmethod
     def _prob_combo_fn(
         x: Union[
@@ -430,3 +594,19 @@ class ParamShift(CircuitGradient):
         if hasattr(operator, "primitive") and isinstance(operator.primitive, ListOp):
             return [operator.__class__(op) for op in operator.primitive]
         return operator
+
+
+def _is_expectation(operator: OperatorBase) -> bool:
+    """Return whether the operator evaluates to expectation values, or to sums or lists of them.
+
+    Only ``SummedOp`` and ``ListOp`` with the default ``combo_fn`` are accepted, since the shift
+    rule is applied to the combined values and thus only holds for combination functions which
+    are linear in the expectation values.
+    """
+    if isinstance(operator, ComposedOp):
+        return True
+    if isinstance(operator, SummedOp) or (
+        type(operator) == ListOp and operator.combo_fn == ListOp([]).combo_fn
+    ):
+        return all(_is_expectation(op) for op in operator.oplist)
+    return False
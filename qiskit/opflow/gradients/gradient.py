@@ -12,15 +12,20 @@
 
 """The base interface for Opflow's gradient."""
 
-from typing import Union, List, Optional
+from collections.abc import Iterable
+from typing import Callable, Union, List, Optional
 import functools
+import logging
 import numpy as np
 
 from qiskit.circuit.quantumcircuit import _compare_parameters
 from qiskit.exceptions import MissingOptionalLibraryError
 from qiskit.circuit import ParameterExpression, ParameterVector
+from qiskit.providers import BaseBackend
+from qiskit.utils.quantum_instance import QuantumInstance
 from ..expectations.pauli_expectation import PauliExpectation
 from .gradient_base import GradientBase
+from .circuit_gradients.param_shift import ParamShift
 from .derivative_base import _coeff_derivative
 from ..list_ops.composed_op import ComposedOp
 from ..list_ops.list_op import ListOp
@@ -38,6 +43,8 @@ try:
 except ImportError:
     _HAS_JAX = False
 
+logger = logging.getLogger(__name__)
+
 
 class Gradient(GradientBase):
     """Convert an operator expression to the first-order gradient."""
@@ -85,6 +92,43 @@ class Gradient(GradientBase):
         cleaned_op = self._factor_coeffs_out_of_composed_op(expec_op)
         return self.get_gradient(cleaned_op, param)
 
+    def gradient_wrapper(
+        self,
+        operator: OperatorBase,
+        bind_params: Union[ParameterExpression, ParameterVector, List[ParameterExpression]],
+        grad_params: Optional[
+            Union[ParameterExpression, ParameterVector, List[ParameterExpression]]
+        ] = None,
+        backend: Optional[Union[BaseBackend, QuantumInstance]] = None,
+    ) -> Callable[[Iterable], np.ndarray]:
+        """Get a callable function which provides the gradient for given parameter values.
+
+        With the parameter shift method and a backend, expectation value gradients are computed
+        by :meth:`~qiskit.opflow.gradients.circuit_gradients.ParamShift.gradient_wrapper`,
+        which evaluates all parameter shifts in a single batch of circuits.
+
+        Args:
+            operator: The operator for which we want to get the gradient.
+            bind_params: The operator parameters to which the parameter values are assigned.
+            grad_params: The parameters with respect to which we are taking the gradient.
+                If grad_params = None, then grad_params = bind_params
+            backend: The quantum backend or QuantumInstance to use to evaluate the gradient.
+
+        Returns:
+            callable(param_values): Function to compute the gradient. The function takes an
+            iterable as argument which holds the parameter values.
+        """
+        if backend is not None and isinstance(self.grad_method, ParamShift):
+            try:
+                return self.grad_method.gradient_wrapper(
+                    operator, bind_params, grad_params=grad_params, backend=backend
+                )
+            except OpflowError as ex:
+                logger.debug("Evaluating the gradient operator instead of batched shifts: %s", ex)
+        return super().gradient_wrapper(
+            operator, bind_params, grad_params=grad_params, backend=backend
+        )
+
     # pylint: disable=too-many-return-statements
     def get_gradient(
         self,
@@ -12,15 +12,20 @@
 
 """ SummedOp Class """
 
-from typing import List, Union, cast
+import operator
+from functools import reduce
+from typing import Dict, List, Optional, Tuple, Union, cast
 
 import numpy as np
+from scipy.sparse import spmatrix
+from scipy.sparse.linalg import LinearOperator
 
 from qiskit import QuantumCircuit
 from qiskit.circuit import ParameterExpression
 from qiskit.opflow.exceptions import OpflowError
 from qiskit.opflow.list_ops.list_op import ListOp
 from qiskit.opflow.operator_base import OperatorBase
+from qiskit.quantum_info import SparsePauliOp, Statevector
 
 
 class SummedOp(ListOp):
@@ -87,27 +92,39 @@ class SummedOp(ListOp):
             A simplified ``SummedOp`` equivalent to self.
         """
         # pylint: disable=cyclic-import
+        from ..primitive_ops.pauli_op import PauliOp
         from ..primitive_ops.primitive_op import PrimitiveOp
 
         oplist = []  # type: List[OperatorBase]
         coeffs = []  # type: List[Union[int, float, complex, ParameterExpression]]
+        # Paulis are merged by their symplectic representation, so that collecting N terms does
+        # not need O(N^2) comparisons. Other operators are compared with ``==`` as before.
+        pauli_indices = {}  # type: Dict[Tuple[bytes, bytes, int], int]
+        other_indices = []  # type: List[int]
+
+        def _merge(new_op, new_coeff):
+            for index in other_indices:
+                if oplist[index] == new_op:
+                    coeffs[index] += new_coeff
+                    return
+            other_indices.append(len(oplist))
+            oplist.append(new_op)
+            coeffs.append(new_coeff)
+
         for op in self.oplist:
-            if isinstance(op, PrimitiveOp):
-                new_op = PrimitiveOp(op.primitive)
+            if isinstance(op, PauliOp):
+                key = (op.primitive.x.tobytes(), op.primitive.z.tobytes(), op.primitive.phase)
                 new_coeff = op.coeff * self.coeff
-                if new_op in oplist:
-                    index = oplist.index(new_op)
-                    coeffs[index] += new_coeff
+                if key in pauli_indices:
+                    coeffs[pauli_indices[key]] += new_coeff
                 else:
-                    oplist.append(new_op)
+                    pauli_indices[key] = len(oplist)
+                    oplist.append(PauliOp(op.primitive))
                     coeffs.append(new_coeff)
+            elif isinstance(op, PrimitiveOp):
+                _merge(PrimitiveOp(op.primitive), op.coeff * self.coeff)
             else:
-                if op in oplist:
-                    index = oplist.index(op)
-                    coeffs[index] += self.coeff
-                else:
-                    oplist.append(op)
-                    coeffs.append(self.coeff)
+                _merge(op, self.coeff)
         return SummedOp([op * coeff for op, coeff in zip(oplist, coeffs)])
 
     # TODO be smarter about the fact that any two ops in oplist could be evaluated for sum.
@@ -124,7 +141,15 @@ class SummedOp(ListOp):
             return SummedOp([], coeff=self.coeff, abelian=self.abelian)
 
         # reduce constituents
-        reduced_ops = sum(op.reduce() for op in self.oplist) * self.coeff
+        reduced_ops = [op.reduce() for op in self.oplist]
+
+        # sums of Paulis are collected into a single PauliSumOp at once rather than by adding
+        # the terms pairwise, which copies the accumulated terms for every summand
+        pauli_sum = SummedOp._to_pauli_sum_op(reduced_ops, self.coeff)
+        if pauli_sum is not None and not SummedOp._is_single_pauli(reduced_ops):
+            return pauli_sum.reduce()
+
+        reduced_ops = sum(reduced_ops) * self.coeff
 
         # group duplicate operators
         if isinstance(reduced_ops, SummedOp):
@@ -141,6 +166,90 @@ class SummedOp(ListOp):
         else:
             return cast(OperatorBase, reduced_ops)
 
+    def eval(
+        self,
+        front: Optional[
+            Union[str, Dict[str, complex], np.ndarray, OperatorBase, Statevector]
+        ] = None,
+    ) -> Union[OperatorBase, complex]:
+        """Evaluate the sum on ``front``, see :meth:`ListOp.eval`.
+
+        If all summands are ``PauliOp`` or ``PauliSumOp`` operators with numeric coefficients and
+        ``front`` is a dict or vector state, the summands are combined into a single
+        ``PauliSumOp`` which is applied to ``front`` at once, instead of evaluating and adding up
+        the summands one by one.
+        """
+        # pylint: disable=cyclic-import
+        from ..state_fns.dict_state_fn import DictStateFn
+        from ..state_fns.state_fn import StateFn
+        from ..state_fns.vector_state_fn import VectorStateFn
+
+        if front is not None:
+            pauli_sum = SummedOp._to_pauli_sum_op(self.oplist, self.coeff)
+            if pauli_sum is not None:
+                if not isinstance(front, OperatorBase):
+                    front = StateFn(front, is_measurement=False)
+                if (
+                    isinstance(front, (DictStateFn, VectorStateFn))
+                    and not front.is_measurement
+                    and front.num_qubits == pauli_sum.num_qubits
+                ):
+                    return pauli_sum.eval(front)
+
+        return super().eval(front)
+
+    @staticmethod
+    def _to_pauli_sum_op(
+        oplist: List[OperatorBase], coeff: Union[complex, ParameterExpression] = 1.0
+    ) -> Optional[OperatorBase]:
+        """Combine the summands ``oplist`` into one ``PauliSumOp``.
+
+        Returns:
+            The ``PauliSumOp`` equal to the sum of ``oplist`` times ``coeff``, or ``None`` if
+            ``oplist`` is empty, contains anything but ``PauliOp`` and ``PauliSumOp`` operators on
+            the same number of qubits, or any coefficient is parameterized.
+        """
+        # pylint: disable=cyclic-import
+        from ..primitive_ops.pauli_op import PauliOp
+        from ..primitive_ops.pauli_sum_op import PauliSumOp
+
+        if (
+            len(oplist) == 0
+            or not isinstance(coeff, (int, float, complex))
+            or not all(
+                isinstance(op, (PauliOp, PauliSumOp))
+                and isinstance(op.coeff, (int, float, complex))
+                and op.num_qubits == oplist[0].num_qubits
+                for op in oplist
+            )
+        ):
+            return None
+
+        xs, zs, coeffs = [], [], []
+        for op in oplist:
+            if isinstance(op, PauliOp):
+                xs.append(op.primitive.x[np.newaxis, :])
+                zs.append(op.primitive.z[np.newaxis, :])
+                coeffs.append([op.coeff * (-1j) ** op.primitive.phase])
+            else:
+                xs.append(op.primitive.table.X)
+                zs.append(op.primitive.table.Z)
+                coeffs.append(op.coeff * op.primitive.coeffs)
+        primitive = SparsePauliOp(
+            np.hstack([np.vstack(xs), np.vstack(zs)]), coeff * np.hstack(coeffs).astype(complex)
+        )
+        return PauliSumOp(primitive)
+
+    @staticmethod
+    def _is_single_pauli(oplist: List[OperatorBase]) -> bool:
+        """Return whether ``oplist`` consists of ``PauliOp`` operators with the same primitive,
+        which sum to a ``PauliOp`` rather than a ``PauliSumOp``."""
+        # pylint: disable=cyclic-import
+        from ..primitive_ops.pauli_op import PauliOp
+
+        first = oplist[0]
+        return all(isinstance(op, PauliOp) and op.primitive == first.primitive for op in oplist)
+
     def to_circuit(self) -> QuantumCircuit:
         """Returns the quantum circuit, representing the SummedOp. In the first step,
         the SummedOp is converted to MatrixOp. This is straightforward for most operators,
@@ -168,15 +277,47 @@ class SummedOp(ListOp):
             "not return a MatrixOp."
         )
 
+    def to_matrix(self, massive: bool = False) -> np.ndarray:
+        pauli_sum = SummedOp._to_pauli_sum_op(self.oplist, self.coeff)
+        if pauli_sum is not None:
+            return pauli_sum.to_matrix(massive=massive)
+        return super().to_matrix(massive=massive)
+
+    def to_spmatrix(self) -> Union[spmatrix, List[spmatrix]]:
+        pauli_sum = SummedOp._to_pauli_sum_op(self.oplist, self.coeff)
+        if pauli_sum is not None:
+            return pauli_sum.to_spmatrix()
+        return super().to_spmatrix()
+
     def to_matrix_op(self, massive: bool = False) -> "SummedOp":
         """Returns an equivalent Operator composed of only NumPy-based primitives, such as
         ``MatrixOp`` and ``VectorStateFn``."""
+        pauli_sum = SummedOp._to_pauli_sum_op(self.oplist, self.coeff)
+        if pauli_sum is not None:
+            return cast(SummedOp, pauli_sum.to_matrix_op(massive=massive))
+
         accum = self.oplist[0].to_matrix_op(massive=massive)
         for i in range(1, len(self.oplist)):
             accum += self.oplist[i].to_matrix_op(massive=massive)
 
         return cast(SummedOp, accum * self.coeff)
 
+    def to_linear_operator(self) -> LinearOperator:
+        """Returns a SciPy ``LinearOperator`` representation of the sum.
+
+        If all summands are ``PauliOp`` or ``PauliSumOp`` operators the terms are combined into a
+        single matrix-free ``LinearOperator`` acting directly on their symplectic representation.
+        Otherwise the ``LinearOperator`` representations of the summands are added.
+
+        Returns:
+            The SciPy ``LinearOperator`` equivalent to this Operator.
+        """
+        pauli_sum = SummedOp._to_pauli_sum_op(self.oplist, self.coeff)
+        if pauli_sum is not None:
+            return pauli_sum.to_linear_operator()
+
+        return reduce(operator.add, [op.to_linear_operator() for op in self.oplist]) * self.coeff
+
     def to_pauli_op(self, massive: bool = False) -> "SummedOp":
         # pylint: disable=cyclic-import
         from ..state_fns.state_fn import StateFn
@@ -19,6 +19,7 @@ from typing import Dict, List, Optional, Set, Tuple, Union, cast
 
 import numpy as np
 from scipy.sparse import csr_matrix, spmatrix
+from scipy.sparse.linalg import LinearOperator, aslinearoperator
 
 from qiskit.circuit import ParameterExpression, ParameterVector
 from qiskit.opflow.exceptions import OpflowError
@@ -155,6 +156,19 @@ class OperatorBase(ABC):
         """
         return csr_matrix(self.to_matrix())
 
+    def to_linear_operator(self) -> LinearOperator:
+        r"""Return a SciPy ``LinearOperator`` representation of the Operator, which can be used
+        with SciPy's iterative solvers such as ``scipy.sparse.linalg.eigsh``.
+
+        By default this wraps the sparse matrix returned by :meth:`to_spmatrix`. Operators which
+        can be applied to a vector without constructing their matrix, such as sums of Paulis,
+        return a matrix-free ``LinearOperator`` instead.
+
+        Returns:
+              The SciPy ``LinearOperator`` equivalent to this Operator.
+        """
+        return aslinearoperator(self.to_spmatrix())
+
     @staticmethod
     def _indent(lines: str, indentation: str = INDENTATION) -> str:
         """Indented representation to allow pretty representation of nested operators."""
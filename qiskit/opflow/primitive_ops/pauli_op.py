@@ -16,6 +16,7 @@ from typing import Dict, List, Optional, Set, Union, cast
 
 import numpy as np
 from scipy.sparse import spmatrix
+from scipy.sparse.linalg import LinearOperator
 
 from qiskit import QuantumCircuit
 from qiskit.circuit import Instruction, ParameterExpression
@@ -192,6 +193,16 @@ class PauliOp(PrimitiveOp):
         """
         return self.primitive.to_matrix(sparse=True) * self.coeff
 
+    def to_linear_operator(self) -> LinearOperator:
+        """Returns a matrix-free SciPy ``LinearOperator`` representation of the Operator.
+
+        Returns:
+            ``LinearOperator`` which computes products with the Pauli directly from its
+            symplectic representation.
+        """
+        coeff = self.coeff * (-1j) ** self.primitive.phase
+        return SparsePauliOp(self.primitive, coeffs=[coeff]).to_linear_operator()
+
     def __str__(self) -> str:
         prim_str = str(self.primitive)
         if self.coeff == 1.0:
@@ -235,28 +246,20 @@ class PauliOp(PrimitiveOp):
                 )
 
             if isinstance(front, DictStateFn):
-
-                new_dict: Dict[str, complex] = {}
-                corrected_x_bits = self.primitive.x[::-1]
-                corrected_z_bits = self.primitive.z[::-1]
-
-                for bstr, v in front.primitive.items():
-                    bitstr = np.fromiter(bstr, dtype=int).astype(bool)
-                    new_b_str = np.logical_xor(bitstr, corrected_x_bits)
-                    new_str = "".join(map(str, 1 * new_b_str))
-                    z_factor = np.product(1 - 2 * np.logical_and(bitstr, corrected_z_bits))
-                    y_factor = np.product(
-                        np.sqrt(1 - 2 * np.logical_and(corrected_x_bits, corrected_z_bits) + 0j)
-                    )
-                    new_dict[new_str] = (v * z_factor * y_factor) + new_dict.get(new_str, 0)
-                    # The coefficient consists of:
-                    #   1. the coefficient of *this* PauliOp (self)
-                    #   2. the coefficient of the evaluated DictStateFn (front)
-                    #   3. AND acquires the phase of the internal primitive. This is necessary to
-                    #      ensure that (X @ Z) and (-iY) return the same result.
-                    new_front = StateFn(
-                        new_dict, coeff=self.coeff * front.coeff * (-1j) ** self.primitive.phase
-                    )
+                indices, values = front._apply_paulis(
+                    self.primitive.x[None, :], self.primitive.z[None, :], np.ones(1)
+                )
+                # The coefficient consists of:
+                #   1. the coefficient of *this* PauliOp (self)
+                #   2. the coefficient of the evaluated DictStateFn (front)
+                #   3. AND acquires the phase of the internal primitive. This is necessary to
+                #      ensure that (X @ Z) and (-iY) return the same result.
+                new_front = DictStateFn._from_arrays(
+                    indices,
+                    values,
+                    front.num_qubits,
+                    coeff=self.coeff * front.coeff * (-1j) ** self.primitive.phase,
+                )
 
             elif isinstance(front, StateFn) and front.is_measurement:
                 raise ValueError("Operator composed with a measurement is undefined.")
@@ -12,11 +12,11 @@
 
 """PauliSumOp Class """
 
-from collections import defaultdict
 from typing import Dict, List, Optional, Set, Tuple, Union, cast
 
 import numpy as np
 from scipy.sparse import spmatrix
+from scipy.sparse.linalg import LinearOperator
 
 from qiskit.circuit import Instruction, ParameterExpression
 from qiskit.opflow.exceptions import OpflowError
@@ -237,9 +237,7 @@ class PauliSumOp(PrimitiveOp):
 
     def to_matrix(self, massive: bool = False) -> np.ndarray:
         OperatorBase._check_massive("to_matrix", True, self.num_qubits, massive)
-        if isinstance(self.coeff, ParameterExpression):
-            return (self.primitive.to_matrix(sparse=True)).toarray() * self.coeff
-        return (self.primitive.to_matrix(sparse=True) * self.coeff).toarray()
+        return self.primitive.to_matrix() * self.coeff
 
     def __str__(self) -> str:
         def format_sign(x):
@@ -277,6 +275,7 @@ class PauliSumOp(PrimitiveOp):
         from ..state_fns.circuit_state_fn import CircuitStateFn
         from ..state_fns.dict_state_fn import DictStateFn
         from ..state_fns.state_fn import StateFn
+        from ..state_fns.vector_state_fn import VectorStateFn
         from .circuit_op import CircuitOp
 
         # For now, always do this. If it's not performant, we can be more granular.
@@ -297,22 +296,12 @@ class PauliSumOp(PrimitiveOp):
                 )
 
             if isinstance(front, DictStateFn):
-                new_dict: Dict[str, int] = defaultdict(int)
-                corrected_x_bits = self.primitive.table.X[::, ::-1]
-                corrected_z_bits = self.primitive.table.Z[::, ::-1]
-                coeffs = self.primitive.coeffs
-                for bstr, v in front.primitive.items():
-                    bitstr = np.fromiter(bstr, dtype=int).astype(bool)
-                    new_b_str = np.logical_xor(bitstr, corrected_x_bits)
-                    new_str = ["".join([str(b) for b in bs]) for bs in new_b_str.astype(int)]
-                    z_factor = np.product(1 - 2 * np.logical_and(bitstr, corrected_z_bits), axis=1)
-                    y_factor = np.product(
-                        np.sqrt(1 - 2 * np.logical_and(corrected_x_bits, corrected_z_bits) + 0j),
-                        axis=1,
-                    )
-                    for i, n_str in enumerate(new_str):
-                        new_dict[n_str] += v * z_factor[i] * y_factor[i] * coeffs[i]
-                return DictStateFn(new_dict, coeff=self.coeff * front.coeff)
+                indices, values = front._apply_paulis(
+                    self.primitive.table.X, self.primitive.table.Z, self.primitive.coeffs
+                )
+                return DictStateFn._from_arrays(
+                    indices, values, front.num_qubits, coeff=self.coeff * front.coeff
+                )
 
             elif isinstance(front, StateFn) and front.is_measurement:
                 raise ValueError("Operator composed with a measurement is undefined.")
@@ -321,6 +310,13 @@ class PauliSumOp(PrimitiveOp):
             elif isinstance(front, (PauliSumOp, PauliOp, CircuitOp, CircuitStateFn)):
                 return self.compose(front).eval()
 
+            # Apply the operator to the vector without constructing its matrix
+            elif isinstance(front, VectorStateFn) and not isinstance(
+                self.coeff, ParameterExpression
+            ):
+                vec = self.primitive._matvec(front.primitive.data)
+                return VectorStateFn(vec * (self.coeff * front.coeff))
+
         # Covers VectorStateFn and OperatorStateFn
         front = cast(StateFn, front)
         return self.to_matrix_op().eval(front.to_matrix_op())
@@ -407,6 +403,15 @@ class PauliSumOp(PrimitiveOp):
         """
         return self.primitive.to_matrix(sparse=True) * self.coeff
 
+    def to_linear_operator(self) -> LinearOperator:
+        """Returns a matrix-free SciPy ``LinearOperator`` representation of the ``PauliSumOp``.
+
+        Returns:
+            ``LinearOperator`` which computes products with the ``PauliSumOp`` directly from the
+            symplectic representation of its terms.
+        """
+        return (self.coeff * self.primitive).to_linear_operator()
+
     @classmethod
     def from_list(
         cls,
@@ -12,8 +12,7 @@
 
 """ DictStateFn Class """
 
-import itertools
-from typing import Dict, List, Optional, Set, Union, cast
+from typing import Dict, List, Optional, Set, Tuple, Union, cast
 
 import numpy as np
 from scipy import sparse
@@ -25,6 +24,7 @@ from qiskit.opflow.operator_base import OperatorBase
 from qiskit.opflow.state_fns.state_fn import StateFn
 from qiskit.opflow.state_fns.vector_state_fn import VectorStateFn
 from qiskit.quantum_info import Statevector
+from qiskit.quantum_info.operators.symplectic.pauli_table import PauliTable
 from qiskit.result import Result
 from qiskit.utils import algorithm_globals
 
@@ -32,9 +32,12 @@ from qiskit.utils import algorithm_globals
 class DictStateFn(StateFn):
     """A class for state functions and measurements which are defined by a lookup table,
     stored in a dict.
-    """
 
-    primitive: Dict[str, complex]
+    Alongside the dict, the state function keeps arrays of the integer values of its
+    bitstrings and of their amplitudes, which are used to vectorize evaluation and
+    algebra. State functions created from these arrays only build the dict when the
+    ``primitive`` is accessed.
+    """
 
     # TODO allow normalization somehow?
     def __init__(
@@ -80,13 +83,71 @@ class DictStateFn(StateFn):
             )
 
         super().__init__(primitive, coeff=coeff, is_measurement=is_measurement)
+        self._indices: Optional[np.ndarray] = None
+        self._values: Optional[np.ndarray] = None
+        self._num_qubits = _key_length(next(iter(primitive))) if primitive else None
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        indices: np.ndarray,
+        values: np.ndarray,
+        num_qubits: int,
+        coeff: Union[complex, ParameterExpression] = 1.0,
+        is_measurement: bool = False,
+    ) -> "DictStateFn":
+        """Create a DictStateFn from arrays of integer bitstrings and amplitudes.
+
+        Args:
+            indices: The integer values of the bitstrings, which must be unique.
+            values: The amplitude of each bitstring.
+            num_qubits: The number of qubits.
+            coeff: A coefficient by which to multiply the state function.
+            is_measurement: Whether the StateFn is a measurement operator.
+
+        Returns:
+            The state function, whose dict primitive is only built when accessed.
+        """
+        state_fn = cls({}, coeff=coeff, is_measurement=is_measurement)
+        state_fn._primitive = None
+        state_fn._indices = indices
+        state_fn._values = values
+        state_fn._num_qubits = num_qubits
+        return state_fn
+
+    @property
+    def primitive(self) -> Dict[str, complex]:
+        """The dict of bitstrings and amplitudes which defines the state function."""
+        if self._primitive is None:
+            num_qubits = self._num_qubits
+            self._primitive = {
+                format(index, "b").zfill(num_qubits): value
+                for index, value in zip(self._indices.tolist(), self._values.tolist())
+            }
+        return self._primitive
+
+    def _to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the arrays of the integer bitstrings and the amplitudes of the primitive.
+
+        The integers are ``int64`` for up to 62 qubits and Python integers otherwise. The
+        spaces separating the registers in the keys of counts are ignored.
+        """
+        if self._indices is None:
+            self._indices = np.array(
+                [int(key.replace(" ", ""), 2) for key in self.primitive],
+                dtype=_index_dtype(self.num_qubits),
+            )
+            self._values = np.array(list(self.primitive.values()))
+        return self._indices, self._values
 
     def primitive_strings(self) -> Set[str]:
         return {"Dict"}
 
     @property
     def num_qubits(self) -> int:
-        return len(next(iter(self.primitive)))
+        if self._num_qubits is None:
+            self._num_qubits = _key_length(next(iter(self.primitive)))
+        return self._num_qubits
 
     def add(self, other: OperatorBase) -> OperatorBase:
         if not self.num_qubits == other.num_qubits:
@@ -98,12 +159,28 @@ class DictStateFn(StateFn):
         # Right now doesn't make sense to add a StateFn to a Measurement
         if isinstance(other, DictStateFn) and self.is_measurement == other.is_measurement:
             # TODO add compatibility with vector and Operator?
-            if self.primitive == other.primitive:
-                return DictStateFn(
-                    self.primitive,
+            self_indices, self_values = self._to_arrays()
+            other_indices, other_values = other._to_arrays()
+            if np.array_equal(self_indices, other_indices) and np.array_equal(
+                self_values, other_values
+            ):
+                return DictStateFn._from_arrays(
+                    self_indices,
+                    self_values,
+                    self.num_qubits,
                     coeff=self.coeff + other.coeff,
                     is_measurement=self.is_measurement,
                 )
+            elif not isinstance(self.coeff, ParameterExpression) and not isinstance(
+                other.coeff, ParameterExpression
+            ):
+                indices, values = _sum_duplicates(
+                    np.concatenate((self_indices, other_indices)),
+                    np.concatenate((self_values * self.coeff, other_values * other.coeff)),
+                )
+                return DictStateFn._from_arrays(
+                    indices, values, self.num_qubits, is_measurement=self._is_measurement
+                )
             else:
                 new_dict = {
                     b: (v * self.coeff) + (other.primitive.get(b, 0) * other.coeff)
@@ -123,8 +200,11 @@ class DictStateFn(StateFn):
         return SummedOp([self, other])
 
     def adjoint(self) -> "DictStateFn":
-        return DictStateFn(
-            {b: np.conj(v) for (b, v) in self.primitive.items()},
+        indices, values = self._to_arrays()
+        return DictStateFn._from_arrays(
+            indices,
+            np.conj(values),
+            self.num_qubits,
             coeff=self.coeff.conjugate(),
             is_measurement=(not self.is_measurement),
         )
@@ -134,36 +214,49 @@ class DictStateFn(StateFn):
         if self.num_qubits != len(permutation):
             raise OpflowError("New index must be defined for each qubit of the operator.")
 
-        # helper function to permute the key
-        def perm(key):
-            list_key = ["0"] * new_num_qubits
-            for i, k in enumerate(permutation):
-                list_key[k] = key[i]
-            return "".join(list_key)
-
-        new_dict = {perm(key): value for key, value in self.primitive.items()}
-        return DictStateFn(new_dict, coeff=self.coeff, is_measurement=self.is_measurement)
+        # Character i of a key is bit num_qubits - 1 - i of its integer value
+        indices, values = self._to_arrays()
+        indices = indices.astype(_index_dtype(new_num_qubits))
+        new_indices = np.zeros_like(indices)
+        for i, k in enumerate(permutation):
+            new_indices |= ((indices >> (self.num_qubits - 1 - i)) & 1) << (new_num_qubits - 1 - k)
+        return DictStateFn._from_arrays(
+            new_indices,
+            values,
+            new_num_qubits,
+            coeff=self.coeff,
+            is_measurement=self.is_measurement,
+        )
 
     def _expand_dim(self, num_qubits: int) -> "DictStateFn":
-        pad = "0" * num_qubits
-        new_dict = {key + pad: value for key, value in self.primitive.items()}
-        return DictStateFn(new_dict, coeff=self.coeff, is_measurement=self.is_measurement)
+        new_num_qubits = self.num_qubits + num_qubits
+        indices, values = self._to_arrays()
+        new_indices = indices.astype(_index_dtype(new_num_qubits)) << num_qubits
+        return DictStateFn._from_arrays(
+            new_indices,
+            values,
+            new_num_qubits,
+            coeff=self.coeff,
+            is_measurement=self.is_measurement,
+        )
 
     def tensor(self, other: OperatorBase) -> OperatorBase:
         # Both dicts
         if isinstance(other, DictStateFn):
-            new_dict = {
-                k1 + k2: v1 * v2
-                for (
-                    (
-                        k1,
-                        v1,
-                    ),
-                    (k2, v2),
-                ) in itertools.product(self.primitive.items(), other.primitive.items())
-            }
-            return StateFn(
-                new_dict, coeff=self.coeff * other.coeff, is_measurement=self.is_measurement
+            new_num_qubits = self.num_qubits + other.num_qubits
+            dtype = _index_dtype(new_num_qubits)
+            self_indices, self_values = self._to_arrays()
+            other_indices, other_values = other._to_arrays()
+            new_indices = (self_indices.astype(dtype)[:, None] << other.num_qubits) | (
+                other_indices.astype(dtype)[None, :]
+            )
+            new_values = self_values[:, None] * other_values[None, :]
+            return DictStateFn._from_arrays(
+                new_indices.ravel(),
+                new_values.ravel(),
+                new_num_qubits,
+                coeff=self.coeff * other.coeff,
+                is_measurement=self.is_measurement,
             )
         # pylint: disable=cyclic-import
         from ..list_ops.tensored_op import TensoredOp
@@ -179,8 +272,8 @@ class DictStateFn(StateFn):
         OperatorBase._check_massive("to_matrix", False, self.num_qubits, massive)
         states = int(2 ** self.num_qubits)
         probs = np.zeros(states) + 0.0j
-        for k, v in self.primitive.items():
-            probs[int(k, 2)] = v
+        indices, values = self._to_arrays()
+        probs[indices] = values
         vec = probs * self.coeff
 
         # Reshape for measurements so np.dot still works for composition.
@@ -196,8 +289,8 @@ class DictStateFn(StateFn):
             ValueError: invalid parameters.
         """
 
-        indices = [int(v, 2) for v in self.primitive.keys()]
-        vals = np.array(list(self.primitive.values())) * self.coeff
+        indices, vals = self._to_arrays()
+        vals = vals * self.coeff
         spvec = sparse.csr_matrix(
             (vals, (np.zeros(len(indices), dtype=int), indices)), shape=(1, 2 ** self.num_qubits)
         )
@@ -262,13 +355,16 @@ class DictStateFn(StateFn):
         # we define all missing strings to have a function value of
         # zero.
         if isinstance(front, DictStateFn):
+            overlap = 0
+            if self.num_qubits == front.num_qubits:
+                self_indices, self_values = self._to_arrays()
+                front_indices, front_values = front._to_arrays()
+                _, self_pos, front_pos = np.intersect1d(
+                    self_indices, front_indices, assume_unique=True, return_indices=True
+                )
+                overlap = np.sum(self_values[self_pos] * front_values[front_pos])
             return np.round(
-                cast(
-                    float,
-                    sum([v * front.primitive.get(b, 0) for (b, v) in self.primitive.items()])
-                    * self.coeff
-                    * front.coeff,
-                ),
+                cast(float, overlap * self.coeff * front.coeff),
                 decimals=EVAL_SIG_DIGITS,
             )
 
@@ -278,12 +374,9 @@ class DictStateFn(StateFn):
             # TODO does it need to be this way for measurement?
             # return sum([v * front.primitive.data[int(b, 2)] *
             # np.conj(front.primitive.data[int(b, 2)])
+            indices, values = self._to_arrays()
             return np.round(
-                cast(
-                    float,
-                    sum([v * front.primitive.data[int(b, 2)] for (b, v) in self.primitive.items()])
-                    * self.coeff,
-                ),
+                cast(float, np.sum(values * front.primitive.data[indices]) * self.coeff),
                 decimals=EVAL_SIG_DIGITS,
             )
 
@@ -307,16 +400,81 @@ class DictStateFn(StateFn):
     def sample(
         self, shots: int = 1024, massive: bool = False, reverse_endianness: bool = False
     ) -> Dict[str, float]:
-        probs = np.square(np.abs(np.array(list(self.primitive.values()))))
-        unique, counts = np.unique(
-            algorithm_globals.random.choice(
-                list(self.primitive.keys()), size=shots, p=(probs / sum(probs))
-            ),
-            return_counts=True,
-        )
-        counts = dict(zip(unique, counts))
+        indices, values = self._to_arrays()
+        probs = np.square(np.abs(values))
+        samples = algorithm_globals.random.choice(len(indices), size=shots, p=(probs / sum(probs)))
+        # Sorting the integer bitstrings sorts the keys as strings
+        unique, counts = np.unique(indices[samples], return_counts=True)
+        num_qubits = self.num_qubits
+        counts = {
+            format(index, "b").zfill(num_qubits): count
+            for index, count in zip(unique.tolist(), counts)
+        }
         if reverse_endianness:
             scaled_dict = {bstr[::-1]: (prob / shots) for (bstr, prob) in counts.items()}
         else:
             scaled_dict = {bstr: (prob / shots) for (bstr, prob) in counts.items()}
         return dict(sorted(scaled_dict.items(), key=lambda x: x[1], reverse=True))
+
+    def _apply_paulis(
+        self, x: np.ndarray, z: np.ndarray, coeffs: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Apply a sum of Paulis to the state function.
+
+        Args:
+            x: Boolean array of shape ``(num_paulis, num_qubits)`` of the X bits of the Paulis.
+            z: Boolean array of shape ``(num_paulis, num_qubits)`` of the Z bits of the Paulis.
+            coeffs: The coefficient of each Pauli.
+
+        Returns:
+            The arrays of the unique integer bitstrings and the amplitudes of the result,
+            without the coefficient of the state function.
+        """
+        indices, values = self._to_arrays()
+        dtype = indices.dtype
+        weights = np.array([1 << qubit for qubit in range(self.num_qubits)], dtype=dtype)
+        x_masks = np.dot(x.astype(dtype), weights)
+        z_masks = np.dot(z.astype(dtype), weights)
+        # Each Y contributes a factor of i, and each Z on a 1 bit a factor of -1
+        factors = coeffs * _I_POWERS[_bit_count(x_masks & z_masks) % 4]
+        signs = 1 - 2 * (_bit_count(indices[None, :] & z_masks[:, None]) % 2)
+        amplitudes = (factors[:, None] * signs) * values[None, :]
+        if not np.any(x_masks):
+            # Diagonal Paulis leave the bitstrings unchanged
+            return indices, np.sum(amplitudes, axis=0)
+        return _sum_duplicates((indices[None, :] ^ x_masks[:, None]).ravel(), amplitudes.ravel())
+
+
+_I_POWERS = np.array([1, 1j, -1, -1j])
+
+
+def _key_length(key: str) -> int:
+    """Return the number of qubits of a bitstring, whose registers may be separated by spaces."""
+    return len(key) - key.count(" ")
+
+
+def _index_dtype(num_qubits: int) -> type:
+    """Return the dtype of the integer bitstrings of a number of qubits."""
+    return np.int64 if num_qubits < 63 else object
+
+
+def _bit_count(array: np.ndarray) -> np.ndarray:
+    """Return the number of set bits of each integer in an array."""
+    if array.dtype == object:
+        return np.array([bin(value).count("1") for value in array.ravel()], dtype=int).reshape(
+            array.shape
+        )
+    return PauliTable._count_bits(array.ravel().astype(np.uint64)).reshape(array.shape)
+
+
+def _sum_duplicates(indices: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the unique integer bitstrings and the summed amplitudes of each."""
+    unique, inverse = np.unique(indices, return_inverse=True)
+    if values.dtype.kind in "fc":
+        summed = np.bincount(inverse, weights=values.real, minlength=len(unique))
+        if values.dtype.kind == "c":
+            summed = summed + 1j * np.bincount(inverse, weights=values.imag, minlength=len(unique))
+        return unique, summed
+    summed = np.zeros(len(unique), dtype=values.dtype)
+    np.add.at(summed, inverse, values)
+    return unique, summed
@@ -208,14 +208,9 @@ class VectorStateFn(StateFn):
         from .dict_state_fn import DictStateFn
 
         if isinstance(front, DictStateFn):
+            indices, values = front._to_arrays()
             return np.round(
-                sum(
-                    [
-                        v * self.primitive.data[int(b, 2)] * front.coeff
-                        for (b, v) in front.primitive.items()
-                    ]
-                )
-                * self.coeff,
+                np.sum(values * self.primitive.data[indices]) * front.coeff * self.coeff,
                 decimals=EVAL_SIG_DIGITS,
             )
 
@@ -14,8 +14,9 @@
 
 """
 
+from functools import lru_cache
 from string import ascii_uppercase, ascii_lowercase
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -63,6 +64,28 @@ def single_gate_matrix(gate: str, params: Optional[List[float]] = None):
     return gc(*params).to_matrix()
 
 
+@lru_cache(maxsize=1024)
+def _cached_single_gate_matrix(gate: str, params: Tuple[float, ...]):
+    """Return a read-only cached matrix for ``single_gate_matrix``."""
+    matrix = single_gate_matrix(gate, list(params))
+    matrix.setflags(write=False)
+    return matrix
+
+
+def cached_single_gate_matrix(gate: str, params: Optional[List[float]] = None):
+    """Get the matrix for a single qubit, reusing matrices of repeated gates.
+
+    The returned matrix is shared between calls and is read-only.
+
+    Args:
+        gate: the single qubit gate name
+        params: the operation parameters op['params']
+    Returns:
+        array: A numpy array representing the matrix
+    """
+    return _cached_single_gate_matrix(gate, tuple(params or ()))
+
+
 # Cache CX matrix as no parameters.
 _CX_MATRIX = gates.CXGate().to_matrix()
 
@@ -178,3 +201,123 @@ def _einsum_matmul_index_helper(gate_indices, number_of_qubits):
     # Combine indices into matrix multiplication string format
     # for numpy.einsum function
     return mat_left, mat_right, tens_in, tens_out
+
+
+@lru_cache(maxsize=1024)
+def gate_index_plan(gate_indices: Tuple[int, ...], number_of_qubits: int):
+    """Return the tensor indices of the subspace blocks acted on by a gate.
+
+    The N-qubit state is stored as a rank-N tensor with the axis for qubit
+    ``q`` at position ``N - 1 - q``. The indices returned select, for each
+    basis state ``i`` of the gate qubits, the view of the tensor where the
+    gate qubits are fixed to the bits of ``i``, with the first gate qubit as
+    the least significant bit. Additional trailing tensor axes, such as the
+    column indices of a unitary matrix, are left untouched.
+
+    Args:
+        gate_indices: the qubits the gate acts on.
+        number_of_qubits: the total number of qubits.
+
+    Returns:
+        tuple: a tuple of ``2 ** len(gate_indices)`` index tuples.
+    """
+    plan = []
+    for basis in range(2 ** len(gate_indices)):
+        index = [slice(None)] * number_of_qubits
+        for pos, qubit in enumerate(gate_indices):
+            index[number_of_qubits - 1 - qubit] = (basis >> pos) & 1
+        # A trailing ellipsis keeps the block a view when all axes are fixed
+        plan.append(tuple(index) + (Ellipsis,))
+    return tuple(plan)
+
+
+def apply_gate_inplace(
+    tensor: np.ndarray, gate: np.ndarray, gate_indices: Sequence[int], number_of_qubits: int
+):
+    """Apply an M-qubit gate matrix to an N-qubit tensor inplace.
+
+    This performs the same update as ``np.einsum`` with the
+    :func:`einsum_vecmul_index` or :func:`einsum_matmul_index` index strings,
+    but updates the blocks of the tensor selected by :func:`gate_index_plan`
+    directly. Zero and identity entries of the gate are skipped, so diagonal
+    and permutation gates such as ``cx`` only scale or copy blocks.
+
+    Args:
+        tensor: a complex rank-N tensor, or rank-2N tensor for a unitary matrix.
+        gate: a ``2 ** M`` by ``2 ** M`` gate matrix.
+        gate_indices: the qubits the gate acts on.
+        number_of_qubits: the total number of qubits N.
+    """
+    gate = np.asarray(gate, dtype=complex)
+    plan = gate_index_plan(tuple(gate_indices), number_of_qubits)
+    blocks = [tensor[index] for index in plan]
+
+    if len(blocks) == 2:
+        _apply_single_qubit_gate(blocks[0], blocks[1], gate)
+        return
+
+    # Rows of the gate which act as the identity leave their block unchanged
+    rows = [
+        row for row in range(len(blocks)) if gate[row, row] != 1 or np.count_nonzero(gate[row]) != 1
+    ]
+    columns = [np.flatnonzero(gate[row]) for row in rows]
+    # Copy the blocks which are overwritten before they are read
+    sources = {}
+    for cols in columns:
+        for col in cols:
+            if col not in sources:
+                sources[col] = blocks[col].copy() if col in rows else blocks[col]
+    for row, cols in zip(rows, columns):
+        if cols.size == 0:
+            blocks[row][...] = 0
+            continue
+        np.multiply(sources[cols[0]], gate[row, cols[0]], out=blocks[row])
+        for col in cols[1:]:
+            blocks[row] += gate[row, col] * sources[col]
+
+
+def _apply_single_qubit_gate(block0: np.ndarray, block1: np.ndarray, gate: np.ndarray):
+    """Apply a 2x2 gate matrix inplace to the 0 and 1 blocks of a qubit."""
+    (mat00, mat01), (mat10, mat11) = gate
+    if mat01 == 0 and mat10 == 0:
+        # Diagonal gate
+        if mat00 != 1:
+            block0 *= mat00
+        if mat11 != 1:
+            block1 *= mat11
+    elif mat00 == 0 and mat11 == 0:
+        # Anti-diagonal gate
+        tmp = block0.copy()
+        np.multiply(block1, mat01, out=block0)
+        np.multiply(tmp, mat10, out=block1)
+    else:
+        tmp = block0.copy()
+        block0 *= mat00
+        block0 += mat01 * block1
+        block1 *= mat11
+        block1 += mat10 * tmp
+
+
+def parameter_expression_values(expression, parameter_values: dict, num_values: int):
+    """Evaluate a parameter expression for a table of parameter values.
+
+    The expression is compiled once into a NumPy function which is evaluated
+    on the columns of the table, rather than binding each row separately.
+
+    Args:
+        expression (ParameterExpression): the expression to evaluate.
+        parameter_values: map from each parameter of the expression to a
+            1D array of its values.
+        num_values: the number of rows in the table.
+
+    Returns:
+        ndarray: the real value of the expression for each row of the table.
+    """
+    # pylint: disable=protected-access
+    import sympy
+
+    parameters = list(expression.parameters)
+    symbols = [sympy.sympify(expression._parameter_symbols[param]) for param in parameters]
+    func = sympy.lambdify(symbols, sympy.sympify(expression._symbol_expr), "numpy")
+    values = func(*[parameter_values[param] for param in parameters])
+    return np.array(np.broadcast_to(np.real(values), num_values), dtype=float)
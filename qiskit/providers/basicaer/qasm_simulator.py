@@ -28,27 +28,30 @@ later be queried for the Result object. The result will contain a 'memory' data
 field, which is a result of measurements for each shot.
 """
 
+import copy
 import uuid
 import time
 import logging
 import warnings
 
 from math import log2
-from collections import Counter
 import numpy as np
 
+from qiskit.circuit.parameterexpression import ParameterExpression
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.utils.multiprocessing import local_hardware_info
+from qiskit.tools.parallel import parallel_map
 from qiskit.providers.models import QasmBackendConfiguration
 from qiskit.result import Result
 from qiskit.providers.backend import BackendV1
 from qiskit.providers.options import Options
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from .exceptions import BasicAerError
-from .basicaertools import single_gate_matrix
+from .basicaertools import cached_single_gate_matrix
 from .basicaertools import SINGLE_QUBIT_GATES
 from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_vecmul_index
+from .basicaertools import apply_gate_inplace
+from .basicaertools import parameter_expression_values
 
 logger = logging.getLogger(__name__)
 
@@ -120,12 +123,14 @@ class QasmSimulatorPy(BackendV1):
         self._classical_memory = 0
         self._classical_register = 0
         self._statevector = 0
+        self._single_qubit_gates = {}
         self._number_of_cmembits = 0
         self._number_of_qubits = 0
         self._shots = 0
         self._memory = False
         self._initial_statevector = self.options.get("initial_statevector")
         self._chop_threshold = self.options.get("chop_threashold")
+        self._max_parallel_experiments = self.options.get("max_parallel_experiments")
         self._qobj_config = None
         # TEMP
         self._sample_measure = False
@@ -140,6 +145,7 @@ class QasmSimulatorPy(BackendV1):
             allow_sample_measuring=True,
             seed_simulator=None,
             parameter_binds=None,
+            max_parallel_experiments=1,
         )
 
     def _add_unitary(self, gate, qubits):
@@ -149,16 +155,36 @@ class QasmSimulatorPy(BackendV1):
             gate (matrix_like): an N-qubit unitary matrix
             qubits (list): the list of N-qubits.
         """
-        # Get the number of qubits
-        num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_vecmul_index(qubits, self._number_of_qubits)
-        # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex), num_qubits * [2, 2])
-        # Apply matrix multiplication
-        self._statevector = np.einsum(
-            indexes, gate_tensor, self._statevector, dtype=complex, casting="no"
-        )
+        self._apply_single_qubit_gates(qubits)
+        apply_gate_inplace(self._statevector, gate, qubits, self._number_of_qubits)
+
+    def _add_single_qubit_gate(self, gate, qubit):
+        """Add a single-qubit gate to the fused gate of a qubit.
+
+        Runs of single-qubit gates on a qubit are multiplied together and
+        only applied to the statevector once another operation acts on
+        the qubit.
+
+        Args:
+            gate (matrix_like): a single-qubit unitary matrix
+            qubit (int): the qubit to apply the gate to.
+        """
+        fused = self._single_qubit_gates.get(qubit)
+        self._single_qubit_gates[qubit] = gate if fused is None else np.dot(gate, fused)
+
+    def _apply_single_qubit_gates(self, qubits=None):
+        """Apply the fused single-qubit gates of qubits to the statevector.
+
+        Args:
+            qubits (list or None): the qubits to apply fused gates to. If None
+                                   the fused gates of all qubits are applied.
+        """
+        if qubits is None:
+            qubits = list(self._single_qubit_gates)
+        for qubit in qubits:
+            gate = self._single_qubit_gates.pop(qubit, None)
+            if gate is not None:
+                apply_gate_inplace(self._statevector, gate, [qubit], self._number_of_qubits)
 
     def _get_measure_outcome(self, qubit):
         """Simulate the outcome of measurement of a qubit.
@@ -170,6 +196,7 @@ class QasmSimulatorPy(BackendV1):
             tuple: pair (outcome, probability) where outcome is '0' or '1' and
             probability is the probability of the returned outcome.
         """
+        self._apply_single_qubit_gates([qubit])
         # Axis for numpy.sum to compute probabilities
         axis = list(range(self._number_of_qubits))
         axis.remove(self._number_of_qubits - 1 - qubit)
@@ -190,7 +217,7 @@ class QasmSimulatorPy(BackendV1):
             num_samples (int): The number of memory samples to generate.
 
         Returns:
-            list: A list of memory values in hex format.
+            ndarray: An array of classical memory values as integers.
         """
         # Get unique qubits that are actually measured and sort in
         # ascending order
@@ -210,20 +237,47 @@ class QasmSimulatorPy(BackendV1):
         # Generate samples on measured qubits as ints with qubit
         # position in the bit-string for each int given by the qubit
         # position in the sorted measured_qubits list
-        samples = self._local_random.choice(range(2 ** num_measured), num_samples, p=probabilities)
-        # Convert the ints to bitstrings
-        memory = []
-        for sample in samples:
-            classical_memory = self._classical_memory
-            for qubit, cmembit in measure_params:
-                pos = measured_qubits.index(qubit)
-                qubit_outcome = int((sample & (1 << pos)) >> pos)
-                membit = 1 << cmembit
-                classical_memory = (classical_memory & (~membit)) | (qubit_outcome << cmembit)
-            value = bin(classical_memory)[2:]
-            memory.append(hex(int(value, 2)))
+        samples = self._local_random.choice(2 ** num_measured, num_samples, p=probabilities)
+        # Map each memory bit to the position of its qubit in the samples. If a
+        # memory bit is measured more than once the last measurement is kept.
+        positions = {cmembit: measured_qubits.index(qubit) for qubit, cmembit in measure_params}
+        # Fall back to Python integers if the memory does not fit in int64
+        if self._number_of_cmembits < 63:
+            dtype = np.int64
+        else:
+            dtype = object
+        samples = samples.astype(dtype)
+        cleared = self._classical_memory
+        for cmembit in positions:
+            cleared &= ~(1 << cmembit)
+        memory = np.full(num_samples, cleared, dtype=dtype)
+        for cmembit, pos in positions.items():
+            memory |= ((samples >> pos) & 1) << cmembit
         return memory
 
+    def _format_memory(self, memory):
+        """Return the counts and hex memory list of classical memory values.
+
+        Args:
+            memory (list or ndarray): classical memory values as integers.
+
+        Returns:
+            tuple: pair (counts, hex_memory) where counts is a dict of hex
+            memory values and hex_memory is a list of the hex memory value of
+            each shot, or None if memory is not being returned.
+        """
+        if len(memory) == 0:
+            return {}, []
+        values, inverse, frequencies = np.unique(
+            np.asarray(memory), return_inverse=True, return_counts=True
+        )
+        hex_values = [hex(int(value)) for value in values]
+        counts = dict(zip(hex_values, frequencies.tolist()))
+        hex_memory = None
+        if self._memory:
+            hex_memory = np.array(hex_values, dtype=object)[inverse].tolist()
+        return counts, hex_memory
+
     def _add_qasm_measure(self, qubit, cmembit, cregbit=None):
         """Apply a measure instruction to a qubit.
 
@@ -291,6 +345,7 @@ class QasmSimulatorPy(BackendV1):
         # Reset default options
         self._initial_statevector = self.options.get("initial_statevector")
         self._chop_threshold = self.options.get("chop_threshold")
+        self._max_parallel_experiments = self.options.get("max_parallel_experiments")
         if "backend_options" in backend_options and backend_options["backend_options"]:
             backend_options = backend_options["backend_options"]
 
@@ -315,6 +370,11 @@ class QasmSimulatorPy(BackendV1):
             self._chop_threshold = backend_options["chop_threshold"]
         elif hasattr(qobj_config, "chop_threshold"):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for the number of experiments to run in parallel
+        if "max_parallel_experiments" in backend_options:
+            self._max_parallel_experiments = backend_options["max_parallel_experiments"]
+        elif hasattr(qobj_config, "max_parallel_experiments"):
+            self._max_parallel_experiments = qobj_config.max_parallel_experiments
 
     def _initialize_statevector(self):
         """Set the initial statevector for simulation"""
@@ -386,18 +446,32 @@ class QasmSimulatorPy(BackendV1):
         Additional Information:
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
+                * "max_parallel_experiments": int
+                * "parameter_binds": list[dict]
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
             zero state. This size of this vector must be correct for the number
             of qubits in all experiments in the qobj.
 
+            The "max_parallel_experiments" option sets the maximum number of
+            experiments in the qobj that are run in parallel processes. If set
+            to 0 the number of CPUs is used. The default of 1 runs the
+            experiments serially.
+
+            The "parameter_binds" option runs each parameterized circuit for
+            every dict of parameter values in the list. The circuits are only
+            assembled once, and the results are ordered by circuit and then
+            by parameter bind, as if the circuits were bound and assembled
+            for every parameter bind.
+
             Example::
 
                 backend_options = {
                     "initial_statevector": np.array([1, 0, 0, 1j]) / np.sqrt(2),
                 }
         """
+        parameter_sweep = None
         if isinstance(qobj, (QuantumCircuit, list)):
             from qiskit.compiler import assemble
 
@@ -409,7 +483,13 @@ class QasmSimulatorPy(BackendV1):
                     )
                 else:
                     out_options[key] = backend_options[key]
-            qobj = assemble(qobj, self, **out_options)
+            parameter_binds = out_options.pop("parameter_binds", None)
+            if parameter_binds:
+                qobj, parameter_sweep = self._assemble_parameter_sweep(
+                    qobj, parameter_binds, out_options
+                )
+            else:
+                qobj = assemble(qobj, self, **out_options)
             qobj_options = qobj.config
         else:
             warnings.warn(
@@ -420,15 +500,120 @@ class QasmSimulatorPy(BackendV1):
             qobj_options = qobj.config
         self._set_options(qobj_config=qobj_options, backend_options=backend_options)
         job_id = str(uuid.uuid4())
-        job = BasicAerJob(self, job_id, self._run_job(job_id, qobj))
+        job = BasicAerJob(self, job_id, self._run_job(job_id, qobj, parameter_sweep))
         return job
 
-    def _run_job(self, job_id, qobj):
+    def _assemble_parameter_sweep(self, circuits, parameter_binds, assemble_options):
+        """Assemble parameterized circuits once for a sweep over parameter binds.
+
+        Each circuit is bound to the first parameter bind and assembled into a
+        template experiment. The values of its parameterized instruction
+        parameters are evaluated for all parameter binds at once into a
+        program of ``(instruction index, {param index: values})`` entries, so
+        the experiment for a parameter bind is obtained by substituting values
+        into the template instead of binding and assembling a new circuit.
+
+        Args:
+            circuits (QuantumCircuit or list): the parameterized circuits.
+            parameter_binds (list[dict]): the parameter values to run.
+            assemble_options (dict): options passed to assemble.
+
+        Returns:
+            tuple: pair (qobj, parameter_sweep) of the qobj of template
+            experiments and a list of ``(program, global_phases, names)``
+            tuples for each experiment, where global_phases is None unless the
+            global phase of the circuit is parameterized and names are the
+            experiment names for each parameter bind.
+
+        Raises:
+            BasicAerError: if the parameter binds do not match the parameters
+                of a circuit.
+        """
+        # pylint: disable=protected-access
+        from qiskit.compiler import assemble
+
+        if isinstance(circuits, QuantumCircuit):
+            circuits = [circuits]
+        binds = [QuantumCircuit()._unroll_param_dict(bind) for bind in parameter_binds]
+        num_binds = len(binds)
+        templates = []
+        parameter_sweep = []
+        for circuit in circuits:
+            parameters = set(circuit.parameters)
+            if any(set(bind) != parameters for bind in binds):
+                raise BasicAerError(
+                    "Mismatch between parameter_binds and the parameters of circuit "
+                    '"{}". Parameter binds: {} Circuit parameters: {}'.format(
+                        circuit.name, [list(bind) for bind in binds], list(parameters)
+                    )
+                )
+            columns = {
+                param: np.array([bind[param] for bind in binds], dtype=float)
+                for param in parameters
+            }
+            program = []
+            index = 0
+            for operation, _, _ in circuit.data:
+                # Conditional instructions are preceded by a bfunc instruction
+                if operation.condition:
+                    index += 1
+                values = {}
+                for param_index, param in enumerate(operation.params):
+                    if isinstance(param, ParameterExpression) and param.parameters:
+                        values[param_index] = parameter_expression_values(param, columns, num_binds)
+                if values:
+                    program.append((index, values))
+                index += 1
+            global_phases = None
+            global_phase = circuit.global_phase
+            if isinstance(global_phase, ParameterExpression) and global_phase.parameters:
+                global_phases = parameter_expression_values(global_phase, columns, num_binds)
+            template = circuit.bind_parameters(binds[0])
+            # Name the experiment of every parameter bind as binding the
+            # circuit would name it
+            names = [template.name]
+            for _ in range(num_binds - 1):
+                named = copy.copy(circuit)
+                circuit._increment_instances()
+                named._name_update()
+                names.append(named.name)
+            templates.append(template)
+            parameter_sweep.append((program, global_phases, names))
+        return assemble(templates, self, **assemble_options), parameter_sweep
+
+    @staticmethod
+    def _expand_parameter_sweep(experiments, parameter_sweep):
+        """Return the experiments for every parameter bind of a sweep.
+
+        Only the header and the instructions with parameterized params are
+        copied, all other instructions are shared with the template experiment.
+        """
+        expanded = []
+        for experiment, (program, global_phases, names) in zip(experiments, parameter_sweep):
+            for bind_index, name in enumerate(names):
+                bound = copy.copy(experiment)
+                bound.instructions = list(experiment.instructions)
+                for index, values in program:
+                    instruction = copy.copy(bound.instructions[index])
+                    instruction.params = list(instruction.params)
+                    for param_index, param_values in values.items():
+                        instruction.params[param_index] = param_values[bind_index]
+                    bound.instructions[index] = instruction
+                bound.header = copy.copy(experiment.header)
+                bound.header.name = name
+                if global_phases is not None:
+                    bound.header.global_phase = global_phases[bind_index]
+                expanded.append(bound)
+        return expanded
+
+    def _run_job(self, job_id, qobj, parameter_sweep=None):
         """Run experiments in qobj
 
         Args:
             job_id (str): unique id for the job.
             qobj (Qobj): job description
+            parameter_sweep (list): optional list of parameter sweep programs
+                for the experiments in qobj from ``_assemble_parameter_sweep``.
 
         Returns:
             Result: Result object
@@ -439,8 +624,21 @@ class QasmSimulatorPy(BackendV1):
         self._memory = getattr(qobj.config, "memory", False)
         self._qobj_config = qobj.config
         start = time.time()
-        for experiment in qobj.experiments:
-            result_list.append(self.run_experiment(experiment))
+        experiments = qobj.experiments
+        if parameter_sweep is not None:
+            experiments = self._expand_parameter_sweep(experiments, parameter_sweep)
+        num_processes = self._max_parallel_experiments or local_hardware_info()["cpus"]
+        num_processes = min(num_processes, len(experiments))
+        if num_processes > 1:
+            result_list = parallel_map(
+                _run_experiment,
+                self._seed_experiments(experiments),
+                task_args=(self,),
+                num_processes=num_processes,
+            )
+        else:
+            for experiment in experiments:
+                result_list.append(self.run_experiment(experiment))
         end = time.time()
         result = {
             "backend_name": self.name(),
@@ -456,6 +654,147 @@ class QasmSimulatorPy(BackendV1):
 
         return Result.from_dict(result)
 
+    def _apply_instructions(self, instructions, measure_sample_ops):
+        """Apply a list of qobj instructions to the current simulator state.
+
+        Args:
+            instructions (list): the qobj instructions to apply.
+            measure_sample_ops (list): list to record (qubit, cmembit) pairs of
+                                       measure instructions in if measurements
+                                       are being sampled.
+
+        Raises:
+            BasicAerError: if an instruction is not supported.
+        """
+        for operation in instructions:
+            conditional = getattr(operation, "conditional", None)
+            if isinstance(conditional, int):
+                conditional_bit_set = (self._classical_register >> conditional) & 1
+                if not conditional_bit_set:
+                    continue
+            elif conditional is not None:
+                mask = int(operation.conditional.mask, 16)
+                if mask > 0:
+                    value = self._classical_memory & mask
+                    while (mask & 0x1) == 0:
+                        mask >>= 1
+                        value >>= 1
+                    if value != int(operation.conditional.val, 16):
+                        continue
+
+            # Check if single  gate
+            if operation.name == "unitary":
+                qubits = operation.qubits
+                gate = operation.params[0]
+                self._add_unitary(gate, qubits)
+            elif operation.name in SINGLE_QUBIT_GATES:
+                params = getattr(operation, "params", None)
+                qubit = operation.qubits[0]
+                gate = cached_single_gate_matrix(operation.name, params)
+                self._add_single_qubit_gate(gate, qubit)
+            # Check if CX gate
+            elif operation.name in ("id", "u0"):
+                pass
+            elif operation.name in ("CX", "cx"):
+                qubit0 = operation.qubits[0]
+                qubit1 = operation.qubits[1]
+                gate = cx_gate_matrix()
+                self._add_unitary(gate, [qubit0, qubit1])
+            # Check if reset
+            elif operation.name == "reset":
+                qubit = operation.qubits[0]
+                self._add_qasm_reset(qubit)
+            # Check if barrier
+            elif operation.name == "barrier":
+                pass
+            # Check if measure
+            elif operation.name == "measure":
+                qubit = operation.qubits[0]
+                cmembit = operation.memory[0]
+                cregbit = operation.register[0] if hasattr(operation, "register") else None
+
+                if self._sample_measure:
+                    # If sampling measurements record the qubit and cmembit
+                    # for this measurement for later sampling
+                    measure_sample_ops.append((qubit, cmembit))
+                else:
+                    # If not sampling perform measurement as normal
+                    self._add_qasm_measure(qubit, cmembit, cregbit)
+            elif operation.name == "bfunc":
+                mask = int(operation.mask, 16)
+                relation = operation.relation
+                val = int(operation.val, 16)
+
+                cregbit = operation.register
+                cmembit = operation.memory if hasattr(operation, "memory") else None
+
+                compared = (self._classical_register & mask) - val
+
+                if relation == "==":
+                    outcome = compared == 0
+                elif relation == "!=":
+                    outcome = compared != 0
+                elif relation == "<":
+                    outcome = compared < 0
+                elif relation == "<=":
+                    outcome = compared <= 0
+                elif relation == ">":
+                    outcome = compared > 0
+                elif relation == ">=":
+                    outcome = compared >= 0
+                else:
+                    raise BasicAerError("Invalid boolean function relation.")
+
+                # Store outcome in register and optionally memory slot
+                regbit = 1 << cregbit
+                self._classical_register = (self._classical_register & (~regbit)) | (
+                    int(outcome) << cregbit
+                )
+                if cmembit is not None:
+                    membit = 1 << cmembit
+                    self._classical_memory = (self._classical_memory & (~membit)) | (
+                        int(outcome) << cmembit
+                    )
+            else:
+                backend = self.name()
+                err_msg = '{0} encountered unrecognized operation "{1}"'
+                raise BasicAerError(err_msg.format(backend, operation.name))
+
+    def _seed_experiments(self, experiments):
+        """Return experiments with a ``seed_simulator`` set in their config.
+
+        Experiments run in parallel processes cannot share the global random
+        state of this process, so experiments without a seed from their
+        config or the qobj config are copied and given a random seed here.
+        """
+        if hasattr(self._qobj_config, "seed_simulator"):
+            return experiments
+        seeded = []
+        for experiment in experiments:
+            if not hasattr(experiment.config, "seed_simulator"):
+                experiment = copy.copy(experiment)
+                experiment.config = copy.copy(experiment.config)
+                # For compatibility on Windows force dyte to be int32
+                # and set the maximum value to be (2 ** 31) - 1
+                experiment.config.seed_simulator = np.random.randint(2147483647, dtype="int32")
+            seeded.append(experiment)
+        return seeded
+
+    @staticmethod
+    def _deterministic_prefix_length(instructions):
+        """Return the number of instructions before the first non-unitary one.
+
+        Measure, reset, bfunc and conditional instructions depend on the
+        random outcomes of a shot, all instructions before the first of them
+        evolve the state identically in every shot.
+        """
+        for index, operation in enumerate(instructions):
+            if operation.name in ("measure", "reset", "bfunc") or (
+                getattr(operation, "conditional", None) is not None
+            ):
+                return index
+        return len(instructions)
+
     def run_experiment(self, experiment):
         """Run an experiment (circuit) and return a single experiment result.
 
@@ -516,119 +855,40 @@ class QasmSimulatorPy(BackendV1):
             measure_sample_ops = []
         else:
             shots = self._shots
-        for _ in range(shots):
-            self._initialize_statevector()
-            # apply global_phase
-            self._statevector *= np.exp(1j * global_phase)
+            measure_sample_ops = None
+        # Instructions before the first non-unitary operation are the same
+        # for every shot so they are only simulated once
+        prefix_length = self._deterministic_prefix_length(experiment.instructions)
+        self._initialize_statevector()
+        # apply global_phase
+        self._statevector *= np.exp(1j * global_phase)
+        self._single_qubit_gates = {}
+        self._apply_instructions(experiment.instructions[:prefix_length], measure_sample_ops)
+        self._apply_single_qubit_gates()
+        prefix_statevector = self._statevector
+        for shot in range(shots):
+            if shot < shots - 1:
+                self._statevector = prefix_statevector.copy()
+            else:
+                self._statevector = prefix_statevector
+            self._single_qubit_gates = {}
             # Initialize classical memory to all 0
             self._classical_memory = 0
             self._classical_register = 0
-            for operation in experiment.instructions:
-                conditional = getattr(operation, "conditional", None)
-                if isinstance(conditional, int):
-                    conditional_bit_set = (self._classical_register >> conditional) & 1
-                    if not conditional_bit_set:
-                        continue
-                elif conditional is not None:
-                    mask = int(operation.conditional.mask, 16)
-                    if mask > 0:
-                        value = self._classical_memory & mask
-                        while (mask & 0x1) == 0:
-                            mask >>= 1
-                            value >>= 1
-                        if value != int(operation.conditional.val, 16):
-                            continue
-
-                # Check if single  gate
-                if operation.name == "unitary":
-                    qubits = operation.qubits
-                    gate = operation.params[0]
-                    self._add_unitary(gate, qubits)
-                elif operation.name in SINGLE_QUBIT_GATES:
-                    params = getattr(operation, "params", None)
-                    qubit = operation.qubits[0]
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_unitary(gate, [qubit])
-                # Check if CX gate
-                elif operation.name in ("id", "u0"):
-                    pass
-                elif operation.name in ("CX", "cx"):
-                    qubit0 = operation.qubits[0]
-                    qubit1 = operation.qubits[1]
-                    gate = cx_gate_matrix()
-                    self._add_unitary(gate, [qubit0, qubit1])
-                # Check if reset
-                elif operation.name == "reset":
-                    qubit = operation.qubits[0]
-                    self._add_qasm_reset(qubit)
-                # Check if barrier
-                elif operation.name == "barrier":
-                    pass
-                # Check if measure
-                elif operation.name == "measure":
-                    qubit = operation.qubits[0]
-                    cmembit = operation.memory[0]
-                    cregbit = operation.register[0] if hasattr(operation, "register") else None
-
-                    if self._sample_measure:
-                        # If sampling measurements record the qubit and cmembit
-                        # for this measurement for later sampling
-                        measure_sample_ops.append((qubit, cmembit))
-                    else:
-                        # If not sampling perform measurement as normal
-                        self._add_qasm_measure(qubit, cmembit, cregbit)
-                elif operation.name == "bfunc":
-                    mask = int(operation.mask, 16)
-                    relation = operation.relation
-                    val = int(operation.val, 16)
-
-                    cregbit = operation.register
-                    cmembit = operation.memory if hasattr(operation, "memory") else None
-
-                    compared = (self._classical_register & mask) - val
-
-                    if relation == "==":
-                        outcome = compared == 0
-                    elif relation == "!=":
-                        outcome = compared != 0
-                    elif relation == "<":
-                        outcome = compared < 0
-                    elif relation == "<=":
-                        outcome = compared <= 0
-                    elif relation == ">":
-                        outcome = compared > 0
-                    elif relation == ">=":
-                        outcome = compared >= 0
-                    else:
-                        raise BasicAerError("Invalid boolean function relation.")
-
-                    # Store outcome in register and optionally memory slot
-                    regbit = 1 << cregbit
-                    self._classical_register = (self._classical_register & (~regbit)) | (
-                        int(outcome) << cregbit
-                    )
-                    if cmembit is not None:
-                        membit = 1 << cmembit
-                        self._classical_memory = (self._classical_memory & (~membit)) | (
-                            int(outcome) << cmembit
-                        )
-                else:
-                    backend = self.name()
-                    err_msg = '{0} encountered unrecognized operation "{1}"'
-                    raise BasicAerError(err_msg.format(backend, operation.name))
-
+            self._apply_instructions(experiment.instructions[prefix_length:], measure_sample_ops)
+            # Apply remaining fused single-qubit gates
+            self._apply_single_qubit_gates()
             # Add final creg data to memory list
             if self._number_of_cmembits > 0:
                 if self._sample_measure:
                     # If sampling we generate all shot samples from the final statevector
                     memory = self._add_sample_measure(measure_sample_ops, self._shots)
                 else:
-                    # Turn classical_memory (int) into bit string and pad zero for unused cmembits
-                    outcome = bin(self._classical_memory)[2:]
-                    memory.append(hex(int(outcome, 2)))
+                    memory.append(self._classical_memory)
 
         # Add data
-        data = {"counts": dict(Counter(memory))}
+        counts, memory = self._format_memory(memory)
+        data = {"counts": counts}
         # Optionally add memory list
         if self._memory:
             data["memory"] = memory
@@ -673,3 +933,8 @@ class QasmSimulatorPy(BackendV1):
                     'No measurements in circuit "%s", ' "classical register will remain all zeros.",
                     name,
                 )
+
+
+def _run_experiment(experiment, backend):
+    """Run a single experiment on a backend, for use with parallel_map."""
+    return backend.run_experiment(experiment)
@@ -42,10 +42,10 @@ from qiskit.providers.options import Options
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from qiskit.result import Result
 from .exceptions import BasicAerError
-from .basicaertools import single_gate_matrix
+from .basicaertools import cached_single_gate_matrix
 from .basicaertools import SINGLE_QUBIT_GATES
 from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_matmul_index
+from .basicaertools import apply_gate_inplace
 
 logger = logging.getLogger(__name__)
 
@@ -115,6 +115,7 @@ class UnitarySimulatorPy(BackendV1):
 
         # Define attributes inside __init__.
         self._unitary = None
+        self._single_qubit_gates = {}
         self._number_of_qubits = 0
         self._initial_unitary = None
         self._global_phase = 0
@@ -131,14 +132,35 @@ class UnitarySimulatorPy(BackendV1):
             gate (matrix_like): an N-qubit unitary matrix
             qubits (list): the list of N-qubits.
         """
-        # Get the number of qubits
-        num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_matmul_index(qubits, self._number_of_qubits)
-        # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex), num_qubits * [2, 2])
-        # Apply matrix multiplication
-        self._unitary = np.einsum(indexes, gate_tensor, self._unitary, dtype=complex, casting="no")
+        self._apply_single_qubit_gates(qubits)
+        apply_gate_inplace(self._unitary, gate, qubits, self._number_of_qubits)
+
+    def _add_single_qubit_gate(self, gate, qubit):
+        """Add a single-qubit gate to the fused gate of a qubit.
+
+        Runs of single-qubit gates on a qubit are multiplied together and
+        only applied to the unitary once another operation acts on the qubit.
+
+        Args:
+            gate (matrix_like): a single-qubit unitary matrix
+            qubit (int): the qubit to apply the gate to.
+        """
+        fused = self._single_qubit_gates.get(qubit)
+        self._single_qubit_gates[qubit] = gate if fused is None else np.dot(gate, fused)
+
+    def _apply_single_qubit_gates(self, qubits=None):
+        """Apply the fused single-qubit gates of qubits to the unitary.
+
+        Args:
+            qubits (list or None): the qubits to apply fused gates to. If None
+                                   the fused gates of all qubits are applied.
+        """
+        if qubits is None:
+            qubits = list(self._single_qubit_gates)
+        for qubit in qubits:
+            gate = self._single_qubit_gates.pop(qubit, None)
+            if gate is not None:
+                apply_gate_inplace(self._unitary, gate, [qubit], self._number_of_qubits)
 
     def _validate_initial_unitary(self):
         """Validate an initial unitary matrix"""
@@ -325,6 +347,7 @@ class UnitarySimulatorPy(BackendV1):
         # Validate the dimension of initial unitary if set
         self._validate_initial_unitary()
         self._initialize_unitary()
+        self._single_qubit_gates = {}
 
         for operation in experiment.instructions:
             if operation.name == "unitary":
@@ -335,8 +358,8 @@ class UnitarySimulatorPy(BackendV1):
             elif operation.name in SINGLE_QUBIT_GATES:
                 params = getattr(operation, "params", None)
                 qubit = operation.qubits[0]
-                gate = single_gate_matrix(operation.name, params)
-                self._add_unitary(gate, [qubit])
+                gate = cached_single_gate_matrix(operation.name, params)
+                self._add_single_qubit_gate(gate, qubit)
             elif operation.name in ("id", "u0"):
                 pass
             # Check if CX gate
@@ -352,6 +375,8 @@ class UnitarySimulatorPy(BackendV1):
                 backend = self.name()
                 err_msg = '{0} encountered unrecognized operation "{1}"'
                 raise BasicAerError(err_msg.format(backend, operation.name))
+        # Apply remaining fused single-qubit gates
+        self._apply_single_qubit_gates()
         # Add final state to data
         data = {"unitary": self._get_unitary()}
         end = time.time()
@@ -27,6 +27,7 @@ Operators
    Clifford
    ScalarOp
    SparsePauliOp
+   SparsePauliOpAccumulator
    CNOTDihedral
    PauliTable
    StabilizerTable
@@ -121,6 +122,7 @@ Synthesis
 
 from .operators import Operator, ScalarOp, Pauli, Clifford, SparsePauliOp
 from .operators import PauliTable, StabilizerTable, pauli_basis, pauli_group
+from .operators import SparsePauliOpAccumulator
 from .operators.channel import Choi, SuperOp, Kraus, Stinespring, Chi, PTM
 from .operators.measures import process_fidelity, average_gate_fidelity, gate_error, diamond_norm
 from .operators.dihedral import CNOTDihedral
@@ -271,55 +271,33 @@ class Clifford(BaseOperator, AdjointMixin):
             table1 = other.table
             table2 = self.table
 
-        num_qubits = self.num_qubits
-
-        array1 = table1.array.astype(int)
-        phase1 = table1.phase.astype(int)
-
-        array2 = table2.array.astype(int)
-        phase2 = table2.phase.astype(int)
+        # Each row of table2 selects the rows of table1 whose ordered product
+        # is the image of that row under the composed Clifford.
+        array1 = table1.array.astype(float)
+        array2 = table2.array.astype(float)
+        ycount1 = np.sum(table1.X & table1.Z, axis=1)
+        ycount2 = np.sum(table2.X & table2.Z, axis=1)
 
         # Update Pauli table
-        pauli = StabilizerTable(array2.dot(array1) % 2)
+        pauli = StabilizerTable(_mod2_dot(array2, array1).astype(bool))
 
         # Add phases
-        phase = np.mod(array2.dot(phase1) + phase2, 2)
-
-        # Correcting for phase due to Pauli multiplication
-        ifacts = np.zeros(2 * num_qubits, dtype=int)
-
-        for k in range(2 * num_qubits):
-
-            row2 = array2[k]
-            x2 = table2.X[k]
-            z2 = table2.Z[k]
-
-            # Adding a factor of i for each Y in the image of an operator under the
-            # first operation, since Y=iXZ
-
-            ifacts[k] += np.sum(x2 & z2)
+        phase = _mod2_dot(array2, table1.phase.astype(float)) + table2.phase
 
-            # Adding factors of i due to qubit-wise Pauli multiplication
+        # Correcting for phase due to Pauli multiplication. Writing each row as
+        # i^{x.z} X^x Z^z, the factors of i are the Y counts of the rows of
+        # table1 that are multiplied, a sign for every ordered pair (i < j) of
+        # those rows with odd z_i.x_j, and the inverse of the Y count of the
+        # product. A factor of i is also added for each Y in table2, since Y=iXZ.
+        num_rows = len(array1)
+        pairs = _mod2_dot(array1[:, num_rows // 2 :], array1[:, : num_rows // 2].T)
+        pairs = np.triu(pairs, k=1)
+        signs = np.sum(_mod2_dot(array2, pairs) * array2, axis=1)
+        ifacts = ycount2 + array2.dot(ycount1) + 2 * signs - np.sum(pauli.X & pauli.Z, axis=1)
 
-            for j in range(num_qubits):
-                x = 0
-                z = 0
-                for i in range(2 * num_qubits):
-                    if row2[i]:
-                        x1 = array1[i, j]
-                        z1 = array1[i, j + num_qubits]
-                        if (x | z) & (x1 | z1):
-                            val = np.mod(np.abs(3 * z1 - x1) - np.abs(3 * z - x) - 1, 3)
-                            if val == 0:
-                                ifacts[k] += 1
-                            elif val == 1:
-                                ifacts[k] -= 1
-                        x = np.mod(x + x1, 2)
-                        z = np.mod(z + z1, 2)
+        p = np.mod(ifacts.astype(int), 4) // 2
 
-        p = np.mod(ifacts, 4) // 2
-
-        phase = np.mod(phase + p, 2)
+        phase = np.mod(phase + p, 2).astype(bool)
 
         return Clifford(StabilizerTable(pauli, phase), validate=False)
 
@@ -392,10 +370,6 @@ class Clifford(BaseOperator, AdjointMixin):
         if not isinstance(circuit, (QuantumCircuit, Instruction)):
             raise QiskitError("Input must be a QuantumCircuit or Instruction")
 
-        # Convert circuit to an instruction
-        if isinstance(circuit, QuantumCircuit):
-            circuit = circuit.to_instruction()
-
         # Initialize an identity Clifford
         clifford = Clifford(np.eye(2 * circuit.num_qubits), validate=False)
         _append_circuit(clifford, circuit)
@@ -472,11 +446,10 @@ class Clifford(BaseOperator, AdjointMixin):
         if mat.shape != (2 * dim, 2 * dim):
             return False
 
-        one = np.eye(dim, dtype=int)
-        zero = np.zeros((dim, dim), dtype=int)
-        seye = np.block([[zero, one], [one, zero]])
-        arr = mat.astype(int)
-        return np.array_equal(np.mod(arr.T.dot(seye).dot(arr), 2), seye)
+        # Multiplying by seye on the left swaps the X and Z blocks of the rows
+        seye = np.roll(np.eye(2 * dim), dim, axis=1)
+        arr = mat.astype(float)
+        return np.array_equal(_mod2_dot(arr.T, np.roll(arr, dim, axis=0)), seye)
 
     @staticmethod
     def _conjugate_transpose(clifford, method):
@@ -526,5 +499,15 @@ class Clifford(BaseOperator, AdjointMixin):
         return padded
 
 
+def _mod2_dot(mat1, mat2):
+    """Return the matrix product of two binary matrices modulo 2.
+
+    The product is computed in single precision floating point so that it
+    can use BLAS, which is exact for the integer sums of binary matrices
+    with fewer than 2**24 columns.
+    """
+    return np.mod(np.dot(np.asarray(mat1, np.float32), np.asarray(mat2, np.float32)), 2)
+
+
 # Update docstrings for API docs
 generate_apidocs(Clifford)
@@ -16,11 +16,20 @@ Circuit simulation for the Clifford class.
 from qiskit.exceptions import QiskitError
 from qiskit.circuit import QuantumCircuit
 from qiskit.circuit.barrier import Barrier
+from .pauli_table import PauliTable
+
+# Minimum number of basis gates for which the circuit is simulated on a
+# bit-packed table
+_PACKED_MIN_GATES = 16
 
 
 def _append_circuit(clifford, circuit, qargs=None):
     """Update Clifford inplace by applying a Clifford circuit.
 
+    The circuit is first unrolled to Clifford basis gates. Circuits with many
+    gates are then simulated on a bit-packed copy of the table, where each
+    gate updates whole 64-bit words of the table columns it acts on.
+
     Args:
         clifford (Clifford): the Clifford to update.
         circuit (QuantumCircuit or Instruction): the gate or composite gate to apply.
@@ -32,80 +41,86 @@ def _append_circuit(clifford, circuit, qargs=None):
     Raises:
         QiskitError: if input gate cannot be decomposed into Clifford gates.
     """
-    if isinstance(circuit, Barrier):
-        return clifford
-
     if qargs is None:
         qargs = list(range(clifford.num_qubits))
 
-    if isinstance(circuit, QuantumCircuit):
-        gate = circuit.to_instruction()
-    else:
-        gate = circuit
-
-    # Basis Clifford Gates
-    basis_1q = {
-        "i": _append_i,
-        "id": _append_i,
-        "iden": _append_i,
-        "x": _append_x,
-        "y": _append_y,
-        "z": _append_z,
-        "h": _append_h,
-        "s": _append_s,
-        "sdg": _append_sdg,
-        "sinv": _append_sdg,
-        "v": _append_v,
-        "w": _append_w,
-    }
-    basis_2q = {"cx": _append_cx, "cz": _append_cz, "swap": _append_swap}
-
-    # Non-clifford gates
-    non_clifford = ["t", "tdg", "ccx", "ccz"]
-
-    if isinstance(gate, str):
+    gates = []
+    _unroll_circuit(circuit, qargs, gates)
+
+    if len(gates) < _PACKED_MIN_GATES:
+        for name, qubits in gates:
+            _BASIS_GATES[name](clifford, *qubits)
+        return clifford
+
+    table = clifford.table
+    num_qubits = clifford.num_qubits
+    num_rows = len(table)
+    # Row q of the packed table holds the X column of qubit q and row
+    # num_qubits + q the Z column, packed over the rows of the table.
+    packed = PauliTable._pack_bits(table.array.T)
+    phase = PauliTable._pack_bits(table.phase)[0]
+    for name, qubits in gates:
+        words = [packed[i] for qubit in qubits for i in (qubit, num_qubits + qubit)]
+        _PACKED_GATES[name](phase, *words)
+    table.array[:] = PauliTable._unpack_bits(packed, num_rows).T
+    table.phase[:] = PauliTable._unpack_bits(phase.reshape(1, -1), num_rows)[0]
+    return clifford
+
+
+def _unroll_circuit(circuit, qargs, gates):
+    """Unroll a circuit into a list of Clifford basis gates.
+
+    Args:
+        circuit (QuantumCircuit or Instruction or str): the circuit to unroll.
+        qargs (list): The qubits to apply the circuit to.
+        gates (list): the list of ``(name, qubits)`` basis gates to append to.
+
+    Raises:
+        QiskitError: if input gate cannot be decomposed into Clifford gates.
+    """
+    if isinstance(circuit, Barrier):
+        return
+
+    if isinstance(circuit, str):
         # Check if gate is a valid Clifford basis gate string
-        if gate not in basis_1q and gate not in basis_2q:
-            raise QiskitError("Invalid Clifford gate name string {}".format(gate))
-        name = gate
+        if circuit not in _BASIS_GATES:
+            raise QiskitError("Invalid Clifford gate name string {}".format(circuit))
+        name = circuit
     else:
-        # Assume gate is an Instruction
-        name = gate.name
+        # Assume gate is a QuantumCircuit or an Instruction
+        name = circuit.name
 
     # Apply gate if it is a Clifford basis gate
-    if name in non_clifford:
+    if name in _NON_CLIFFORD_GATES:
         raise QiskitError("Cannot update Clifford with non-Clifford gate {}".format(name))
-    if name in basis_1q:
-        if len(qargs) != 1:
-            raise QiskitError("Invalid qubits for 1-qubit gate.")
-        return basis_1q[name](clifford, qargs[0])
-    if name in basis_2q:
-        if len(qargs) != 2:
-            raise QiskitError("Invalid qubits for 2-qubit gate.")
-        return basis_2q[name](clifford, qargs[0], qargs[1])
+    if name in _BASIS_GATES:
+        if len(qargs) != _BASIS_NUM_QUBITS[name]:
+            raise QiskitError("Invalid qubits for {}-qubit gate.".format(_BASIS_NUM_QUBITS[name]))
+        gates.append((name, tuple(qargs)))
+        return
 
     # If not a Clifford basis gate we try to unroll the gate and
     # raise an exception if unrolling reaches a non-Clifford gate.
     # TODO: We could also check u3 params to see if they
     # are a single qubit Clifford gate rather than raise an exception.
-    if gate.definition is None:
-        raise QiskitError("Cannot apply Instruction: {}".format(gate.name))
-    if not isinstance(gate.definition, QuantumCircuit):
+    definition = circuit if isinstance(circuit, QuantumCircuit) else circuit.definition
+    if definition is None:
+        raise QiskitError("Cannot apply Instruction: {}".format(name))
+    if not isinstance(definition, QuantumCircuit):
         raise QiskitError(
             "{} instruction definition is {}; expected QuantumCircuit".format(
-                gate.name, type(gate.definition)
+                name, type(definition)
             )
         )
-    qubit_indices = {bit: idx for idx, bit in enumerate(gate.definition.qubits)}
-    for instr, qregs, cregs in gate.definition:
+    qubit_indices = {bit: idx for idx, bit in enumerate(definition.qubits)}
+    for instr, qregs, cregs in definition:
         if cregs:
             raise QiskitError(
                 "Cannot apply Instruction with classical registers: {}".format(instr.name)
             )
         # Get the integer position of the flat register
         new_qubits = [qargs[qubit_indices[tup]] for tup in qregs]
-        _append_circuit(clifford, instr, new_qubits)
-    return clifford
+        _unroll_circuit(instr, new_qubits, gates)
 
 
 # ---------------------------------------------------------------------
@@ -321,3 +336,138 @@ def _append_swap(clifford, qubit0, qubit1):
     clifford.table.X[:, [qubit0, qubit1]] = clifford.table.X[:, [qubit1, qubit0]]
     clifford.table.Z[:, [qubit0, qubit1]] = clifford.table.Z[:, [qubit1, qubit0]]
     return clifford
+
+
+# ---------------------------------------------------------------------
+# Helper functions for applying basis gates to a bit-packed table
+# ---------------------------------------------------------------------
+# Each function takes the packed phase words followed by the packed X and Z
+# column words of each gate qubit, and updates them inplace. Unused bits of
+# the final word are zero, and every update below keeps them zero.
+
+
+def _packed_i(phase, x, z):
+    """Apply an I gate to a packed table."""
+    # pylint: disable=unused-argument
+    pass
+
+
+def _packed_x(phase, x, z):
+    """Apply an X gate to a packed table."""
+    # pylint: disable=unused-argument
+    phase ^= z
+
+
+def _packed_y(phase, x, z):
+    """Apply a Y gate to a packed table."""
+    phase ^= x ^ z
+
+
+def _packed_z(phase, x, z):
+    """Apply a Z gate to a packed table."""
+    # pylint: disable=unused-argument
+    phase ^= x
+
+
+def _packed_h(phase, x, z):
+    """Apply a H gate to a packed table."""
+    phase ^= x & z
+    tmp = x.copy()
+    x[:] = z
+    z[:] = tmp
+
+
+def _packed_s(phase, x, z):
+    """Apply an S gate to a packed table."""
+    phase ^= x & z
+    z ^= x
+
+
+def _packed_sdg(phase, x, z):
+    """Apply an Sdg gate to a packed table."""
+    phase ^= x & ~z
+    z ^= x
+
+
+def _packed_v(phase, x, z):
+    """Apply a V gate to a packed table."""
+    # pylint: disable=unused-argument
+    tmp = x.copy()
+    x ^= z
+    z[:] = tmp
+
+
+def _packed_w(phase, x, z):
+    """Apply a W gate to a packed table."""
+    # pylint: disable=unused-argument
+    tmp = z.copy()
+    z ^= x
+    x[:] = tmp
+
+
+def _packed_cx(phase, x0, z0, x1, z1):
+    """Apply a CX gate to a packed table."""
+    phase ^= ~(x1 ^ z0) & z1 & x0
+    x1 ^= x0
+    z0 ^= z1
+
+
+def _packed_cz(phase, x0, z0, x1, z1):
+    """Apply a CZ gate to a packed table."""
+    phase ^= x0 & x1 & (z0 ^ z1)
+    z1 ^= x0
+    z0 ^= x1
+
+
+def _packed_swap(phase, x0, z0, x1, z1):
+    """Apply a Swap gate to a packed table."""
+    # pylint: disable=unused-argument
+    tmp = x0.copy()
+    x0[:] = x1
+    x1[:] = tmp
+    tmp = z0.copy()
+    z0[:] = z1
+    z1[:] = tmp
+
+
+# Non-clifford gates
+_NON_CLIFFORD_GATES = {"t", "tdg", "ccx", "ccz"}
+
+# Basis Clifford Gates
+_BASIS_GATES = {
+    "i": _append_i,
+    "id": _append_i,
+    "iden": _append_i,
+    "x": _append_x,
+    "y": _append_y,
+    "z": _append_z,
+    "h": _append_h,
+    "s": _append_s,
+    "sdg": _append_sdg,
+    "sinv": _append_sdg,
+    "v": _append_v,
+    "w": _append_w,
+    "cx": _append_cx,
+    "cz": _append_cz,
+    "swap": _append_swap,
+}
+
+_PACKED_GATES = {
+    "i": _packed_i,
+    "id": _packed_i,
+    "iden": _packed_i,
+    "x": _packed_x,
+    "y": _packed_y,
+    "z": _packed_z,
+    "h": _packed_h,
+    "s": _packed_s,
+    "sdg": _packed_sdg,
+    "sinv": _packed_sdg,
+    "v": _packed_v,
+    "w": _packed_w,
+    "cx": _packed_cx,
+    "cz": _packed_cz,
+    "swap": _packed_swap,
+}
+
+_BASIS_NUM_QUBITS = {name: 2 if name in ("cx", "cz", "swap") else 1 for name in _BASIS_GATES}
@@ -23,6 +23,19 @@ from qiskit.quantum_info.operators.symplectic.pauli import Pauli
 from qiskit.quantum_info.operators.custom_iterator import CustomIterator
 from qiskit.quantum_info.operators.mixins import generate_apidocs, AdjointMixin
 
+# Constants for SWAR popcount of packed uint64 symplectic words
+_WORD_ONE = np.uint64(1)
+_WORD_TWO = np.uint64(2)
+_WORD_FOUR = np.uint64(4)
+_WORD_SHIFT = np.uint64(56)
+_WORD_M1 = np.uint64(0x5555555555555555)
+_WORD_M2 = np.uint64(0x3333333333333333)
+_WORD_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_WORD_H01 = np.uint64(0x0101010101010101)
+# Constants for hashing rows of packed words into 64-bit keys
+_HASH_MUL = np.uint64(0x9E3779B97F4A7C15)
+_HASH_SHIFT = np.uint64(29)
+
 
 class PauliTable(BaseOperator, AdjointMixin):
     r"""Symplectic representation of a list Pauli matrices.
@@ -377,28 +390,20 @@ class PauliTable(BaseOperator, AdjointMixin):
         # I => 0, X => 1, Y => 2, Z => 3
         x = self.X
         z = self.Z
-        order = 1 * (x & ~z) + 2 * (x & z) + 3 * (~x & z)
-        # Optionally get the weight of Pauli
+        order = np.asarray(1 * (x & ~z) + 2 * (x & z) + 3 * (~x & z), dtype=np.uint8)
+
+        # Lexicographic sort where the last qubit is the primary key.
+        # This is equivalent to successive stable sorts over qubits 0..N-1
+        # but done in a single pass over all keys.
+        keys = [order[:, i] for i in range(self.num_qubits)]
+        # Optionally sort by the weight of Pauli as the primary key.
         # This is the number of non identity terms
         if weight:
-            weights = np.sum(x | z, axis=1)
-
-        # Sort by order
-        # To preserve ordering between successive sorts we
-        # are use the 'stable' sort method
-        indices = np.arange(self.size)
-        for i in range(self.num_qubits):
-            sort_inds = order[:, i].argsort(kind="stable")
-            order = order[sort_inds]
-            indices = indices[sort_inds]
-            if weight:
-                weights = weights[sort_inds]
-
-        # If using weights we implement a final sort by total number
-        # of non-identity Paulis
-        if weight:
-            indices = indices[weights.argsort(kind="stable")]
-        return indices
+            x_words, z_words = self._pack_blocks(self)
+            keys.append(self._count_bits(x_words | z_words))
+        if not keys:
+            return np.arange(self.size)
+        return np.lexsort(keys)
 
     def sort(self, weight=False):
         """Sort the rows of the table.
@@ -476,20 +481,14 @@ class PauliTable(BaseOperator, AdjointMixin):
                 The number of times each of the unique values comes up in the
                 original array. Only provided if ``return_counts`` is True.
         """
-        if return_counts:
-            _, index, counts = np.unique(self.array, return_index=True, return_counts=True, axis=0)
-        else:
-            _, index = np.unique(self.array, return_index=True, axis=0)
-        # Sort the index so we return unique rows in the original array order
-        sort_inds = index.argsort()
-        index = index[sort_inds]
+        index, _, counts = self._unique_rows(self._pack_bits(self._array))
         unique = self[index]
         # Concatenate return tuples
         ret = (unique,)
         if return_index:
             ret += (index,)
         if return_counts:
-            ret += (counts[sort_inds],)
+            ret += (counts,)
         if len(ret) == 1:
             return ret[0]
         return ret
@@ -762,15 +761,20 @@ class PauliTable(BaseOperator, AdjointMixin):
         """
         if not isinstance(other, PauliTable):
             other = PauliTable(other)
-        comms = PauliTable._commutes(self, other[0])
-        (inds,) = np.where(comms == int(not anti))
-        for pauli in other[1:]:
-            comms = PauliTable._commutes(self[inds], pauli)
+        # Pack both tables once and filter the remaining rows
+        # using word-wise operations for each Pauli in other.
+        x1, z1 = PauliTable._pack_blocks(self)
+        x2, z2 = PauliTable._pack_blocks(other)
+        inds = np.arange(self.size)
+        for i in range(other.size):
+            comms = PauliTable._commutes_packed(x1, z1, x2[i], z2[i])
             (new_inds,) = np.where(comms == int(not anti))
             if new_inds.size == 0:
                 # No commuting rows
                 return new_inds
             inds = inds[new_inds]
+            x1 = x1[new_inds]
+            z1 = z1[new_inds]
         return inds
 
     @staticmethod
@@ -785,17 +789,169 @@ class PauliTable(BaseOperator, AdjointMixin):
             array: boolean vector of which rows commute (True) or
                    anti-commute (False).
         """
-        # Find positions where self and pauli are not identities
-        non_iden = (pauli_table.X | pauli_table.Z) & (pauli.X | pauli.Z)
-        # Multiply array by Pauli, and set entries where inputs
-        # where I to I
-        tmp = PauliTable(pauli_table.array ^ pauli.array)
-        tmp.X = tmp.X & non_iden
-        tmp.Z = tmp.Z & non_iden
-        # Find total number of non I Pauli's remaining in table
-        # if there are an even number the row commutes with the
-        # input Pauli, otherwise it anti-commutes
-        return np.logical_not(np.sum((tmp.X | tmp.Z), axis=1) % 2)
+        x1, z1 = PauliTable._pack_blocks(pauli_table)
+        x2, z2 = PauliTable._pack_blocks(pauli)
+        return PauliTable._commutes_packed(x1, z1, x2, z2)
+
+    @staticmethod
+    def _commutes_packed(x1, z1, x2, z2):
+        """Return which rows of packed Paulis commute with packed Paulis.
+
+        Args:
+            x1 (array): packed X block words of the first Paulis.
+            z1 (array): packed Z block words of the first Paulis.
+            x2 (array): packed X block words of the second Paulis.
+            z2 (array): packed Z block words of the second Paulis.
+
+        Returns:
+            array: boolean vector of which rows commute (True) or
+                   anti-commute (False).
+        """
+        # Two Paulis anti-commute if the symplectic inner product
+        # x1.z2 + z1.x2 is odd. Since we only need the parity we can
+        # reduce the words with XOR before counting bits.
+        words = np.bitwise_xor.reduce((x1 & z2) ^ (z1 & x2), axis=-1)
+        return np.logical_not(PauliTable._count_bits(words) % 2)
+
+    @staticmethod
+    def _pack_bits(array):
+        """Pack the columns of a boolean array into 64-bit words.
+
+        Column ``j`` of each row is stored in bit ``j % 64`` of word
+        ``j // 64``. Unused bits of the final word are zero, so bitwise
+        operations between packed arrays of the same width are safe.
+
+        Args:
+            array (array): a 2D boolean array.
+
+        Returns:
+            array: a 2D ``uint64`` array with ``ceil(cols / 64)`` columns.
+        """
+        array = np.asarray(array, dtype=bool)
+        if array.ndim == 1:
+            array = array.reshape((1, array.size))
+        rows, cols = array.shape
+        num_words = max(1, -(-cols // 64))
+        packed = np.zeros((rows, 8 * num_words), dtype=np.uint8)
+        packed[:, : -(-cols // 8)] = np.packbits(array, axis=1, bitorder="little")
+        return packed.view("<u8").astype(np.uint64, copy=False)
+
+    @staticmethod
+    def _unpack_bits(words, num_bits):
+        """Unpack 64-bit words into a boolean array.
+
+        This is the inverse of :meth:`_pack_bits`.
+
+        Args:
+            words (array): a 2D ``uint64`` array of packed words.
+            num_bits (int): the number of boolean columns to return.
+
+        Returns:
+            array: a 2D boolean array with ``num_bits`` columns.
+        """
+        words = np.ascontiguousarray(words, dtype="<u8")
+        packed = words.view(np.uint8).reshape((words.shape[0], -1))
+        return np.unpackbits(packed, axis=1, count=num_bits, bitorder="little").astype(bool)
+
+    @staticmethod
+    def _pack_blocks(table):
+        """Return the packed X and Z blocks of a PauliTable."""
+        return PauliTable._pack_bits(table.X), PauliTable._pack_bits(table.Z)
+
+    @staticmethod
+    def _count_bits(words):
+        """Return the number of set bits in an array of packed words.
+
+        Args:
+            words (array): ``uint64`` array of packed words.
+
+        Returns:
+            array: the total number of set bits along the last axis
+                   for 2D input, or the per-word count for 1D input.
+        """
+        words = np.asarray(words, dtype=np.uint64)
+        words = words - ((words >> _WORD_ONE) & _WORD_M1)
+        words = (words & _WORD_M2) + ((words >> _WORD_TWO) & _WORD_M2)
+        words = (words + (words >> _WORD_FOUR)) & _WORD_M4
+        words = (words * _WORD_H01) >> _WORD_SHIFT
+        if words.ndim > 1:
+            return np.sum(words, axis=-1, dtype=np.int64)
+        return words.astype(np.int64)
+
+    @staticmethod
+    def _row_keys(words):
+        """Return a 64-bit hash key for each row of packed words.
+
+        Rows that fit in a single word are used directly as their own key.
+        Wider rows are combined with a fixed multiply-xorshift mix so that
+        the keys are deterministic between runs and platforms.
+
+        Args:
+            words (array): a 2D ``uint64`` array of packed rows.
+
+        Returns:
+            array: a 1D ``uint64`` array of row keys.
+        """
+        if words.shape[1] == 1:
+            return words[:, 0]
+        keys = np.zeros(words.shape[0], dtype=np.uint64)
+        for i in range(words.shape[1]):
+            keys = (keys ^ words[:, i]) * _HASH_MUL
+            keys ^= keys >> _HASH_SHIFT
+        return keys
+
+    @staticmethod
+    def _unique_rows(words):
+        """Return the unique rows of packed words in order of first occurrence.
+
+        Rows are deduplicated with a single sort over 1D row keys
+        (see :meth:`_row_keys`). If two distinct rows share a key the exact
+        row-wise comparison is used instead, so the result never depends on
+        the hash.
+
+        Args:
+            words (array): a 2D ``uint64`` array of packed rows.
+
+        Returns:
+            tuple: ``(index, inverse, counts)`` where ``index`` are the
+            indices of the first occurrence of each unique row in increasing
+            order, ``inverse`` maps each row to its position in ``index``,
+            and ``counts`` is the number of occurrences of each unique row.
+        """
+        keys = PauliTable._row_keys(words)
+        _, index, inverse, counts = np.unique(
+            keys, return_index=True, return_inverse=True, return_counts=True
+        )
+        if words.shape[1] > 1 and not np.array_equal(words, words[index[inverse]]):
+            # Hash collision, fall back to exact row-wise deduplication
+            _, index, inverse, counts = np.unique(
+                words, return_index=True, return_inverse=True, return_counts=True, axis=0
+            )
+        inverse = np.reshape(inverse, -1)
+        # Relabel unique rows to be in order of their first occurrence
+        order = index.argsort(kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+        return index[order], rank[inverse], counts[order]
+
+    @staticmethod
+    def _lexsort_rows(array):
+        """Return indices that sort the rows of a boolean array lexicographically.
+
+        This gives the same row order as ``np.unique(array, axis=0)`` but
+        compares rows packed into bytes rather than individual booleans.
+
+        Args:
+            array (array): a 2D boolean array.
+
+        Returns:
+            array: the indices that sort the rows.
+        """
+        packed = np.packbits(array, axis=1, bitorder="big")
+        if packed.shape[1] == 0:
+            return np.arange(packed.shape[0])
+        # lexsort uses the last key as the primary key
+        return np.lexsort(packed.T[::-1])
 
     @staticmethod
     def _block_stack(array1, array2):
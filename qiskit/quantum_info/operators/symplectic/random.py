@@ -17,7 +17,7 @@ import numpy as np
 from numpy.random import default_rng
 
 from .pauli import Pauli
-from .clifford import Clifford
+from .clifford import Clifford, _mod2_dot
 from .stabilizer_table import StabilizerTable
 from .pauli_table import PauliTable
 
@@ -141,8 +141,8 @@ def random_clifford(num_qubits, seed=None):
 
     # Compute stabilizer table
     zero = np.zeros((num_qubits, num_qubits), dtype=np.int8)
-    prod1 = np.matmul(gamma1, delta1) % 2
-    prod2 = np.matmul(gamma2, delta2) % 2
+    prod1 = _mod2_dot(gamma1, delta1).astype(np.int8)
+    prod2 = _mod2_dot(gamma2, delta2).astype(np.int8)
     inv1 = _inverse_tril(delta1, block_inverse_threshold).transpose()
     inv2 = _inverse_tril(delta2, block_inverse_threshold).transpose()
     table1 = np.block([[delta1, zero], [prod1, inv1]])
@@ -159,7 +159,7 @@ def random_clifford(num_qubits, seed=None):
     table[lhs_inds, :] = table[rhs_inds, :]
 
     # Apply table
-    table = np.mod(np.matmul(table1, table), 2).astype(bool)
+    table = _mod2_dot(table1, table).astype(bool)
 
     # Generate random phases
     phase = rng.integers(2, size=2 * num_qubits).astype(bool)
@@ -269,6 +269,6 @@ def _inverse_tril(mat, block_inverse_threshold):
     dim1 = dim // 2
     mat_a = _inverse_tril(mat[0:dim1, 0:dim1], block_inverse_threshold)
     mat_d = _inverse_tril(mat[dim1:dim, dim1:dim], block_inverse_threshold)
-    mat_c = np.matmul(np.matmul(mat_d, mat[dim1:dim, 0:dim1]), mat_a)
+    mat_c = _mod2_dot(_mod2_dot(mat_d, mat[dim1:dim, 0:dim1]), mat_a).astype(np.int8)
     inv = np.block([[mat_a, np.zeros((dim1, dim - dim1), dtype=int)], [mat_c, mat_d]])
     return inv % 2
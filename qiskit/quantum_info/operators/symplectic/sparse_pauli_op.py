@@ -201,6 +201,17 @@ class SparsePauliOp(LinearOp):
 
         # Take product of coefficients and add phase correction
         coeffs = c1 * c2
+        # The phase correction is computed on bit-packed X and Z blocks
+        # which are packed before stacking to avoid packing the
+        # full outer product of the two tables.
+        if qargs is not None:
+            x1 = PauliTable._pack_bits(self.table.X[:, qargs])
+            z1 = PauliTable._pack_bits(self.table.Z[:, qargs])
+        else:
+            x1, z1 = PauliTable._pack_blocks(self.table)
+        x2, z2 = PauliTable._pack_blocks(other.table)
+        x1, x2 = PauliTable._block_stack(x1, x2)
+        z1, z2 = PauliTable._block_stack(z1, z2)
         # We pick additional phase terms for the products
         # X.Y = i * Z, Y.Z = i * X, Z.X = i * Y
         # Y.X = -i * Z, Z.Y = -i * X, X.Z = -i * Y
@@ -210,8 +221,8 @@ class SparsePauliOp(LinearOp):
         else:
             minus_i = (x1 & ~z1 & x2 & z2) | (x1 & z1 & ~x2 & z2) | (~x1 & z1 & x2 & ~z2)
             plus_i = (x2 & ~z2 & x1 & z1) | (x2 & z2 & ~x1 & z1) | (~x2 & z2 & x1 & ~z1)
-        coeffs *= 1j ** np.array(np.sum(plus_i, axis=1), dtype=int)
-        coeffs *= (-1j) ** np.array(np.sum(minus_i, axis=1), dtype=int)
+        phase = PauliTable._count_bits(plus_i) - PauliTable._count_bits(minus_i)
+        coeffs *= 1j ** np.mod(phase, 4)
         return SparsePauliOp(table, coeffs)
 
     def tensor(self, other):
@@ -306,17 +317,18 @@ class SparsePauliOp(LinearOp):
         if rtol is None:
             rtol = self.rtol
 
-        table, indexes = np.unique(self.table.array, return_inverse=True, axis=0)
-        coeffs = np.zeros(len(table), dtype=complex)
-        for i, val in zip(indexes, self.coeffs):
-            coeffs[i] += val
+        # Merge duplicate rows using hash keys of the bit-packed table
+        index, inverse, _ = PauliTable._unique_rows(PauliTable._pack_bits(self.table.array))
+        coeffs = self._merge_coeffs(inverse, self.coeffs, index.size)
         # Delete zero coefficient rows
-        # TODO: Add atol/rtol for zero comparison
-        non_zero = [
-            i for i in range(coeffs.size) if not np.isclose(coeffs[i], 0, atol=atol, rtol=rtol)
-        ]
-        table = table[non_zero]
+        non_zero = np.logical_not(np.isclose(coeffs, 0, atol=atol, rtol=rtol))
+        table = self.table.array[index[non_zero]]
         coeffs = coeffs[non_zero]
+        # Return the remaining rows in lexicographic order so that the
+        # simplified operator has a canonical form.
+        order = PauliTable._lexsort_rows(table)
+        table = table[order]
+        coeffs = coeffs[order]
         # Check edge case that we deleted all Paulis
         # In this case we return an identity Pauli with a zero coefficient
         if coeffs.size == 0:
@@ -324,6 +336,14 @@ class SparsePauliOp(LinearOp):
             coeffs = np.array([0j])
         return SparsePauliOp(table, coeffs)
 
+    @staticmethod
+    def _merge_coeffs(inverse, coeffs, size):
+        """Sum complex coefficients that map to the same index."""
+        coeffs = np.asarray(coeffs, dtype=complex)
+        real = np.bincount(inverse, weights=coeffs.real, minlength=size)
+        imag = np.bincount(inverse, weights=coeffs.imag, minlength=size)
+        return real + 1j * imag
+
     # ---------------------------------------------------------------------
     # Additional conversions
     # ---------------------------------------------------------------------
@@ -428,18 +448,175 @@ class SparsePauliOp(LinearOp):
             array: A dense matrix if `sparse=False`.
             csr_matrix: A sparse matrix in CSR format if `sparse=True`.
         """
-        mat = None
-        for i in self.matrix_iter(sparse=sparse):
-            if mat is None:
-                mat = i
-            else:
-                mat += i
+        # The matrix is built directly from the symplectic representation.
+        # Terms with the same X block share the same sparsity pattern, so
+        # for each distinct X block we only compute the sum of their
+        # diagonal factors, which gives the non-zero values for all rows.
+        dim = 2 ** self.num_qubits
+        rows = np.arange(dim)
+        x_masks = []
+        values = []
+        for x_mask, diag in self._x_group_diagonals():
+            x_masks.append(x_mask)
+            values.append(diag)
+
+        if not sparse:
+            mat = np.zeros((dim, dim), dtype=complex)
+            for x_mask, diag in zip(x_masks, values):
+                mat[rows, rows ^ x_mask] = diag
+            return mat
+
+        from scipy.sparse import csr_matrix
+
+        num_groups = len(x_masks)
+        indices = rows[:, None] ^ np.array(x_masks, dtype=rows.dtype)[None, :]
+        data = np.stack(values, axis=1)
+        indptr = num_groups * np.arange(dim + 1)
+        mat = csr_matrix((data.ravel(), indices.ravel(), indptr), shape=(dim, dim), dtype=complex)
+        mat.eliminate_zeros()
+        mat.sort_indices()
         return mat
 
     def to_operator(self):
         """Convert to a matrix Operator object"""
         return Operator(self.to_matrix())
 
+    def to_linear_operator(self):
+        """Convert to a matrix-free SciPy ``LinearOperator``.
+
+        The returned operator computes matrix-vector products directly from
+        the symplectic representation of the terms, so the memory required
+        scales with the size of the vectors rather than the number of
+        non-zero matrix elements. This allows the use of iterative solvers
+        such as :func:`scipy.sparse.linalg.eigsh` for operators on too many
+        qubits to construct their dense or sparse matrix.
+
+        Returns:
+            LinearOperator: a linear operator with the action of this operator.
+        """
+        from scipy.sparse.linalg import LinearOperator
+
+        groups = self._x_groups()
+        adjoint = []
+
+        def matvec(vec):
+            return self._matvec(vec, groups=groups)
+
+        def rmatvec(vec):
+            # The adjoint groups are only computed if they are used
+            if not adjoint:
+                adjoint.append(self.adjoint()._x_groups())
+            return self._matvec(vec, groups=adjoint[0])
+
+        dim = 2 ** self.num_qubits
+        return LinearOperator(
+            (dim, dim), matvec=matvec, rmatvec=rmatvec, matmat=matvec, dtype=complex
+        )
+
+    def _matvec(self, vec, groups=None):
+        """Return the product of the operator matrix with a vector.
+
+        The product is computed directly from the symplectic representation
+        without constructing the operator matrix. Only the non-zero values of
+        the terms sharing a single X block are held in memory at a time.
+
+        Args:
+            vec (np.ndarray): a vector of length ``2 ** num_qubits``, or a
+                              2D array whose columns are such vectors.
+            groups (list): Optional, the terms grouped by :meth:`_x_groups`.
+
+        Returns:
+            np.ndarray: the product of the operator with ``vec``.
+        """
+        vec = np.asarray(vec)
+        rows = np.arange(2 ** self.num_qubits)
+        shape = (rows.size,) + (vec.ndim - 1) * (1,)
+        ret = np.zeros(vec.shape, dtype=complex)
+        for x_mask, diag in self._x_group_diagonals(groups=groups):
+            if x_mask:
+                ret += diag.reshape(shape) * vec[rows ^ x_mask]
+            else:
+                ret += diag.reshape(shape) * vec
+        return ret
+
+    def _x_groups(self):
+        """Return the terms of the operator grouped by X block.
+
+        For an N-qubit Pauli with integer X and Z masks ``x`` and ``z`` the
+        non-zero matrix element in row ``r`` is in column ``r ^ x`` and has
+        value ``(-i)^{|x & z|} (-1)^{|z & r|}``.
+
+        Returns:
+            list: a list of tuples ``(x_mask, z_masks, coeffs)`` of the
+            integer X mask of each group, and the integer Z masks and the
+            coefficients including the ``(-i)^{|x & z|}`` phase of its terms.
+        """
+        table = self.table
+        twos = 1 << np.arange(self.num_qubits)
+        x_ints = table.X.dot(twos)
+        z_ints = table.Z.dot(twos)
+        # Phase from the Y terms in the symplectic representation
+        phases = np.array([1, -1j, -1, 1j])[np.mod(np.sum(table.X & table.Z, axis=1), 4)]
+        coeffs = phases * self.coeffs
+        x_masks, inverse = np.unique(x_ints, return_inverse=True)
+        groups = []
+        for i, x_mask in enumerate(x_masks):
+            group = inverse == i
+            groups.append((x_mask, z_ints[group], coeffs[group]))
+        return groups
+
+    def _x_group_diagonals(self, groups=None):
+        """Return an iterator over the non-zero values of terms grouped by X block.
+
+        Summing the non-zero values of all terms with the same X mask gives
+        a single vector of values for the group (see :meth:`_x_groups`).
+
+        Args:
+            groups (list): Optional, the terms grouped by :meth:`_x_groups`.
+
+        Yields:
+            tuple: ``(x_mask, values)`` pairs of the integer X mask of a group
+            and the vector of non-zero values for each row.
+        """
+        if groups is None:
+            groups = self._x_groups()
+        for x_mask, z_ints, coeffs in groups:
+            yield x_mask, self._z_diagonal(z_ints, coeffs, self.num_qubits)
+
+    @staticmethod
+    def _z_diagonal(z_ints, coeffs, num_qubits):
+        """Return the diagonal of a sum of Z-type Paulis.
+
+        Args:
+            z_ints (np.ndarray): integer Z masks of the terms.
+            coeffs (np.ndarray): complex coefficients of the terms.
+            num_qubits (int): the number of qubits.
+
+        Returns:
+            np.ndarray: the vector ``sum_k coeffs[k] (-1)^{|z_ints[k] & r|}``.
+        """
+        dim = 2 ** num_qubits
+        if len(z_ints) > num_qubits:
+            # For many terms use a fast Walsh-Hadamard transform of the
+            # coefficient vector which costs O(N 2^N) independent of the
+            # number of terms.
+            diag = np.zeros(dim, dtype=complex)
+            np.add.at(diag, z_ints, coeffs)
+            for qubit in range(num_qubits):
+                diag = diag.reshape((-1, 2, 2 ** qubit))
+                diag = np.concatenate(
+                    [diag[:, :1] + diag[:, 1:], diag[:, :1] - diag[:, 1:]], axis=1
+                )
+            return diag.reshape(dim)
+        diag = np.zeros(dim, dtype=complex)
+        for z_int, coeff in zip(z_ints, coeffs):
+            # Build the sign vector as a tensor product of [1, +-1] factors
+            signs = np.ones(1)
+            for qubit in range(num_qubits):
+                signs = np.hstack([signs, -signs if (z_int >> qubit) & 1 else signs])
+            diag += coeff * signs
+        return diag
+
     # ---------------------------------------------------------------------
     # Custom Iterators
     # ---------------------------------------------------------------------
@@ -498,5 +675,122 @@ class SparsePauliOp(LinearOp):
         return MatrixIterator(self)
 
 
+class SparsePauliOpAccumulator:
+    """Incremental accumulator for building large sums of Pauli terms.
+
+    Terms added to the accumulator are buffered and periodically merged, so
+    that coefficients of duplicate Paulis are combined with the same hashing
+    method used by :meth:`SparsePauliOp.simplify` without re-simplifying the
+    full operator after every addition. The returned operator is equal to
+    the :meth:`SparsePauliOp.simplify` of the sum of all added terms.
+
+    **Example**
+
+    .. jupyter-execute::
+
+        from qiskit.quantum_info import SparsePauliOp, SparsePauliOpAccumulator
+
+        acc = SparsePauliOpAccumulator(2)
+        acc.add('XX', 0.5)
+        acc.add(SparsePauliOp.from_list([('ZZ', 1), ('XX', 0.5)]))
+        print(acc.to_operator())
+    """
+
+    def __init__(self, num_qubits, compact_size=4096):
+        """Initialize an empty accumulator.
+
+        Args:
+            num_qubits (int): the number of qubits of the accumulated operator.
+            compact_size (int): the minimum number of buffered terms before
+                                the buffer is merged into the accumulated
+                                terms (Default: 4096).
+        """
+        self._num_qubits = num_qubits
+        self._compact_size = compact_size
+        # Accumulated unique terms stored as packed rows of the PauliTable array
+        self._words = np.zeros((0, max(1, -(-2 * num_qubits // 64))), dtype=np.uint64)
+        self._coeffs = np.zeros(0, dtype=complex)
+        self._buffer_words = []
+        self._buffer_coeffs = []
+        self._buffer_size = 0
+
+    def __len__(self):
+        """Return the number of accumulated terms including duplicates in the buffer."""
+        return len(self._coeffs) + self._buffer_size
+
+    @property
+    def num_qubits(self):
+        """Return the number of qubits of the accumulated operator."""
+        return self._num_qubits
+
+    def add(self, other, coeff=1):
+        """Add terms to the accumulator.
+
+        Args:
+            other (SparsePauliOp or PauliTable or str): terms to add. Any input
+                accepted by :class:`SparsePauliOp` may be used.
+            coeff (complex): additional coefficient to multiply the added
+                             terms by (Default: 1).
+
+        Returns:
+            SparsePauliOpAccumulator: the accumulator.
+
+        Raises:
+            QiskitError: if the number of qubits of other is incorrect.
+        """
+        if not isinstance(other, SparsePauliOp):
+            other = SparsePauliOp(other)
+        if other.num_qubits != self._num_qubits:
+            raise QiskitError(
+                "Number of qubits of the added terms does not match the "
+                "accumulator ({} != {}).".format(other.num_qubits, self._num_qubits)
+            )
+        self._buffer_words.append(PauliTable._pack_bits(other.table.array))
+        self._buffer_coeffs.append(coeff * other.coeffs)
+        self._buffer_size += other.size
+        if self._buffer_size >= max(self._compact_size, len(self._coeffs)):
+            self._compact()
+        return self
+
+    def _compact(self):
+        """Merge the buffered terms into the accumulated terms."""
+        if not self._buffer_size:
+            return
+        words = np.vstack([self._words] + self._buffer_words)
+        coeffs = np.hstack([self._coeffs] + self._buffer_coeffs)
+        index, inverse, _ = PauliTable._unique_rows(words)
+        self._words = words[index]
+        self._coeffs = SparsePauliOp._merge_coeffs(inverse, coeffs, index.size)
+        self._buffer_words = []
+        self._buffer_coeffs = []
+        self._buffer_size = 0
+
+    def to_operator(self, atol=None, rtol=None):
+        """Return the accumulated sum as a simplified SparsePauliOp.
+
+        Args:
+            atol (float): Optional. Absolute tolerance for checking if
+                          coefficients are zero (Default: 1e-8).
+            rtol (float): Optional. relative tolerance for checking if
+                          coefficients are zero (Default: 1e-5).
+
+        Returns:
+            SparsePauliOp: the accumulated operator.
+        """
+        if atol is None:
+            atol = SparsePauliOp.atol
+        if rtol is None:
+            rtol = SparsePauliOp.rtol
+        self._compact()
+        non_zero = np.logical_not(np.isclose(self._coeffs, 0, atol=atol, rtol=rtol))
+        if not np.any(non_zero):
+            # Return an identity Pauli with a zero coefficient
+            table = np.zeros((1, 2 * self._num_qubits), dtype=bool)
+            return SparsePauliOp(table, np.array([0j]))
+        table = PauliTable._unpack_bits(self._words[non_zero], 2 * self._num_qubits)
+        order = PauliTable._lexsort_rows(table)
+        return SparsePauliOp(table[order], self._coeffs[non_zero][order])
+
+
 # Update docstrings for API docs
 generate_apidocs(SparsePauliOp)
@@ -435,22 +435,16 @@ class StabilizerTable(PauliTable, AdjointMixin):
                 The number of times each of the unique values comes up in the
                 original array. Only provided if ``return_counts`` is True.
         """
-        # Combine array and phases into single array for sorting
-        stack = np.hstack([self._array, self._phase.reshape((self.size, 1))])
-        if return_counts:
-            _, index, counts = np.unique(stack, return_index=True, return_counts=True, axis=0)
-        else:
-            _, index = np.unique(stack, return_index=True, axis=0)
-        # Sort the index so we return unique rows in the original array order
-        sort_inds = index.argsort()
-        index = index[sort_inds]
+        # Combine array and phases into single bit-packed array for hashing
+        stack = self._pack_bits(np.hstack([self._array, self._phase.reshape((self.size, 1))]))
+        index, _, counts = self._unique_rows(stack)
         unique = self[index]
         # Concatenate return tuples
         ret = (unique,)
         if return_index:
             ret += (index,)
         if return_counts:
-            ret += (counts[sort_inds],)
+            ret += (counts,)
         if len(ret) == 1:
             return ret[0]
         return ret
@@ -594,13 +588,27 @@ class StabilizerTable(PauliTable, AdjointMixin):
         else:
             pauli = np.hstack((x1 ^ x2, z1 ^ z2))
 
+        # The phase shift is computed on bit-packed X and Z blocks
+        # which are packed before stacking to avoid packing the
+        # full outer product of the two tables.
+        if qargs is not None:
+            x1 = self._pack_bits(self.X[:, qargs])
+            z1 = self._pack_bits(self.Z[:, qargs])
+        else:
+            x1, z1 = self._pack_blocks(self)
+        x2, z2 = self._pack_blocks(other)
+        x1, x2 = self._block_stack(x1, x2)
+        z1, z2 = self._block_stack(z1, z2)
+
         # We pick up a minus sign for products:
         # Y.Y = -I, X.Y = -Z, Y.Z = -X, Z.X = -Y
         if front:
             minus = (x1 & z2 & (x2 | z1)) | (~x1 & x2 & z1 & ~z2)
         else:
             minus = (x2 & z1 & (x1 | z2)) | (~x2 & x1 & z2 & ~z1)
-        phase_shift = np.array(np.sum(minus, axis=1) % 2, dtype=bool)
+        # Only the parity is needed so reduce words with XOR before counting
+        minus = np.bitwise_xor.reduce(minus, axis=1)
+        phase_shift = np.array(self._count_bits(minus) % 2, dtype=bool)
         phase = phase_shift ^ phase1 ^ phase2
         return StabilizerTable(pauli, phase)
 
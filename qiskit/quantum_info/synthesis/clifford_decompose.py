@@ -18,7 +18,9 @@ from itertools import product
 import numpy as np
 from qiskit.exceptions import QiskitError
 from qiskit.circuit import QuantumCircuit
+from qiskit.quantum_info.operators.symplectic.stabilizer_table import StabilizerTable
 from qiskit.quantum_info.operators.symplectic.clifford_circuits import (
+    _append_circuit,
     _append_z,
     _append_x,
     _append_h,
@@ -468,55 +470,31 @@ def decompose_clifford_greedy(clifford):
     num_qubits = clifford.num_qubits
     circ = QuantumCircuit(num_qubits, name=str(clifford))
     qubit_list = list(range(num_qubits))
-    clifford_cpy = clifford.copy()
+    # Only the inverse of the reduced Clifford is needed by each elimination
+    # step, and it is updated by appending the decoupling circuits to it.
+    clifford_cpy_inv = clifford.adjoint()
 
     # Reducing the original Clifford to identity
     # via symplectic Gaussian elimination
     while len(qubit_list) > 0:
-        clifford_cpy_inv = clifford_cpy.adjoint()
-
-        list_greedy_cost = []
-        for qubit in qubit_list:
-            cliff_ox = clifford_cpy.copy()
-            _append_x(cliff_ox, qubit)
-            cliff_ox = cliff_ox.compose(clifford_cpy_inv)
-
-            cliff_oz = clifford_cpy.copy()
-            _append_z(cliff_oz, qubit)
-            cliff_oz = cliff_oz.compose(clifford_cpy_inv)
-
-            list_pairs = []
-            pauli_count = 0
-
-            # Compute the CNOT cost in order to find the qubit with the minimal cost
-            for i in qubit_list:
-                typeq = _from_pair_cliffs_to_type(cliff_ox, cliff_oz, i)
-                list_pairs.append(typeq)
-                pauli_count += 1
-            cost = _compute_greedy_cost(list_pairs)
-            list_greedy_cost.append([cost, qubit])
-
-        _, min_qubit = (sorted(list_greedy_cost))[0]
+        # Compute the CNOT cost of every qubit in order to find the qubit with the minimal cost
+        costs = _compute_greedy_costs(clifford_cpy_inv, qubit_list)
+        min_qubit = qubit_list[np.argmin(costs)]
 
         # Gaussian elimination step for the qubit with minimal CNOT cost
-        cliff_ox = clifford_cpy.copy()
-        _append_x(cliff_ox, min_qubit)
-        cliff_ox = cliff_ox.compose(clifford_cpy_inv)
-
-        cliff_oz = clifford_cpy.copy()
-        _append_z(cliff_oz, min_qubit)
-        cliff_oz = cliff_oz.compose(clifford_cpy_inv)
+        cliff_ox = _pauli_clifford(clifford_cpy_inv.destabilizer[min_qubit])
+        cliff_oz = _pauli_clifford(clifford_cpy_inv.stabilizer[min_qubit])
 
         # Compute the decoupling operator of cliff_ox and cliff_oz
-        decouple_circ, decouple_cliff = _calc_decoupling(
-            cliff_ox, cliff_oz, qubit_list, min_qubit, num_qubits
-        )
-        circ = circ.compose(decouple_circ)
+        decouple_circ, _ = _calc_decoupling(cliff_ox, cliff_oz, qubit_list, min_qubit, num_qubits)
+        circ.compose(decouple_circ, inplace=True)
 
         # Now the clifford acts trivially on min_qubit
-        clifford_cpy = decouple_cliff.adjoint().compose(clifford_cpy)
+        _append_circuit(clifford_cpy_inv, decouple_circ)
         qubit_list.remove(min_qubit)
 
+    clifford_cpy = clifford_cpy_inv.adjoint()
+
     # Add the phases (Pauli gates) to the Clifford circuit
     for qubit in range(num_qubits):
         stab = clifford_cpy.stabilizer.phase[qubit]
@@ -576,38 +554,65 @@ E_class = [[[False, False], [False, False]]]  # 'II'
 def _from_pair_cliffs_to_type(cliff_ox, cliff_oz, qubit):
     """Converts a pair of Paulis Ox and Oz into a type"""
 
-    type_ox = [cliff_ox.destabilizer.phase[qubit], cliff_ox.stabilizer.phase[qubit]]
-    type_oz = [cliff_oz.destabilizer.phase[qubit], cliff_oz.stabilizer.phase[qubit]]
+    # Index the phases of the full tables, rather than creating the destabilizer
+    # and stabilizer tables of each Clifford
+    num_qubits = cliff_ox.num_qubits
+    phase_ox = cliff_ox.table.phase
+    phase_oz = cliff_oz.table.phase
+    type_ox = [phase_ox[qubit], phase_ox[num_qubits + qubit]]
+    type_oz = [phase_oz[qubit], phase_oz[num_qubits + qubit]]
     return [type_ox, type_oz]
 
 
-def _compute_greedy_cost(list_pairs):
-    """Compute the CNOT cost of one step of the algorithm"""
+def _pauli_clifford(row):
+    """Return the Clifford C^{-1} * P * C for the Pauli P = C * O * C^{-1}.
+
+    Here O is an X or Z operator on a single qubit and ``row`` is the
+    corresponding row of the table of C^{-1}. The returned Clifford is the
+    identity table with the phases of the conjugated Pauli. This is
+    equivalent to appending O to C and composing with C^{-1}.
+    """
+    # pylint: disable=cyclic-import
+    from qiskit.quantum_info.operators.symplectic.clifford import Clifford
 
-    A_num = 0
-    B_num = 0
-    C_num = 0
-    D_num = 0
+    num_qubits = row.num_qubits
+    phase = np.hstack([row.Z[0], row.X[0]])
+    return Clifford(StabilizerTable(np.eye(2 * num_qubits, dtype=bool), phase), validate=False)
 
-    for pair in list_pairs:
-        if pair in A_class:
-            A_num += 1
-        elif pair in B_class:
-            B_num += 1
-        elif pair in C_class:
-            C_num += 1
-        elif pair in D_class:
-            D_num += 1
 
-    if (A_num % 2) == 0:
+def _compute_greedy_costs(clifford_inv, qubit_list):
+    """Compute the CNOT cost of one step of the algorithm for each qubit.
+
+    The cost of a qubit is computed from the classes of the pairs of Paulis
+    Ox and Oz on every qubit in ``qubit_list``, given the inverse of the
+    Clifford being reduced.
+    """
+    num_qubits = clifford_inv.num_qubits
+    rows = np.asarray(qubit_list)
+    table = clifford_inv.table
+    # Pauli pair types of qubit i (columns) for the Ox and Oz operators of each qubit (rows)
+    ox_z = table.Z[np.ix_(rows, rows)]
+    ox_x = table.X[np.ix_(rows, rows)]
+    oz_z = table.Z[np.ix_(rows + num_qubits, rows)]
+    oz_x = table.X[np.ix_(rows + num_qubits, rows)]
+    ox_nonzero = ox_z | ox_x
+    oz_nonzero = oz_z | oz_x
+    same = (ox_z == oz_z) & (ox_x == oz_x)
+
+    a_class = ox_nonzero & oz_nonzero & ~same
+    a_num = np.sum(a_class, axis=1)
+    b_num = np.sum(ox_nonzero & same, axis=1)
+    c_num = np.sum(ox_nonzero & ~oz_nonzero, axis=1)
+    d_num = np.sum(~ox_nonzero & oz_nonzero, axis=1)
+
+    if np.any(a_num % 2 == 0):
         raise QiskitError("Symplectic Gaussian elimination fails.")
 
     # Calculate the CNOT cost
-    cost = 3 * (A_num - 1) / 2 + (B_num + 1) * (B_num > 0) + C_num + D_num
-    if list_pairs[0] not in A_class:  # additional SWAP
-        cost += 3
-
-    return cost
+    costs = 3 * (a_num - 1) / 2 + (b_num + 1) * (b_num > 0) + c_num + d_num
+    # additional SWAP
+    costs += 3 * ~a_class[:, 0]
+    return costs
 
 
 def _calc_decoupling(cliff_ox, cliff_oz, qubit_list, min_qubit, num_qubits):
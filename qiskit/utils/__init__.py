@@ -47,16 +47,19 @@ Algorithm Utilities
    :nosignatures:
 
    QuantumInstance
+   MeasurementCalibrationStore
 
 A QuantumInstance holds the Qiskit `backend` as well as a number of compile and
 runtime parameters controlling circuit compilation and execution. Quantum
 :mod:`algorithms <qiskit.algorithms>`
 are run on a device or simulator by passing a QuantumInstance setup with the desired
-backend etc.
+backend etc. The measurement error mitigation calibrations of quantum instances can be
+shared, also across processes, through a MeasurementCalibrationStore.
 
 """
 
 from .quantum_instance import QuantumInstance
+from .measurement_calibration_store import MeasurementCalibrationStore
 from .deprecation import _filter_deprecation_warnings
 from .deprecation import deprecate_arguments
 from .deprecation import deprecate_function
@@ -73,6 +76,7 @@ from .algorithm_globals import algorithm_globals
 
 __all__ = [
     "QuantumInstance",
+    "MeasurementCalibrationStore",
     "summarize_circuits",
     "get_entangler_map",
     "validate_entangler_map",
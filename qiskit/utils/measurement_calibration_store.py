@@ -0,0 +1,365 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Store of measurement error mitigation calibrations """
+
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_SUFFIX = ".cal"
+
+
+def _check_private(directory: str) -> None:
+    """Raise a ValueError unless the directory is owned by and only writable by the current user."""
+    if not hasattr(os, "getuid"):
+        # file ownership is not available on this platform, e.g. on Windows
+        return
+    status = os.stat(directory)
+    if status.st_uid != os.getuid() or status.st_mode & 0o022:
+        raise ValueError(
+            "The calibration directory {} must be owned by the current user and must not be "
+            "writable by the group or others, since the calibrations in it are "
+            "unpickled.".format(directory)
+        )
+
+
+class _Entry:
+    """A stored calibration, whose fitter is loaded from disk on first use."""
+
+    __slots__ = ("timestamp", "fitter", "filename")
+
+    def __init__(self, timestamp, fitter=None, filename=None):
+        self.timestamp = timestamp
+        self.fitter = fitter
+        self.filename = filename
+
+
+class MeasurementCalibrationStore:
+    """Store of measurement error mitigation fitters.
+
+    The fitters are indexed by the name of the backend, the set of calibrated qubits, the number
+    of shots of the calibration and the time the calibration was built. Besides looking up the
+    calibration of a set of qubits, the store efficiently finds the most recent calibration of a
+    superset of them, from which the fitter of the qubits can be derived, by keeping the stored
+    qubit sets indexed by each of their qubits.
+
+    A store can be shared by several :class:`~qiskit.utils.QuantumInstance` objects, which then
+    reuse each other's calibrations. If a ``directory`` is given, each calibration is also written
+    to a file in it, so that other processes of the same user using a store on the same directory,
+    for example in a memory backed file system, find it too. Files are written atomically and only
+    read when a calibration is looked up, so processes may read and write the directory
+    concurrently. The fitters must be picklable in this case. Since loading a pickle can run
+    arbitrary code, the directory must be owned by the current user and must not be writable by
+    anyone else. It is created with these permissions if it does not exist.
+
+    Copies of a store, made with :mod:`copy` or :mod:`pickle`, hold the same calibrations but
+    are independent of the original, apart from a shared directory.
+
+    Calibrations older than ``ttl`` seconds are evicted, from the directory as well.
+    """
+
+    def __init__(self, directory: Optional[str] = None, ttl: Optional[float] = None) -> None:
+        """
+        Args:
+            directory: The directory to persist the calibrations in. If None, the calibrations
+                are only kept in memory.
+            ttl: The time to live of a calibration in seconds. If None, calibrations are kept
+                until they are replaced or :meth:`clear` is called.
+
+        Raises:
+            ValueError: if ``ttl`` is not positive, or if the ``directory`` is not owned by the
+                current user or is writable by others.
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError("The time to live must be positive, was {}.".format(ttl))
+        self._directory = directory
+        self._ttl = ttl
+        self._lock = threading.RLock()
+        self._entries: Dict[Tuple[str, Tuple[int, ...], int], _Entry] = {}
+        # (backend name, shots) -> qubit -> stored qubit sets containing the qubit
+        self._index: Dict[Tuple[str, int], Dict[int, Set[Tuple[int, ...]]]] = {}
+        # file name -> (modification time, key) of the files read from the directory
+        self._files: Dict[str, Tuple[int, Tuple[str, Tuple[int, ...], int]]] = {}
+        if directory is not None:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            _check_private(directory)
+
+    def __getstate__(self):
+        # locks cannot be copied, each copy gets a lock of its own
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def directory(self) -> Optional[str]:
+        """Returns the directory the calibrations are persisted in."""
+        return self._directory
+
+    @property
+    def ttl(self) -> Optional[float]:
+        """Returns the time to live of a calibration in seconds."""
+        return self._ttl
+
+    def put(
+        self,
+        backend_name: str,
+        qubits: List[int],
+        shots: int,
+        fitter: object,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """Store a calibration, replacing a previous one of the same qubits.
+
+        Args:
+            backend_name: The name of the calibrated backend.
+            qubits: The calibrated qubits.
+            shots: The number of shots of the calibration circuits.
+            fitter: The measurement error mitigation fitter.
+            timestamp: The time the calibration was built, defaults to now.
+        """
+        key = (backend_name, tuple(sorted(qubits)), shots)
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            filename = None
+            if self._directory is not None:
+                filename = self._write(key, timestamp, fitter)
+            self._add(key, _Entry(timestamp, fitter, filename))
+
+    def get(
+        self, backend_name: str, qubits: List[int], shots: int
+    ) -> Optional[Tuple[object, float]]:
+        """Look up the calibration of exactly the given qubits.
+
+        Args:
+            backend_name: The name of the calibrated backend.
+            qubits: The calibrated qubits.
+            shots: The number of shots of the calibration circuits.
+
+        Returns:
+            The fitter and the time it was built, or None if there is no such calibration.
+        """
+        key = (backend_name, tuple(sorted(qubits)), shots)
+        with self._lock:
+            self._sync()
+            entry = self._entries.get(key)
+            if entry is None or self._expired(key, entry, time.time()):
+                return None
+            fitter = self._load(key, entry)
+            return None if fitter is None else (fitter, entry.timestamp)
+
+    def find(
+        self, backend_name: str, qubits: List[int], shots: int
+    ) -> Optional[Tuple[object, float, List[int]]]:
+        """Look up a calibration of the given qubits or of a superset of them.
+
+        A calibration of exactly the given qubits is preferred, otherwise the most recent of the
+        calibrations of supersets is returned, the smallest of them on ties.
+
+        Args:
+            backend_name: The name of the calibrated backend.
+            qubits: The qubits to calibrate.
+            shots: The number of shots of the calibration circuits.
+
+        Returns:
+            The fitter, the time it was built and the sorted qubits it calibrates, or None if no
+            calibration contains all of the qubits.
+        """
+        qubit_set = tuple(sorted(qubits))
+        with self._lock:
+            self._sync()
+            now = time.time()
+            index = self._index.get((backend_name, shots), {})
+            candidates = None
+            for qubit in qubit_set:
+                stored = index.get(qubit, set())
+                candidates = set(stored) if candidates is None else candidates & stored
+                if not candidates:
+                    return None
+            if candidates is None:
+                return None
+
+            best = None
+            for stored_qubits in candidates:
+                key = (backend_name, stored_qubits, shots)
+                entry = self._entries[key]
+                if self._expired(key, entry, now):
+                    continue
+                rank = (stored_qubits == qubit_set, entry.timestamp, -len(stored_qubits))
+                if best is None or rank > best[0]:
+                    best = (rank, key, entry)
+            if best is None:
+                return None
+            _, key, entry = best
+            fitter = self._load(key, entry)
+            return None if fitter is None else (fitter, entry.timestamp, list(key[1]))
+
+    def items(
+        self, backend_name: Optional[str] = None
+    ) -> Iterator[Tuple[Tuple[str, Tuple[int, ...], int], Tuple[object, float]]]:
+        """Iterate over the stored calibrations.
+
+        Args:
+            backend_name: Only iterate over the calibrations of this backend, if given.
+
+        Yields:
+            The (backend name, qubits, shots) key and the (fitter, timestamp) of each calibration.
+        """
+        with self._lock:
+            self._sync()
+            now = time.time()
+            calibrations = [
+                (key, (self._load(key, entry), entry.timestamp))
+                for key, entry in list(self._entries.items())
+                if (backend_name is None or key[0] == backend_name)
+                and not self._expired(key, entry, now)
+            ]
+        yield from calibrations
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._sync()
+            return len(self._entries)
+
+    def evict_expired(self) -> int:
+        """Remove all calibrations older than the time to live.
+
+        Returns:
+            The number of removed calibrations.
+        """
+        with self._lock:
+            self._sync()
+            now = time.time()
+            expired = [
+                key for key, entry in list(self._entries.items()) if self._expired(key, entry, now)
+            ]
+            return len(expired)
+
+    def clear(self) -> None:
+        """Remove all calibrations, from the directory as well."""
+        with self._lock:
+            self._sync()
+            for key in list(self._entries):
+                self._remove(key, delete_file=True)
+
+    def _expired(self, key, entry, now):
+        """Check if an entry is expired and evict it if so."""
+        if self._ttl is None or now - entry.timestamp <= self._ttl:
+            return False
+        logger.debug("Evicting the expired calibration of %s.", key)
+        self._remove(key, delete_file=True)
+        return True
+
+    def _add(self, key, entry):
+        self._entries[key] = entry
+        backend_name, qubits, shots = key
+        index = self._index.setdefault((backend_name, shots), {})
+        for qubit in qubits:
+            index.setdefault(qubit, set()).add(qubits)
+
+    def _remove(self, key, delete_file=False):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        backend_name, qubits, shots = key
+        index = self._index.get((backend_name, shots), {})
+        for qubit in qubits:
+            index.get(qubit, set()).discard(qubits)
+        if entry.filename is not None:
+            self._files.pop(entry.filename, None)
+            if delete_file:
+                try:
+                    os.remove(os.path.join(self._directory, entry.filename))
+                except FileNotFoundError:
+                    pass
+
+    @staticmethod
+    def _filename(key):
+        backend_name, qubits, shots = key
+        name = "{}:{}:{}".format(backend_name, ",".join(map(str, qubits)), shots)
+        return hashlib.sha1(name.encode()).hexdigest() + _SUFFIX
+
+    def _write(self, key, timestamp, fitter):
+        """Atomically write a calibration to the directory and return the file name."""
+        filename = self._filename(key)
+        handle, tmp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as file:
+                # the header is a separate pickle, so the index is built without loading fitters
+                pickle.dump((key, timestamp), file)
+                pickle.dump(fitter, file)
+            os.replace(tmp_path, os.path.join(self._directory, filename))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._files[filename] = (self._mtime(filename), key)
+        return filename
+
+    def _mtime(self, filename):
+        return os.stat(os.path.join(self._directory, filename)).st_mtime_ns
+
+    def _sync(self):
+        """Update the index with the calibrations written to the directory by others."""
+        if self._directory is None:
+            return
+        present = set()
+        for dir_entry in os.scandir(self._directory):
+            filename = dir_entry.name
+            if not filename.endswith(_SUFFIX):
+                continue
+            present.add(filename)
+            try:
+                mtime = dir_entry.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+            known = self._files.get(filename)
+            if known is not None and known[0] == mtime:
+                continue
+            try:
+                with open(dir_entry.path, "rb") as file:
+                    key, timestamp = pickle.load(file)
+            except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+                continue
+            self._files[filename] = (mtime, key)
+            self._add(key, _Entry(timestamp, filename=filename))
+
+        for filename in set(self._files) - present:
+            _, key = self._files.pop(filename)
+            entry = self._entries.get(key)
+            if entry is not None and entry.filename == filename:
+                self._remove(key)
+
+    def _load(self, key, entry):
+        """Return the fitter of an entry, reading it from the directory if necessary."""
+        if entry.fitter is None and entry.filename is not None:
+            try:
+                with open(os.path.join(self._directory, entry.filename), "rb") as file:
+                    pickle.load(file)
+                    entry.fitter = pickle.load(file)
+            except FileNotFoundError:
+                # evicted by another process in the meantime
+                self._remove(key)
+                return None
+            logger.debug("Loaded the calibration of %s from the directory.", key)
+        return entry.fitter
@@ -14,7 +14,13 @@
 
 import copy
 
+import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
+
 from qiskit import compiler
+from qiskit.circuit import QuantumCircuit
+from qiskit.result import Result
 from ..exceptions import QiskitError, MissingOptionalLibraryError
 
 # pylint: disable=invalid-name
@@ -99,13 +105,39 @@ def get_measured_qubits_from_qobj(qobj):
     return sorted(qubit_index), qubit_mappings
 
 
+def _build_calibration_circuits(qubit_list, fitter_cls, circlabel, name):
+    """Build the untranspiled calibration circuits of ``fitter_cls`` and their state labels."""
+    if isinstance(fitter_cls, type) and issubclass(fitter_cls, LocalMeasFitter):
+        return fitter_cls.calibration_circuits(len(qubit_list), circlabel=circlabel)
+
+    try:
+        from qiskit.ignis.mitigation.measurement import (
+            complete_meas_cal,
+            CompleteMeasFitter,
+            TensoredMeasFitter,
+        )
+    except ImportError as ex:
+        raise MissingOptionalLibraryError(
+            libname="qiskit-ignis",
+            name=name,
+            pip_install="pip install qiskit-ignis",
+        ) from ex
+
+    if fitter_cls == CompleteMeasFitter:
+        return complete_meas_cal(qubit_list=range(len(qubit_list)), circlabel=circlabel)
+    if fitter_cls == TensoredMeasFitter:
+        # TODO support different calibration
+        raise QiskitError("Does not support TensoredMeasFitter yet.")
+    raise QiskitError("Unknown fitter {}".format(fitter_cls))
+
+
 def build_measurement_error_mitigation_circuits(
     qubit_list, fitter_cls, backend, backend_config=None, compile_config=None
 ):
     """Build measurement error mitigation circuits
     Args:
         qubit_list (list[int]): list of ordered qubits used in the algorithm
-        fitter_cls (callable): CompleteMeasFitter or TensoredMeasFitter
+        fitter_cls (callable): CompleteMeasFitter, TensoredMeasFitter or LocalMeasFitter
         backend (BaseBackend): backend instance
         backend_config (dict, optional): configuration for backend
         compile_config (dict, optional): configuration for compilation
@@ -117,33 +149,14 @@ def build_measurement_error_mitigation_circuits(
         QiskitError: when the fitter_cls is not recognizable.
         MissingOptionalLibraryError: Qiskit-Ignis not installed
     """
-    try:
-        from qiskit.ignis.mitigation.measurement import (
-            complete_meas_cal,
-            CompleteMeasFitter,
-            TensoredMeasFitter,
-        )
-    except ImportError as ex:
-        raise MissingOptionalLibraryError(
-            libname="qiskit-ignis",
-            name="build_measurement_error_mitigation_qobj",
-            pip_install="pip install qiskit-ignis",
-        ) from ex
-
     circlabel = "mcal"
 
     if not qubit_list:
         raise QiskitError("The measured qubit list can not be [].")
 
-    if fitter_cls == CompleteMeasFitter:
-        meas_calibs_circuits, state_labels = complete_meas_cal(
-            qubit_list=range(len(qubit_list)), circlabel=circlabel
-        )
-    elif fitter_cls == TensoredMeasFitter:
-        # TODO support different calibration
-        raise QiskitError("Does not support TensoredMeasFitter yet.")
-    else:
-        raise QiskitError("Unknown fitter {}".format(fitter_cls))
+    meas_calibs_circuits, state_labels = _build_calibration_circuits(
+        qubit_list, fitter_cls, circlabel, "build_measurement_error_mitigation_circuits"
+    )
 
     # the provided `qubit_list` would be used as the initial layout to
     # assure the consistent qubit mapping used in the main circuits.
@@ -162,7 +175,7 @@ def build_measurement_error_mitigation_qobj(
     """
     Args:
         qubit_list (list[int]): list of ordered qubits used in the algorithm
-        fitter_cls (callable): CompleteMeasFitter or TensoredMeasFitter
+        fitter_cls (callable): CompleteMeasFitter, TensoredMeasFitter or LocalMeasFitter
         backend (BaseBackend): backend instance
         backend_config (dict, optional): configuration for backend
         compile_config (dict, optional): configuration for compilation
@@ -177,33 +190,14 @@ def build_measurement_error_mitigation_qobj(
         QiskitError: when the fitter_cls is not recognizable.
         MissingOptionalLibraryError: Qiskit-Ignis not installed
     """
-    try:
-        from qiskit.ignis.mitigation.measurement import (
-            complete_meas_cal,
-            CompleteMeasFitter,
-            TensoredMeasFitter,
-        )
-    except ImportError as ex:
-        raise MissingOptionalLibraryError(
-            libname="qiskit-ignis",
-            name="build_measurement_error_mitigation_qobj",
-            pip_install="pip install qiskit-ignis",
-        ) from ex
-
     circlabel = "mcal"
 
     if not qubit_list:
         raise QiskitError("The measured qubit list can not be [].")
 
-    if fitter_cls == CompleteMeasFitter:
-        meas_calibs_circuits, state_labels = complete_meas_cal(
-            qubit_list=range(len(qubit_list)), circlabel=circlabel
-        )
-    elif fitter_cls == TensoredMeasFitter:
-        # TODO support different calibration
-        raise QiskitError("Does not support TensoredMeasFitter yet.")
-    else:
-        raise QiskitError("Unknown fitter {}".format(fitter_cls))
+    meas_calibs_circuits, state_labels = _build_calibration_circuits(
+        qubit_list, fitter_cls, circlabel, "build_measurement_error_mitigation_qobj"
+    )
 
     # the provided `qubit_list` would be used as the initial layout to
     # assure the consistent qubit mapping used in the main circuits.
@@ -217,3 +211,289 @@ def build_measurement_error_mitigation_qobj(
     if hasattr(cals_qobj.config, "parameterizations"):
         del cals_qobj.config.parameterizations
     return cals_qobj, state_labels, circlabel
+
+
+class LocalMeasFitter:
+    """Measurement error mitigation fitter for readout errors local to clusters of qubits.
+
+    The readout errors of the measured qubits are assumed to be independent between clusters of
+    ``cluster_size`` consecutive measured qubits, so the calibration matrix is the tensor product
+    of one :math:`2^s \\times 2^s` matrix per cluster of :math:`s` qubits. All clusters are
+    calibrated at once by :math:`2^s` circuits, 2 for the default of single qubit clusters,
+    instead of the :math:`2^n` circuits of a complete calibration of :math:`n` qubits, which
+    makes the fitter usable for many measured qubits. To calibrate larger clusters, subclass it::
+
+        class PairMeasFitter(LocalMeasFitter):
+            cluster_size = 2
+
+    The fitter is used like the ``CompleteMeasFitter`` of Qiskit Ignis, e.g. as the
+    ``measurement_error_mitigation_cls`` of a :class:`~qiskit.utils.QuantumInstance`, and
+    does not need Qiskit Ignis to be installed.
+    """
+
+    cluster_size = 1
+
+    def __init__(self, results, state_labels, qubit_list, circlabel="mcal"):
+        """
+        Args:
+            results (Result): the results of the calibration circuits
+            state_labels (list[str]): the labels of the prepared basis states
+            qubit_list (list[int]): the measured qubits, the i-th of which is measured into the
+                i-th classical bit
+            circlabel (str): the label of the calibration circuits
+        """
+        self._qubit_list = list(qubit_list)
+        positions = _clusters(len(self._qubit_list), self.cluster_size)
+        self._clusters = [[self._qubit_list[pos] for pos in cluster] for cluster in positions]
+        self._cal_matrices = [np.zeros((2 ** len(cluster),) * 2) for cluster in positions]
+
+        for label in state_labels:
+            prepared = _bit_array([label], len(self._qubit_list))
+            counts = results.get_counts("{}cal_{}".format(circlabel, label))
+            measured = _bit_array(counts.keys(), len(self._qubit_list))
+            values = np.fromiter(counts.values(), dtype=float, count=len(counts))
+            for cluster, matrix in zip(positions, self._cal_matrices):
+                column = _cluster_states(prepared, cluster)[0]
+                np.add.at(matrix[:, column], _cluster_states(measured, cluster), values)
+
+        for matrix in self._cal_matrices:
+            matrix /= matrix.sum(axis=0)
+
+    @classmethod
+    def calibration_circuits(cls, num_qubits, circlabel="mcal"):
+        """Build the calibration circuits preparing the basis states of all clusters at once.
+
+        Args:
+            num_qubits (int): the number of measured qubits
+            circlabel (str): the label of the calibration circuits
+
+        Returns:
+            list[QuantumCircuit]: the calibration circuits
+            list[str]: the labels of the prepared basis states
+        """
+        clusters = _clusters(num_qubits, cls.cluster_size)
+        circuits, state_labels = [], []
+        for state in range(2 ** max(len(cluster) for cluster in clusters)):
+            bits = [0] * num_qubits
+            for cluster in clusters:
+                for k, pos in enumerate(cluster):
+                    bits[pos] = (state >> k) & 1
+            label = "".join(str(bit) for bit in reversed(bits))
+            circuit = QuantumCircuit(
+                num_qubits, num_qubits, name="{}cal_{}".format(circlabel, label)
+            )
+            for pos, bit in enumerate(bits):
+                if bit:
+                    circuit.x(pos)
+            circuit.barrier()
+            circuit.measure(range(num_qubits), range(num_qubits))
+            circuits.append(circuit)
+            state_labels.append(label)
+        return circuits, state_labels
+
+    @property
+    def qubit_list(self):
+        """Return the measured qubits."""
+        return self._qubit_list
+
+    @property
+    def clusters(self):
+        """Return the clusters of qubits, each ordered from the least significant bit."""
+        return self._clusters
+
+    @property
+    def cal_matrix(self):
+        """Return the calibration matrices of the clusters, whose tensor product is the
+        calibration matrix of all qubits."""
+        return self._cal_matrices
+
+    @property
+    def filter(self):
+        """Return a measurement filter applying the inverse of the calibration matrix."""
+        positions = [
+            [self._qubit_list.index(qubit) for qubit in cluster] for cluster in self._clusters
+        ]
+        return LocalMeasFilter(self._cal_matrices, positions, len(self._qubit_list))
+
+    def subset_fitter(self, qubit_sublist):
+        """Return the fitter of a subset of the qubits.
+
+        The calibration matrix of a cluster only partially contained in the subset is
+        marginalized over the other qubits of the cluster, averaging over their prepared states.
+
+        Args:
+            qubit_sublist (list[int]): the measured qubits of the new fitter, the i-th of which is
+                measured into the i-th classical bit
+
+        Returns:
+            LocalMeasFitter: the fitter of the subset
+
+        Raises:
+            QiskitError: if the qubits are not a subset of the calibrated ones
+        """
+        if not set(qubit_sublist).issubset(self._qubit_list):
+            raise QiskitError(
+                "The qubits {} are not a subset of the calibrated qubits {}.".format(
+                    qubit_sublist, self._qubit_list
+                )
+            )
+        fitter = copy.copy(self)
+        fitter._qubit_list = list(qubit_sublist)
+        fitter._clusters, fitter._cal_matrices = [], []
+        for cluster, matrix in zip(self._clusters, self._cal_matrices):
+            keep = [k for k, qubit in enumerate(cluster) if qubit in qubit_sublist]
+            if keep:
+                fitter._clusters.append([cluster[k] for k in keep])
+                fitter._cal_matrices.append(_marginal_cal_matrix(matrix, len(cluster), keep))
+        return fitter
+
+
+class LocalMeasFilter:
+    """Measurement error mitigation filter applying the inverse of a tensor product of the
+    calibration matrices of clusters of qubits.
+
+    The inverse is applied in the subspace of the measured bitstrings only, so the cost grows
+    with the number of distinct measured bitstrings rather than with the dimension of the
+    measured qubits.
+    """
+
+    def __init__(self, cal_matrices, clusters, num_qubits):
+        """
+        Args:
+            cal_matrices (list[np.ndarray]): the calibration matrix of each cluster
+            clusters (list[list[int]]): the classical bits of each cluster, ordered from the least
+                significant bit of its calibration matrix
+            num_qubits (int): the number of measured qubits
+        """
+        self._cal_matrices = cal_matrices
+        self._clusters = clusters
+        self._num_qubits = num_qubits
+
+    def apply(self, raw_data, method="least_squares"):
+        """Apply the filter to counts.
+
+        Args:
+            raw_data (Union[dict, Result]): the counts to mitigate, or a result whose counts of
+                every experiment are mitigated
+            method (str): ``"pseudo_inverse"`` to return the mitigated quasi-probabilities scaled
+                by the number of shots, which may be negative, or ``"least_squares"`` to return
+                the closest counts with non-negative values
+
+        Returns:
+            Union[dict, Result]: the mitigated counts or result
+
+        Raises:
+            QiskitError: if the method is unknown
+        """
+        if method not in ("least_squares", "pseudo_inverse"):
+            raise QiskitError("Unrecognized method {}.".format(method))
+
+        if isinstance(raw_data, Result):
+            new_result = copy.deepcopy(raw_data)
+            for idx in range(len(raw_data.results)):
+                counts = self.apply(raw_data.get_counts(idx), method)
+                new_result.results[idx].data.counts = {
+                    hex(int(key, 2)): value for key, value in counts.items()
+                }
+            return new_result
+
+        keys = [key.replace(" ", "") for key in raw_data]
+        values = np.fromiter(raw_data.values(), dtype=float, count=len(raw_data))
+        shots = values.sum()
+        matrix = self._reduced_cal_matrix(_bit_array(keys, self._num_qubits))
+        quasi = np.atleast_1d(scipy.sparse.linalg.spsolve(matrix, values / shots))
+        if method == "least_squares":
+            quasi = _nearest_probabilities(quasi)
+        return {key: value * shots for key, value in zip(keys, quasi) if value != 0}
+
+    def _reduced_cal_matrix(self, bits, block_size=512, atol=1e-12):
+        """The calibration matrix restricted to the measured bitstrings.
+
+        The entries are products of one entry of each cluster matrix, computed as the exponential
+        of sums of logarithms in blocks of rows via matrix products with the one-hot encodings
+        of the states of the clusters. The columns are renormalized within the subspace.
+        """
+        offsets = np.cumsum([0] + [len(matrix) for matrix in self._cal_matrices])
+        one_hot = np.zeros((len(bits), offsets[-1]))
+        log_matrix = np.zeros((offsets[-1], offsets[-1]))
+        for offset, cluster, matrix in zip(offsets, self._clusters, self._cal_matrices):
+            one_hot[np.arange(len(bits)), offset + _cluster_states(bits, cluster)] = 1
+            block = slice(offset, offset + len(matrix))
+            log_matrix[block, block] = np.log(np.maximum(matrix, np.finfo(float).tiny))
+
+        rows, cols, data = [], [], []
+        right = log_matrix @ one_hot.T
+        for start in range(0, len(bits), block_size):
+            block = np.exp(one_hot[start : start + block_size] @ right)
+            row, col = np.nonzero(block > atol)
+            rows.append(row + start)
+            cols.append(col)
+            data.append(block[row, col])
+        matrix = scipy.sparse.csc_matrix(
+            (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(len(bits), len(bits)),
+        )
+        return matrix @ scipy.sparse.diags(1 / np.asarray(matrix.sum(axis=0)).ravel())
+
+
+def _clusters(num_qubits, cluster_size):
+    """Split the positions of the measured qubits into clusters of consecutive positions."""
+    return [
+        list(range(start, min(start + cluster_size, num_qubits)))
+        for start in range(0, num_qubits, cluster_size)
+    ]
+
+
+def _bit_array(bitstrings, num_bits):
+    """Return the bits of the bitstrings, the i-th column holding the i-th least significant bit.
+
+    Raises:
+        QiskitError: if a bitstring does not have ``num_bits`` bits
+    """
+    bits = []
+    for bitstring in bitstrings:
+        bitstring = bitstring.replace(" ", "")
+        if len(bitstring) != num_bits:
+            raise QiskitError(
+                "The bitstring {} does not have {} bits, one per measured qubit.".format(
+                    bitstring, num_bits
+                )
+            )
+        bits.append([bit == "1" for bit in reversed(bitstring)])
+    return np.array(bits, dtype=int).reshape(-1, num_bits)
+
+
+def _cluster_states(bits, cluster):
+    """Return the basis state indices of a cluster of bit positions."""
+    return bits[:, cluster] @ (1 << np.arange(len(cluster)))
+
+
+def _marginal_cal_matrix(matrix, size, keep):
+    """Marginalize the calibration matrix of a cluster of ``size`` bits to the bits ``keep``,
+    summing over the measured and averaging over the prepared states of the other bits."""
+    # the axes of the reshaped matrix are ordered from the most significant bit
+    tensor = matrix.reshape((2,) * (2 * size))
+    drop = [k for k in range(size) if k not in keep]
+    tensor = tensor.sum(axis=tuple(size - 1 - k for k in drop))
+    tensor = tensor.mean(axis=tuple(2 * size - len(drop) - 1 - k for k in drop))
+    # reorder the kept bits as listed in keep, which the remaining axes hold in decreasing order
+    order = sorted(keep, reverse=True)
+    axes = [order.index(k) for k in reversed(keep)]
+    tensor = tensor.transpose(axes + [len(keep) + axis for axis in axes])
+    return tensor.reshape((2 ** len(keep),) * 2)
+
+
+def _nearest_probabilities(quasi):
+    """Return the probability distribution closest in the 2-norm to quasi-probabilities summing
+    to one, following Smolin, Gambetta and Smith, Phys. Rev. Lett. 108, 070502 (2012)."""
+    order = np.argsort(quasi)
+    probs = np.zeros_like(quasi)
+    accumulated = 0.0
+    for position, idx in enumerate(order):
+        remaining = len(quasi) - position
+        if quasi[idx] + accumulated / remaining >= 0:
+            rest = order[position:]
+            probs[rest] = quasi[rest] + accumulated / remaining
+            break
+        accumulated += quasi[idx]
+    return probs
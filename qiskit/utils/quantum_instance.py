@@ -21,6 +21,7 @@ import numpy as np
 from qiskit.qobj import Qobj
 from qiskit.utils import circuit_utils
 from qiskit.exceptions import QiskitError
+from .measurement_calibration_store import MeasurementCalibrationStore
 from .backend_utils import (
     is_ibmq_provider,
     is_aer_provider,
@@ -76,11 +77,14 @@ class QuantumInstance:
         # job
         timeout: Optional[float] = None,
         wait: float = 5.0,
+        max_concurrent_jobs: Optional[int] = None,
+        streaming: bool = False,
         # others
         skip_qobj_validation: bool = True,
         measurement_error_mitigation_cls: Optional[Callable] = None,
         cals_matrix_refresh_period: int = 30,
         measurement_error_mitigation_shots: Optional[int] = None,
+        measurement_error_mitigation_store: Optional[MeasurementCalibrationStore] = None,
         job_callback: Optional[Callable] = None,
     ) -> None:
         """
@@ -111,6 +115,14 @@ class QuantumInstance:
             noise_model (Optional['NoiseModel']): noise model for simulator
             timeout: Seconds to wait for job. If None, wait indefinitely.
             wait: Seconds between queries for job result
+            max_concurrent_jobs: The maximum number of jobs in flight at the same time when the
+                circuits are split into several jobs. If None, at most
+                ``min(32, os.cpu_count() + 4)``.
+            streaming: If True, the circuits are transpiled and assembled in chunks of the
+                maximum number of experiments per job of the backend, and each chunk is submitted
+                as soon as it is ready, so that the next chunk is transpiled while the previous
+                jobs are running. Circuits for the measurement error mitigation are submitted
+                through the same pipeline.
             skip_qobj_validation: Bypass Qobj validation to decrease circuit
                 processing time during submission to backend.
             measurement_error_mitigation_cls: The approach to mitigate
@@ -121,10 +133,15 @@ class QuantumInstance:
                 matrix in measurement mitigation. in minutes
             measurement_error_mitigation_shots: The number of shots number for
                 building calibration matrix. If None, the main `shots` parameter value is used.
+            measurement_error_mitigation_store: The store the measurement error mitigation
+                fitters are kept in. Quantum instances sharing a store, also across processes
+                if the store is persisted in a directory, reuse each other's calibrations.
+                If None, the fitters are kept in a store private to this quantum instance.
             job_callback: Optional user supplied callback which can be used
                 to monitor job progress as jobs are submitted for processing by an Aqua algorithm.
                 The callback is provided the following arguments: `job_id, job_status,
-                queue_position, job`
+                queue_position, job`. It is always called in the thread executing the
+                circuits, also when several jobs are waited on concurrently.
 
         Raises:
             QiskitError: the shots exceeds the maximum number of shots
@@ -211,7 +228,9 @@ class QuantumInstance:
                 )
         else:
             self._meas_error_mitigation_cls = measurement_error_mitigation_cls
-        self._meas_error_mitigation_fitters: Dict[str, Tuple[np.ndarray, float]] = {}
+        if measurement_error_mitigation_store is None:
+            measurement_error_mitigation_store = MeasurementCalibrationStore()
+        self._meas_error_mitigation_store = measurement_error_mitigation_store
         # TODO: support different fitting method in error mitigation?
         self._meas_error_mitigation_method = "least_squares"
         self._cals_matrix_refresh_period = cals_matrix_refresh_period
@@ -241,6 +260,8 @@ class QuantumInstance:
         self._skip_qobj_validation = skip_qobj_validation
         self._circuit_summary = False
         self._job_callback = job_callback
+        self._max_concurrent_jobs = max_concurrent_jobs
+        self._streaming = streaming
         self._time_taken = 0.0
         logger.info(self)
 
@@ -328,10 +349,6 @@ class QuantumInstance:
             build_measurement_error_mitigation_qobj,
         )
 
-        # maybe compile
-        if not had_transpiled:
-            circuits = self.transpile(circuits)
-
         # fix for providers that don't support QasmQobj until a bigger refactor happens
         from qiskit.providers import BackendV1
 
@@ -342,6 +359,16 @@ class QuantumInstance:
             and not is_ibmq_provider(self._backend)
         )
 
+        if self._streaming:
+            result = self._execute_streaming(circuits, had_transpiled, circuit_job)
+            if self._circuit_summary:
+                self._circuit_summary = False
+            return result
+
+        # maybe compile
+        if not had_transpiled:
+            circuits = self.transpile(circuits)
+
         # assemble
         if not circuit_job:
             qobj = self.assemble(circuits)
@@ -352,40 +379,10 @@ class QuantumInstance:
                 if circuit_job
                 else get_measured_qubits_from_qobj(qobj)
             )
-            qubit_index_str = "_".join([str(x) for x in qubit_index]) + "_{}".format(
-                self._meas_error_mitigation_shots or self._run_config.shots
-            )
-            meas_error_mitigation_fitter, timestamp = self._meas_error_mitigation_fitters.get(
-                qubit_index_str, (None, 0.0)
+            meas_error_mitigation_fitter, timestamp = self._find_meas_error_mitigation_fitter(
+                qubit_index
             )
 
-            if meas_error_mitigation_fitter is None:
-                # check the asked qubit_index are the subset of build matrices
-                for key, _ in self._meas_error_mitigation_fitters.items():
-                    stored_qubit_index = [int(x) for x in key.split("_")[:-1]]
-                    stored_shots = int(key.split("_")[-1])
-                    if len(qubit_index) < len(stored_qubit_index):
-                        tmp = list(set(qubit_index + stored_qubit_index))
-                        if (
-                            sorted(tmp) == sorted(stored_qubit_index)
-                            and self._run_config.shots == stored_shots
-                        ):
-                            # the qubit used in current job is the subset and shots are the same
-                            (
-                                meas_error_mitigation_fitter,
-                                timestamp,
-                            ) = self._meas_error_mitigation_fitters.get(key, (None, 0.0))
-                            meas_error_mitigation_fitter = (
-                                meas_error_mitigation_fitter.subset_fitter(
-                                    qubit_sublist=qubit_index
-                                )
-                            )
-                            logger.info(
-                                "The qubits used in the current job is the subset of "
-                                "previous jobs, "
-                                "reusing the calibration matrix if it is not out-of-date."
-                            )
-
             build_cals_matrix = (
                 self.maybe_refresh_cals_matrix(timestamp) or meas_error_mitigation_fitter is None
             )
@@ -420,6 +417,7 @@ class QuantumInstance:
                             noise_config=self._noise_config,
                             run_config=self._run_config.to_dict(),
                             job_callback=self._job_callback,
+                            max_concurrent_jobs=self._max_concurrent_jobs,
                         )
                         self._time_taken += cals_result.time_taken
                         result = run_circuits(
@@ -430,18 +428,19 @@ class QuantumInstance:
                             noise_config=self._noise_config,
                             run_config=self.run_config.to_dict(),
                             job_callback=self._job_callback,
+                            max_concurrent_jobs=self._max_concurrent_jobs,
                         )
                         self._time_taken += result.time_taken
                     else:
-                        circuits[0:0] = cal_circuits
                         result = run_circuits(
-                            circuits,
+                            cal_circuits + circuits,
                             self._backend,
                             qjob_config=self.qjob_config,
                             backend_options=self.backend_options,
                             noise_config=self._noise_config,
                             run_config=self.run_config.to_dict(),
                             job_callback=self._job_callback,
+                            max_concurrent_jobs=self._max_concurrent_jobs,
                         )
                         self._time_taken += result.time_taken
                         cals_result = result
@@ -477,6 +476,7 @@ class QuantumInstance:
                             self._noise_config,
                             self._skip_qobj_validation,
                             self._job_callback,
+                            max_concurrent_jobs=self._max_concurrent_jobs,
                         )
                         self._time_taken += cals_result.time_taken
                         result = run_qobj(
@@ -487,6 +487,7 @@ class QuantumInstance:
                             self._noise_config,
                             self._skip_qobj_validation,
                             self._job_callback,
+                            max_concurrent_jobs=self._max_concurrent_jobs,
                         )
                         self._time_taken += result.time_taken
                     else:
@@ -500,6 +501,7 @@ class QuantumInstance:
                             self._noise_config,
                             self._skip_qobj_validation,
                             self._job_callback,
+                            max_concurrent_jobs=self._max_concurrent_jobs,
                         )
                         self._time_taken += result.time_taken
                         cals_result = result
@@ -508,10 +510,7 @@ class QuantumInstance:
                 meas_error_mitigation_fitter = self._meas_error_mitigation_cls(
                     cals_result, state_labels, qubit_list=qubit_index, circlabel=circuit_labels
                 )
-                self._meas_error_mitigation_fitters[qubit_index_str] = (
-                    meas_error_mitigation_fitter,
-                    time.time(),
-                )
+                self._store_meas_error_mitigation_fitter(qubit_index, meas_error_mitigation_fitter)
             else:
                 result = (
                     run_circuits(
@@ -522,6 +521,7 @@ class QuantumInstance:
                         noise_config=self._noise_config,
                         run_config=self._run_config.to_dict(),
                         job_callback=self._job_callback,
+                        max_concurrent_jobs=self._max_concurrent_jobs,
                     )
                     if circuit_job
                     else run_qobj(
@@ -532,29 +532,19 @@ class QuantumInstance:
                         self._noise_config,
                         self._skip_qobj_validation,
                         self._job_callback,
+                        max_concurrent_jobs=self._max_concurrent_jobs,
                     )
                 )
                 self._time_taken += result.time_taken
 
             if meas_error_mitigation_fitter is not None:
-                logger.info("Performing measurement error mitigation.")
-                skip_num_circuits = len(result.results) - len(circuits)
-                #  remove the calibration counts from result object to assure the length of
-                #  ExperimentalResult is equal length to input circuits
-                result.results = result.results[skip_num_circuits:]
-                tmp_result = copy.deepcopy(result)
-                for qubit_index_str, c_idx in qubit_mappings.items():
-                    curr_qubit_index = [int(x) for x in qubit_index_str.split("_")]
-                    tmp_result.results = [result.results[i] for i in c_idx]
-                    if curr_qubit_index == qubit_index:
-                        tmp_fitter = meas_error_mitigation_fitter
-                    else:
-                        tmp_fitter = meas_error_mitigation_fitter.subset_fitter(curr_qubit_index)
-                    tmp_result = tmp_fitter.filter.apply(
-                        tmp_result, self._meas_error_mitigation_method
-                    )
-                    for i, n in enumerate(c_idx):
-                        result.results[n] = tmp_result.results[i]
+                result = self._apply_meas_error_mitigation(
+                    result,
+                    meas_error_mitigation_fitter,
+                    qubit_index,
+                    qubit_mappings,
+                    len(circuits),
+                )
 
         else:
             result = (
@@ -566,6 +556,7 @@ class QuantumInstance:
                     noise_config=self._noise_config,
                     run_config=self._run_config.to_dict(),
                     job_callback=self._job_callback,
+                    max_concurrent_jobs=self._max_concurrent_jobs,
                 )
                 if circuit_job
                 else run_qobj(
@@ -576,6 +567,7 @@ class QuantumInstance:
                     self._noise_config,
                     self._skip_qobj_validation,
                     self._job_callback,
+                    max_concurrent_jobs=self._max_concurrent_jobs,
                 )
             )
             self._time_taken += result.time_taken
@@ -585,6 +577,237 @@ class QuantumInstance:
 
         return result
 
+    def _find_meas_error_mitigation_fitter(
+        self, qubit_index: List[int]
+    ) -> Tuple[Optional[object], float]:
+        """Look up a stored measurement error mitigation fitter for the measured qubits.
+
+        Args:
+            qubit_index: The measured qubits.
+
+        Returns:
+            The fitter, or None if there is none for the qubits, and the time it was built.
+        """
+        found = self._meas_error_mitigation_store.find(
+            self.backend_name,
+            qubit_index,
+            self._meas_error_mitigation_shots or self._run_config.shots,
+        )
+        if found is None:
+            return None, 0.0
+
+        meas_error_mitigation_fitter, timestamp, stored_qubit_index = found
+        if stored_qubit_index != sorted(qubit_index):
+            # the qubit used in current job is the subset and shots are the same
+            meas_error_mitigation_fitter = meas_error_mitigation_fitter.subset_fitter(
+                qubit_sublist=qubit_index
+            )
+            logger.info(
+                "The qubits used in the current job is the subset of "
+                "previous jobs, "
+                "reusing the calibration matrix if it is not out-of-date."
+            )
+
+        return meas_error_mitigation_fitter, timestamp
+
+    def _store_meas_error_mitigation_fitter(self, qubit_index: List[int], fitter) -> None:
+        """Store a newly built measurement error mitigation fitter for the measured qubits."""
+        self._meas_error_mitigation_store.put(
+            self.backend_name,
+            qubit_index,
+            self._meas_error_mitigation_shots or self._run_config.shots,
+            fitter,
+        )
+
+    def _apply_meas_error_mitigation(
+        self,
+        result,
+        meas_error_mitigation_fitter,
+        qubit_index: List[int],
+        qubit_mappings: Dict[str, List[int]],
+        num_circuits: int,
+    ):
+        """Apply measurement error mitigation to ``result``.
+
+        Args:
+            result (Result): The result of the circuits, possibly preceded by the results of the
+                calibration circuits.
+            meas_error_mitigation_fitter: The fitter for the qubits ``qubit_index``.
+            qubit_index: The measured qubits.
+            qubit_mappings: The indices of the circuits measuring each set of qubits.
+            num_circuits: The number of circuits.
+
+        Returns:
+            Result: The mitigated result of the circuits.
+        """
+        logger.info("Performing measurement error mitigation.")
+        skip_num_circuits = len(result.results) - num_circuits
+        #  remove the calibration counts from result object to assure the length of
+        #  ExperimentalResult is equal length to input circuits
+        result.results = result.results[skip_num_circuits:]
+        tmp_result = copy.deepcopy(result)
+        for qubits_str, c_idx in qubit_mappings.items():
+            curr_qubit_index = [int(x) for x in qubits_str.split("_")]
+            tmp_result.results = [result.results[i] for i in c_idx]
+            if curr_qubit_index == qubit_index:
+                tmp_fitter = meas_error_mitigation_fitter
+            else:
+                tmp_fitter = meas_error_mitigation_fitter.subset_fitter(curr_qubit_index)
+            tmp_result = tmp_fitter.filter.apply(tmp_result, self._meas_error_mitigation_method)
+            for i, n in enumerate(c_idx):
+                result.results[n] = tmp_result.results[i]
+
+        return result
+
+    def _execute_streaming(self, circuits, had_transpiled: bool, circuit_job: bool):
+        """Execute the circuits by streaming them through transpilation, assembly and submission.
+
+        The circuits are transpiled in chunks of at most the number of experiments the backend
+        accepts in a job and each chunk is submitted as soon as it is ready, so that the next
+        chunk is transpiled while the jobs of the previous ones are running. If the measurement
+        error mitigation needs to be calibrated, the calibration circuits are submitted through
+        the same pipeline after the circuits.
+
+        Returns:
+            Result: result object
+        """
+        # pylint: disable=cyclic-import
+        from qiskit.utils.run_circuits import (
+            _max_circuits_per_job,
+            _run_circuit_chunks,
+            _run_qobjs,
+            _split_qobj_to_qobjs,
+        )
+        from qiskit.utils.measurement_error_mitigation import (
+            get_measured_qubits,
+            build_measurement_error_mitigation_circuits,
+            build_measurement_error_mitigation_qobj,
+        )
+
+        if not isinstance(circuits, list):
+            circuits = [circuits]
+        chunk_size = _max_circuits_per_job(self._backend)
+        transpiled_circuits = []
+        calibration = {}
+
+        def chunks():
+            for start in range(0, len(circuits), chunk_size):
+                chunk = circuits[start : start + chunk_size]
+                if not had_transpiled:
+                    chunk = self.transpile(chunk)
+                transpiled_circuits.extend(chunk)
+                if circuit_job:
+                    yield chunk
+                else:
+                    yield from _split_qobj_to_qobjs(self.assemble(chunk), chunk_size)
+
+            if self._meas_error_mitigation_cls is None:
+                return
+
+            # the measured qubits are only known once all circuits are transpiled
+            qubit_index, qubit_mappings = get_measured_qubits(transpiled_circuits)
+            fitter, timestamp = self._find_meas_error_mitigation_fitter(qubit_index)
+            calibration.update(
+                qubit_index=qubit_index,
+                qubit_mappings=qubit_mappings,
+                fitter=fitter,
+            )
+            if not (self.maybe_refresh_cals_matrix(timestamp) or fitter is None):
+                return
+
+            logger.info("Adding the circuits for measurement error mitigation to the pipeline.")
+            if circuit_job:
+                (
+                    cal_circuits,
+                    state_labels,
+                    circuit_labels,
+                ) = build_measurement_error_mitigation_circuits(
+                    qubit_index,
+                    self._meas_error_mitigation_cls,
+                    self._backend,
+                    self._backend_config,
+                    self._compile_config,
+                )
+                num_cal_circuits = len(cal_circuits)
+                cal_chunks = [
+                    cal_circuits[start : start + chunk_size]
+                    for start in range(0, num_cal_circuits, chunk_size)
+                ]
+            else:
+                temp_run_config = copy.deepcopy(self._run_config)
+                if self._meas_error_mitigation_shots is not None:
+                    temp_run_config.shots = self._meas_error_mitigation_shots
+                (
+                    cals_qobj,
+                    state_labels,
+                    circuit_labels,
+                ) = build_measurement_error_mitigation_qobj(
+                    qubit_index,
+                    self._meas_error_mitigation_cls,
+                    self._backend,
+                    self._backend_config,
+                    self._compile_config,
+                    temp_run_config,
+                )
+                num_cal_circuits = len(cals_qobj.experiments)
+                cal_chunks = _split_qobj_to_qobjs(cals_qobj, chunk_size)
+            calibration.update(
+                state_labels=state_labels,
+                circuit_labels=circuit_labels,
+                num_cal_circuits=num_cal_circuits,
+            )
+            yield from cal_chunks
+
+        if circuit_job:
+            result = _run_circuit_chunks(
+                chunks(),
+                self._backend,
+                self._qjob_config,
+                self._backend_options,
+                self._noise_config,
+                self._run_config.to_dict(),
+                self._job_callback,
+                self._max_concurrent_jobs,
+            )
+        else:
+            result = _run_qobjs(
+                chunks(),
+                self._backend,
+                self._qjob_config,
+                self._backend_options,
+                self._noise_config,
+                self._skip_qobj_validation,
+                self._job_callback,
+                self._max_concurrent_jobs,
+            )
+        self._time_taken += result.time_taken
+
+        if self._meas_error_mitigation_cls is None:
+            return result
+
+        fitter = calibration["fitter"]
+        if "num_cal_circuits" in calibration:
+            # the calibration results are at the end of the result
+            cals_result = copy.deepcopy(result)
+            cals_result.results = result.results[-calibration["num_cal_circuits"] :]
+            result.results = result.results[: -calibration["num_cal_circuits"]]
+            logger.info("Building calibration matrix for measurement error mitigation.")
+            fitter = self._meas_error_mitigation_cls(
+                cals_result,
+                calibration["state_labels"],
+                qubit_list=calibration["qubit_index"],
+                circlabel=calibration["circuit_labels"],
+            )
+            self._store_meas_error_mitigation_fitter(calibration["qubit_index"], fitter)
+
+        return self._apply_meas_error_mitigation(
+            result,
+            fitter,
+            calibration["qubit_index"],
+            calibration["qubit_mappings"],
+            len(circuits),
+        )
+
     def set_config(self, **kwargs):
         """Set configurations for the quantum instance."""
         for k, v in kwargs.items():
@@ -704,6 +927,16 @@ class QuantumInstance:
         """sets measurement error mitigation shots"""
         self._meas_error_mitigation_shots = new_value
 
+    @property
+    def measurement_error_mitigation_store(self):  # pylint: disable=invalid-name
+        """returns the store of the measurement error mitigation fitters"""
+        return self._meas_error_mitigation_store
+
+    @measurement_error_mitigation_store.setter
+    def measurement_error_mitigation_store(self, new_value):  # pylint: disable=invalid-name
+        """sets the store of the measurement error mitigation fitters"""
+        self._meas_error_mitigation_store = new_value
+
     @property
     def backend(self):
         """Return BaseBackend backend object."""
@@ -739,6 +972,16 @@ class QuantumInstance:
         """sets skip qobj validation flag"""
         self._skip_qobj_validation = new_value
 
+    @property
+    def streaming(self) -> bool:
+        """checks if the circuits are streamed through transpilation, assembly and submission"""
+        return self._streaming
+
+    @streaming.setter
+    def streaming(self, new_value: bool) -> None:
+        """sets whether the circuits are streamed through transpilation, assembly and submission"""
+        self._streaming = new_value
+
     def maybe_refresh_cals_matrix(self, timestamp: Optional[float] = None) -> bool:
         """
         Calculate the time difference from the query of last time.
@@ -775,12 +1018,15 @@ class QuantumInstance:
         """
         shots = self._meas_error_mitigation_shots or self._run_config.shots
         if qubit_index:
-            qubit_index_str = "_".join([str(x) for x in qubit_index]) + "_{}".format(shots)
-            fitter, timestamp = self._meas_error_mitigation_fitters.get(qubit_index_str, None)
-            if fitter is not None:
+            stored = self._meas_error_mitigation_store.get(self.backend_name, qubit_index, shots)
+            if stored is not None:
+                fitter, timestamp = stored
                 return fitter.cal_matrix, timestamp
         else:
-            return {
-                k: (v.cal_matrix, t) for k, (v, t) in self._meas_error_mitigation_fitters.items()
-            }
+            matrices = {}
+            stored = self._meas_error_mitigation_store.items(self.backend_name)
+            for (_, qubits, stored_shots), (fitter, timestamp) in stored:
+                qubit_index_str = "_".join([str(x) for x in qubits]) + "_{}".format(stored_shots)
+                matrices[qubit_index_str] = (fitter.cal_matrix, timestamp)
+            return matrices
         return None
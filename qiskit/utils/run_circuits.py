@@ -12,13 +12,16 @@
 
 """ run circuits functions """
 
-from typing import Optional, Dict, Callable, List, Union, Tuple
+from typing import Any, Optional, Dict, Callable, Iterable, List, Union, Tuple
 import sys
 import logging
+import threading
 import time
 import copy
 import os
+import queue
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
@@ -38,6 +41,10 @@ from .backend_utils import (
 MAX_CIRCUITS_PER_JOB = os.environ.get("QISKIT_AQUA_MAX_CIRCUITS_PER_JOB", None)
 MAX_GATES_PER_JOB = os.environ.get("QISKIT_AQUA_MAX_GATES_PER_JOB", None)
 
+# the number of jobs in flight at the same time if no maximum is given, as the default number of
+# workers of a ThreadPoolExecutor
+_DEFAULT_MAX_CONCURRENT_JOBS = min(32, (os.cpu_count() or 1) + 4)
+
 logger = logging.getLogger(__name__)
 
 
@@ -201,7 +208,9 @@ def _safe_submit_qobj(
     return job, job_id
 
 
-def _safe_get_job_status(job: BaseJob, job_id: str) -> JobStatus:
+def _safe_get_job_status(
+    job: BaseJob, job_id: str, stop: Optional[threading.Event] = None
+) -> JobStatus:
 
     while True:
         try:
@@ -213,7 +222,7 @@ def _safe_get_job_status(job: BaseJob, job_id: str) -> JobStatus:
                 job_id,
                 ex,
             )
-            time.sleep(5)
+            _sleep(5, stop)
         except Exception as ex:
             raise QiskitError(
                 "FAILURE: job id: {}, "
@@ -223,6 +232,245 @@ def _safe_get_job_status(job: BaseJob, job_id: str) -> JobStatus:
     return job_status
 
 
+class _JobsStopped(Exception):
+    """Raised in the worker threads of :func:`_run_jobs` when waiting for the jobs was stopped."""
+
+
+def _sleep(seconds: float, stop: Optional[threading.Event]) -> None:
+    """Sleep for ``seconds``, or raise as soon as ``stop`` is set."""
+    if stop is None:
+        time.sleep(seconds)
+    elif stop.wait(seconds):
+        raise _JobsStopped()
+
+
+def _max_circuits_per_job(backend: Union[Backend, BaseBackend]) -> int:
+    if MAX_CIRCUITS_PER_JOB is not None:
+        return int(MAX_CIRCUITS_PER_JOB)
+    if is_local_backend(backend):
+        return sys.maxsize
+    return backend.configuration().max_experiments
+
+
+def _wait_for_result(
+    idx: int,
+    job: BaseJob,
+    job_id: str,
+    backend: Union[Backend, BaseBackend],
+    resubmit: Callable[[BaseJob], Tuple[BaseJob, str]],
+    qjob_config: Dict,
+    job_callback: Optional[Callable],
+    result_kwargs: Dict,
+    stop: Optional[threading.Event] = None,
+) -> Result:
+    """Poll the ``idx``-th job until it reaches a final state and return its result.
+
+    Jobs which are cancelled or fail are submitted again with ``resubmit`` until a result is
+    available, since if there is no result returned, there is no way an algorithm can do any
+    processing. The polling ends with a ``_JobsStopped`` exception once ``stop`` is set.
+    """
+    while True:
+        logger.info("Running %s-th job, job id: %s", idx, job_id)
+        # try to get result if possible
+        while True:
+            if stop is not None and stop.is_set():
+                raise _JobsStopped()
+            job_status = _safe_get_job_status(job, job_id, stop)
+            queue_position = 0
+            if job_status in JOB_FINAL_STATES:
+                # do callback again after the job is in the final states
+                if job_callback is not None:
+                    job_callback(job_id, job_status, queue_position, job)
+                break
+            if job_status == JobStatus.QUEUED and hasattr(job, "queue_position"):
+                queue_position = job.queue_position()
+                logger.info("Job id: %s is queued at position %s", job_id, queue_position)
+            else:
+                logger.info("Job id: %s, status: %s", job_id, job_status)
+            if job_callback is not None:
+                job_callback(job_id, job_status, queue_position, job)
+            _sleep(qjob_config.get("wait", 5.0), stop)
+
+        # get result after the status is DONE
+        if job_status == JobStatus.DONE:
+            while True:
+                result = job.result(**result_kwargs)
+                if result.success:
+                    logger.info("COMPLETED the %s-th job, job id: %s", idx, job_id)
+                    return result
+
+                logger.warning("FAILURE: Job id: %s", job_id)
+                logger.warning(
+                    "Job (%s) is completed anyway, retrieve result " "from backend again.",
+                    job_id,
+                )
+                if stop is not None and stop.is_set():
+                    raise _JobsStopped()
+                job = backend.retrieve_job(job_id)
+
+        # for other cases, resubmit the job until the result is available.
+        if job_status == JobStatus.CANCELLED:
+            logger.warning("FAILURE: Job id: %s is cancelled. Re-submit the job.", job_id)
+        elif job_status == JobStatus.ERROR:
+            logger.warning(
+                "FAILURE: Job id: %s encounters the error. " "Error is : %s. Re-submit the job.",
+                job_id,
+                job.error_message(),
+            )
+        else:
+            logging.warning(
+                "FAILURE: Job id: %s. Unknown status: %s. " "Re-submit the job.",
+                job_id,
+                job_status,
+            )
+
+        job, job_id = resubmit(job)
+
+
+def _run_jobs(
+    payloads: Iterable,
+    submit: Callable[[Any], Tuple[BaseJob, str]],
+    resubmit: Callable[[Any, BaseJob], Tuple[BaseJob, str]],
+    backend: Union[Backend, BaseBackend],
+    qjob_config: Dict,
+    job_callback: Optional[Callable],
+    result_kwargs: Dict,
+    max_concurrent_jobs: Optional[int],
+) -> List[Result]:
+    """Run a job for each of the ``payloads`` and return their results in submission order.
+
+    Each job is submitted with ``submit(payload)`` and then waited on in a worker thread of its
+    own, so that the statuses of all jobs in flight are polled concurrently and a job is
+    submitted as soon as a slot becomes free. Submissions themselves are serialized. At most
+    ``max_concurrent_jobs`` jobs are in flight at the same time, if None at most
+    ``min(32, os.cpu_count() + 4)``.
+
+    If ``payloads`` is not a list it is consumed lazily in the calling thread while the jobs of
+    the payloads produced so far are running, which allows to prepare the next payload, e.g. by
+    transpiling its circuits, while the backend executes the previous ones.
+
+    The ``job_callback`` is always called in the calling thread, hence it need not be thread
+    safe. If an exception is raised, e.g. a ``KeyboardInterrupt`` or the error of a job, the
+    workers stop polling and no further jobs are submitted before it is propagated. Jobs
+    already submitted are not cancelled on the backend.
+
+    Raises:
+        ValueError: ``max_concurrent_jobs`` is not positive.
+    """
+    if max_concurrent_jobs is not None and max_concurrent_jobs < 1:
+        raise ValueError(
+            "max_concurrent_jobs must be a positive integer, not {}".format(max_concurrent_jobs)
+        )
+    max_concurrent_jobs = max_concurrent_jobs or _DEFAULT_MAX_CONCURRENT_JOBS
+
+    with_autorecover = not is_simulator_backend(backend)
+    if with_autorecover:
+        logger.info("Backend status: %s", backend.status())
+        if isinstance(payloads, list):
+            logger.info("There are %s jobs to be submitted.", len(payloads))
+
+    if isinstance(payloads, list) and min(len(payloads), max_concurrent_jobs) <= 1:
+        results = []
+        for idx, payload in enumerate(payloads):
+            job, job_id = submit(payload)
+            if not with_autorecover:
+                results.append(job.result(**result_kwargs))
+            else:
+                results.append(
+                    _wait_for_result(
+                        idx,
+                        job,
+                        job_id,
+                        backend,
+                        lambda job, payload=payload: resubmit(payload, job),
+                        qjob_config,
+                        job_callback,
+                        result_kwargs,
+                    )
+                )
+        return results
+
+    # backends are not required to be thread safe, hence only one job is submitted at a time
+    submit_lock = threading.Lock()
+    stop = threading.Event()
+    # the workers hand the arguments of the job callbacks and their finished futures to the
+    # calling thread through this queue
+    events = queue.Queue()  # type: queue.Queue
+
+    def locked_submit(submit_fn, *args):
+        with submit_lock:
+            if stop.is_set():
+                raise _JobsStopped()
+            return submit_fn(*args)
+
+    def queue_callback(*args):
+        events.put((True, args))
+
+    def run_job(idx, payload):
+        job, job_id = locked_submit(submit, payload)
+        if not with_autorecover:
+            return job.result(**result_kwargs)
+        return _wait_for_result(
+            idx,
+            job,
+            job_id,
+            backend,
+            lambda job: locked_submit(resubmit, payload, job),
+            qjob_config,
+            queue_callback if job_callback is not None else None,
+            result_kwargs,
+            stop,
+        )
+
+    futures = {}
+    results = {}  # type: Dict[int, Result]
+
+    def handle(event):
+        is_callback, value = event
+        if is_callback:
+            job_callback(*value)
+        else:
+            results[futures[value]] = value.result()
+
+    with ThreadPoolExecutor(max_workers=max_concurrent_jobs) as executor:
+        try:
+            for idx, payload in enumerate(payloads):
+                future = executor.submit(run_job, idx, payload)
+                futures[future] = idx
+                future.add_done_callback(lambda future: events.put((False, future)))
+                while not events.empty():
+                    handle(events.get())
+            while len(results) < len(futures):
+                handle(events.get())
+        except BaseException:
+            stop.set()
+            for future in futures:
+                future.cancel()
+            raise
+    return [results[idx] for idx in range(len(results))]
+
+
+def _check_result(result: Result) -> Result:
+    # If result was not successful then raise an exception with either the status msg or
+    # extra information if this was an Aer partial result return
+    if not result.success:
+        msg = result.status
+        if result.status == "PARTIAL COMPLETED":
+            # Aer can return partial results which Aqua algorithms cannot process and signals
+            # using partial completed status where each returned result has a success and status.
+            # We use the status from the first result that was not successful
+            for res in result.results:
+                if not res.success:
+                    msg += ", " + res.status
+                    break
+        raise QiskitError("Circuit execution failed: {}".format(msg))
+
+    if not hasattr(result, "time_taken"):
+        setattr(result, "time_taken", 0.0)
+
+    return result
+
+
 def run_qobj(
     qobj: QasmQobj,
     backend: Union[Backend, BaseBackend],
@@ -231,6 +479,7 @@ def run_qobj(
     noise_config: Optional[Dict] = None,
     skip_qobj_validation: bool = False,
     job_callback: Optional[Callable] = None,
+    max_concurrent_jobs: Optional[int] = None,
 ) -> Result:
     """
     An execution wrapper with Qiskit-Terra, with job auto recover capability.
@@ -238,6 +487,10 @@ def run_qobj(
     The auto-recovery feature is only applied for non-simulator backend.
     This wrapper will try to get the result no matter how long it takes.
 
+    If the qobj exceeds the payload of the backend it is split into several jobs. These are
+    submitted and waited on concurrently, and their results are combined in the order of the
+    experiments in the qobj.
+
     Args:
         qobj: qobj to execute
         backend: backend instance
@@ -249,6 +502,9 @@ def run_qobj(
         job_callback: callback used in querying info of the submitted job, and
                                            providing the following arguments:
                                             job_id, job_status, queue_position, job
+                                           It is always called in the calling thread.
+        max_concurrent_jobs: The maximum number of jobs in flight at the same time. If None,
+            at most ``min(32, os.cpu_count() + 4)``.
 
     Returns:
         Result object
@@ -264,122 +520,52 @@ def run_qobj(
     if backend is None or not isinstance(backend, (Backend, BaseBackend)):
         raise ValueError("Backend is missing or not an instance of BaseBackend")
 
-    with_autorecover = not is_simulator_backend(backend)
-
-    if MAX_CIRCUITS_PER_JOB is not None:
-        max_circuits_per_job = int(MAX_CIRCUITS_PER_JOB)
-    else:
-        if is_local_backend(backend):
-            max_circuits_per_job = sys.maxsize
-        else:
-            max_circuits_per_job = backend.configuration().max_experiments
-
     # split qobj if it exceeds the payload of the backend
+    qobjs = _split_qobj_to_qobjs(qobj, _max_circuits_per_job(backend))
+    return _run_qobjs(
+        qobjs,
+        backend,
+        qjob_config,
+        backend_options,
+        noise_config,
+        skip_qobj_validation,
+        job_callback,
+        max_concurrent_jobs,
+    )
 
-    qobjs = _split_qobj_to_qobjs(qobj, max_circuits_per_job)
-    jobs = []
-    job_ids = []
-    for qob in qobjs:
-        job, job_id = _safe_submit_qobj(
-            qob, backend, backend_options, noise_config, skip_qobj_validation
-        )
-        job_ids.append(job_id)
-        jobs.append(job)
-
-    results = []
-    if with_autorecover:
-        logger.info("Backend status: %s", backend.status())
-        logger.info("There are %s jobs are submitted.", len(jobs))
-        logger.info("All job ids:\n%s", job_ids)
-        for idx, _ in enumerate(jobs):
-            job = jobs[idx]
-            job_id = job_ids[idx]
-            while True:
-                logger.info("Running %s-th qobj, job id: %s", idx, job_id)
-                # try to get result if possible
-                while True:
-                    job_status = _safe_get_job_status(job, job_id)
-                    queue_position = 0
-                    if job_status in JOB_FINAL_STATES:
-                        # do callback again after the job is in the final states
-                        if job_callback is not None:
-                            job_callback(job_id, job_status, queue_position, job)
-                        break
-                    if job_status == JobStatus.QUEUED:
-                        queue_position = job.queue_position()
-                        logger.info("Job id: %s is queued at position %s", job_id, queue_position)
-                    else:
-                        logger.info("Job id: %s, status: %s", job_id, job_status)
-                    if job_callback is not None:
-                        job_callback(job_id, job_status, queue_position, job)
-                    time.sleep(qjob_config["wait"])
-
-                # get result after the status is DONE
-                if job_status == JobStatus.DONE:
-                    while True:
-                        result = job.result(**qjob_config)
-                        if result.success:
-                            results.append(result)
-                            logger.info("COMPLETED the %s-th qobj, job id: %s", idx, job_id)
-                            break
-
-                        logger.warning("FAILURE: Job id: %s", job_id)
-                        logger.warning(
-                            "Job (%s) is completed anyway, retrieve result " "from backend again.",
-                            job_id,
-                        )
-                        job = backend.retrieve_job(job_id)
-                    break
-                # for other cases, resubmit the qobj until the result is available.
-                # since if there is no result returned, there is no way algorithm can do any process
-                # get back the qobj first to avoid for job is consumed
-                qobj = job.qobj()
-                if job_status == JobStatus.CANCELLED:
-                    logger.warning("FAILURE: Job id: %s is cancelled. Re-submit the Qobj.", job_id)
-                elif job_status == JobStatus.ERROR:
-                    logger.warning(
-                        "FAILURE: Job id: %s encounters the error. "
-                        "Error is : %s. Re-submit the Qobj.",
-                        job_id,
-                        job.error_message(),
-                    )
-                else:
-                    logging.warning(
-                        "FAILURE: Job id: %s. Unknown status: %s. " "Re-submit the Qobj.",
-                        job_id,
-                        job_status,
-                    )
-
-                job, job_id = _safe_submit_qobj(
-                    qobj, backend, backend_options, noise_config, skip_qobj_validation
-                )
-                jobs[idx] = job
-                job_ids[idx] = job_id
-    else:
-        results = []
-        for job in jobs:
-            results.append(job.result(**qjob_config))
 
-    result = _combine_result_objects(results) if results else None
+def _run_qobjs(
+    qobjs: Iterable[QasmQobj],
+    backend: Union[Backend, BaseBackend],
+    qjob_config: Dict,
+    backend_options: Dict,
+    noise_config: Dict,
+    skip_qobj_validation: bool,
+    job_callback: Optional[Callable],
+    max_concurrent_jobs: Optional[int],
+) -> Result:
+    """Run a job for each of ``qobjs`` and combine their results, see :func:`run_qobj`."""
 
-    # If result was not successful then raise an exception with either the status msg or
-    # extra information if this was an Aer partial result return
-    if not result.success:
-        msg = result.status
-        if result.status == "PARTIAL COMPLETED":
-            # Aer can return partial results which Aqua algorithms cannot process and signals
-            # using partial completed status where each returned result has a success and status.
-            # We use the status from the first result that was not successful
-            for res in result.results:
-                if not res.success:
-                    msg += ", " + res.status
-                    break
-        raise QiskitError("Circuit execution failed: {}".format(msg))
+    def submit(qobj):
+        return _safe_submit_qobj(qobj, backend, backend_options, noise_config, skip_qobj_validation)
 
-    if not hasattr(result, "time_taken"):
-        setattr(result, "time_taken", 0.0)
+    def resubmit(qobj, job):
+        # get back the qobj first to avoid for job is consumed
+        return _safe_submit_qobj(
+            job.qobj(), backend, backend_options, noise_config, skip_qobj_validation
+        )
 
-    return result
+    results = _run_jobs(
+        qobjs,
+        submit,
+        resubmit,
+        backend,
+        qjob_config,
+        job_callback,
+        qjob_config,
+        max_concurrent_jobs,
+    )
+    return _check_result(_combine_result_objects(results))
 
 
 # skip_qobj_validation = True does what backend.run
@@ -428,6 +614,7 @@ def run_circuits(
     noise_config: Optional[Dict] = None,
     run_config: Optional[Dict] = None,
     job_callback: Optional[Callable] = None,
+    max_concurrent_jobs: Optional[int] = None,
 ) -> Result:
     """
     An execution wrapper with Qiskit-Terra, with job auto recover capability.
@@ -435,6 +622,10 @@ def run_circuits(
     The auto-recovery feature is only applied for non-simulator backend.
     This wrapper will try to get the result no matter how long it takes.
 
+    If there are more circuits than the backend accepts in a single job they are split into
+    several jobs. These are submitted and waited on concurrently, and their results are
+    combined in the order of the circuits.
+
     Args:
         circuits: circuits to execute
         backend: backend instance
@@ -445,6 +636,9 @@ def run_circuits(
         job_callback: callback used in querying info of the submitted job, and
                                            providing the following arguments:
                                             job_id, job_status, queue_position, job
+                                           It is always called in the calling thread.
+        max_concurrent_jobs: The maximum number of jobs in flight at the same time. If None,
+            at most ``min(32, os.cpu_count() + 4)``.
 
     Returns:
         Result object
@@ -455,102 +649,59 @@ def run_circuits(
     backend_options = backend_options or {}
     noise_config = noise_config or {}
     run_config = run_config or {}
-    with_autorecover = not is_simulator_backend(backend)
 
-    job, job_id = _safe_submit_circuits(
-        circuits,
+    if isinstance(circuits, QuantumCircuit):
+        chunks = [circuits]
+    else:
+        chunk_size = _max_circuits_per_job(backend)
+        chunks = [circuits[i : i + chunk_size] for i in range(0, max(len(circuits), 1), chunk_size)]
+
+    return _run_circuit_chunks(
+        chunks,
         backend,
-        qjob_config=qjob_config,
-        backend_options=backend_options,
-        noise_config=noise_config,
-        run_config=run_config,
+        qjob_config,
+        backend_options,
+        noise_config,
+        run_config,
+        job_callback,
+        max_concurrent_jobs,
     )
-    result = None
-    if with_autorecover:
-        logger.info("Backend status: %s", backend.status())
-        logger.info("There is one jobs are submitted: id: %s", job_id)
-        while True:
-            logger.info("Running job id: %s", job_id)
-            # try to get result if possible
-            while True:
-                job_status = _safe_get_job_status(job, job_id)
-                queue_position = 0
-                if job_status in JOB_FINAL_STATES:
-                    # do callback again after the job is in the final states
-                    if job_callback is not None:
-                        job_callback(job_id, job_status, queue_position, job)
-                    break
-                if job_status == JobStatus.QUEUED and hasattr(job, queue_position):
-                    queue_position = job.queue_position()
-                    logger.info("Job id: %s is queued at position %s", job_id, queue_position)
-                else:
-                    logger.info("Job id: %s, status: %s", job_id, job_status)
-                if job_callback is not None:
-                    job_callback(job_id, job_status, queue_position, job)
-                time.sleep(qjob_config["wait"])
-
-            # get result after the status is DONE
-            if job_status == JobStatus.DONE:
-                while True:
-                    result = job.result()
-                    if result.success:
-                        logger.info("COMPLETED: job id: %s", job_id)
-                        break
-
-                    logger.warning("FAILURE: Job id: %s", job_id)
-                    logger.warning(
-                        "Job (%s) is completed anyway, retrieve result " "from backend again.",
-                        job_id,
-                    )
-                    job = backend.retrieve_job(job_id)
-                break
-            # for other cases, resubmit the circuit until the result is available.
-            # since if there is no result returned, there is no way algorithm can do any process
-            if job_status == JobStatus.CANCELLED:
-                logger.warning("FAILURE: Job id: %s is cancelled. Re-submit the circuits.", job_id)
-            elif job_status == JobStatus.ERROR:
-                logger.warning(
-                    "FAILURE: Job id: %s encounters the error. "
-                    "Error is : %s. Re-submit the circuits.",
-                    job_id,
-                    job.error_message(),
-                )
-            else:
-                logging.warning(
-                    "FAILURE: Job id: %s. Unknown status: %s. " "Re-submit the circuits.",
-                    job_id,
-                    job_status,
-                )
 
-            job, job_id = _safe_submit_circuits(
-                circuits,
-                backend,
-                qjob_config=qjob_config,
-                backend_options=backend_options,
-                noise_config=noise_config,
-                run_config=run_config,
-            )
-    else:
-        result = job.result()
 
-    # If result was not successful then raise an exception with either the status msg or
-    # extra information if this was an Aer partial result return
-    if not result.success:
-        msg = result.status
-        if result.status == "PARTIAL COMPLETED":
-            # Aer can return partial results which Aqua algorithms cannot process and signals
-            # using partial completed status where each returned result has a success and status.
-            # We use the status from the first result that was not successful
-            for res in result.results:
-                if not res.success:
-                    msg += ", " + res.status
-                    break
-        raise QiskitError("Circuit execution failed: {}".format(msg))
-
-    if not hasattr(result, "time_taken"):
-        setattr(result, "time_taken", 0.0)
+def _run_circuit_chunks(
+    chunks: Iterable[Union[QuantumCircuit, List[QuantumCircuit]]],
+    backend: Union[Backend, BaseBackend],
+    qjob_config: Dict,
+    backend_options: Dict,
+    noise_config: Dict,
+    run_config: Dict,
+    job_callback: Optional[Callable],
+    max_concurrent_jobs: Optional[int],
+) -> Result:
+    """Run a job for each of the circuit ``chunks`` and combine their results, see
+    :func:`run_circuits`."""
+
+    def submit(circuits):
+        return _safe_submit_circuits(
+            circuits,
+            backend,
+            qjob_config=qjob_config,
+            backend_options=backend_options,
+            noise_config=noise_config,
+            run_config=run_config,
+        )
 
-    return result
+    results = _run_jobs(
+        chunks,
+        submit,
+        lambda circuits, job: submit(circuits),
+        backend,
+        qjob_config,
+        job_callback,
+        {},
+        max_concurrent_jobs,
+    )
+    return _check_result(_combine_result_objects(results))
 
 
 def _safe_submit_circuits(
@@ -0,0 +1,144 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test the parallel evaluation of objective functions """
+
+import threading
+import unittest
+from test.python.algorithms import QiskitAlgorithmsTestCase
+
+import numpy as np
+from scipy.optimize import rosen
+
+from qiskit.utils import algorithm_globals
+from qiskit.algorithms.optimizers import (
+    COBYLA,
+    L_BFGS_B,
+    NELDER_MEAD,
+    P_BFGS,
+    MultiStartOptimizer,
+    Optimizer,
+    WorkerPool,
+    evaluate_points,
+)
+
+
+class _GroupedRosen:
+    """Rosenbrock function accepting concatenated points, recording its calls."""
+
+    def __init__(self, num_vars):
+        self.num_vars = num_vars
+        self.calls = []
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def __call__(self, x):
+        points = np.reshape(x, (-1, self.num_vars))
+        with self.lock:
+            self.calls.append(len(points))
+            self.threads.add(threading.get_ident())
+        values = [rosen(point) for point in points]
+        return values if len(values) > 1 else values[0]
+
+
+class TestParallelEvaluation(QiskitAlgorithmsTestCase):
+    """Test the worker pool and the multi-start optimizers"""
+
+    def setUp(self):
+        super().setUp()
+        algorithm_globals.random_seed = 52
+        self.x_0 = np.array([1.3, 0.7, 0.8, 1.9, 1.2])
+        self.pool = WorkerPool(max_workers=4)
+
+    def tearDown(self):
+        self.pool.shutdown()
+        super().tearDown()
+
+    def test_evaluate_points(self):
+        """Test the points are evaluated in order in groups of at most max_evals_grouped."""
+        points = [self.x_0 + i for i in range(7)]
+        expected = [rosen(point) for point in points]
+        for max_evals_grouped in [1, 3, 10]:
+            for worker_pool in [None, self.pool]:
+                with self.subTest(max_evals_grouped=max_evals_grouped, pool=worker_pool):
+                    objective = _GroupedRosen(5)
+                    values = evaluate_points(objective, points, max_evals_grouped, worker_pool)
+                    np.testing.assert_array_almost_equal(values, expected)
+                    self.assertEqual(sum(objective.calls), 7)
+                    self.assertLessEqual(max(objective.calls), max_evals_grouped)
+
+    def test_nested_map(self):
+        """Test a map issued from a worker of the same pool is evaluated in that worker."""
+        pool = WorkerPool(max_workers=2)
+        result = pool.map(lambda i: pool.map(lambda j: i * j, range(3)), range(4))
+        pool.shutdown()
+        self.assertListEqual(result, [[i * j for j in range(3)] for i in range(4)])
+
+    def test_gradient_num_diff(self):
+        """Test the finite difference gradient is the same with and without the pool."""
+        serial = Optimizer.gradient_num_diff(self.x_0, rosen, 1e-6)
+        objective = _GroupedRosen(5)
+        parallel = Optimizer.gradient_num_diff(self.x_0, objective, 1e-6, 2, self.pool)
+        np.testing.assert_array_almost_equal(parallel, serial)
+        self.assertListEqual(objective.calls, [2, 2, 2])
+
+    def test_l_bfgs_b_worker_pool(self):
+        """Test L_BFGS_B with gradients evaluated on the worker pool."""
+        optimizer = L_BFGS_B(maxfun=1000)
+        optimizer.set_worker_pool(self.pool)
+        objective = _GroupedRosen(5)
+        res = optimizer.optimize(5, objective, initial_point=self.x_0)
+        np.testing.assert_array_almost_equal(res[0], [1.0] * 5, decimal=2)
+        self.assertGreater(len(objective.threads), 1)
+
+    def test_multi_start(self):
+        """Test multi-start COBYLA and Nelder-Mead return the best run, reproducibly."""
+        for optimizer in [COBYLA(maxiter=5000, tol=1e-8), NELDER_MEAD(maxfev=5000, tol=1e-8)]:
+            with self.subTest(optimizer=type(optimizer).__name__):
+                results = []
+                for worker_pool in [None, self.pool]:
+                    algorithm_globals.random_seed = 12
+                    multi_start = MultiStartOptimizer(optimizer, num_starts=3)
+                    multi_start.set_worker_pool(worker_pool)
+                    bounds = [(-2, 2)] * 5
+                    results.append(
+                        multi_start.optimize(
+                            5, rosen, variable_bounds=bounds, initial_point=self.x_0
+                        )
+                    )
+                    single = optimizer.optimize(5, rosen, initial_point=self.x_0)
+                    self.assertLessEqual(results[-1][1], single[1])
+                    self.assertGreater(results[-1][2], single[2])
+
+                np.testing.assert_array_equal(results[0][0], results[1][0])
+                self.assertEqual(results[0][1:], results[1][1:])
+
+    def test_multi_start_serial_by_default(self):
+        """Test multi-start runs in the calling thread if no worker pool is set."""
+        objective = _GroupedRosen(5)
+        multi_start = MultiStartOptimizer(COBYLA(maxiter=50), num_starts=3)
+        multi_start.optimize(5, objective, initial_point=self.x_0)
+        self.assertSetEqual(objective.threads, {threading.get_ident()})
+
+    def test_p_bfgs_reproducible(self):
+        """Test the result of P_BFGS does not depend on the order the runs finish in."""
+        results = []
+        for _ in range(2):
+            algorithm_globals.random_seed = 7
+            optimizer = P_BFGS(maxfun=1000, max_processes=3)
+            results.append(optimizer.optimize(5, rosen, initial_point=self.x_0))
+        np.testing.assert_array_equal(results[0][0], results[1][0])
+        self.assertEqual(results[0][1:], results[1][1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
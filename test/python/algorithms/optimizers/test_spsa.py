@@ -14,11 +14,14 @@
 
 from test.python.algorithms import QiskitAlgorithmsTestCase
 
+import pickle
+
 import numpy as np
 
 from qiskit.algorithms.optimizers import SPSA
 from qiskit.circuit.library import PauliTwoDesign
 from qiskit.opflow import I, Z, StateFn
+from qiskit.utils import algorithm_globals
 
 
 class TestSPSA(QiskitAlgorithmsTestCase):
@@ -75,3 +78,70 @@ class TestSPSA(QiskitAlgorithmsTestCase):
 
         self.assertIsNone(spsa.learning_rate)
         self.assertIsNone(spsa.perturbation)
+
+    def test_batched_evaluations(self):
+        """Test all perturbations of an iteration are evaluated in a single batched call."""
+        hessian = np.diag([1.0, 2.0, 3.0, 4.0])
+
+        def run(max_evals_grouped):
+            calls = []
+
+            def objective(x):
+                points = np.reshape(x, (-1, 4))
+                calls.append(len(points))
+                values = np.einsum("ij,jk,ik->i", points, hessian, points)
+                return values if len(values) > 1 else values[0]
+
+            algorithm_globals.random_seed = 12
+            spsa = SPSA(maxiter=5, resamplings=3, blocking=True)
+            spsa.set_max_evals_grouped(max_evals_grouped)
+            result = spsa.optimize(4, objective, initial_point=np.ones(4))
+            return result, calls
+
+        sequential, sequential_calls = run(1)
+        batched, batched_calls = run(50)
+
+        np.testing.assert_array_almost_equal(batched[0], sequential[0])
+        self.assertAlmostEqual(batched[1], sequential[1])
+        self.assertEqual(batched[2], sequential[2])
+        self.assertEqual(sum(batched_calls), sum(sequential_calls))
+        # calibration, initial loss, standard deviation, then gradient and step per iteration
+        self.assertListEqual(batched_calls[:3], [50, 1, 25])
+        self.assertListEqual(batched_calls[3:-1], [6, 1] * 5)
+
+    def test_resume_from_state(self):
+        """Test an interrupted optimization resumed from the state ends as an uninterrupted one."""
+        hessian = np.diag([1.0, 2.0, 3.0, 4.0])
+
+        def loss(x):
+            return x @ hessian @ x
+
+        # interrupt after the calibration and a few iterations
+        for interrupt_at, kwargs in [(70, {}), (110, {"blocking": True, "last_avg": 3})]:
+            with self.subTest(**kwargs):
+                algorithm_globals.random_seed = 12
+                expected = SPSA(maxiter=20, **kwargs).optimize(4, loss, initial_point=np.ones(4))
+
+                evaluations = []
+
+                def interrupted_loss(x):
+                    evaluations.append(x)
+                    if len(evaluations) == interrupt_at:
+                        raise KeyboardInterrupt
+                    return loss(x)
+
+                algorithm_globals.random_seed = 12
+                spsa = SPSA(maxiter=20, **kwargs)
+                with self.assertRaises(KeyboardInterrupt):
+                    spsa.optimize(4, interrupted_loss, initial_point=np.ones(4))
+                state = pickle.loads(pickle.dumps(spsa.get_state()))
+                self.assertGreater(state["iteration"], 0)
+
+                algorithm_globals.random_seed = 99
+                resumed = SPSA(maxiter=20, **kwargs)
+                resumed.set_state(state)
+                result = resumed.optimize(4, loss, initial_point=np.zeros(4))
+
+                np.testing.assert_array_equal(result[0], expected[0])
+                self.assertEqual(result[1:], expected[1:])
+                self.assertEqual(resumed.get_state()["iteration"], 20)
@@ -13,12 +13,14 @@
 """Test the quantum amplitude estimation algorithm."""
 
 import unittest
+from unittest.mock import patch
 from test.python.algorithms import QiskitAlgorithmsTestCase
 import numpy as np
 from ddt import ddt, idata, data, unpack
 from qiskit import QuantumRegister, QuantumCircuit, BasicAer
 from qiskit.circuit.library import QFT, GroverOperator
 from qiskit.utils import QuantumInstance
+from qiskit.utils.measurement_error_mitigation import LocalMeasFitter
 from qiskit.algorithms import (
     AmplitudeEstimation,
     MaximumLikelihoodAmplitudeEstimation,
@@ -169,6 +171,88 @@ class TestBernoulli(QiskitAlgorithmsTestCase):
                 value, getattr(result, key), places=3, msg="estimate `{}` failed".format(key)
             )
 
+    @idata(
+        [
+            [AmplitudeEstimation(3), ["estimation", "mle", "confidence_interval"], 3],
+            [MaximumLikelihoodAmplitudeEstimation(2), ["estimation", "confidence_interval"], 9],
+            [IterativeAmplitudeEstimation(0.05, 0.05), ["estimation", "powers"], None],
+            [FasterAmplitudeEstimation(0.1, 2, rescale=False), ["estimation"], None],
+        ]
+    )
+    @unpack
+    def test_estimate_batch(self, qae, keys, num_circuits):
+        """Test estimating several problems at once is equal to estimating them one by one."""
+        probabilities = [0.2, 0.49, 0.8]
+        problems = [
+            EstimationProblem(BernoulliStateIn(prob), [0], BernoulliGrover(prob))
+            for prob in probabilities
+        ]
+        for quantum_instance in [self._qasm(100), self._statevector]:
+            with self.subTest(is_statevector=quantum_instance.is_statevector):
+                qae.quantum_instance = quantum_instance
+                expected = [qae.estimate(problem) for problem in problems]
+
+                with patch.object(
+                    quantum_instance, "execute", wraps=quantum_instance.execute
+                ) as execute:
+                    results = qae.estimate_batch(problems)
+
+                # all circuits are executed at once, if the estimator is not iterative
+                if num_circuits is not None:
+                    self.assertEqual(execute.call_count, 1)
+                    self.assertEqual(len(execute.call_args[0][0]), num_circuits)
+                for result, expected_result in zip(results, expected):
+                    for key in keys:
+                        np.testing.assert_array_almost_equal(
+                            getattr(result, key), getattr(expected_result, key)
+                        )
+
+        self.assertListEqual(qae.estimate_batch([]), [])
+
+    @data(
+        AmplitudeEstimation(3),
+        IterativeAmplitudeEstimation(0.1, 0.1),
+        MaximumLikelihoodAmplitudeEstimation(3),
+    )
+    def test_estimate_batch_mitigation(self, qae):
+        """Test estimating problems measuring different qubits with measurement error mitigation."""
+        wide_state = QuantumCircuit(2)
+        wide_state.h(0)
+        wide_state.ry(2 * np.arcsin(np.sqrt(0.8)), 1)
+        problems = [
+            EstimationProblem(BernoulliStateIn(0.2), [0], BernoulliGrover(0.2)),
+            EstimationProblem(wide_state, [1]),
+        ]
+        qae.quantum_instance = QuantumInstance(
+            backend=BasicAer.get_backend("qasm_simulator"),
+            shots=1000,
+            seed_simulator=2,
+            seed_transpiler=2,
+            measurement_error_mitigation_cls=LocalMeasFitter,
+        )
+        results = qae.estimate_batch(problems)
+        for result, expected in zip(results, [0.2, 0.8]):
+            self.assertAlmostEqual(result.estimation, expected, delta=0.1)
+
+    def test_iqae_batch_rounds(self):
+        """Test the rounds of all problems of IQAE are advanced together."""
+        qae = IterativeAmplitudeEstimation(0.01, 0.05, quantum_instance=self._qasm(100))
+        problems = [
+            EstimationProblem(BernoulliStateIn(prob), [0], BernoulliGrover(prob))
+            for prob in [0.2, 0.49, 0.8]
+        ]
+        with patch.object(
+            qae.quantum_instance, "execute", wraps=qae.quantum_instance.execute
+        ) as execute:
+            results = qae.estimate_batch(problems)
+
+        # each round executes the circuits of all problems which have not converged yet
+        num_rounds = max(len(result.powers) for result in results) - 1
+        self.assertEqual(execute.call_count, num_rounds)
+        for i, call in enumerate(execute.call_args_list):
+            num_active = sum(len(result.powers) - 1 > i for result in results)
+            self.assertEqual(len(call[0][0]), num_active)
+
     @data(True, False)
     def test_qae_circuit(self, efficient_circuit):
         """Test circuits resulting from canonical amplitude estimation.
@@ -456,6 +540,29 @@ class TestSineIntegral(QiskitAlgorithmsTestCase):
         np.testing.assert_array_almost_equal(confint, expected_confint)
         self.assertTrue(confint[0] <= result.estimation <= confint[1])
 
+    def test_batched_post_processing(self):
+        """Test the MLEs and confidence intervals of several results are computed at once."""
+        results = []
+        for n, shots in [(2, 10), (3, 100), (4, 1000)]:
+            qae = AmplitudeEstimation(n, quantum_instance=self._qasm(shots))
+            results.append(qae.estimate(EstimationProblem(SineIntegral(n), objective_qubits=[n])))
+        qae = AmplitudeEstimation(2, quantum_instance=self._statevector)
+        results.append(qae.estimate(EstimationProblem(SineIntegral(2), objective_qubits=[2])))
+
+        mles = AmplitudeEstimation.compute_mles(results)
+        np.testing.assert_array_almost_equal(mles, [result.mle for result in results])
+
+        for kind in ["likelihood_ratio", "fisher", "observed_fisher"]:
+            with self.subTest(kind=kind):
+                confints = AmplitudeEstimation.compute_confidence_intervals(results, 0.01, kind)
+                for result, confint in zip(results, confints):
+                    expected = AmplitudeEstimation.compute_confidence_interval(result, 0.01, kind)
+                    np.testing.assert_array_almost_equal(confint, expected)
+                    self.assertTrue(confint[0] <= result.mle <= confint[1])
+
+        with self.assertRaises(NotImplementedError):
+            _ = AmplitudeEstimation.compute_confidence_intervals(results, 0.01, "unknown")
+
 
 @ddt
 class TestFasterAmplitudeEstimation(QiskitAlgorithmsTestCase):
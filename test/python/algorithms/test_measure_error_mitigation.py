@@ -12,18 +12,38 @@
 
 """ Test Measurement Error Mitigation """
 
+import itertools
 import unittest
 
 from test.python.algorithms import QiskitAlgorithmsTestCase
-from qiskit import QuantumCircuit
+import numpy as np
+from qiskit import BasicAer, QuantumCircuit
 from qiskit.exceptions import QiskitError
 from qiskit.utils import QuantumInstance, algorithm_globals
+from qiskit.utils.measurement_error_mitigation import LocalMeasFitter
 from qiskit.algorithms import VQE
 from qiskit.opflow import I, X, Z
 from qiskit.algorithms.optimizers import SPSA
 from qiskit.circuit.library import EfficientSU2
 
 
+class _PairMeasFitter(LocalMeasFitter):
+    """Local fitter calibrating pairs of qubits."""
+
+    cluster_size = 2
+
+
+class _CalibrationResult:
+    """Stand-in for the result of the calibration circuits."""
+
+    def __init__(self, counts):
+        self.counts = counts
+
+    def get_counts(self, name):
+        """Return the counts of a calibration circuit."""
+        return self.counts[name]
+
+
 class TestMeasurementErrorMitigation(QiskitAlgorithmsTestCase):
     """Test measurement error mitigation."""
 
@@ -123,6 +143,128 @@ class TestMeasurementErrorMitigation(QiskitAlgorithmsTestCase):
         quantum_instance.reset_execution_results()
         self.assertAlmostEqual(result.eigenvalue.real, -1.86, delta=0.05)
 
+    def test_measurement_error_mitigation_streaming(self):
+        """measurement error mitigation test with streaming execution"""
+        try:
+            from qiskit.ignis.mitigation.measurement import CompleteMeasFitter
+            from qiskit import Aer
+            from qiskit.providers.aer import noise
+        except ImportError as ex:
+            self.skipTest("Package doesn't appear to be installed. Error: '{}'".format(str(ex)))
+            return
+
+        # build noise model
+        noise_model = noise.NoiseModel()
+        read_err = noise.errors.readout_error.ReadoutError([[0.9, 0.1], [0.25, 0.75]])
+        noise_model.add_all_qubit_readout_error(read_err)
+
+        backend = Aer.get_backend("qasm_simulator")
+        circuits = []
+        for i in range(4):
+            qc = QuantumCircuit(2, 2)
+            qc.h(0)
+            qc.cx(0, 1)
+            if i % 2:
+                qc.x(1)
+            qc.measure([0, 1], [0, 1])
+            circuits.append(qc)
+
+        counts = []
+        for streaming in [False, True]:
+            quantum_instance = QuantumInstance(
+                backend=backend,
+                seed_simulator=1679,
+                seed_transpiler=167,
+                shots=1000,
+                noise_model=noise_model,
+                measurement_error_mitigation_cls=CompleteMeasFitter,
+                streaming=streaming,
+            )
+            result = quantum_instance.execute(circuits)
+            self.assertEqual(len(result.results), 4)
+            counts.append([result.get_counts(i) for i in range(4)])
+
+        for expected, actual in zip(*counts):
+            for key, value in expected.items():
+                self.assertAlmostEqual(actual.get(key, 0), value, delta=100)
+
+    def _readout(self, counts, matrices):
+        """Apply independent readout errors to the counts of the bitstrings."""
+        num_qubits = len(matrices)
+        noisy = {}
+        for key, value in counts.items():
+            prepared = [int(bit) for bit in reversed(key)]
+            for measured in itertools.product([0, 1], repeat=num_qubits):
+                prob = np.prod([m[measured[i], prepared[i]] for i, m in enumerate(matrices)])
+                label = "".join(str(bit) for bit in reversed(measured))
+                noisy[label] = noisy.get(label, 0) + value * prob
+        return noisy
+
+    def test_local_meas_fitter(self):
+        """Test the local fitter calibrates clusters and inverts their tensor product."""
+        rng = np.random.default_rng(5)
+        matrices = []
+        for _ in range(5):
+            flip0, flip1 = rng.uniform(0.01, 0.1, 2)
+            matrices.append(np.array([[1 - flip0, flip1], [flip0, 1 - flip1]]))
+        ideal = {"00000": 500, "11111": 300, "01010": 200}
+        noisy = self._readout(ideal, matrices)
+
+        for fitter_cls in [LocalMeasFitter, _PairMeasFitter]:
+            with self.subTest(cluster_size=fitter_cls.cluster_size):
+                circuits, state_labels = fitter_cls.calibration_circuits(5)
+                self.assertEqual(len(circuits), 2 ** fitter_cls.cluster_size)
+                cal_results = _CalibrationResult(
+                    {
+                        circuit.name: self._readout({label: 1000}, matrices)
+                        for circuit, label in zip(circuits, state_labels)
+                    }
+                )
+                fitter = fitter_cls(cal_results, state_labels, qubit_list=[0, 1, 2, 3, 4])
+                np.testing.assert_allclose(fitter.cal_matrix[-1], matrices[4])
+                expected = matrices[0]
+                if fitter_cls.cluster_size == 2:
+                    expected = np.kron(matrices[1], matrices[0])
+                np.testing.assert_allclose(fitter.cal_matrix[0], expected)
+
+                for method in ["least_squares", "pseudo_inverse"]:
+                    mitigated = fitter.filter.apply(noisy, method)
+                    for key, value in ideal.items():
+                        self.assertAlmostEqual(mitigated[key], value)
+                    self.assertAlmostEqual(sum(mitigated.values()), 1000)
+
+                # measuring qubit 3 into bit 0 and qubit 1 into bit 1
+                subset = fitter.subset_fitter([3, 1])
+                mitigated = subset.filter.apply(self._readout({"10": 100}, matrices[3:0:-2]))
+                self.assertAlmostEqual(mitigated["10"], 100)
+
+    def test_local_meas_fitter_quantum_instance(self):
+        """Test the local fitter is calibrated and applied by the quantum instance."""
+        quantum_instance = QuantumInstance(
+            BasicAer.get_backend("qasm_simulator"),
+            shots=1000,
+            seed_simulator=7,
+            seed_transpiler=7,
+            measurement_error_mitigation_cls=LocalMeasFitter,
+        )
+        qc1 = QuantumCircuit(3, 3)
+        qc1.h(0)
+        qc1.cx(0, 1)
+        qc1.cx(1, 2)
+        qc1.measure([0, 1, 2], [0, 1, 2])
+        qc2 = QuantumCircuit(3, 3)
+        qc2.x(1)
+        qc2.x(2)
+        qc2.measure([2, 1, 0], [0, 1, 2])
+
+        result = quantum_instance.execute([qc1, qc2])
+        self.assertEqual(len(result.results), 2)
+        self.assertEqual(sum(result.get_counts(0).values()), 1000)
+        self.assertEqual(set(result.get_counts(0)), {"000", "111"})
+        self.assertDictEqual(result.get_counts(1), {"011": 1000})
+        matrices, _ = quantum_instance.cals_matrix([0, 1, 2])
+        self.assertEqual(len(matrices), 3)
+
 
 if __name__ == "__main__":
     unittest.main()
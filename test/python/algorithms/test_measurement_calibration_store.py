@@ -0,0 +1,160 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test the store of measurement error mitigation calibrations """
+
+import copy
+import os
+import pickle
+import tempfile
+import time
+import unittest
+
+from test.python.algorithms import QiskitAlgorithmsTestCase
+from qiskit import BasicAer
+from qiskit.utils import MeasurementCalibrationStore, QuantumInstance
+
+
+class _Fitter:
+    """Picklable stand-in for a measurement error mitigation fitter."""
+
+    def __init__(self, qubits, name="fitter"):
+        self.qubits = list(qubits)
+        self.name = name
+        self.cal_matrix = [[len(self.qubits)]]
+
+    def subset_fitter(self, qubit_sublist):
+        """Return the fitter of a subset of the qubits."""
+        return _Fitter(qubit_sublist, self.name + "_subset")
+
+
+class TestMeasurementCalibrationStore(QiskitAlgorithmsTestCase):
+    """Test the MeasurementCalibrationStore"""
+
+    def setUp(self):
+        super().setUp()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+        super().tearDown()
+
+    def test_exact_and_superset_lookup(self):
+        """Test exact calibrations are preferred, then the most recent superset."""
+        store = MeasurementCalibrationStore()
+        now = time.time()
+        store.put("backend", [0, 1, 2, 3], 1024, _Fitter([0, 1, 2, 3], "old"), now - 10)
+        store.put("backend", [4, 2, 1], 1024, _Fitter([1, 2, 4], "new"), now)
+        store.put("backend", [1, 2], 2048, _Fitter([1, 2], "other_shots"), now)
+        store.put("other", [1, 2], 1024, _Fitter([1, 2], "other_backend"), now)
+
+        fitter, timestamp, qubits = store.find("backend", [2, 1], 1024)
+        self.assertEqual(fitter.name, "new")
+        self.assertEqual(timestamp, now)
+        self.assertListEqual(qubits, [1, 2, 4])
+
+        self.assertEqual(store.find("backend", [0, 3], 1024)[0].name, "old")
+        self.assertIsNone(store.find("backend", [0, 4], 1024))
+        self.assertIsNone(store.find("backend", [5], 1024))
+
+        store.put("backend", [1, 2], 1024, _Fitter([1, 2], "exact"), now - 20)
+        self.assertEqual(store.find("backend", [1, 2], 1024)[0].name, "exact")
+        self.assertEqual(store.get("backend", [2, 1], 1024)[0].name, "exact")
+        self.assertIsNone(store.get("backend", [1], 1024))
+        self.assertEqual(len(store), 5)
+
+    def test_ttl_eviction(self):
+        """Test calibrations older than the time to live are evicted, also from disk."""
+        store = MeasurementCalibrationStore(self.tmp_dir.name, ttl=60)
+        store.put("backend", [0, 1], 1024, _Fitter([0, 1], "expired"), time.time() - 61)
+        store.put("backend", [0, 1, 2], 1024, _Fitter([0, 1, 2], "valid"))
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 2)
+
+        self.assertEqual(store.find("backend", [0, 1], 1024)[0].name, "valid")
+        self.assertEqual(store.evict_expired(), 0)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 1)
+
+        with self.assertRaises(ValueError):
+            _ = MeasurementCalibrationStore(ttl=0)
+
+    def test_shared_directory(self):
+        """Test stores on the same directory, e.g. in other processes, share calibrations."""
+        writer = MeasurementCalibrationStore(self.tmp_dir.name)
+        reader = MeasurementCalibrationStore(self.tmp_dir.name)
+        self.assertIsNone(reader.find("backend", [0], 1024))
+
+        writer.put("backend", [0, 1], 1024, _Fitter([0, 1], "first"))
+        fitter, _, qubits = reader.find("backend", [0], 1024)
+        self.assertEqual(fitter.name, "first")
+        self.assertListEqual(qubits, [0, 1])
+
+        # replacing a calibration updates the readers
+        writer.put("backend", [0, 1], 1024, _Fitter([0, 1], "second"))
+        self.assertEqual(reader.get("backend", [0, 1], 1024)[0].name, "second")
+
+        reader.clear()
+        self.assertEqual(len(writer), 0)
+        self.assertListEqual(os.listdir(self.tmp_dir.name), [])
+
+    @unittest.skipUnless(hasattr(os, "getuid"), "file ownership is only checked on POSIX")
+    def test_private_directory(self):
+        """Test the directory is created private and a directory writable by others is refused."""
+        directory = os.path.join(self.tmp_dir.name, "calibrations")
+        _ = MeasurementCalibrationStore(directory)
+        self.assertEqual(os.stat(directory).st_mode & 0o077, 0)
+
+        os.chmod(directory, 0o777)
+        with self.assertRaises(ValueError):
+            _ = MeasurementCalibrationStore(directory)
+
+    def test_copy(self):
+        """Test stores and quantum instances holding them can be copied and pickled."""
+        store = MeasurementCalibrationStore(self.tmp_dir.name)
+        store.put("backend", [0, 1], 1024, _Fitter([0, 1]))
+        for copied in [copy.deepcopy(store), pickle.loads(pickle.dumps(store))]:
+            self.assertEqual(copied.get("backend", [0, 1], 1024)[0].qubits, [0, 1])
+            copied.put("backend", [2], 1024, _Fitter([2]))
+            self.assertIsNotNone(store.get("backend", [2], 1024))
+
+        quantum_instance = QuantumInstance(BasicAer.get_backend("qasm_simulator"), shots=1024)
+        for copied in [
+            copy.deepcopy(quantum_instance),
+            pickle.loads(pickle.dumps(quantum_instance)),
+        ]:
+            self.assertEqual(copied.run_config.shots, 1024)
+
+    def test_shared_by_quantum_instances(self):
+        """Test quantum instances sharing a store reuse each other's calibrations."""
+        backend = BasicAer.get_backend("qasm_simulator")
+        store = MeasurementCalibrationStore(self.tmp_dir.name)
+        first = QuantumInstance(backend, shots=1024, measurement_error_mitigation_store=store)
+        second = QuantumInstance(
+            backend,
+            shots=1024,
+            measurement_error_mitigation_store=MeasurementCalibrationStore(self.tmp_dir.name),
+        )
+        # pylint: disable=protected-access
+        first._store_meas_error_mitigation_fitter([0, 1, 2], _Fitter([0, 1, 2]))
+
+        fitter, timestamp = second._find_meas_error_mitigation_fitter([0, 2])
+        self.assertEqual(fitter.name, "fitter_subset")
+        self.assertListEqual(fitter.qubits, [0, 2])
+        self.assertFalse(second.maybe_refresh_cals_matrix(timestamp))
+
+        self.assertListEqual(second.cals_matrix([0, 1, 2])[0], [[3]])
+        self.assertListEqual(list(second.cals_matrix()), ["0_1_2_1024"])
+        self.assertEqual(second._find_meas_error_mitigation_fitter([3]), (None, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,13 +13,15 @@
 """ Test NumPy Eigen solver """
 
 import unittest
+from unittest.mock import patch
 from test.python.algorithms import QiskitAlgorithmsTestCase
 
 import numpy as np
 from ddt import data, ddt
+from scipy.sparse import linalg as sla
 
 from qiskit.algorithms import NumPyEigensolver
-from qiskit.opflow import PauliSumOp, X, Y, Z
+from qiskit.opflow import I, MatrixOp, PauliSumOp, X, Y, Z
 
 
 @ddt
@@ -56,6 +58,14 @@ class TestNumPyEigensolver(QiskitAlgorithmsTestCase):
             result.eigenvalues.real, [-1.85727503, -1.24458455, -0.88272215, -0.22491125]
         )
 
+    def test_ce_k4_matrix_free(self):
+        """Test for k=4 eigenvalues using a matrix-free operator"""
+        algo = NumPyEigensolver(k=4)
+        algo._MATRIX_FREE_NUM_QUBITS = 1
+        result = algo.compute_eigenvalues(operator=self.qubit_op ^ self.qubit_op)
+        expected = NumPyEigensolver(k=4).compute_eigenvalues(self.qubit_op ^ self.qubit_op)
+        np.testing.assert_array_almost_equal(result.eigenvalues, expected.eigenvalues)
+
     def test_ce_k4_filtered(self):
         """Test for k=4 eigenvalues with filter"""
 
@@ -97,6 +107,63 @@ class TestNumPyEigensolver(QiskitAlgorithmsTestCase):
         result = algo.compute_eigenvalues(operator=op)
         np.testing.assert_array_almost_equal(result.eigenvalues, [-1, 1])
 
+    @data(
+        ("real", False, "eigsh"),
+        ("real", True, "eigsh"),
+        ("complex", False, "eigsh"),
+        ("complex", True, "eigsh"),
+        ("non-hermitian", False, "eigs"),
+    )
+    def test_ce_k2_solver(self, config):
+        """Test Hermitian operators are solved with eigsh, other operators with eigs"""
+        kind, matrix_free, solver = config
+        if kind == "real":
+            operator = self.qubit_op ^ (X + 0.5 * Z)
+        elif kind == "complex":
+            operator = self.qubit_op ^ (Y + 0.5 * Z)
+        else:
+            operator = MatrixOp(np.triu(np.arange(64).reshape(8, 8)) - 20 * np.eye(8))
+        algo = NumPyEigensolver(k=2)
+        if matrix_free:
+            algo._MATRIX_FREE_NUM_QUBITS = 1
+        with patch.object(sla, "eigsh", wraps=sla.eigsh) as eigsh, patch.object(
+            sla, "eigs", wraps=sla.eigs
+        ) as eigs:
+            result = algo.compute_eigenvalues(operator=operator)
+        self.assertEqual(eigsh.called, solver == "eigsh")
+        self.assertEqual(eigs.called, solver == "eigs")
+
+        expected = np.sort_complex(np.linalg.eigvals(operator.to_matrix()))[:2]
+        np.testing.assert_array_almost_equal(result.eigenvalues, expected)
+        if solver == "eigsh":
+            self.assertFalse(np.iscomplexobj(result.eigenvalues))
+        for value, state in zip(result.eigenvalues, result.eigenstates.oplist):
+            vector = state.primitive.data
+            np.testing.assert_array_almost_equal(operator.to_matrix() @ vector, value * vector)
+
+    def test_aux_operators(self):
+        """Test the aux operators are evaluated on all eigenstates"""
+        aux_operators = [
+            PauliSumOp.from_list([("XX", 0.5), ("YY", 0.2), ("ZI", -1)]),
+            MatrixOp(np.diag([1.0, 2.0, 3.0, 4.0])),
+            None,
+            0 * (I ^ Z),
+            1e-14 * (I ^ I),
+        ]
+        algo = NumPyEigensolver(k=4)
+        result = algo.compute_eigenvalues(operator=self.qubit_op, aux_operators=aux_operators)
+
+        self.assertEqual(len(result.aux_operator_eigenvalues), 4)
+        for values, state in zip(result.aux_operator_eigenvalues, result.eigenstates.oplist):
+            vector = state.primitive.data
+            for value, operator in zip(values[:2], aux_operators[:2]):
+                expected = np.vdot(vector, operator.to_matrix() @ vector).real
+                self.assertAlmostEqual(value[0], expected)
+                self.assertEqual(value[1], 0)
+            self.assertIsNone(values[2])
+            self.assertEqual(tuple(values[3]), (0.0, 0))
+            self.assertEqual(tuple(values[4]), (0.0, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
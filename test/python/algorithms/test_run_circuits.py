@@ -0,0 +1,224 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test run_qobj, run_circuits and the streaming execution of the QuantumInstance """
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from test.python.algorithms import QiskitAlgorithmsTestCase
+from qiskit import BasicAer, QuantumCircuit, assemble, transpile
+from qiskit.providers import JobStatus
+from qiskit.test.mock import FakeYorktown
+from qiskit.utils import QuantumInstance
+from qiskit.utils.run_circuits import run_circuits, run_qobj
+
+
+class _SlowFakeYorktown(FakeYorktown):
+    """Fake device whose jobs report ``RUNNING`` once before they are ``DONE``."""
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.submitted = 0
+
+    def run(self, run_input, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.submitted += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return _SlowJob(self, super().run(run_input, **kwargs))
+
+
+class _SlowJob:
+    """Wraps a finished job and delays its final status by one poll."""
+
+    def __init__(self, backend, job):
+        self._backend = backend
+        self._job = job
+        self._polls = 0
+
+    def job_id(self):
+        return self._job.job_id()
+
+    def status(self):
+        self._polls += 1
+        if self._polls == 1:
+            return JobStatus.RUNNING
+        if self._polls == 2:
+            with self._backend.lock:
+                self._backend.in_flight -= 1
+        return JobStatus.DONE
+
+    def result(self, **kwargs):
+        return self._job.result(**kwargs)
+
+
+class _StuckFakeYorktown(_SlowFakeYorktown):
+    """Fake device whose jobs stay ``RUNNING`` forever."""
+
+    def __init__(self):
+        super().__init__()
+        self.polls = 0
+
+    def run(self, run_input, **kwargs):
+        job = super().run(run_input, **kwargs)
+
+        def status():
+            with self.lock:
+                self.polls += 1
+            return JobStatus.RUNNING
+
+        job.status = status
+        return job
+
+
+class TestRunCircuits(QiskitAlgorithmsTestCase):
+    """Test run_qobj and run_circuits"""
+
+    def setUp(self):
+        super().setUp()
+        self.circuits = []
+        for i in range(5):
+            circuit = QuantumCircuit(2, name="circuit_{}".format(i))
+            circuit.x(i % 2)
+            circuit.measure_all()
+            self.circuits.append(circuit)
+        self.expected = [{"01": 64}, {"10": 64}, {"01": 64}, {"10": 64}, {"01": 64}]
+
+    def test_run_qobj_split(self):
+        """Test a qobj split into several jobs is combined in order."""
+        backend = BasicAer.get_backend("qasm_simulator")
+        qobj = assemble(transpile(self.circuits, backend), shots=64)
+        for max_concurrent_jobs in [None, 1, 2]:
+            with self.subTest(max_concurrent_jobs=max_concurrent_jobs):
+                with patch("qiskit.utils.run_circuits.MAX_CIRCUITS_PER_JOB", 2):
+                    result = run_qobj(qobj, backend, max_concurrent_jobs=max_concurrent_jobs)
+                self.assertEqual(len(result.results), 5)
+                self.assertListEqual(
+                    [result.get_counts(i) for i in range(5)],
+                    self.expected,
+                )
+
+    def test_run_circuits_concurrent(self):
+        """Test jobs on a device are waited on concurrently with bounded concurrency."""
+        backend = _SlowFakeYorktown()
+        circuits = transpile(self.circuits, backend, optimization_level=0)
+        statuses = []
+        threads = set()
+
+        def job_callback(job_id, status, position, job):
+            statuses.append(status)
+            threads.add(threading.current_thread())
+
+        with patch("qiskit.utils.run_circuits.MAX_CIRCUITS_PER_JOB", 1):
+            result = run_circuits(
+                circuits,
+                backend,
+                qjob_config={"wait": 0.1},
+                run_config={"shots": 64},
+                job_callback=job_callback,
+                max_concurrent_jobs=2,
+            )
+        self.assertEqual(backend.submitted, 5)
+        self.assertEqual(backend.max_in_flight, 2)
+        self.assertEqual(statuses.count(JobStatus.DONE), 5)
+        # the callback is only called in the calling thread
+        self.assertSetEqual(threads, {threading.current_thread()})
+        self.assertListEqual(
+            [result.get_counts(circuit.name) for circuit in circuits], self.expected
+        )
+
+    def test_run_circuits_stops_polling(self):
+        """Test the workers stop polling their jobs when an exception is raised."""
+        backend = _StuckFakeYorktown()
+        circuits = transpile(self.circuits, backend, optimization_level=0)
+        errors = []
+        calls = []
+
+        def job_callback(job_id, status, position, job):
+            calls.append(job_id)
+            if len(calls) == 1:
+                raise ValueError("stop")
+
+        def run():
+            try:
+                run_circuits(
+                    circuits,
+                    backend,
+                    qjob_config={"wait": 0.1},
+                    run_config={"shots": 64},
+                    job_callback=job_callback,
+                )
+            except ValueError as ex:
+                errors.append(ex)
+
+        with patch("qiskit.utils.run_circuits.MAX_CIRCUITS_PER_JOB", 1):
+            thread = threading.Thread(target=run, daemon=True)
+            thread.start()
+            thread.join(timeout=30)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(len(errors), 1)
+        polls = backend.polls
+        time.sleep(0.3)
+        self.assertEqual(backend.polls, polls)
+
+    def test_streaming_execution(self):
+        """Test chunks are submitted while the following ones are transpiled."""
+        for backend in [BasicAer.get_backend("qasm_simulator"), _SlowFakeYorktown()]:
+            with self.subTest(backend=backend.name()):
+                quantum_instance = QuantumInstance(
+                    backend, shots=64, seed_transpiler=50, wait=0.2, streaming=True
+                )
+                transpiled = []
+                # the numbers of jobs submitted and in flight when a chunk is transpiled
+                in_flight = []
+
+                def transpile_chunk(circuits, quantum_instance=quantum_instance, backend=backend):
+                    if isinstance(backend, _SlowFakeYorktown):
+                        # wait for the jobs of the previous chunks to be submitted, which never
+                        # happens if the circuits are only submitted once all are transpiled
+                        deadline = time.time() + 10
+                        while backend.submitted < len(transpiled) and time.time() < deadline:
+                            time.sleep(0.01)
+                        with backend.lock:
+                            in_flight.append((backend.submitted, backend.in_flight))
+                    transpiled.append(len(circuits))
+                    return QuantumInstance.transpile(quantum_instance, circuits)
+
+                with patch("qiskit.utils.run_circuits.MAX_CIRCUITS_PER_JOB", 2), patch.object(
+                    quantum_instance, "transpile", side_effect=transpile_chunk
+                ):
+                    result = quantum_instance.execute(self.circuits)
+
+                self.assertListEqual(transpiled, [2, 2, 1])
+                if isinstance(backend, _SlowFakeYorktown):
+                    self.assertEqual(backend.submitted, 3)
+                    # the previous job is still running while the next chunk is transpiled
+                    self.assertEqual([submitted for submitted, _ in in_flight], [0, 1, 2])
+                    self.assertTrue(all(running > 0 for _, running in in_flight[1:]))
+                self.assertListEqual([result.get_counts(i) for i in range(5)], self.expected)
+
+    def test_invalid_max_concurrent_jobs(self):
+        """Test a non-positive number of concurrent jobs is rejected."""
+        backend = BasicAer.get_backend("qasm_simulator")
+        qobj = assemble(transpile(self.circuits, backend), shots=64)
+        with self.assertRaises(ValueError):
+            _ = run_qobj(qobj, backend, max_concurrent_jobs=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
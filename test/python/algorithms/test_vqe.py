@@ -14,7 +14,10 @@
 
 """ Test VQE """
 
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
 from test.python.algorithms import QiskitAlgorithmsTestCase
 import numpy as np
 from ddt import ddt, unpack, data
@@ -35,8 +38,8 @@ from qiskit.opflow import (
     ExpectationBase,
     TwoQubitReduction,
 )
-from qiskit.algorithms.optimizers import L_BFGS_B, COBYLA, SPSA, SLSQP
-from qiskit.algorithms import VQE, AlgorithmError
+from qiskit.algorithms.optimizers import L_BFGS_B, COBYLA, P_BFGS, SPSA, SLSQP
+from qiskit.algorithms import VQE, VQECheckpoint, AlgorithmError
 
 
 @ddt
@@ -155,6 +158,31 @@ class TestVQE(QiskitAlgorithmsTestCase):
         result = vqe.compute_minimum_eigenvalue(operator=self.h2_op)
         self.assertAlmostEqual(result.eigenvalue.real, self.h2_energy, places=places)
 
+    @data("statevector_simulator", "qasm_simulator")
+    def test_p_bfgs_reproducible(self, simulator):
+        """Test seeded VQE runs with P_BFGS give the same result."""
+        results = []
+        for _ in range(3):
+            algorithm_globals.random_seed = self.seed
+            quantum_instance = QuantumInstance(
+                BasicAer.get_backend(simulator),
+                shots=1024,
+                seed_simulator=self.seed,
+                seed_transpiler=self.seed,
+            )
+            vqe = VQE(
+                ansatz=self.ry_wavefunction,
+                optimizer=P_BFGS(maxfun=100),
+                quantum_instance=quantum_instance,
+            )
+            with patch("multiprocessing.cpu_count", return_value=4):
+                result = vqe.compute_minimum_eigenvalue(operator=self.h2_op)
+            results.append((result.eigenvalue, result.optimal_point))
+
+        for eigenvalue, optimal_point in results[1:]:
+            self.assertEqual(eigenvalue, results[0][0])
+            np.testing.assert_array_equal(optimal_point, results[0][1])
+
     def test_basic_aer_qasm(self):
         """Test the VQE on BasicAer's QASM simulator."""
         optimizer = SPSA(maxiter=300, last_avg=5)
@@ -337,6 +365,177 @@ class TestVQE(QiskitAlgorithmsTestCase):
         for params in history["parameters"]:
             self.assertTrue(all(isinstance(param, float) for param in params))
 
+    def test_compiled_expectation(self):
+        """Test the compiled expectation gives the same evaluations as the CircuitSampler."""
+
+        def run_vqe():
+            algorithm_globals.random_seed = self.seed
+            history = {"mean": [], "std": []}
+
+            def store_intermediate_result(_, __, mean, std):
+                history["mean"].append(mean)
+                history["std"].append(std)
+
+            vqe = VQE(
+                ansatz=self.ry_wavefunction,
+                optimizer=COBYLA(maxiter=5),
+                callback=store_intermediate_result,
+                quantum_instance=self.qasm_simulator,
+            )
+            result = vqe.compute_minimum_eigenvalue(operator=self.h2_op)
+            return vqe, result, history
+
+        vqe, result, history = run_vqe()
+        self.assertIsNotNone(vqe._compiled_expect_op)
+
+        with patch.object(VQE, "_compile_expectation", return_value=None):
+            _, sampler_result, sampler_history = run_vqe()
+
+        self.assertAlmostEqual(result.eigenvalue.real, sampler_result.eigenvalue.real)
+        np.testing.assert_allclose(history["mean"], sampler_history["mean"])
+        np.testing.assert_allclose(history["std"], sampler_history["std"])
+
+    def test_checkpoint_resume(self):
+        """Test an interrupted VQE resumed from its checkpoint ends as an uninterrupted one."""
+        initial_point = np.linspace(0.1, 0.8, 8)
+
+        def run_vqe(checkpoint=None, callback=None):
+            algorithm_globals.random_seed = self.seed
+            vqe = VQE(
+                ansatz=self.ry_wavefunction,
+                optimizer=SPSA(maxiter=30),
+                initial_point=initial_point,
+                callback=callback,
+                quantum_instance=self.statevector_simulator,
+                checkpoint=checkpoint,
+            )
+            return vqe.compute_minimum_eigenvalue(operator=self.h2_op)
+
+        expected_history = []
+        expected = run_vqe(
+            callback=lambda eval_count, _, value, __: expected_history.append((eval_count, value))
+        )
+
+        def interrupt(eval_count, *_):
+            if eval_count == 95:
+                raise KeyboardInterrupt
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # an interval which is not a multiple of the evaluations per SPSA iteration
+            checkpoint = VQECheckpoint(os.path.join(tmp_dir, "vqe.ckpt"), interval=7)
+            with self.assertRaises(KeyboardInterrupt):
+                run_vqe(checkpoint, interrupt)
+
+            state = checkpoint.load()
+            # saved at the start of an SPSA iteration, which takes two evaluations
+            self.assertEqual(state["eval_count"], 88)
+            self.assertEqual(len(state["history"]), 88)
+            self.assertFalse(state["finished"])
+            self.assertAlmostEqual(
+                state["best_value"], min(value for *_, value in state["history"])
+            )
+
+            result = run_vqe(checkpoint)
+            state = checkpoint.load()
+            self.assertTrue(state["finished"])
+            # each evaluation is in the history once, as in the uninterrupted run
+            self.assertListEqual(
+                [(eval_count, value) for eval_count, _, value in state["history"]],
+                expected_history,
+            )
+
+            checkpoint.remove()
+            self.assertIsNone(checkpoint.load())
+
+        np.testing.assert_array_equal(result.optimal_point, expected.optimal_point)
+        self.assertEqual(result.optimal_value, expected.optimal_value)
+
+    def test_checkpoint_other_ansatz(self):
+        """Test resuming from the checkpoint of another ansatz raises an error."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint = VQECheckpoint(os.path.join(tmp_dir, "vqe.ckpt"))
+            vqe = VQE(
+                ansatz=self.ry_wavefunction,
+                optimizer=COBYLA(maxiter=10),
+                quantum_instance=self.statevector_simulator,
+                checkpoint=checkpoint,
+            )
+            vqe.compute_minimum_eigenvalue(operator=self.h2_op)
+            state = checkpoint.load()
+            state["finished"] = False
+            checkpoint.save(state)
+
+            vqe.ansatz = self.ryrz_wavefunction
+            with self.assertRaises(AlgorithmError):
+                vqe.compute_minimum_eigenvalue(operator=self.h2_op)
+
+    def test_checkpoint_other_operator(self):
+        """Test resuming from the checkpoint of another operator raises an error."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint = VQECheckpoint(os.path.join(tmp_dir, "vqe.ckpt"))
+            vqe = VQE(
+                ansatz=self.ry_wavefunction,
+                optimizer=COBYLA(maxiter=10),
+                quantum_instance=self.statevector_simulator,
+                checkpoint=checkpoint,
+            )
+            vqe.compute_minimum_eigenvalue(operator=self.h2_op)
+            state = checkpoint.load()
+            state["finished"] = False
+            checkpoint.save(state)
+
+            with self.assertRaises(AlgorithmError):
+                vqe.compute_minimum_eigenvalue(operator=2 * self.h2_op)
+            # the checkpoint of the same problem is resumed
+            vqe.compute_minimum_eigenvalue(operator=self.h2_op)
+
+    def test_checkpoint_history_appended(self):
+        """Test each save of a checkpoint only appends the new evaluations to the history."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            checkpoint = VQECheckpoint(os.path.join(tmp_dir, "vqe.ckpt"), interval=5)
+            history = []
+            sizes = []
+            for eval_count in range(1, 31):
+                history.append((eval_count, np.zeros(8), -1.0))
+                if eval_count % 5 == 0:
+                    checkpoint.save({"eval_count": eval_count, "history": history})
+                    sizes.append(os.path.getsize(checkpoint.history_filename))
+            # the history file grows by the same amount with every save
+            self.assertEqual(len(set(np.diff(sizes))), 1)
+            self.assertEqual(len(checkpoint.load()["history"]), 30)
+
+            # a new history replaces the previous one
+            checkpoint.save({"eval_count": 5, "history": history[:5]})
+            self.assertEqual(os.path.getsize(checkpoint.history_filename), sizes[0])
+            self.assertEqual(len(checkpoint.load()["history"]), 5)
+
+    def test_warm_start(self):
+        """Test a scan with warm start starts from the previous optimum and reuses the
+        transpiled circuits."""
+        initial_points = []
+
+        def store_initial_point(eval_count, parameters, *_):
+            if eval_count == 1:
+                initial_points.append(parameters)
+
+        vqe = VQE(
+            ansatz=self.ry_wavefunction,
+            optimizer=COBYLA(maxiter=50),
+            initial_point=np.zeros(8),
+            callback=store_initial_point,
+            quantum_instance=self.qasm_simulator,
+            warm_start=True,
+        )
+        result = vqe.compute_minimum_eigenvalue(operator=self.h2_op)
+        transpiled = vqe._compiled_expect_op.circuits
+
+        vqe.compute_minimum_eigenvalue(operator=self.h2_op + 0.1 * (Z ^ Z))
+
+        np.testing.assert_array_equal(initial_points[1], result.optimal_point)
+        self.assertTrue(
+            all(new is old for new, old in zip(vqe._compiled_expect_op.circuits, transpiled))
+        )
+
     def test_reuse(self):
         """Test re-using a VQE algorithm instance."""
         vqe = VQE()
@@ -22,8 +22,9 @@ import numpy as np
 
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
 from qiskit.compiler import transpile, assemble
-from qiskit.providers.basicaer import QasmSimulatorPy
+from qiskit.providers.basicaer import QasmSimulatorPy, BasicAerError
 from qiskit.test import providers
 
 
@@ -137,6 +138,54 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
         counts = result.get_counts(0)
         self.assertEqual(counts, target)
 
+    def test_measure_sampler_overwritten_clbit(self):
+        """Test measure sampler if a clbit is measured into more than once."""
+        shots = 100
+        qr = QuantumRegister(2, "qr")
+        cr = ClassicalRegister(2, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr[1])
+        circuit.measure(qr[0], cr[0])
+        circuit.measure(qr[1], cr[0])
+        target = {"01": shots}
+        job = execute(circuit, backend=self.backend, shots=shots, seed_simulator=self.seed)
+        result = job.result()
+        counts = result.get_counts(0)
+        self.assertEqual(counts, target)
+
+    def test_measure_sampler_wide_memory(self):
+        """Test measure sampler with more clbits than fit in a 64-bit integer."""
+        shots = 100
+        qr = QuantumRegister(2, "qr")
+        cr = ClassicalRegister(70, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.x(qr[1])
+        circuit.measure(qr[0], cr[0])
+        circuit.measure(qr[1], cr[69])
+        job = execute(circuit, backend=self.backend, shots=shots, seed_simulator=self.seed)
+        result = job.result()
+        counts = result.get_counts(0)
+        self.assertEqual(sum(counts.values()), shots)
+        self.assertEqual(set(counts), {"1" + 68 * "0" + "0", "1" + 68 * "0" + "1"})
+
+    def test_memory_matches_counts(self):
+        """Test the memory of sampled shots agrees with the counts."""
+        shots = 500
+        qr = QuantumRegister(3, "qr")
+        cr = ClassicalRegister(3, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr)
+        circuit.measure(qr, cr)
+        job = execute(
+            circuit, backend=self.backend, shots=shots, seed_simulator=self.seed, memory=True
+        )
+        result = job.result()
+        memory = result.get_memory(0)
+        counts = result.get_counts(0)
+        self.assertEqual(len(memory), shots)
+        self.assertEqual(counts, {key: memory.count(key) for key in set(memory)})
+
     def test_qasm_simulator(self):
         """Test data counts output for single circuit run against reference."""
         result = self.backend.run(self.qobj).result()
@@ -237,6 +286,71 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
         self.log.info("test_teleport: relative error = %s", error)
         self.assertLess(error, 0.05)
 
+    def test_parallel_experiments(self):
+        """Test experiments run in parallel match experiments run serially."""
+        circuits = []
+        for num_qubits in range(1, 4):
+            qr = QuantumRegister(num_qubits, "qr")
+            cr = ClassicalRegister(num_qubits, "cr")
+            circuit = QuantumCircuit(qr, cr)
+            circuit.h(qr)
+            circuit.measure(qr, cr)
+            circuits.append(circuit)
+        serial = execute(circuits, backend=self.backend, seed_simulator=self.seed).result()
+        parallel = execute(
+            circuits, backend=self.backend, seed_simulator=self.seed, max_parallel_experiments=3
+        ).result()
+        self.assertEqual(serial.get_counts(), parallel.get_counts())
+
+    def test_deterministic_prefix(self):
+        """Test non-sampled circuits with gates before and after a reset."""
+        shots = 200
+        qr = QuantumRegister(2, "qr")
+        cr = ClassicalRegister(2, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.x(qr[0])
+        circuit.h(qr[1])
+        circuit.reset(qr[1])
+        circuit.x(qr[1])
+        circuit.measure(qr, cr)
+        job = execute(circuit, backend=self.backend, shots=shots, seed_simulator=self.seed)
+        counts = job.result().get_counts(0)
+        self.assertEqual(counts, {"11": shots})
+
+    def test_parameter_binds(self):
+        """Test parameter_binds match circuits bound before running."""
+        theta = Parameter("θ")
+        phi = Parameter("φ")
+        qr = QuantumRegister(2, "qr")
+        cr = ClassicalRegister(2, "cr")
+        circuit = QuantumCircuit(qr, cr)
+        circuit.rx(theta, qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.ry(2 * phi + theta, qr[1]).c_if(cr, 1)
+        circuit.rz(phi, qr[1])
+        circuit.measure(qr[1], cr[1])
+        circuit = transpile(circuit, self.backend)
+        binds = [{theta: 0.3, phi: 1.2}, {theta: 2.1, phi: -0.4}, {theta: 1.0, phi: 0.0}]
+        result = execute(
+            circuit, self.backend, parameter_binds=binds, seed_simulator=self.seed
+        ).result()
+        target = execute(
+            [circuit.bind_parameters(bind) for bind in binds],
+            self.backend,
+            seed_simulator=self.seed,
+        ).result()
+        self.assertEqual(len(result.results), len(binds))
+        self.assertEqual(result.get_counts(), target.get_counts())
+
+    def test_parameter_binds_mismatch(self):
+        """Test parameter_binds not matching the circuit parameters raise."""
+        theta = Parameter("θ")
+        circuit = QuantumCircuit(1, 1)
+        circuit.rz(theta, 0)
+        circuit.measure(0, 0)
+        with self.assertRaises(BasicAerError):
+            self.backend.run(circuit, parameter_binds=[{Parameter("φ"): 1.0}])
+
     def test_memory(self):
         """Test memory."""
         qr = QuantumRegister(4, "qr")
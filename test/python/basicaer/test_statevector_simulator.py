@@ -19,8 +19,10 @@ from qiskit.providers.basicaer import StatevectorSimulatorPy
 from qiskit.test import ReferenceCircuits
 from qiskit.test import providers
 from qiskit import QuantumRegister, QuantumCircuit, execute
+from qiskit.circuit import ParameterVector
+from qiskit.circuit.random import random_circuit
 from qiskit.quantum_info.random import random_unitary
-from qiskit.quantum_info import state_fidelity
+from qiskit.quantum_info import state_fidelity, Statevector
 
 
 class StatevectorSimulatorTest(providers.BackendTestCase):
@@ -82,6 +84,46 @@ class StatevectorSimulatorTest(providers.BackendTestCase):
                 fidelity = state_fidelity(psi_target, psi_out)
                 self.assertGreater(fidelity, 0.999)
 
+    def test_random_circuits(self):
+        """Test random circuits against the quantum_info statevector"""
+        for num_qubits in [1, 2, 4, 6]:
+            for seed in range(3):
+                circuit = random_circuit(num_qubits, 6, max_operands=3, seed=seed)
+                psi_target = Statevector.from_instruction(circuit).data
+                psi_out = execute(circuit, self.backend).result().get_statevector(0)
+                self.assertTrue(np.allclose(psi_out, psi_target))
+
+    def test_fused_single_qubit_gates(self):
+        """Test runs of single-qubit gates interleaved with multi-qubit gates"""
+        circuit = QuantumCircuit(3)
+        circuit.h(0)
+        circuit.t(0)
+        circuit.sx(1)
+        circuit.rz(0.3, 1)
+        circuit.cx(0, 2)
+        circuit.u(0.1, 0.2, 0.3, 0)
+        circuit.x(2)
+        circuit.unitary(random_unitary(4, seed=5), [2, 0])
+        circuit.ry(0.7, 1)
+        circuit.s(2)
+        psi_target = Statevector.from_instruction(circuit).data
+        psi_out = execute(circuit, self.backend).result().get_statevector(0)
+        self.assertTrue(np.allclose(psi_out, psi_target))
+
+    def test_parameter_binds(self):
+        """Test parameter_binds with a parameterized global phase"""
+        params = ParameterVector("θ", 3)
+        circuit = QuantumCircuit(2)
+        circuit.u(params[0], params[1], 0.2, 0)
+        circuit.cx(0, 1)
+        circuit.rz(params[2] - params[0], 1)
+        circuit.global_phase = params[1]
+        binds = [{params: [0.1, 0.2, 0.3]}, {params: [1.5, -0.7, 2.0]}]
+        result = execute(circuit, self.backend, parameter_binds=binds).result()
+        for i, bind in enumerate(binds):
+            psi_target = Statevector.from_instruction(circuit.bind_parameters(bind)).data
+            self.assertTrue(np.allclose(result.get_statevector(i), psi_target))
+
     def test_global_phase(self):
         """Test global_phase"""
         n_qubits = 4
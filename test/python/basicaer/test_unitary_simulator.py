@@ -18,6 +18,7 @@ import numpy as np
 
 from qiskit import execute
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit.random import random_circuit
 from qiskit.providers.basicaer import UnitarySimulatorPy
 from qiskit.quantum_info.operators.predicates import matrix_equal
 from qiskit.test import ReferenceCircuits
@@ -114,6 +115,15 @@ class BasicAerUnitarySimulatorPyTest(providers.BackendTestCase):
                 fidelity = process_fidelity(unitary_target, unitary_out)
                 self.assertGreater(fidelity, 0.999)
 
+    def test_random_circuits(self):
+        """Test random circuits against the quantum_info operator"""
+        for num_qubits in [1, 2, 4]:
+            for seed in range(3):
+                circuit = random_circuit(num_qubits, 6, max_operands=3, seed=seed)
+                unitary_target = Operator(circuit).data
+                unitary_out = execute(circuit, self.backend).result().get_unitary(0)
+                self.assertTrue(np.allclose(unitary_out, unitary_target))
+
     def test_global_phase(self):
         """Test global phase for XZH
         See https://github.com/Qiskit/qiskit-terra/issues/3083"""
@@ -16,10 +16,26 @@ import random
 import unittest
 from itertools import combinations, product
 from test.python.opflow import QiskitOpflowTestCase
+from unittest.mock import patch
 
+import numpy as np
 from ddt import data, ddt, unpack
 
-from qiskit.opflow import AbelianGrouper, commutator, I, OpflowError, Plus, SummedOp, X, Y, Z, Zero
+from qiskit.opflow import (
+    AbelianGrouper,
+    commutator,
+    I,
+    OpflowError,
+    PauliSumOp,
+    Plus,
+    SummedOp,
+    X,
+    Y,
+    Z,
+    Zero,
+)
+from qiskit.quantum_info import SparsePauliOp
+from qiskit.quantum_info.random import random_pauli_table
 
 
 @ddt
@@ -128,6 +144,47 @@ class TestAbelianGrouper(QiskitOpflowTestCase):
                     else:
                         self.assertTrue(commutator(op_1, op_2).is_zero())
 
+    @data("largest_first", "dsatur")
+    def test_abelian_grouper_strategy(self, strategy):
+        """Abelian grouper test with a coloring strategy"""
+        paulis = (
+            (I ^ I ^ X ^ X * 0.2)
+            + (Z ^ Z ^ X ^ X * 0.3)
+            + (Z ^ Z ^ Z ^ Z * 0.4)
+            + (X ^ X ^ Z ^ Z * 0.5)
+            + (X ^ X ^ X ^ X * 0.6)
+            + (I ^ X ^ X ^ X * 0.7)
+        )
+        for is_summed_op in [True, False]:
+            pauli_sum = paulis.to_pauli_op() if is_summed_op else paulis
+            grouped_sum = AbelianGrouper(strategy=strategy).convert(pauli_sum)
+            self.assertEqual(len(grouped_sum.oplist), 4)
+            for group in grouped_sum:
+                for op_1, op_2 in combinations(group, 2):
+                    if is_summed_op:
+                        self.assertEqual(op_1 @ op_2, op_2 @ op_1)
+                    else:
+                        self.assertTrue(commutator(op_1, op_2).is_zero())
+
+    def test_abelian_grouper_invalid_strategy(self):
+        """Abelian grouper test with an unknown coloring strategy"""
+        with self.assertRaises(OpflowError):
+            _ = AbelianGrouper(strategy="random")
+        with self.assertRaises(OpflowError):
+            _ = AbelianGrouper.group_subops(X + Z, strategy="random")
+
+    def test_anti_commutation_graph_blocks(self):
+        """Test the blockwise anti-commutation graph against a dense computation"""
+        table = random_pauli_table(70, 40, seed=7)
+        # Use small blocks so the graph is built from many blocks of rows
+        with patch("qiskit.opflow.converters.abelian_grouper._BLOCK_WORDS", 50):
+            edges = AbelianGrouper._anti_commutation_graph(PauliSumOp(SparsePauliOp(table)))
+        mat1 = np.array(table.Z + 2 * table.X, dtype=np.int8)
+        mat2 = mat1[:, None]
+        commutable = (((mat1 * mat2) * (mat1 - mat2)) == 0).all(axis=2)
+        expected = list(zip(*np.where(np.triu(np.logical_not(commutable), k=1))))
+        self.assertListEqual(edges, [(int(i), int(j)) for i, j in expected])
+
 
 if __name__ == "__main__":
     unittest.main()
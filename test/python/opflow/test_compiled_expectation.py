@@ -0,0 +1,144 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test CompiledExpectation """
+
+import pickle
+import unittest
+from test.python.opflow import QiskitOpflowTestCase
+
+import numpy as np
+from ddt import ddt, data
+
+from qiskit import BasicAer
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.opflow import (
+    X,
+    Y,
+    Z,
+    I,
+    ListOp,
+    StateFn,
+    PauliExpectation,
+    MatrixExpectation,
+    CircuitSampler,
+    CompiledExpectation,
+    OpflowError,
+)
+from qiskit.utils import QuantumInstance
+
+
+@ddt
+class TestCompiledExpectation(QiskitOpflowTestCase):
+    """Compiled expectation tests."""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.seed = 97
+        self.hamiltonian = (
+            0.5 * (X ^ Z ^ I)
+            + 0.3 * (Z ^ Z ^ Z)
+            - 0.7 * (Y ^ I ^ X)
+            + 0.2 * (I ^ I ^ Z)
+            + 0.1 * (X ^ X ^ X)
+        )
+        self.ansatz = RealAmplitudes(3, reps=2)
+        values = np.random.default_rng(self.seed).random((3, self.ansatz.num_parameters))
+        self.bindings = dict(zip(self.ansatz.parameters, values.T.tolist()))
+
+    def _quantum_instance(self, backend_name):
+        return QuantumInstance(
+            BasicAer.get_backend(backend_name),
+            shots=2048,
+            seed_simulator=self.seed,
+            seed_transpiler=self.seed,
+        )
+
+    @data(
+        ("qasm_simulator", True),
+        ("qasm_simulator", False),
+        ("statevector_simulator", True),
+        ("statevector_simulator", False),
+    )
+    def test_matches_circuit_sampler(self, config):
+        """Test the compiled expectation agrees with the CircuitSampler."""
+        backend_name, group_paulis = config
+        expectation = PauliExpectation(group_paulis=group_paulis)
+        for operator in [self.hamiltonian, ListOp([self.hamiltonian, 2 * (Z ^ Z ^ I)])]:
+            with self.subTest(operator=type(operator).__name__):
+                meas = expectation.convert(~StateFn(operator) @ StateFn(self.ansatz))
+                sampler = CircuitSampler(self._quantum_instance(backend_name))
+                expected = np.array(sampler.convert(meas, params=self.bindings).eval())
+                compiled = CompiledExpectation(meas, self._quantum_instance(backend_name))
+                np.testing.assert_allclose(compiled.evaluate(self.bindings), expected)
+
+    def test_variance(self):
+        """Test the variances agree with PauliExpectation.compute_variance."""
+        expectation = PauliExpectation()
+        meas = expectation.convert(~StateFn(self.hamiltonian) @ StateFn(self.ansatz, coeff=0.8))
+        sampler = CircuitSampler(self._quantum_instance("qasm_simulator"))
+        sampled = sampler.convert(meas, params=self.bindings)
+        compiled = CompiledExpectation(meas, self._quantum_instance("qasm_simulator"))
+        means, variances = compiled.evaluate(self.bindings, compute_variance=True)
+        self.assertEqual(compiled.num_groups, 4)
+        np.testing.assert_allclose(means, sampled.eval())
+        np.testing.assert_allclose(variances, expectation.compute_variance(sampled))
+
+    def test_single_binding(self):
+        """Test evaluating a single binding returns a scalar, as the CircuitSampler does."""
+        meas = PauliExpectation().convert(~StateFn(self.hamiltonian) @ StateFn(self.ansatz))
+        binding = {param: values[0] for param, values in self.bindings.items()}
+        compiled = CompiledExpectation(meas, self._quantum_instance("statevector_simulator"))
+        result = compiled.evaluate(binding)
+        self.assertEqual(np.shape(result), ())
+        self.assertAlmostEqual(result, compiled.evaluate(self.bindings)[0])
+
+    def test_unsupported_operator(self):
+        """Test operators without diagonal Pauli measurements are rejected."""
+        meas = MatrixExpectation().convert(~StateFn(self.hamiltonian) @ StateFn(self.ansatz))
+        with self.assertRaises(OpflowError):
+            _ = CompiledExpectation(meas, self._quantum_instance("statevector_simulator"))
+
+    def test_circuit_cache(self):
+        """Test the transpiled circuits are reused for equal measurement circuits, also with
+        new parameter objects of the same names."""
+        quantum_instance = self._quantum_instance("qasm_simulator")
+        expectation = PauliExpectation()
+        meas = expectation.convert(~StateFn(self.hamiltonian) @ StateFn(self.ansatz))
+        compiled = CompiledExpectation(meas, quantum_instance)
+
+        # the same measurement circuits with other coefficients
+        scaled = expectation.convert(~StateFn(2 * self.hamiltonian) @ StateFn(self.ansatz))
+        reused = CompiledExpectation(scaled, quantum_instance, circuit_cache=compiled.circuit_cache)
+        self.assertTrue(all(new is old for new, old in zip(reused.circuits, compiled.circuits)))
+        np.testing.assert_allclose(
+            reused.evaluate(self.bindings), 2 * compiled.evaluate(self.bindings)
+        )
+
+        # a rebuilt ansatz, e.g. in another process, and a pickled cache
+        ansatz = RealAmplitudes(3, reps=2)
+        rebuilt = expectation.convert(~StateFn(self.hamiltonian) @ StateFn(ansatz))
+        cache = pickle.loads(pickle.dumps(compiled.circuit_cache))
+        reused = CompiledExpectation(rebuilt, quantum_instance, circuit_cache=cache)
+        self.assertTrue(all(new is not old for new, old in zip(reused.circuits, compiled.circuits)))
+        self.assertEqual(set(reused.circuits[0].parameters), set(ansatz.parameters))
+        bindings = dict(zip(ansatz.parameters, self.bindings.values()))
+        np.testing.assert_allclose(reused.evaluate(bindings), compiled.evaluate(self.bindings))
+
+        # other measurement circuits are transpiled anew
+        other = expectation.convert(~StateFn(Z ^ Z ^ Z) @ StateFn(RealAmplitudes(3, reps=1)))
+        compiled_other = CompiledExpectation(other, quantum_instance, circuit_cache=cache)
+        self.assertEqual(compiled_other.circuits[0].num_parameters, 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,8 +34,10 @@ from qiskit.utils import algorithm_globals
 from qiskit.algorithms import VQE
 from qiskit.algorithms.optimizers import CG
 from qiskit.opflow import I, X, Y, Z, StateFn, CircuitStateFn, ListOp, CircuitSampler, TensoredOp
+from qiskit.opflow import OpflowError
 from qiskit.opflow.gradients import Gradient, NaturalGradient, Hessian
 from qiskit.opflow.gradients.qfi import QFI
+from qiskit.opflow.gradients.circuit_gradients import ParamShift
 from qiskit.opflow.gradients.circuit_qfis import LinCombFull, OverlapBlockDiag, OverlapDiag
 from qiskit.circuit import Parameter, ParameterExpression
 from qiskit.circuit import ParameterVector
@@ -948,6 +950,89 @@ class TestGradients(QiskitOpflowTestCase):
             self.assertTrue(np.allclose(result[0], correct_values[i][0], atol=0.1))
             self.assertTrue(np.allclose(result[1], correct_values[i][1], atol=0.1))
 
+    @data("param_shift", "fin_diff")
+    def test_batched_param_shift_gradient_wrapper(self, method):
+        """Test the batched parameter shift gradient of an expectation value, including
+        gate parameters given by expressions and shared between gates."""
+        a = Parameter("a")
+        b = Parameter("b")
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.ry(2 * a + b, 0)
+        qc.rx(a * b, 1)
+        qc.cx(0, 1)
+        qc.rz(a, 1)
+        qc.u(a, b, 0.3, 0)
+        ham = 0.5 * (X ^ Z) - 0.3 * (Y ^ Y) + (Z ^ I)
+        op = ~StateFn(ham) @ StateFn(qc)
+
+        q_instance = QuantumInstance(BasicAer.get_backend("statevector_simulator"))
+        gradient = Gradient(grad_method=method)
+        batched_grad = gradient.gradient_wrapper(op, [a, b], backend=q_instance)
+        exact_grad = gradient.gradient_wrapper(op, [a, b])
+        single_grad = gradient.gradient_wrapper(op, [a, b], grad_params=b, backend=q_instance)
+
+        for values in [[0.3, -0.7], [np.pi / 4, 0.1]]:
+            with self.subTest(values=values):
+                expected = exact_grad(values)
+                np.testing.assert_array_almost_equal(batched_grad(values), expected, decimal=5)
+                self.assertAlmostEqual(single_grad(values), expected[1], places=5)
+
+    def test_batched_param_shift_custom_combo_fn(self):
+        """Test the batched parameter shift rejects a ListOp with a custom combo_fn, and the
+        gradient wrapper falls back to the chain rule through the combo_fn."""
+        a = Parameter("a")
+        b = Parameter("b")
+        qc = QuantumCircuit(1)
+        qc.ry(a, 0)
+        qc.rx(2 * b, 0)
+        op = ListOp(
+            [~StateFn(Z) @ CircuitStateFn(qc)],
+            combo_fn=lambda x: x[0] ** 2,
+            grad_combo_fn=lambda x: 2 * x[0],
+        )
+        q_instance = QuantumInstance(BasicAer.get_backend("statevector_simulator"))
+
+        with self.assertRaises(OpflowError):
+            ParamShift().gradient_wrapper(op, [a, b], backend=q_instance)
+
+        grad = Gradient().gradient_wrapper(op, [a, b], backend=q_instance)
+        values = [0.4, -0.2]
+        # f = <Z>^2 with <Z> = cos(a) cos(2b)
+        exp = np.cos(values[0]) * np.cos(2 * values[1])
+        expected = [
+            -2 * exp * np.sin(values[0]) * np.cos(2 * values[1]),
+            -4 * exp * np.cos(values[0]) * np.sin(2 * values[1]),
+        ]
+        np.testing.assert_array_almost_equal(np.ravel(grad(values)), expected)
+
+    def test_param_shift_parameter_list(self):
+        """Test ParamShift returns the gradients for a list of parameters."""
+        a = Parameter("a")
+        b = Parameter("b")
+        qc = QuantumCircuit(1)
+        qc.ry(a, 0)
+        qc.rx(b, 0)
+        op = ~StateFn(Z) @ StateFn(qc)
+
+        grad = ParamShift().convert(op, [a, b])
+        values = grad.assign_parameters({a: 0.4, b: -0.2}).eval()
+        # <Z> = cos(a) cos(b)
+        expected = [-np.sin(0.4) * np.cos(-0.2), -np.cos(0.4) * np.sin(-0.2)]
+        np.testing.assert_array_almost_equal(values, expected)
+
+    def test_batched_param_shift_template(self):
+        """Test the batched parameter shift builds a single template with a shift per gate
+        parameter, instead of shifted copies of the operator."""
+        ansatz = RealAmplitudes(3, reps=2)
+        params = list(ansatz.parameters)
+        circuit = ansatz.decompose()
+        template, shift_params, weights = ParamShift._shift_template(circuit, params)
+
+        self.assertEqual(len(shift_params), len(params))
+        self.assertEqual(len(template.parameters), 2 * len(params))
+        self.assertEqual(sorted(weights), [(i, i, 1.0) for i in range(len(params))])
+
     @slow_test
     def test_vqe(self):
         """Test VQE with gradients"""
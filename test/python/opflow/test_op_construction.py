@@ -55,6 +55,7 @@ from qiskit.opflow import (
     Zero,
     OpflowError,
     SparseVectorStateFn,
+    PauliSumOp,
 )
 
 
@@ -228,6 +229,21 @@ class TestOpConstruction(QiskitOpflowTestCase):
         # unitary = execute(qc, BasicAer.get_backend('unitary_simulator')).result().get_unitary()
         # np.testing.assert_array_almost_equal(new_op.primitive.to_matrix(), unitary)
 
+    def test_to_linear_operator(self):
+        """to linear operator test"""
+        vec = np.arange(1, 9) - 0.5j
+        ops = [
+            (-1j * X) ^ Y ^ Z,
+            (X ^ Y ^ Z) + 0.5 * (Z ^ Z ^ I),
+            (Z ^ X ^ I) + PauliSumOp.from_list([("YYI", 0.2), ("XIZ", -1)]),
+            2 * SummedOp([X ^ X ^ X, (Z ^ Z ^ Z) + (X ^ Y ^ Z)], coeff=0.5),
+            (H ^ I ^ Z) + (X ^ X ^ X),
+        ]
+        for op in ops:
+            with self.subTest(op=op):
+                lin_op = op.to_linear_operator()
+                np.testing.assert_array_almost_equal(lin_op.matvec(vec), op.to_matrix() @ vec)
+
     def test_to_matrix(self):
         """to matrix text"""
         np.testing.assert_array_equal(X.to_matrix(), Operator.from_label("X").data)
@@ -448,6 +464,39 @@ class TestOpConstruction(QiskitOpflowTestCase):
             expected = SummedOp([PauliOp(Pauli("ZZ")), PauliOp(Pauli("IZ")), PauliOp(Pauli("ZX"))])
             self.assertEqual(sum_op.to_pauli_op(), expected)
 
+    def test_summed_op_of_paulis(self):
+        """Test SummedOps of Paulis are evaluated as a single PauliSumOp."""
+        sum_op = SummedOp(
+            [2 * (X ^ Y ^ Z), PauliOp(Pauli("-iXXZ"), 1j), 0.5 * (Z ^ Z ^ I), (X ^ Y ^ Z)],
+            coeff=0.7,
+        )
+        expected = 0.7 * sum(op.to_matrix() for op in sum_op.oplist)
+
+        with self.subTest("matrices"):
+            np.testing.assert_array_almost_equal(sum_op.to_matrix(), expected)
+            np.testing.assert_array_almost_equal(sum_op.to_spmatrix().toarray(), expected)
+            self.assertIsInstance(sum_op.to_matrix_op(), MatrixOp)
+            np.testing.assert_array_almost_equal(sum_op.to_matrix_op().to_matrix(), expected)
+
+        with self.subTest("eval"):
+            for front in ["101", {"101": 0.6, "011": 0.8}, np.arange(8) / np.sqrt(140)]:
+                state = StateFn(front).to_matrix()
+                result = sum_op.eval(front)
+                self.assertIsInstance(result, type(StateFn(front)))
+                np.testing.assert_array_almost_equal(result.to_matrix(), expected @ state)
+
+        with self.subTest("reduce"):
+            reduced = sum_op.reduce()
+            self.assertIsInstance(reduced, PauliSumOp)
+            self.assertEqual(len(reduced), 3)
+            np.testing.assert_array_almost_equal(reduced.to_matrix(), expected)
+            self.assertEqual(SummedOp([X, X]).reduce(), PauliOp(Pauli("X"), 2))
+
+        with self.subTest("collapse_summands"):
+            collapsed = sum_op.collapse_summands()
+            self.assertListEqual([str(op.primitive) for op in collapsed], ["XYZ", "-iXXZ", "ZZI"])
+            np.testing.assert_array_almost_equal([op.coeff for op in collapsed], [2.1, 0.7j, 0.35])
+
     def test_compose_op_of_different_dim(self):
         """
         Test if smaller operator expands to correct dim when composed with bigger operator.
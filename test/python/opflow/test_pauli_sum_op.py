@@ -31,6 +31,7 @@ from qiskit.opflow import (
     OperatorStateFn,
     PauliSumOp,
     SummedOp,
+    VectorStateFn,
     X,
     Y,
     Z,
@@ -194,6 +195,14 @@ class TestPauliSumOp(QiskitOpflowTestCase):
         for bstr1, bstr2 in product(full_basis, full_basis):
             self.assertEqual(pauli_op.eval(bstr1).eval(bstr2), mat_op.eval(bstr1).eval(bstr2))
 
+    def test_eval_vector(self):
+        """eval test with a vector state"""
+        pauli_sum = 2 * ((X ^ Y ^ Z) + 3 * (I ^ Z ^ Z) - 0.5j * (Y ^ I ^ X))
+        vec = np.arange(8) / np.linalg.norm(np.arange(8))
+        target = pauli_sum.eval(VectorStateFn(vec, coeff=0.5))
+        self.assertIsInstance(target, VectorStateFn)
+        np.testing.assert_allclose(target.to_matrix(), 0.5 * pauli_sum.to_matrix().dot(vec))
+
     def test_exp_i(self):
         """exp_i test"""
         # TODO: add tests when special methods are added
@@ -25,6 +25,7 @@ from qiskit.quantum_info import Statevector
 
 from qiskit.opflow import (
     StateFn,
+    DictStateFn,
     Zero,
     One,
     Plus,
@@ -239,6 +240,59 @@ class TestStateConstruction(QiskitOpflowTestCase):
         self.assertEqual(len(ex), 3)
         self.assertEqual(ex.eval(), 1)
 
+    def test_dict_state_fn_pauli_eval(self):
+        """Test evaluating Pauli operators on a DictStateFn against matrices"""
+        state = StateFn({"101": 0.5, "011": 0.5j, "110": -0.5, "000": 0.5})
+        for op in [X ^ Y ^ Z, Z ^ I ^ Z, (0.5 * X ^ Y ^ I) + (0.3 * Z ^ Z ^ Z) + (I ^ I ^ Y)]:
+            with self.subTest(op=str(op)):
+                np.testing.assert_allclose(
+                    op.eval(state).to_matrix(), op.to_matrix() @ state.to_matrix(), atol=1e-10
+                )
+                expectation = StateFn(op, is_measurement=True).eval(state)
+                target = np.vdot(state.to_matrix(), op.to_matrix() @ state.to_matrix())
+                self.assertAlmostEqual(expectation, target)
+
+    def test_dict_state_fn_algebra(self):
+        """Test DictStateFn algebra on states wider than 64 qubits"""
+        num_qubits = 70
+        key1 = "1" + "0" * (num_qubits - 2) + "1"
+        key2 = "01" * (num_qubits // 2)
+        state1 = StateFn({key1: 0.6, key2: 0.8})
+        state2 = StateFn({key2: 1.0})
+        self.assertEqual((state1 + state2).primitive, {key1: 0.6, key2: 1.8})
+        self.assertAlmostEqual((~state1).eval(state2), 0.8)
+        tensored = state1 ^ StateFn({"1": 1.0})
+        self.assertIsInstance(tensored, DictStateFn)
+        self.assertEqual(tensored.primitive, {key1 + "1": 0.6, key2 + "1": 0.8})
+        permutation = list(reversed(range(num_qubits)))
+        permuted = state1.permute(permutation)
+        self.assertEqual(permuted.primitive, {key1[::-1]: 0.6, key2[::-1]: 0.8})
+        self.assertEqual((Z ^ num_qubits).eval(state2).primitive, {key2: (-1) ** (num_qubits // 2)})
+
+    def test_dict_state_fn_spaced_keys(self):
+        """Test DictStateFn with keys of several registers separated by spaces"""
+        state = StateFn({"01 1": 0.6, "10 0": 0.8})
+        self.assertEqual(state.num_qubits, 3)
+        self.assertEqual((state + StateFn({"011": 1.0})).primitive, {"011": 1.6, "100": 0.8})
+        self.assertEqual((~state).primitive, {"011": 0.6, "100": 0.8})
+        self.assertEqual((state ^ StateFn({"1": 1.0})).primitive, {"0111": 0.6, "1001": 0.8})
+        self.assertEqual(state.permute([2, 1, 0]).primitive, {"110": 0.6, "001": 0.8})
+        self.assertAlmostEqual((~state).eval(StateFn({"011": 1.0})), 0.6)
+        self.assertEqual(set(state.sample(shots=100)), {"011", "100"})
+        np.testing.assert_allclose(state.to_matrix(), [0, 0, 0, 0.6, 0.8, 0, 0, 0])
+
+    def test_dict_state_fn_add_keeps_arrays(self):
+        """Test adding DictStateFns built from arrays does not build their dicts"""
+        state = StateFn({"01": 0.6, "10": 0.8}) ^ StateFn({"1": 1.0})
+        other = StateFn({"1": 1.0}) ^ StateFn({"01": 1.0})
+        self.assertIsNone(state._primitive)
+        for summed in [state + other, state + state]:
+            self.assertIsNone(state._primitive)
+            self.assertIsNone(other._primitive)
+            self.assertIsNone(summed._primitive)
+        self.assertEqual((state + other).primitive, {"011": 0.6, "101": 1.8})
+        self.assertEqual((state + state).coeff, 2.0)
+
 
 if __name__ == "__main__":
     unittest.main()
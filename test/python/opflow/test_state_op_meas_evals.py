@@ -20,6 +20,7 @@ from test.python.opflow import QiskitOpflowTestCase
 from ddt import ddt, data
 import numpy
 
+from qiskit import BasicAer
 from qiskit.circuit import QuantumCircuit, Parameter
 from qiskit.utils import QuantumInstance
 from qiskit.opflow import StateFn, Zero, One, H, X, I, Z, Plus, Minus, CircuitSampler, ListOp
@@ -183,6 +184,78 @@ class TestStateOpMeasEvals(QiskitOpflowTestCase):
         else:
             self.assertEqual(len(sampler._cached_ops.keys()), 2)
 
+    def test_circuit_sampler_lru_caching(self):
+        """Test the LRU cache keeps the most recently used operators and shares circuits."""
+        x = Parameter("x")
+        circuit = QuantumCircuit(1)
+        circuit.ry(x, 0)
+        other = QuantumCircuit(1)
+        other.rx(x, 0)
+        expr1 = ~StateFn(Z) @ StateFn(circuit)
+        expr2 = ~StateFn(2 * Z) @ StateFn(circuit)
+        expr3 = ~StateFn(Z) @ StateFn(other)
+
+        backend = BasicAer.get_backend("statevector_simulator")
+        sampler = CircuitSampler(backend, caching="lru", max_cache_size=2)
+        reference = CircuitSampler(backend)
+
+        for expr in [expr1, expr2, expr1, expr3, expr1, expr2]:
+            with self.subTest(expr=expr):
+                self.assertAlmostEqual(
+                    sampler.convert(expr, params={x: 0.3}).eval(),
+                    reference.convert(expr, params={x: 0.3}).eval(),
+                )
+
+        info = sampler.cache_info
+        # expr2 was evicted by expr3, since expr1 had been used more recently
+        self.assertEqual((info.hits, info.misses, info.evictions), (2, 4, 2))
+        self.assertEqual(info.operators, 2)
+        # expr1 and expr2 share their circuit
+        self.assertEqual(info.circuits, 1)
+        self.assertIsNone(info.memory)
+
+    def test_circuit_sampler_cache_memory_bound(self):
+        """Test the LRU cache bounded by memory always keeps the last operator."""
+        x = Parameter("x")
+        circuit = QuantumCircuit(1)
+        circuit.ry(x, 0)
+        sampler = CircuitSampler(
+            BasicAer.get_backend("qasm_simulator"), caching="lru", max_cache_memory=1
+        )
+        for op in [Z, X, Z]:
+            _ = sampler.convert(~StateFn(op) @ StateFn(circuit), params={x: 0.3})
+
+        info = sampler.cache_info
+        self.assertEqual((info.operators, info.circuits, info.evictions), (1, 1, 2))
+        self.assertGreater(info.memory, 0)
+
+    def test_circuit_sampler_cache_custom_instructions(self):
+        """Test custom instructions with the same name but different bodies do not share templates."""
+        blocks = []
+        for gate in ["h", "x"]:
+            body = QuantumCircuit(1, name="blk")
+            getattr(body, gate)(0)
+            blocks.append(body.to_instruction())
+        circuits = []
+        for block in blocks:
+            circuit = QuantumCircuit(1)
+            circuit.append(block, [0])
+            circuits.append(circuit)
+
+        sampler = CircuitSampler(BasicAer.get_backend("statevector_simulator"), caching="lru")
+        for circuit, expected in zip(circuits, [[1, 1], [0, numpy.sqrt(2)]]):
+            with self.subTest(expected=expected):
+                result = sampler.convert(StateFn(circuit)).eval()
+                numpy.testing.assert_allclose(
+                    result.to_matrix(), numpy.array(expected) / numpy.sqrt(2), atol=1e-10
+                )
+        self.assertEqual(sampler.cache_info.circuits, 2)
+
+    def test_circuit_sampler_invalid_caching(self):
+        """Test an unknown caching strategy raises a ValueError."""
+        with self.assertRaises(ValueError):
+            _ = CircuitSampler(BasicAer.get_backend("qasm_simulator"), caching="none")
+
     def test_adjoint_nonunitary_circuit_raises(self):
         """Test adjoint on a non-unitary circuit raises a OpflowError instead of CircuitError."""
         circuit = QuantumCircuit(1)
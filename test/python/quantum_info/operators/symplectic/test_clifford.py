@@ -392,6 +392,29 @@ class TestCliffordGates(QiskitTestCase):
             cliff = _append_circuit(cliff, "sdg", [0])
             self.assertEqual(cliff, cliff1)
 
+    @combine(num_qubits=[1, 2, 5, 70])
+    def test_append_circuit_packed(self, num_qubits):
+        """Test appending a {num_qubits}-qubit circuit on a packed table"""
+        samples = 3
+        num_gates = 200
+        seed = 900
+        for i in range(samples):
+            circ = random_clifford_circuit(num_qubits, num_gates, seed=seed + i)
+            target = Clifford(np.eye(2 * num_qubits))
+            for instr, qargs, _ in circ:
+                qubits = [circ.qubits.index(qubit) for qubit in qargs]
+                target = _append_circuit(target, instr, qubits)
+            self.assertEqual(Clifford(circ), target)
+
+    def test_append_circuit_non_clifford(self):
+        """Test a non-Clifford gate leaves the Clifford unchanged"""
+        circ = random_clifford_circuit(3, 20, seed=910)
+        circ.t(0)
+        cliff = Clifford(np.eye(6))
+        with self.assertRaises(QiskitError):
+            _append_circuit(cliff, circ)
+        self.assertEqual(cliff, Clifford(np.eye(6)))
+
 
 @ddt
 class TestCliffordSynthesis(QiskitTestCase):
@@ -641,6 +664,18 @@ class TestCliffordOperators(QiskitTestCase):
             target = Clifford(circ1.extend(circ2))
             self.assertEqual(target, value)
 
+    @combine(num_qubits=[10, 40])
+    def test_compose_random(self, num_qubits):
+        """Test compose method for random {num_qubits}-qubit Cliffords"""
+        samples = 3
+        seed = 610
+        for i in range(samples):
+            cliff1 = random_clifford(num_qubits, seed=seed + i)
+            cliff2 = random_clifford(num_qubits, seed=seed + samples + i)
+            target = _append_circuit(cliff1.copy(), cliff2.to_circuit())
+            self.assertEqual(cliff1.compose(cliff2), target)
+            self.assertEqual(cliff2.compose(cliff1, front=True), target)
+
     @combine(num_qubits=[1, 2, 3])
     def test_dot_method(self, num_qubits):
         """Test dot method"""
@@ -1374,6 +1374,54 @@ class TestPauliTableMethods(QiskitTestCase):
             target = []
             self.assertEqual(value, target)
 
+    def test_commutes_packed(self):
+        """Test commutes methods for tables spanning several packed words."""
+        rng = np.random.default_rng(1234)
+        num_qubits = 130
+        pauli = PauliTable(rng.integers(2, size=(20, 2 * num_qubits), dtype=bool))
+        other = PauliTable(rng.integers(2, size=(3, 2 * num_qubits), dtype=bool))
+
+        def symp_commutes(table, row):
+            x1, z1 = table.X, table.Z
+            x2, z2 = row.X, row.Z
+            return np.sum((x1 & z2) ^ (z1 & x2), axis=1) % 2 == 0
+
+        with self.subTest(msg="commutes"):
+            value = pauli.commutes(other[0])
+            target = symp_commutes(pauli, other[0])
+            self.assertEqual(list(value), list(target))
+
+        with self.subTest(msg="commutes_with_all"):
+            value = pauli.commutes_with_all(other)
+            target = np.where(np.all([symp_commutes(pauli, row) for row in other], axis=0))[0]
+            self.assertEqual(list(value), list(target))
+
+        with self.subTest(msg="anticommutes_with_all"):
+            value = pauli.anticommutes_with_all(other[:1])
+            target = np.where(~symp_commutes(pauli, other[0]))[0]
+            self.assertEqual(list(value), list(target))
+
+    def test_pack_bits_round_trip(self):
+        """Test packing and unpacking boolean arrays into words."""
+        rng = np.random.default_rng(4321)
+        for cols in [1, 7, 64, 65, 200]:
+            with self.subTest(msg="{} columns".format(cols)):
+                array = rng.integers(2, size=(5, cols), dtype=bool)
+                words = PauliTable._pack_bits(array)
+                self.assertEqual(words.shape, (5, -(-cols // 64)))
+                self.assertEqual(list(PauliTable._count_bits(words)), list(np.sum(array, axis=1)))
+                np.testing.assert_array_equal(PauliTable._unpack_bits(words, cols), array)
+
+    def test_unique_packed(self):
+        """Test unique method for tables spanning several packed words."""
+        rng = np.random.default_rng(2021)
+        array = rng.integers(2, size=(6, 150), dtype=bool)
+        pauli = PauliTable(np.vstack([array, array[::2], array[1:3]]))
+        value, index, counts = pauli.unique(return_index=True, return_counts=True)
+        self.assertEqual(value, PauliTable(array))
+        self.assertEqual(list(index), list(range(6)))
+        self.assertEqual(list(counts), [2, 2, 3, 1, 2, 1])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,7 +21,8 @@ import numpy as np
 from qiskit import QiskitError
 from qiskit.test import QiskitTestCase
 from qiskit.quantum_info.random import random_unitary
-from qiskit.quantum_info.operators import Operator, SparsePauliOp, PauliTable
+from qiskit.quantum_info.operators import Operator, SparsePauliOp, PauliTable, Pauli
+from qiskit.quantum_info.operators import SparsePauliOpAccumulator
 
 
 def pauli_mat(label):
@@ -340,6 +341,54 @@ class TestSparsePauliOpMethods(QiskitTestCase):
         value = (spp_op / value).to_operator()
         self.assertEqual(value, target)
 
+    @combine(front=[True, False])
+    def test_compose_packed(self, front):
+        """Test compose phases for operators spanning several packed words."""
+        num_qubits = 70
+        spp_op1 = self.random_spp_op(num_qubits, 5)
+        spp_op2 = self.random_spp_op(num_qubits, 3)
+        value = spp_op1.compose(spp_op2, front=front)
+        labels1 = spp_op1.table.to_labels()
+        labels2 = spp_op2.table.to_labels()
+        phases = {"": 1, "-": -1, "i": 1j, "-i": -1j}
+        for i, (label1, coeff1) in enumerate(zip(labels1, spp_op1.coeffs)):
+            for j, (label2, coeff2) in enumerate(zip(labels2, spp_op2.coeffs)):
+                target = Pauli(label1).compose(Pauli(label2), front=front).to_label()
+                index = i * len(labels2) + j
+                self.assertEqual(value.table.to_labels()[index], target[-num_qubits:])
+                self.assertAlmostEqual(
+                    value.coeffs[index], phases[target[:-num_qubits]] * coeff1 * coeff2
+                )
+
+    @combine(num_qubits=[1, 2, 3, 4], num_terms=[2, 64])
+    def test_to_matrix_terms(self, num_qubits, num_terms):
+        """Test {num_qubits}-qubit to_matrix with {num_terms} terms."""
+        spp_op = self.random_spp_op(num_qubits, num_terms)
+        target = sum(mat for mat in spp_op.matrix_iter())
+        np.testing.assert_allclose(spp_op.to_matrix(), target)
+        np.testing.assert_allclose(spp_op.to_matrix(sparse=True).toarray(), target)
+
+    @combine(num_qubits=[1, 2, 3, 4], num_terms=[2, 64])
+    def test_matvec(self, num_qubits, num_terms):
+        """Test {num_qubits}-qubit matrix-free product with {num_terms} terms."""
+        spp_op = self.random_spp_op(num_qubits, num_terms)
+        mat = spp_op.to_matrix()
+        vecs = self.RNG.uniform(-1, 1, size=(2 ** num_qubits, 3))
+        np.testing.assert_allclose(spp_op._matvec(vecs), mat.dot(vecs))
+        np.testing.assert_allclose(spp_op._matvec(vecs[:, 0]), mat.dot(vecs[:, 0]))
+
+    @combine(num_qubits=[1, 2, 3, 4], num_terms=[2, 64])
+    def test_to_linear_operator(self, num_qubits, num_terms):
+        """Test {num_qubits}-qubit to_linear_operator with {num_terms} terms."""
+        spp_op = self.random_spp_op(num_qubits, num_terms)
+        mat = spp_op.to_matrix()
+        lin_op = spp_op.to_linear_operator()
+        vecs = self.RNG.uniform(-1, 1, size=(2 ** num_qubits, 3))
+        self.assertEqual(lin_op.shape, mat.shape)
+        np.testing.assert_allclose(lin_op.matvec(vecs[:, 0]), mat.dot(vecs[:, 0]))
+        np.testing.assert_allclose(lin_op.matmat(vecs), mat.dot(vecs))
+        np.testing.assert_allclose(lin_op.rmatvec(vecs[:, 0]), mat.conj().T.dot(vecs[:, 0]))
+
     def test_simplify(self):
         """Test simplify method"""
         coeffs = [3 + 1j, -3 - 1j, 0, 4, -5, 2.2, -1.1j]
@@ -350,6 +399,65 @@ class TestSparsePauliOpMethods(QiskitTestCase):
         target = SparsePauliOp(PauliTable.from_labels(target_labels), target_coeffs)
         self.assertEqual(value, target)
 
+    @combine(num_qubits=[3, 40])
+    def test_simplify_random(self, num_qubits):
+        """Test simplify method on random {num_qubits}-qubit operators"""
+        spp_op = self.random_spp_op(num_qubits, 5)
+        spp_op = spp_op + spp_op[[3, 0, 1]] - spp_op[[2]]
+        value = spp_op.simplify()
+        # Target from a lexicographically sorted unique table
+        table, inverse = np.unique(spp_op.table.array, return_inverse=True, axis=0)
+        coeffs = np.zeros(len(table), dtype=complex)
+        np.add.at(coeffs, inverse, spp_op.coeffs)
+        non_zero = np.abs(coeffs) > 1e-8
+        target = SparsePauliOp(table[non_zero], coeffs[non_zero])
+        self.assertEqual(value, target)
+
+
+class TestSparsePauliOpAccumulator(QiskitTestCase):
+    """Tests for SparsePauliOpAccumulator."""
+
+    def test_accumulate(self):
+        """Test accumulating terms with duplicates."""
+        acc = SparsePauliOpAccumulator(2, compact_size=2)
+        acc.add("XX", 0.5)
+        acc.add(SparsePauliOp.from_list([("ZZ", 1), ("XX", 0.5), ("IY", 2j)]))
+        acc.add(SparsePauliOp.from_list([("IY", 1), ("ZZ", -1)]), coeff=-2j)
+        target = SparsePauliOp.from_list([("ZZ", 1 + 2j), ("XX", 1)])
+        self.assertEqual(acc.to_operator(), target)
+
+    def test_accumulate_matches_simplify(self):
+        """Test accumulator matches simplify of the full sum."""
+        rng = np.random.default_rng(12)
+        num_qubits = 70
+        acc = SparsePauliOpAccumulator(num_qubits, compact_size=8)
+        terms = []
+        for _ in range(10):
+            labels = ["".join(rng.choice(["I", "Z"], size=num_qubits)) for _ in range(3)]
+            coeffs = rng.uniform(-1, 1, size=3)
+            term = SparsePauliOp(PauliTable.from_labels(labels), coeffs)
+            terms.append(term)
+            acc.add(term)
+            acc.add(term[0], coeff=-1)
+        target = terms[0]
+        for term in terms[1:]:
+            target = target + term - term[0]
+        target = (target - terms[0][0]).simplify()
+        self.assertEqual(acc.to_operator(), target)
+
+    def test_accumulate_zero(self):
+        """Test accumulating cancelling terms returns a zero operator."""
+        acc = SparsePauliOpAccumulator(3)
+        acc.add("XYZ", 1).add("XYZ", -1)
+        target = SparsePauliOp("III", [0])
+        self.assertEqual(acc.to_operator(), target)
+
+    def test_accumulate_wrong_qubits(self):
+        """Test adding terms on the wrong number of qubits raises."""
+        acc = SparsePauliOpAccumulator(3)
+        with self.assertRaises(QiskitError):
+            acc.add("XX")
+
 
 if __name__ == "__main__":
     unittest.main()